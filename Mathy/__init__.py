@@ -1,37 +1,83 @@
-"""Marks the current directory as a package."""
+"""
+Marks the current directory as a package.
+
+Submodules are imported lazily: a public name is only loaded, together
+with its submodule, the first time it is accessed. Pure geometry users
+therefore never import pygame, NumPy or the texture assets.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_LAZY_NAMES = {
+    "pi": "math_utils",
+    "factorial": "math_utils",
+    "deg_to_rad": "math_utils",
+    "sin": "math_utils",
+    "cos": "math_utils",
+    "tan": "math_utils",
+    "is_close": "math_utils",
+    "Vector2": "vector2",
+    "Vector3": "vector3",
+    "HomogeneousVector3": "vector3",
+    "Triangle": "triangle",
+    "Triangle3D": "triangle",
+    "Matrix2x2": "matrix2x2",
+    "Matrix3x3": "matrix3x3",
+    "TranslationMatrix3x3": "matrix3x3",
+    "RotationMatrix3x3": "matrix3x3",
+    "HomothetyMatrix3x3": "matrix3x3",
+    "Matrix4x4": "matrix4x4",
+    "TranslationMatrix4x4": "matrix4x4",
+    "RotationMatrix4x4_x": "matrix4x4",
+    "RotationMatrix4x4_y": "matrix4x4",
+    "RotationMatrix4x4_z": "matrix4x4",
+    "HomothetyMatrix4x4": "matrix4x4",
+    "AnisotropicMatrix4x4": "matrix4x4",
+    "TotalRotationMatrix4x4": "matrix4x4",
+    "barycentric_coordinates": "barycentric",
+    "TriangleSetup": "triangle_setup",
+    "Texture": "texture",
+    "gengar_tex": "texture",
+    "Vector4": "vector4",
+    "HomogeneousVector4": "vector4",
+    "Vector3Array": "vector_array",
+    "Vector4Array": "vector_array",
+    "FrameBuffer": "framebuffer",
+    "weld_vertices": "mesh_optimizer",
+    "optimize_vertex_cache": "mesh_optimizer",
+    "optimize_vertex_fetch": "mesh_optimizer",
+    "average_cache_miss_ratio": "mesh_optimizer",
+    "Mesh": "mesh",
+    "Renderer3D": "renderer3d",
+    "TiledRasterizer": "tiled_rasterizer",
+    "Quaternion": "quaternion",
+    "Transform": "transform",
+    "GameObject": "gameobject",
+    "Cube": "gameobject",
+    "Airplane": "gameobject",
+    "Renderer": "renderer",
+    "Camera": "camera",
+    "Projection": "projection",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access."""
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + module_name, __name__),
+                    name)
+    # Cache the value so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names alongside the loaded module attributes."""
+    return sorted(set(globals()) | set(_LAZY_NAMES))
 
-from .math_utils import pi, factorial, deg_to_rad, sin, cos, tan, is_close
-from .vector2 import Vector2
-from .vector3 import Vector3
-from .triangle import Triangle
-from .triangle import Triangle3D
-from .matrix2x2 import Matrix2x2
-from .vector3 import HomogeneousVector3
-from .matrix3x3 import Matrix3x3
-from .matrix3x3 import TranslationMatrix3x3
-from .matrix3x3 import RotationMatrix3x3
-from .matrix3x3 import HomothetyMatrix3x3
-from .matrix4x4 import Matrix4x4
-from .matrix4x4 import TranslationMatrix4x4
-from .matrix4x4 import RotationMatrix4x4_x
-from .matrix4x4 import RotationMatrix4x4_y
-from .matrix4x4 import RotationMatrix4x4_z
-from .matrix4x4 import HomothetyMatrix4x4
-from .barycentric import barycentric_coordinates
-from .texture import gengar_tex
-from .vector4 import Vector4
-from .vector4 import HomogeneousVector4
-from .matrix4x4 import AnisotropicMatrix4x4
-from .matrix4x4 import TotalRotationMatrix4x4
-from .renderer3d import Renderer3D
-from .quaternion import Quaternion
-from .transform import Transform
-from .gameobject import GameObject
-from .renderer import Renderer
-from .gameobject import Cube
-from .camera import Camera
-from .projection import Projection
-from .gameobject import Airplane
 
 __all__ = [
     "Vector2",
@@ -41,6 +87,7 @@ __all__ = [
     "TranslationMatrix3x3",
     "RotationMatrix3x3",
     "HomothetyMatrix3x3",
+    "Texture",
     "gengar_tex",
     "pi",
     "factorial",
@@ -52,8 +99,11 @@ __all__ = [
     "Vector3",
     "HomogeneousVector3",
     "barycentric_coordinates",
+    "TriangleSetup",
     "Vector4",
     "HomogeneousVector4",
+    "Vector3Array",
+    "Vector4Array",
     "Matrix4x4",
     "TranslationMatrix4x4",
     "HomothetyMatrix4x4",
@@ -62,7 +112,14 @@ __all__ = [
     "RotationMatrix4x4_z",
     "AnisotropicMatrix4x4",
     "TotalRotationMatrix4x4",
+    "FrameBuffer",
+    "weld_vertices",
+    "optimize_vertex_cache",
+    "optimize_vertex_fetch",
+    "average_cache_miss_ratio",
+    "Mesh",
     "Renderer3D",
+    "TiledRasterizer",
     "Transform",
     "GameObject",
     "Renderer",
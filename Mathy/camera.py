@@ -4,18 +4,71 @@ from Mathy import Vector3, Vector4, Matrix4x4
 
 
 class Camera:
-    """Represents a simple 3D camera for view transformations."""
+    """
+    Represents a simple 3D camera for view transformations.
+
+    The view matrix is cached and only rebuilt after position, target or up
+    is reassigned. Call mark_dirty() after mutating one of them in place.
+    """
 
     def __init__(self, position:  Vector3 = None, target: Vector3 = None, up: Vector3 = None):  # noqa: E501
         """Initialize a camera class."""
+        # Incremented every time the view matrix becomes stale
+        self.version = 0
+        self._view_matrix = None
+        self._view_projection_matrix = None
+        self._view_projection_key = None
+        self._frustum_planes = None
+        self._frustum_source = None
         self.position = position or Vector3(0, 0, 0)
         # Default target in negative Z direction (conventional)
-        self.target = Vector3(target.x, target.y, -target.z) or Vector3(0, 0, -1)  # noqa: E501
+        self.target = Vector3(target.x, target.y, -target.z) if target else Vector3(0, 0, -1)  # noqa: E501
         # Default up vector pointing in positive Y direction
         self.up = up or Vector3(0, 1, 0)
 
+    @property
+    def position(self) -> Vector3:
+        """Return the camera position."""
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector3):
+        """Move the camera and invalidate the cached matrices."""
+        self._position = value
+        self.mark_dirty()
+
+    @property
+    def target(self) -> Vector3:
+        """Return the point the camera looks at."""
+        return self._target
+
+    @target.setter
+    def target(self, value: Vector3):
+        """Change the target and invalidate the cached matrices."""
+        self._target = value
+        self.mark_dirty()
+
+    @property
+    def up(self) -> Vector3:
+        """Return the camera up vector."""
+        return self._up
+
+    @up.setter
+    def up(self, value: Vector3):
+        """Change the up vector and invalidate the cached matrices."""
+        self._up = value
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Invalidate the cached view and view-projection matrices."""
+        self._view_matrix = None
+        self._view_projection_matrix = None
+        self.version += 1
+
     def get_view_matrix(self):
         """Get view matrix (camera coordinates)."""
+        if self._view_matrix is not None:
+            return self._view_matrix
         # Compute forward, right, and up vectors
         forward = self.target.subtract(self.position).normalize()
         right = self.up.cross_product(forward).normalize()
@@ -38,9 +91,54 @@ class Camera:
         )
 
         # Combine rotation and translation to get the view matrix
-        view_matrix = rot.prod(translation)
+        self._view_matrix = rot.prod(translation)
 
-        return view_matrix
+        return self._view_matrix
+
+    def get_view_projection_matrix(self, projection):
+        """
+        Get the projection matrix multiplied by the view matrix.
+
+        The product is cached until the camera or the projection changes,
+        so a frame can fetch it once and apply a single matrix per vertex.
+        """
+        key = (projection, projection.version)
+        if (self._view_projection_matrix is None
+                or self._view_projection_key[0] is not key[0]
+                or self._view_projection_key[1] != key[1]):
+            self._view_projection_matrix = (
+                projection.get_projection_matrix().prod(
+                    self.get_view_matrix()))
+            self._view_projection_key = key
+        return self._view_projection_matrix
+
+    def get_frustum_planes(self, projection):
+        """
+        Return the six planes of the view frustum in world space.
+
+        The planes are extracted from the rows of the view-projection
+        matrix (Gribb-Hartmann method), in the order left, right, bottom,
+        top, near, far. Each plane is an (a, b, c, d) tuple normalized so
+        that a * x + b * y + c * z + d is the signed distance of a point,
+        positive inside the frustum.
+        The planes are cached along with the view-projection matrix.
+        """
+        view_projection = self.get_view_projection_matrix(projection)
+        if self._frustum_source is view_projection:
+            return self._frustum_planes
+        m = view_projection.flat
+        planes = []
+        for row in range(3):
+            for sign in (1, -1):
+                planes.append([m[12 + k] + sign * m[4 * row + k]
+                               for k in range(4)])
+        self._frustum_planes = []
+        for a, b, c, d in planes:
+            length = (a * a + b * b + c * c) ** 0.5
+            self._frustum_planes.append(
+                (a / length, b / length, c / length, d / length))
+        self._frustum_source = view_projection
+        return self._frustum_planes
 
     def look_at(self, target: Vector3):
         """Set the camera to look at a specific target point in 3D space."""
@@ -0,0 +1,80 @@
+"""Functions to clip triangles in homogeneous clip space."""
+
+import numpy as np
+
+# Default guard band: the x and y clip planes are pushed out to twice the
+# viewport, triangles crossing the screen edges inside it are left to the
+# rasterizer, which clamps its bounding box to the screen
+GUARD_BAND = 2.0
+
+
+def clip_planes(guard_band: float = GUARD_BAND) -> np.ndarray:
+    """
+    Return the clip-space planes as a (6, 4) array.
+
+    A point (x, y, z, w) is inside plane p when p . (x, y, z, w) >= 0.
+    The planes are near (z >= -w), far (z <= w), then the guard band
+    planes |x| <= guard_band * w and |y| <= guard_band * w.
+    """
+    g = guard_band
+    return np.array([
+        [0, 0, 1, 1],
+        [0, 0, -1, 1],
+        [1, 0, 0, g],
+        [-1, 0, 0, g],
+        [0, 1, 0, g],
+        [0, -1, 0, g],
+    ], dtype=np.float64)
+
+
+def outcodes(clip_vertices: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    """
+    Return the outcode of every clip-space vertex.
+
+    Bit i of the outcode is set when the vertex is outside plane i.
+    """
+    outside = clip_vertices @ planes.T < 0
+    return outside.astype(np.intp) @ (1 << np.arange(len(planes)))
+
+
+def clip_polygon(points: list, uvs: list, planes: np.ndarray,
+                 mask: int = -1) -> tuple[list, list]:
+    """
+    Clip a convex polygon with the Sutherland-Hodgman algorithm.
+
+    points are (x, y, z, w) clip-space tuples and uvs their texture
+    coordinates. Only the planes whose bit is set in mask are used.
+    Attributes are interpolated linearly in clip space, before the
+    perspective divide, which keeps them perspective-correct.
+    Return the clipped (points, uvs), empty if nothing is left.
+    """
+    for i, plane in enumerate(planes.tolist()):
+        if not mask >> i & 1 or not points:
+            continue
+        a, b, c, d = plane
+        distances = [a * p[0] + b * p[1] + c * p[2] + d * p[3]
+                     for p in points]
+        clipped_points = []
+        clipped_uvs = []
+        count = len(points)
+        for j in range(count):
+            k = (j + 1) % count
+            p, q = points[j], points[k]
+            dp, dq = distances[j], distances[k]
+            if dp >= 0:
+                clipped_points.append(p)
+                clipped_uvs.append(uvs[j])
+            if dp > 0 > dq or dp < 0 < dq:
+                # The edge strictly crosses the plane: emit the
+                # intersection. A corner lying on the plane is already
+                # kept as is and must not be emitted twice
+                t = dp / (dp - dq)
+                clipped_points.append(tuple(
+                    p[n] + t * (q[n] - p[n]) for n in range(4)))
+                u, v = uvs[j]
+                clipped_uvs.append((u + t * (uvs[k][0] - u),
+                                    v + t * (uvs[k][1] - v)))
+        points, uvs = clipped_points, clipped_uvs
+    if len(points) < 3:
+        return [], []
+    return points, uvs
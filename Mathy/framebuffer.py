@@ -0,0 +1,191 @@
+"""Defines a frame buffer holding the depth and color planes of a frame."""
+
+import numpy as np
+
+# Side of the square depth tiles of the hierarchical depth buffer
+HIZ_TILE_SIZE = 8
+# Margin under which a depth is not trusted to fail the depth test, to
+# absorb rounding between interpolated and stored depths
+HIZ_EPSILON = 1e-6
+
+
+class FrameBuffer:
+    """
+    A class to store the depth and color of every pixel of a render target.
+
+    Both planes are row-major NumPy arrays indexed as [y, x]:
+    depth is a (height, width) float32 plane and color a (height, width, 3)
+    uint8 RGB plane, which can be handed to pygame without copying.
+
+    A hierarchical depth buffer keeps the nearest and farthest depth of
+    every tile of tile_size pixels. Writes only flag their tiles as stale,
+    the bounds are refreshed when queried. Call mark_depth_dirty() after
+    writing into the depth plane directly.
+    """
+
+    def __init__(self, width: int, height: int,
+                 clear_color: tuple[int, int, int] = (0, 0, 0),
+                 tile_size: int = HIZ_TILE_SIZE):
+        """Allocate the depth and color planes for the given size."""
+        if not (isinstance(width, int) and isinstance(height, int)):
+            raise TypeError("Width and height must be ints.")
+        if width <= 0 or height <= 0:
+            raise ValueError("Width and height must be positive.")
+        self.width = width
+        self.height = height
+        self.clear_color = clear_color
+        self.depth = np.empty((height, width), dtype=np.float32)
+        self.color = np.empty((height, width, 3), dtype=np.uint8)
+        self._allocate_tiles(tile_size)
+        self.clear()
+
+    def _allocate_tiles(self, tile_size: int):
+        """Allocate the per-tile depth bounds of the hierarchical buffer."""
+        if tile_size <= 0:
+            raise ValueError("The tile size must be positive.")
+        self.tile_size = tile_size
+        shape = (-(-self.height // tile_size), -(-self.width // tile_size))
+        self.tile_min_depth = np.full(shape, np.inf, dtype=np.float32)
+        self.tile_max_depth = np.full(shape, np.inf, dtype=np.float32)
+        # Tiles written since their bounds were last computed
+        self._dirty_tiles = np.ones(shape, dtype=bool)
+
+    @classmethod
+    def from_arrays(cls, depth: np.ndarray, color: np.ndarray,
+                    clear_color: tuple[int, int, int] = (0, 0, 0),
+                    tile_size: int = HIZ_TILE_SIZE):
+        """
+        Build a frame buffer on existing planes, without copying them.
+
+        depth must be a (height, width) float32 array and color a
+        (height, width, 3) uint8 array, for instance views on shared
+        memory. Their content is left untouched, and the tile depth bounds
+        are computed from it on first use.
+        """
+        height, width = depth.shape
+        if depth.dtype != np.float32 or color.dtype != np.uint8:
+            raise TypeError("Expected float32 depth and uint8 color planes.")
+        if color.shape != (height, width, 3):
+            raise ValueError("The depth and color planes do not match.")
+        framebuffer = cls.__new__(cls)
+        framebuffer.width = width
+        framebuffer.height = height
+        framebuffer.clear_color = clear_color
+        framebuffer.depth = depth
+        framebuffer.color = color
+        framebuffer._allocate_tiles(tile_size)
+        return framebuffer
+
+    def clear(self):
+        """Reset every pixel in place (infinite depth, clear color)."""
+        self.depth.fill(np.inf)
+        self.color[...] = self.clear_color
+        self.tile_min_depth.fill(np.inf)
+        self.tile_max_depth.fill(np.inf)
+        self._dirty_tiles.fill(False)
+
+    def mark_depth_dirty(self, x0: int = 0, x1: int = None, y0: int = 0,
+                         y1: int = None):
+        """Flag the tiles of an inclusive pixel rectangle as stale."""
+        size = self.tile_size
+        x1 = self.width - 1 if x1 is None else x1
+        y1 = self.height - 1 if y1 is None else y1
+        self._dirty_tiles[y0 // size:y1 // size + 1,
+                          x0 // size:x1 // size + 1] = True
+
+    def tile_depth_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the (min, max) depth of every tile, as (rows, columns) arrays.
+
+        Stale tiles are refreshed first, with a single reduction over the
+        rectangle of tiles enclosing them.
+        """
+        dirty = self._dirty_tiles
+        if dirty.any():
+            rows = np.flatnonzero(dirty.any(axis=1))
+            columns = np.flatnonzero(dirty.any(axis=0))
+            r0, r1 = rows[0], rows[-1] + 1
+            c0, c1 = columns[0], columns[-1] + 1
+            size = self.tile_size
+            block = self.depth[r0 * size:r1 * size, c0 * size:c1 * size]
+            row_starts = np.arange(0, block.shape[0], size)
+            column_starts = np.arange(0, block.shape[1], size)
+            for reduce, bounds in ((np.minimum, self.tile_min_depth),
+                                   (np.maximum, self.tile_max_depth)):
+                bounds[r0:r1, c0:c1] = reduce.reduceat(
+                    reduce.reduceat(block, row_starts, axis=0),
+                    column_starts, axis=1)
+            dirty[r0:r1, c0:c1] = False
+        return self.tile_min_depth, self.tile_max_depth
+
+    def occluded_tiles(self, x0: int, x1: int, y0: int, y1: int,
+                       z_nearest: float) -> np.ndarray:
+        """
+        Find the tiles of a pixel rectangle hiding a fragment depth range.
+
+        A tile is occluded when z_nearest, the nearest depth of the
+        fragments, is behind the farthest depth stored in the tile: then
+        no fragment can pass the depth test there.
+        Return the boolean mask of the tiles overlapping the inclusive
+        rectangle, the first one being tile (y0 // size, x0 // size).
+        """
+        _, tile_max = self.tile_depth_bounds()
+        size = self.tile_size
+        tiles = tile_max[y0 // size:y1 // size + 1, x0 // size:x1 // size + 1]
+        return z_nearest - HIZ_EPSILON >= tiles
+
+    def get_depth(self, x: int, y: int) -> float:
+        """Return the depth stored for pixel (x, y)."""
+        return float(self.depth[y, x])
+
+    def get_color(self, x: int, y: int) -> tuple[int, int, int]:
+        """Return the RGB color stored for pixel (x, y)."""
+        r, g, b = self.color[y, x].tolist()
+        return (r, g, b)
+
+    def depth_test(self, x: int, y: int, z: float) -> bool:
+        """Check if depth z is in front of the depth stored for (x, y)."""
+        return z < float(self.depth[y, x])
+
+    def set_pixel(self, x: int, y: int, z: float, color):
+        """Store a depth and an RGB color (rounded to 0-255) for (x, y)."""
+        self.depth[y, x] = z
+        self.color[y, x] = [0 if c < 0 else 255 if c > 255 else round(c)
+                            for c in color]
+        self._dirty_tiles[y // self.tile_size, x // self.tile_size] = True
+
+    def write(self, xs, ys, zs, colors, depth_test: bool = True):
+        """
+        Write a batch of fragments with array operations.
+
+        xs, ys and zs are arrays of N pixel coordinates and depths and colors
+        an (N, 3) array. Fragments are assumed to target distinct pixels.
+        Return the boolean mask of the fragments that were written.
+        """
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        zs = np.asarray(zs, dtype=np.float64)
+        if depth_test:
+            written = zs < self.depth[ys, xs]
+        else:
+            written = np.ones(zs.shape, dtype=bool)
+        xs = xs[written]
+        ys = ys[written]
+        self.depth[ys, xs] = zs[written]
+        self.color[ys, xs] = np.clip(
+            np.rint(np.asarray(colors)[written]), 0, 255)
+        size = self.tile_size
+        self._dirty_tiles[ys // size, xs // size] = True
+        return written
+
+    def region(self, x0: int, x1: int, y0: int, y1: int):
+        """
+        Return (depth, color) views on the inclusive pixel rectangle.
+
+        The views are indexed as [x, y] like the rasterizer's pixel grids,
+        and writing into them writes into the frame buffer (call
+        mark_depth_dirty() after writing depths).
+        """
+        depth = self.depth[y0:y1 + 1, x0:x1 + 1].T
+        color = self.color[y0:y1 + 1, x0:x1 + 1].transpose(1, 0, 2)
+        return depth, color
@@ -1,61 +1,270 @@
 """Defines a GameObject class."""
 
-from Mathy import Transform, Renderer3D, Vector3, gengar_tex
+from Mathy import Mesh, Transform, Renderer3D, Vector3, gengar_tex
+from Mathy.mesh_optimizer import DEFAULT_CACHE_SIZE
 
 
 class GameObject:
-    """Represents a 3D object in the scene with a transform and a renderer."""
+    """
+    Represents a 3D object in the scene with a transform and a renderer.
 
-    def __init__(self, vertices: list[Vector3],
-                 indices: list[int], name="GameObject", texture=gengar_tex):
-        """Initialize a game object."""
+    The geometry lives in an immutable Mesh, which may be shared by many
+    objects: subclasses such as Cube build their mesh once, on the first
+    instance, and every other instance reuses it.
+    """
+
+    def __init__(self, vertices: list[Vector3] = None,
+                 indices: list[int] = None, name="GameObject",
+                 texture=gengar_tex,
+                 uv: list[tuple[float, float]] = None, mesh: Mesh = None):
+        """
+        Initialize a game object.
+
+        Pass either the vertices, indices and optional texture coordinates
+        of a new mesh, or an existing mesh to share.
+        """
+        if mesh is None and (vertices is None or indices is None):
+            raise ValueError("Pass the vertices and indices of the object, "
+                             "or a mesh.")
+        if mesh is not None and (vertices is not None or indices is not None
+                                 or uv is not None):
+            raise ValueError("Pass either vertices and indices or a mesh, "
+                             "not both.")
         self.name = name
-        # 3D mesh data
         self.texture = texture
-        self.vertices = vertices
-        self.indices = indices
-        self.uv = None
-        self.triangles = []
+        self._world_sphere = None
+        self._world_sphere_key = None
         # Transform and renderer components
         self.transform = Transform()
         self.renderer = Renderer3D()
-        # Generate vertices in homogeneous coordinates
-        self.homogeneous_vertices = []
-        for vertex in self.vertices:
-            self.homogeneous_vertices.append(vertex.homogenize())
-        # Set the mesh data for the renderer
+        # Scene graph links, mirrored by the transform hierarchy
+        self.parent = None
+        self.children = []
+        # 3D mesh data, also bound to the renderer
+        self.mesh = mesh if mesh is not None else Mesh(vertices, indices, uv)
+
+    @classmethod
+    def shared_mesh(cls) -> Mesh:
+        """
+        Return the mesh shared by the instances of the class.
+
+        The mesh is built on the first call by the _build_mesh static
+        method of the class, e.g. Cube's.
+        """
+        # Looked up in the class itself, so subclasses get their own mesh
+        mesh = cls.__dict__.get("_shared_mesh")
+        if mesh is None:
+            if not hasattr(cls, "_build_mesh"):
+                raise TypeError(f"{cls.__name__} has no shared mesh.")
+            mesh = cls._build_mesh()
+            cls._shared_mesh = mesh
+        return mesh
+
+    @property
+    def mesh(self) -> Mesh:
+        """Return the geometry of the object."""
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh: Mesh):
+        """Replace the geometry and rebuild the renderer data."""
+        if not isinstance(mesh, Mesh):
+            raise TypeError(f"{mesh} is not a Mesh")
+        self._mesh = mesh
+        self.invalidate_bounds()
         self.renderer.set_mesh_data(self)
 
+    @property
+    def vertices(self) -> tuple[Vector3, ...]:
+        """Return the mesh vertices."""
+        return self._mesh.vertices
+
+    @property
+    def indices(self) -> tuple[int, ...]:
+        """Return the mesh indices, three per triangle."""
+        return self._mesh.indices
+
+    @property
+    def uv(self) -> tuple[tuple[float, float], ...]:
+        """Return the texture coordinates of the vertices, or None."""
+        return self._mesh.uv
+
+    @uv.setter
+    def uv(self, uv: list[tuple[float, float]]):
+        """Give the object a new mesh with these texture coordinates."""
+        # The mesh may be shared: it is replaced, not modified
+        self.mesh = Mesh(self.vertices, self.indices, uv, self._mesh.name)
+
+    @property
+    def homogeneous_vertices(self) -> tuple:
+        """Return the mesh vertices in homogeneous coordinates."""
+        return self._mesh.homogeneous_vertices
+
+    @property
+    def triangles(self) -> tuple:
+        """Return the mesh triangles in local space."""
+        return self._mesh.triangles
+
+    def set_parent(self, parent: 'GameObject'):
+        """
+        Attach the object to a parent object, or detach it with None.
+
+        The transform becomes a child of the parent's transform: moving the
+        parent moves the whole subtree.
+        """
+        if parent is not None and not isinstance(parent, GameObject):
+            raise TypeError(f"{parent} is not a GameObject")
+        self.transform.set_parent(parent.transform if parent else None)
+        if self.parent is not None:
+            self.parent.children.remove(self)
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self)
+
+    def add_child(self, child: 'GameObject'):
+        """Attach a child object to this one."""
+        child.set_parent(self)
+
+    def walk(self):
+        """Yield the object and all its descendants, parents first."""
+        stack = [self]
+        while stack:
+            game_object = stack.pop()
+            yield game_object
+            stack.extend(reversed(game_object.children))
+
+    def invalidate_bounds(self):
+        """Discard the cached world bounding sphere."""
+        self._world_sphere_key = None
+
+    @property
+    def bounding_box(self) -> tuple[Vector3, Vector3]:
+        """Return the (min, max) corners of the local axis-aligned box."""
+        if self._mesh.bounding_box is None:
+            raise ValueError("Cannot bound an object without vertices.")
+        return self._mesh.bounding_box
+
+    @property
+    def bounding_sphere(self) -> tuple[Vector3, float]:
+        """
+        Return the (center, radius) of a local bounding sphere.
+
+        The sphere is centered on the bounding box, its radius is the
+        distance to the farthest vertex.
+        """
+        if self._mesh.bounding_sphere is None:
+            raise ValueError("Cannot bound an object without vertices.")
+        return self._mesh.bounding_sphere
+
+    def get_world_bounding_sphere(self) -> tuple[Vector3, float]:
+        """
+        Return the bounding sphere transformed to world space.
+
+        The radius is scaled by the largest scale factor of the world
+        matrix. The result is cached until the transform or one of its
+        ancestors changes.
+        """
+        transform = self.transform
+        key = (transform, transform.world_version)
+        if key != self._world_sphere_key:
+            m = transform.world_matrix.flat
+            center, radius = self.bounding_sphere
+            x, y, z = center.x, center.y, center.z
+            world_center = Vector3(m[0] * x + m[1] * y + m[2] * z + m[3],
+                                   m[4] * x + m[5] * y + m[6] * z + m[7],
+                                   m[8] * x + m[9] * y + m[10] * z + m[11])
+            scale = max(m[j] ** 2 + m[4 + j] ** 2 + m[8 + j] ** 2
+                        for j in range(3)) ** 0.5
+            self._world_sphere = (world_center, radius * scale)
+            self._world_sphere_key = key
+        return self._world_sphere
+
+    def weld_vertices(self, tolerance: float = 1e-6) -> dict:
+        """
+        Merge duplicate vertices and give the object the welded mesh.
+
+        Vertices closer than tolerance (with matching uv when the object has
+        texture coordinates) are welded, indices and uv are remapped and the
+        renderer buffers are rebuilt, so that vertex processing only pays for
+        unique vertices.
+        Return a report of the vertex and triangle counts before and after.
+        """
+        from Mathy.mesh_optimizer import weld_vertices
+        vertices, indices, uv, _ = weld_vertices(
+            self.vertices, self.indices, self.uv, tolerance)
+        report = {
+            "vertices_before": len(self.vertices),
+            "vertices_after": len(vertices),
+            "triangles_before": len(self.indices) // 3,
+            "triangles_after": len(indices) // 3,
+        }
+        report["reduction"] = (
+            1 - report["vertices_after"] / report["vertices_before"]
+            if self.vertices else 0.0)
+        # The mesh may be shared: give the object a new one
+        self.mesh = Mesh(vertices, indices, uv, self._mesh.name)
+        return report
+
+    def optimize_vertex_cache(self,
+                              cache_size: int = DEFAULT_CACHE_SIZE) -> dict:
+        """
+        Reorder the triangles and vertices for the post-transform cache.
+
+        Triangles are reordered with Forsyth's algorithm, then vertices are
+        renumbered in order of first use, and the renderer buffers are
+        rebuilt in the new order.
+        Return the average cache miss ratio (ACMR) before and after, both
+        measured with a cache of cache_size vertices.
+        """
+        from Mathy.mesh_optimizer import (average_cache_miss_ratio,
+                                          optimize_vertex_cache,
+                                          optimize_vertex_fetch)
+        acmr_before = average_cache_miss_ratio(self.indices, cache_size)
+        indices = optimize_vertex_cache(self.indices, len(self.vertices),
+                                        cache_size)
+        vertices, indices, uv = optimize_vertex_fetch(
+            list(self.vertices), indices, self.uv)
+        self.mesh = Mesh(vertices, indices, uv, self._mesh.name)
+        return {"acmr_before": acmr_before,
+                "acmr_after": average_cache_miss_ratio(self.indices,
+                                                       cache_size)}
+
+
 class Cube(GameObject):
     """A class to represent a cube."""
 
     def __init__(self):
         """Initialize a cubic game object."""
-        super().__init__([Vector3(-1.0, -1.0,  1.0),
-                         Vector3(1.0, -1.0,  1.0),
-                         Vector3(-1.0,  1.0,  1.0),
-                         Vector3(1.0,  1.0,  1.0),
-                         Vector3(-1.0, -1.0, -1.0),
-                         Vector3(1.0, -1.0, -1.0),
-                         Vector3(-1.0,  1.0, -1.0),
-                         Vector3(1.0,  1.0, -1.0)],
-                         indices=[0, 1, 2,
-                                1, 3, 2,
-                                4, 5, 6,
-                                5, 7, 6,
-                                0, 1, 4,
-                                1, 5, 4,
-                                2, 3, 6,
-                                3, 7, 6,
-                                0, 2, 4,
-                                2, 6, 4,
-                                1, 3, 5,
-                                3, 7, 5]
-                        )
-        self.uv = [
-                (0.0, 1.0), (1.0, 1.0), (0.0, 0.0), (1.0, 0.0),
-                (0.0, 1.0), (1.0, 1.0), (0.0, 0.0), (1.0, 0.0)
-        ]
+        super().__init__(mesh=self.shared_mesh())
+
+    @staticmethod
+    def _build_mesh() -> Mesh:
+        """Build the cube geometry."""
+        return Mesh([Vector3(-1.0, -1.0,  1.0),
+                    Vector3(1.0, -1.0,  1.0),
+                    Vector3(-1.0,  1.0,  1.0),
+                    Vector3(1.0,  1.0,  1.0),
+                    Vector3(-1.0, -1.0, -1.0),
+                    Vector3(1.0, -1.0, -1.0),
+                    Vector3(-1.0,  1.0, -1.0),
+                    Vector3(1.0,  1.0, -1.0)],
+                    indices=[0, 1, 2,
+                           1, 3, 2,
+                           4, 5, 6,
+                           5, 7, 6,
+                           0, 1, 4,
+                           1, 5, 4,
+                           2, 3, 6,
+                           3, 7, 6,
+                           0, 2, 4,
+                           2, 6, 4,
+                           1, 3, 5,
+                           3, 7, 5],
+                    uv=[
+                        (0.0, 1.0), (1.0, 1.0), (0.0, 0.0), (1.0, 0.0),
+                        (0.0, 1.0), (1.0, 1.0), (0.0, 0.0), (1.0, 0.0)
+                    ],
+                    name="Cube")
 
 
 class Airplane(GameObject):
@@ -63,314 +272,319 @@ class Airplane(GameObject):
 
     def __init__(self):
         """Initialize an airplane-like game object."""
-        super().__init__([Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, 1.0),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(1.0, -1.0, 1.0),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(-1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, 1.0),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(-0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-1.0, 0.9999999403953552, 1.0),
-                          Vector3(-0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(-0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(-0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(1.0, -1.0, 1.0),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(1.0, -1.0, 1.0),
-                          Vector3(0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(1.0, -1.0, 1.0),
-                          Vector3(0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(-0.6343790292739868, -
-                                  0.6343790292739868, 2.071401596069336),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(-1.0, 0.9999999403953552, 1.0),
-                          Vector3(-0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(-0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(0.6343790292739868,
-                                  0.6343790888786316, 2.071401596069336),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(-1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(-1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(1.0, 0.0, 1.0),
-                          Vector3(5.639326572418213, 0.0, 1.0),
-                          Vector3(5.639326572418213, 0.0, -1.0000004768371582),
-                          Vector3(1.0, 0.0, 1.0),
-                          Vector3(5.639326572418213, 0.0, -1.0000004768371582),
-                          Vector3(1.0, 0.0, -1.0000004768371582),
-                          Vector3(-1.0, 0.0, -1.0000004768371582),
-                          Vector3(-5.639326572418213,
-                                  0.0, -1.0000004768371582),
-                          Vector3(-5.639326572418213, 0.0, 1.0),
-                          Vector3(-1.0, 0.0, -1.0000004768371582),
-                          Vector3(-5.639326572418213, 0.0, 1.0),
-                          Vector3(-1.0, 0.0, 1.0),
-                          Vector3(0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(1.910941243171692, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(1.910941243171692, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(1.910941243171692, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-1.910941243171692, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-1.910941243171692, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-1.910941243171692, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  2.765233278274536),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(-0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(-1.0, -1.0, -2.765233278274536),
-                          Vector3(-0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(-0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(0.550787627696991,
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(1.0, -1.0, -2.765233278274536),
-                          Vector3(0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(0.550787627696991, -
-                                  0.550787627696991, -7.27072286605835),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(1.0, 0.9999999403953552, -2.765233278274536),
-                          Vector3(0.6800898909568787, -
-                                  0.49545127153396606, -5.973852634429932),
-                          Vector3(0.5693285465240479, -
-                                  0.49545127153396606, -7.084762096405029),
-                          Vector3(-1.0, 0.0, 1.0),
-                          Vector3(-1.0, 0.9999999403953552, 1.0),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(-1.0, 0.0, 1.0),
-                          Vector3(-1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(-1.0, 0.0, -1.0000004768371582),
-                          Vector3(-1.0, 0.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(-1.0, 0.0, -1.0000004768371582),
-                          Vector3(-1.0, -1.0, 1.0),
-                          Vector3(-1.0, 0.0, 1.0),
-                          Vector3(1.0, 0.0, -1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, -
-                                  1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(1.0, 0.0, -1.0000004768371582),
-                          Vector3(1.0, 0.9999999403953552, 1.0),
-                          Vector3(1.0, 0.0, 1.0),
-                          Vector3(1.0, 0.0, 1.0),
-                          Vector3(1.0, -1.0, 1.0),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(1.0, 0.0, 1.0),
-                          Vector3(1.0, -1.0, -1.0000004768371582),
-                          Vector3(1.0, 0.0, -1.0000004768371582)],
-
-                         [0, 1, 2,
-                          3, 4, 5,
-                          6, 7, 8,
-                          9, 10, 11,
-                          12, 13, 14,
-                          15, 16, 17,
-                          18, 19, 20,
-                          21, 22, 23,
-                          24, 25, 26,
-                          27, 28, 29,
-                          30, 31, 32,
-                          33, 34, 35,
-                          36, 37, 38,
-                          39, 40, 41,
-                          42, 43, 44,
-                          45, 46, 47,
-                          48, 49, 50,
-                          51, 52, 53,
-                          54, 55, 56,
-                          57, 58, 59,
-                          60, 61, 62,
-                          63, 64, 65,
-                          66, 67, 68,
-                          69, 70, 71,
-                          72, 73, 74,
-                          75, 76, 77,
-                          78, 79, 80,
-                          81, 82, 83,
-                          84, 85, 86,
-                          87, 88, 89,
-                          90, 91, 92,
-                          93, 94, 95,
-                          96, 97, 98,
-                          99, 100, 101,
-                          102, 103, 104,
-                          105, 106, 107,
-                          108, 109, 110,
-                          111, 112, 113,
-                          114, 115, 116,
-                          117, 118, 119,
-                          120, 121, 122,
-                          123, 124, 125,
-                          126, 127, 128,
-                          129, 130, 131,
-                          132, 133, 134,
-                          135, 136, 137,
-                          138, 139, 140,
-                          141, 142, 143,
-                          144, 145, 146,
-                          147, 148, 149,
-                          150, 151, 152,
-                          153, 154, 155,
-                          156, 157, 158,
-                          159, 160, 161,
-                          162, 163, 164,
-                          165, 166, 167])
+        super().__init__(mesh=self.shared_mesh())
+
+    @staticmethod
+    def _build_mesh() -> Mesh:
+        """Build the airplane geometry."""
+        return Mesh([Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, 1.0),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(1.0, -1.0, 1.0),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(-1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, 1.0),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(-0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-1.0, 0.9999999403953552, 1.0),
+                     Vector3(-0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(-0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(-0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(1.0, -1.0, 1.0),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(1.0, -1.0, 1.0),
+                     Vector3(0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(1.0, -1.0, 1.0),
+                     Vector3(0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(-0.6343790292739868, -
+                             0.6343790292739868, 2.071401596069336),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(-1.0, 0.9999999403953552, 1.0),
+                     Vector3(-0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(-0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(0.6343790292739868,
+                             0.6343790888786316, 2.071401596069336),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(-1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(-1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(1.0, 0.0, 1.0),
+                     Vector3(5.639326572418213, 0.0, 1.0),
+                     Vector3(5.639326572418213, 0.0, -1.0000004768371582),
+                     Vector3(1.0, 0.0, 1.0),
+                     Vector3(5.639326572418213, 0.0, -1.0000004768371582),
+                     Vector3(1.0, 0.0, -1.0000004768371582),
+                     Vector3(-1.0, 0.0, -1.0000004768371582),
+                     Vector3(-5.639326572418213,
+                             0.0, -1.0000004768371582),
+                     Vector3(-5.639326572418213, 0.0, 1.0),
+                     Vector3(-1.0, 0.0, -1.0000004768371582),
+                     Vector3(-5.639326572418213, 0.0, 1.0),
+                     Vector3(-1.0, 0.0, 1.0),
+                     Vector3(0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(1.910941243171692, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(1.910941243171692, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(1.910941243171692, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-1.910941243171692, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-1.910941243171692, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-1.910941243171692, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             2.765233278274536),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(-0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(-1.0, -1.0, -2.765233278274536),
+                     Vector3(-0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(-0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(0.550787627696991,
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(1.0, -1.0, -2.765233278274536),
+                     Vector3(0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(0.550787627696991, -
+                             0.550787627696991, -7.27072286605835),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(1.0, 0.9999999403953552, -2.765233278274536),
+                     Vector3(0.6800898909568787, -
+                             0.49545127153396606, -5.973852634429932),
+                     Vector3(0.5693285465240479, -
+                             0.49545127153396606, -7.084762096405029),
+                     Vector3(-1.0, 0.0, 1.0),
+                     Vector3(-1.0, 0.9999999403953552, 1.0),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(-1.0, 0.0, 1.0),
+                     Vector3(-1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(-1.0, 0.0, -1.0000004768371582),
+                     Vector3(-1.0, 0.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(-1.0, 0.0, -1.0000004768371582),
+                     Vector3(-1.0, -1.0, 1.0),
+                     Vector3(-1.0, 0.0, 1.0),
+                     Vector3(1.0, 0.0, -1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, -
+                             1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(1.0, 0.0, -1.0000004768371582),
+                     Vector3(1.0, 0.9999999403953552, 1.0),
+                     Vector3(1.0, 0.0, 1.0),
+                     Vector3(1.0, 0.0, 1.0),
+                     Vector3(1.0, -1.0, 1.0),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(1.0, 0.0, 1.0),
+                     Vector3(1.0, -1.0, -1.0000004768371582),
+                     Vector3(1.0, 0.0, -1.0000004768371582)],
+
+                    [0, 1, 2,
+                     3, 4, 5,
+                     6, 7, 8,
+                     9, 10, 11,
+                     12, 13, 14,
+                     15, 16, 17,
+                     18, 19, 20,
+                     21, 22, 23,
+                     24, 25, 26,
+                     27, 28, 29,
+                     30, 31, 32,
+                     33, 34, 35,
+                     36, 37, 38,
+                     39, 40, 41,
+                     42, 43, 44,
+                     45, 46, 47,
+                     48, 49, 50,
+                     51, 52, 53,
+                     54, 55, 56,
+                     57, 58, 59,
+                     60, 61, 62,
+                     63, 64, 65,
+                     66, 67, 68,
+                     69, 70, 71,
+                     72, 73, 74,
+                     75, 76, 77,
+                     78, 79, 80,
+                     81, 82, 83,
+                     84, 85, 86,
+                     87, 88, 89,
+                     90, 91, 92,
+                     93, 94, 95,
+                     96, 97, 98,
+                     99, 100, 101,
+                     102, 103, 104,
+                     105, 106, 107,
+                     108, 109, 110,
+                     111, 112, 113,
+                     114, 115, 116,
+                     117, 118, 119,
+                     120, 121, 122,
+                     123, 124, 125,
+                     126, 127, 128,
+                     129, 130, 131,
+                     132, 133, 134,
+                     135, 136, 137,
+                     138, 139, 140,
+                     141, 142, 143,
+                     144, 145, 146,
+                     147, 148, 149,
+                     150, 151, 152,
+                     153, 154, 155,
+                     156, 157, 158,
+                     159, 160, 161,
+                     162, 163, 164,
+                     165, 166, 167], name="Airplane")
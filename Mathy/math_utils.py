@@ -1,5 +1,7 @@
 """Define useful math functions and constants."""
 
+import math
+
 pi = 3.1415926535897932384626433832795028841971  # Value of constant pi
 
 
@@ -19,7 +21,13 @@ def deg_to_rad(x):
     return rad
 
 
-def sin(x):
+def _numpy():
+    """Import NumPy on demand, it is only needed for array arguments."""
+    import numpy
+    return numpy
+
+
+def _taylor_sin(x):
     """Approximate sinus(x) for any x (radians) using Taylor expansion."""
     x = x % (2 * pi)
     if x > pi:
@@ -30,7 +38,7 @@ def sin(x):
     return sinx
 
 
-def cos(x):
+def _taylor_cos(x):
     """Approximate cosinus(x) for any x (radians) using Taylor expansion."""
     x = x % (2 * pi)
     if x > pi:
@@ -41,11 +49,172 @@ def cos(x):
     return cosx
 
 
+def _taylor_sin_array(x):
+    """Evaluate the reference Taylor expansion of sinus on an array."""
+    np = _numpy()
+    x = x % (2 * pi)
+    x = np.where(x > pi, x - 2 * pi, x)
+    sinx = np.zeros_like(x)
+    for k in range(15):
+        sinx += (-1)**k * x**(2*k + 1) / factorial(2*k + 1)
+    return sinx
+
+
+def _taylor_cos_array(x):
+    """Evaluate the reference Taylor expansion of cosinus on an array."""
+    np = _numpy()
+    x = x % (2 * pi)
+    x = np.where(x > pi, x - 2 * pi, x)
+    cosx = np.zeros_like(x)
+    for k in range(15):
+        cosx += (-1)**k * x**(2*k) / factorial(2*k)
+    return cosx
+
+
+# Taylor coefficients in x**2, highest degree first for Horner's scheme.
+# After range reduction |x| <= pi/4, so the first omitted terms
+# (x**17/17! and x**18/18!) are below double precision.
+_SIN_COEFFICIENTS = tuple((-1)**k / factorial(2*k + 1)
+                          for k in reversed(range(8)))
+_COS_COEFFICIENTS = tuple((-1)**k / factorial(2*k)
+                          for k in reversed(range(9)))
+# pi/2 split in two parts so that x - n*pi/2 stays exact for moderate n
+_PIO2_HI = 1.57079632673412561417e+00
+_PIO2_LO = 6.07710050650619224932e-11
+_TWO_OVER_PI = 2 / pi
+
+
+def _reduce(x):
+    """Return (quadrant, r) such that x = quadrant*pi/2 + r, |r| <= pi/4."""
+    n = round(x * _TWO_OVER_PI)
+    r = (x - n * _PIO2_HI) - n * _PIO2_LO
+    return n & 3, r
+
+
+def _horner_sin_poly(r):
+    """Evaluate the sinus polynomial on the reduced range."""
+    r2 = r * r
+    acc = 0.0
+    for c in _SIN_COEFFICIENTS:
+        acc = acc * r2 + c
+    return acc * r
+
+
+def _horner_cos_poly(r):
+    """Evaluate the cosinus polynomial on the reduced range."""
+    r2 = r * r
+    acc = 0.0
+    for c in _COS_COEFFICIENTS:
+        acc = acc * r2 + c
+    return acc
+
+
+def _horner_sin(x):
+    """Approximate sinus(x) with range reduction and Horner's scheme."""
+    quadrant, r = _reduce(x)
+    if quadrant == 0:
+        return _horner_sin_poly(r)
+    if quadrant == 1:
+        return _horner_cos_poly(r)
+    if quadrant == 2:
+        return -_horner_sin_poly(r)
+    return -_horner_cos_poly(r)
+
+
+def _horner_cos(x):
+    """Approximate cosinus(x) with range reduction and Horner's scheme."""
+    quadrant, r = _reduce(x)
+    if quadrant == 0:
+        return _horner_cos_poly(r)
+    if quadrant == 1:
+        return -_horner_sin_poly(r)
+    if quadrant == 2:
+        return -_horner_cos_poly(r)
+    return _horner_sin_poly(r)
+
+
+def _horner_array(x, shift):
+    """Evaluate sinus (shift=0) or cosinus (shift=1) on an array."""
+    np = _numpy()
+    n = np.rint(x * _TWO_OVER_PI)
+    r = (x - n * _PIO2_HI) - n * _PIO2_LO
+    quadrant = (n.astype(np.int64) + shift) & 3
+    s = _horner_sin_poly(r)
+    c = _horner_cos_poly(r)
+    return np.select([quadrant == 0, quadrant == 1, quadrant == 2],
+                     [s, c, -s], -c)
+
+
+# name: (scalar sin, scalar cos, array sin, array cos)
+_TRIG_BACKENDS = {
+    "taylor": (_taylor_sin, _taylor_cos,
+               _taylor_sin_array, _taylor_cos_array),
+    "horner": (_horner_sin, _horner_cos,
+               lambda x: _horner_array(x, 0), lambda x: _horner_array(x, 1)),
+    "math": (math.sin, math.cos,
+             lambda x: _numpy().sin(x), lambda x: _numpy().cos(x)),
+}
+_trig_backend = "horner"
+_trig = _TRIG_BACKENDS[_trig_backend]
+
+
+def set_trig_backend(name: str):
+    """
+    Select the implementation used by sin, cos and tan.
+
+    "horner" (default) reduces the angle to [-pi/4, pi/4] and evaluates a
+    precomputed coefficient table with Horner's scheme, "taylor" is the
+    original 15-term Taylor expansion and "math" delegates to the standard
+    library (NumPy for arrays).
+    """
+    global _trig_backend, _trig
+    if name not in _TRIG_BACKENDS:
+        raise ValueError(f"Unknown trigonometry backend: {name}")
+    _trig_backend = name
+    _trig = _TRIG_BACKENDS[name]
+
+
+def get_trig_backend() -> str:
+    """Return the name of the selected trigonometry backend."""
+    return _trig_backend
+
+
+def _as_array(x):
+    """Convert a non-scalar argument to a float64 NumPy array."""
+    return _numpy().asarray(x, dtype=float)
+
+
+def _from_array(result):
+    """Return 0-d array results as plain floats."""
+    return float(result) if result.ndim == 0 else result
+
+
+def sin(x):
+    """Approximate sinus(x) for any x (radians), scalar or array."""
+    if isinstance(x, (int, float)):
+        return _trig[0](x)
+    return _from_array(_trig[2](_as_array(x)))
+
+
+def cos(x):
+    """Approximate cosinus(x) for any x (radians), scalar or array."""
+    if isinstance(x, (int, float)):
+        return _trig[1](x)
+    return _from_array(_trig[3](_as_array(x)))
+
+
 def tan(x):
     """Approximate tangent(x) for any x (radians) using sin and cos."""
-    if abs(cos(x)) < 1e-9:
+    if isinstance(x, (int, float)):
+        if abs(cos(x)) < 1e-9:
+            raise ValueError("Tangent is undefined for this angle (cosine is zero).")  # noqa: E501
+        return sin(x) / cos(x)
+    np = _numpy()
+    x = _as_array(x)
+    c = _trig[3](x)
+    if np.any(np.abs(c) < 1e-9):
         raise ValueError("Tangent is undefined for this angle (cosine is zero).")  # noqa: E501
-    return sin(x) / cos(x)
+    return _from_array(_trig[2](x) / c)
 
 
 def is_close(a, b, rel_tol=1e-9, abs_tol=0.0):
@@ -1,27 +1,37 @@
 """Defines a 2x2 matrix class."""
 
+from Mathy.matrix_view import MatrixView
 
 class Matrix2x2:
-    """A class to represent a 2 by 2 matrix."""
+    """
+    A class to represent a 2 by 2 matrix.
+
+    The entries are stored in a flat, row-major list (flat);
+    matrix[i][j] remains available through a view.
+    """
+
+    __slots__ = ("flat",)
 
     def __init__(self, x1: float | int, x2: float | int,
                  x3: float | int, x4: float | int):
         """Initialize a 2x2 matrix with the given values."""
-        self.matrix = [[x1, x2], [x3, x4]]
+        self.flat = [x1, x2, x3, x4]
+
+    @property
+    def matrix(self) -> MatrixView:
+        """Return a matrix[i][j] view on the entries."""
+        return MatrixView(self.flat, 2)
 
     def __repr__(self):
         """Return a string representation of the matrix."""
-        return f"Matrix2x2([\n  {self.matrix[0]},\n  {self.matrix[1]}\n])"
+        m = self.flat
+        return f"Matrix2x2([\n  {m[0:2]},\n  {m[2:4]}\n])"
 
     def add(self, matrix2: 'Matrix2x2') -> 'Matrix2x2':
         """Add two 2x2 matrices."""
         if isinstance(matrix2, Matrix2x2):
-            res = [[0, 0], [0, 0]]
-            for i in range(2):
-                for j in range(2):
-                    res[i][j] = self.matrix[i][j] + matrix2.matrix[i][j]
             # Return a new Matrix2x2 object with the result of the addition
-            return Matrix2x2(res[0][0], res[0][1], res[1][0], res[1][1])
+            return Matrix2x2(*[a + b for a, b in zip(self.flat, matrix2.flat)])
         else:
             raise TypeError(f'{matrix2} is not a Matrix2x2')
 
@@ -29,24 +39,20 @@ class Matrix2x2:
         """Multiply the matrix by a scalar value."""
         if not isinstance(scalar, (int, float)):
             raise TypeError(f'{scalar} is not a scalar')
-        res = [[0, 0], [0, 0]]
-        for i in range(2):
-            for j in range(2):
-                res[i][j] = self.matrix[i][j] * scalar
         # Return a new Matrix2x2 object
         # with the result of the scalar multiplication
-        return Matrix2x2(res[0][0], res[0][1], res[1][0], res[1][1])
+        return Matrix2x2(*[a * scalar for a in self.flat])
 
     def prod(self, matrix2: 'Matrix2x2') -> 'Matrix2x2':
         """Multiply two 2x2 matrices."""
         if isinstance(matrix2, Matrix2x2):
-            a = self.matrix
-            b = matrix2.matrix
+            a00, a01, a10, a11 = self.flat
+            b00, b01, b10, b11 = matrix2.flat
             # Apply dot product for each element
-            x1 = a[0][0] * b[0][0] + a[0][1] * b[1][0]
-            x2 = a[0][0] * b[0][1] + a[0][1] * b[1][1]
-            x3 = a[1][0] * b[0][0] + a[1][1] * b[1][0]
-            x4 = a[1][0] * b[0][1] + a[1][1] * b[1][1]
+            x1 = a00 * b00 + a01 * b10
+            x2 = a00 * b01 + a01 * b11
+            x3 = a10 * b00 + a11 * b10
+            x4 = a10 * b01 + a11 * b11
             # Return a new Matrix2x2 object
             # with the result of the matrix multiplication
             return Matrix2x2(x1, x2, x3, x4)
@@ -55,10 +61,7 @@ class Matrix2x2:
 
     def determinant(self) -> float:
         """Calculate the determinant of a 2x2 matrix."""
-        a = self.matrix[0][0]
-        b = self.matrix[0][1]
-        c = self.matrix[1][0]
-        d = self.matrix[1][1]
+        a, b, c, d = self.flat
         # The determinant of a 2x2 matrix is calculated as (ad - bc)
         return a * d - b * c
 
@@ -71,14 +74,14 @@ class Matrix2x2:
         from Mathy import Vector2
         if isinstance(b, Vector2):
             det = self.determinant()
-            a = self.matrix
+            a00, a01, a10, a11 = self.flat
             # Check if matrix is invertible
             if abs(det) < 1e-9:
                 raise ValueError("Matrix is not invertible (determinant is zero). Cannot solve system.")  # noqa: E501
             # Calculate the determinant of the system for the x coordinate
-            det_x = b.x * a[1][1] - b.y * a[0][1]
+            det_x = b.x * a11 - b.y * a01
             # Calculate the determinant of the system for the y coordinate
-            det_y = a[0][0] * b.y - a[1][0] * b.x
+            det_y = a00 * b.y - a10 * b.x
             # Use Cramer's rule to find the solutions for x and y
             x = det_x / det
             y = det_y / det
@@ -1,28 +1,41 @@
 """Defines a 3x3 matrix class."""
 
 from Mathy import cos, sin, deg_to_rad
+from Mathy.matrix_view import MatrixView
 
 
 class Matrix3x3:
-    """A class to represent a 3 by 3 matrix."""
+    """
+    A class to represent a 3 by 3 matrix.
+
+    The entries are stored in a flat, row-major list (flat);
+    matrix[i][j] remains available through a view.
+    """
+
+    __slots__ = ("flat",)
 
     def __init__(self, x1: float | int, x2: float | int, x3: float | int,
                  x4: float | int, x5: float | int, x6: float | int,
                  x7: float | int, x8: float | int, x9: float | int):
         """Initialize a 3x3 matrix with the given values."""
-        self.matrix = [[x1, x2, x3], [x4, x5, x6], [x7, x8, x9]]
+        self.flat = [x1, x2, x3, x4, x5, x6, x7, x8, x9]
+
+    @property
+    def matrix(self) -> MatrixView:
+        """Return a matrix[i][j] view on the entries."""
+        return MatrixView(self.flat, 3)
 
     def __repr__(self):
         """Return a string representation of the matrix."""
-        return f"Matrix3x3([\n {self.matrix[0]},\n {self.matrix[1]},\n {self.matrix[2]}\n])"  # noqa: E501
+        m = self.flat
+        return f"Matrix3x3([\n {m[0:3]},\n {m[3:6]},\n {m[6:9]}\n])"
 
     def __eq__(self, other: 'Matrix3x3') -> bool:
         """Check if two 3x3 matrices are equal."""
         if isinstance(other, Matrix3x3):
-            for i in range(3):
-                for j in range(3):
-                    if abs(self.matrix[i][j] - other.matrix[i][j]) >= 1e-9:
-                        return False
+            for a, b in zip(self.flat, other.flat):
+                if abs(a - b) >= 1e-9:
+                    return False
             return True
         else:
             raise TypeError(f"{other} is not a Matrix3x3")
@@ -30,16 +43,8 @@ class Matrix3x3:
     def add(self, other: 'Matrix3x3') -> 'Matrix3x3':
         """Add two 3x3 matrices."""
         if isinstance(other, Matrix3x3):
-            res = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
-            for i in range(3):
-                for j in range(3):
-                    res[i][j] = self.matrix[i][j] + other.matrix[i][j]
             # Return a new Matrix3x3 object with the result of the addition
-            return Matrix3x3(
-                res[0][0], res[0][1], res[0][2],
-                res[1][0], res[1][1], res[1][2],
-                res[2][0], res[2][1], res[2][2],
-            )
+            return Matrix3x3(*[a + b for a, b in zip(self.flat, other.flat)])
         else:
             raise TypeError(f'{other} is not a Matrix3x3')
 
@@ -47,43 +52,34 @@ class Matrix3x3:
         """Multiply the matrix by a scalar value."""
         if not isinstance(scalar, (int, float)):
             raise TypeError(f'{scalar} is not a scalar')
-        res = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
-        for i in range(3):
-            for j in range(3):
-                res[i][j] = self.matrix[i][j] * scalar
         # Return a new Matrix3x3 object
         # with the result of the scalar multiplication
-        return Matrix3x3(
-            res[0][0], res[0][1], res[0][2],
-            res[1][0], res[1][1], res[1][2],
-            res[2][0], res[2][1], res[2][2],
-        )
+        return Matrix3x3(*[a * scalar for a in self.flat])
 
     def prod(self, other: 'Matrix3x3') -> 'Matrix3x3':
         """Multiply two 3x3 matrices."""
         if isinstance(other, Matrix3x3):
-            a = self.matrix
-            b = other.matrix
-            res = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
-            for i in range(3):
-                for j in range(3):
-                    for k in range(3):
-                        res[i][j] += a[i][k] * b[k][j]
+            a00, a01, a02, a10, a11, a12, a20, a21, a22 = self.flat
+            b00, b01, b02, b10, b11, b12, b20, b21, b22 = other.flat
             # Return a new Matrix3x3 object
             # with the result of the matrix multiplication
             return Matrix3x3(
-                res[0][0], res[0][1], res[0][2],
-                res[1][0], res[1][1], res[1][2],
-                res[2][0], res[2][1], res[2][2]
+                a00 * b00 + a01 * b10 + a02 * b20,
+                a00 * b01 + a01 * b11 + a02 * b21,
+                a00 * b02 + a01 * b12 + a02 * b22,
+                a10 * b00 + a11 * b10 + a12 * b20,
+                a10 * b01 + a11 * b11 + a12 * b21,
+                a10 * b02 + a11 * b12 + a12 * b22,
+                a20 * b00 + a21 * b10 + a22 * b20,
+                a20 * b01 + a21 * b11 + a22 * b21,
+                a20 * b02 + a21 * b12 + a22 * b22
             )
         else:
             raise TypeError(f'{other} is not a Matrix3x3')
 
     def determinant(self) -> float:
         """Calculate the determinant of a 3x3 matrix."""
-        a, b, c = self.matrix[0]
-        d, e, f = self.matrix[1]
-        g, h, i = self.matrix[2]
+        a, b, c, d, e, f, g, h, i = self.flat
         # The determinant of a 3x3 matrix is calculated as
         # det = a(ei−fh)−b(di−fg)+c(dh−eg)
         return a * (e*i - f*h) - b * (d*i - f*g) + c * (d*h - e*g)
@@ -91,17 +87,13 @@ class Matrix3x3:
     def round(self, decimal: int) -> 'Matrix3x3':
         """Return a rounded approximation of the matrix's contents."""
         if (decimal >= 0 and isinstance(decimal, int)):
-            res = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
-            for i in range(3):
-                for j in range(3):
-                    res[i][j] = round(self.matrix[i][j], decimal)
-                    if abs(res[i][j]) < 10**(-decimal):
-                        res[i][j] = 0.0
-            return Matrix3x3(
-                    res[0][0], res[0][1], res[0][2],
-                    res[1][0], res[1][1], res[1][2],
-                    res[2][0], res[2][1], res[2][2],
-                )
+            res = []
+            for value in self.flat:
+                value = round(value, decimal)
+                if abs(value) < 10**(-decimal):
+                    value = 0.0
+                res.append(value)
+            return Matrix3x3(*res)
         else:
             if (decimal < 0):
                 raise ValueError(f'{decimal} should not be negative.')
@@ -112,6 +104,8 @@ class Matrix3x3:
 class TranslationMatrix3x3(Matrix3x3):
     """A class to represent a 3 by 3 translation matrix."""
 
+    __slots__ = ("a", "b")
+
     def __init__(self, a, b):
         """Initialize a translation matrix."""
         super().__init__(
@@ -131,6 +125,8 @@ class RotationMatrix3x3(Matrix3x3):
         theta (float): Angle of rotation in degrees.
     """
 
+    __slots__ = ("t_radians",)
+
     def __init__(self, t_degrees):
         """Initialize a rotation matrix."""
         theta = deg_to_rad(t_degrees)  # Convert degrees to radians
@@ -145,6 +141,8 @@ class RotationMatrix3x3(Matrix3x3):
 class HomothetyMatrix3x3(Matrix3x3):
     """A class to represent a 3 by 3 homothety matrix."""
 
+    __slots__ = ("k",)
+
     def __init__(self, k):
         """Initialize a homotethy matrix."""
         super().__init__(
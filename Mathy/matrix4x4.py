@@ -1,11 +1,43 @@
 """Defines a 4x4 matrix class."""
 
 
-from Mathy import cos, sin, deg_to_rad, Matrix3x3
+from Mathy import cos, sin, deg_to_rad
+from Mathy.matrix_view import MatrixView
+
+
+def _prod_flat(a: list, b: list) -> list:
+    """Multiply two flat, row-major 4x4 matrices with an unrolled product."""
+    a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+    b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+    return [
+        a0 * b0 + a1 * b4 + a2 * b8 + a3 * b12,
+        a0 * b1 + a1 * b5 + a2 * b9 + a3 * b13,
+        a0 * b2 + a1 * b6 + a2 * b10 + a3 * b14,
+        a0 * b3 + a1 * b7 + a2 * b11 + a3 * b15,
+        a4 * b0 + a5 * b4 + a6 * b8 + a7 * b12,
+        a4 * b1 + a5 * b5 + a6 * b9 + a7 * b13,
+        a4 * b2 + a5 * b6 + a6 * b10 + a7 * b14,
+        a4 * b3 + a5 * b7 + a6 * b11 + a7 * b15,
+        a8 * b0 + a9 * b4 + a10 * b8 + a11 * b12,
+        a8 * b1 + a9 * b5 + a10 * b9 + a11 * b13,
+        a8 * b2 + a9 * b6 + a10 * b10 + a11 * b14,
+        a8 * b3 + a9 * b7 + a10 * b11 + a11 * b15,
+        a12 * b0 + a13 * b4 + a14 * b8 + a15 * b12,
+        a12 * b1 + a13 * b5 + a14 * b9 + a15 * b13,
+        a12 * b2 + a13 * b6 + a14 * b10 + a15 * b14,
+        a12 * b3 + a13 * b7 + a14 * b11 + a15 * b15,
+    ]
 
 
 class Matrix4x4:
-    """A class to represent a 4 by 4 matrix."""
+    """
+    A class to represent a 4 by 4 matrix.
+
+    The entries are stored in a flat, row-major list (flat);
+    matrix[i][j] remains available through a view.
+    """
+
+    __slots__ = ("flat",)
 
     def __init__(
             self,
@@ -19,21 +51,25 @@ class Matrix4x4:
             x15: float | int, x16: float | int
             ):
         """Initialize a 4x4 matrix with the given values."""
-        self.matrix = [
-            [x1, x2, x3, x4], [x5, x6, x7, x8],
-            [x9, x10, x11, x12], [x13, x14, x15, x16]]
+        self.flat = [x1, x2, x3, x4, x5, x6, x7, x8,
+                     x9, x10, x11, x12, x13, x14, x15, x16]
+
+    @property
+    def matrix(self) -> MatrixView:
+        """Return a matrix[i][j] view on the entries."""
+        return MatrixView(self.flat, 4)
 
     def __repr__(self):
         """Return a string representation of the matrix."""
-        return f"Matrix4x4([\n {self.matrix[0]},\n {self.matrix[1]},\n {self.matrix[2]},\n {self.matrix[3]}\n])"  # noqa: E501
+        m = self.flat
+        return f"Matrix4x4([\n {m[0:4]},\n {m[4:8]},\n {m[8:12]},\n {m[12:16]}\n])"  # noqa: E501
 
     def __eq__(self, other: 'Matrix4x4') -> bool:
         """Check if two 4x4 matrices are equal."""
         if isinstance(other, Matrix4x4):
-            for i in range(4):
-                for j in range(4):
-                    if abs(self.matrix[i][j] - other.matrix[i][j]) >= 1e-9:
-                        return False
+            for a, b in zip(self.flat, other.flat):
+                if abs(a - b) >= 1e-9:
+                    return False
             return True
         else:
             raise TypeError(f"{other} is not a Matrix4x4")
@@ -41,17 +77,8 @@ class Matrix4x4:
     def add(self, other: 'Matrix4x4') -> 'Matrix4x4':
         """Add two 4x4 matrices."""
         if isinstance(other, Matrix4x4):
-            res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-            for i in range(4):
-                for j in range(4):
-                    res[i][j] = self.matrix[i][j] + other.matrix[i][j]
             # Return a new Matrix4x4 object with the result of the addition
-            return Matrix4x4(
-                res[0][0], res[0][1], res[0][2], res[0][3],
-                res[1][0], res[1][1], res[1][2], res[1][3],
-                res[2][0], res[2][1], res[2][2], res[2][3],
-                res[3][0], res[3][1], res[3][2], res[3][3],
-            )
+            return Matrix4x4(*[a + b for a, b in zip(self.flat, other.flat)])
         else:
             raise TypeError(f'{other} is not a Matrix4x4')
 
@@ -59,93 +86,218 @@ class Matrix4x4:
         """Multiply the matrix by a scalar value."""
         if not isinstance(scalar, (int, float)):
             raise TypeError(f'{scalar} is not a scalar')
-        res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-        for i in range(4):
-            for j in range(4):
-                res[i][j] = self.matrix[i][j] * scalar
         # Return a new Matrix4x4 object
         # with the result of the scalar multiplication
-        return Matrix4x4(
-            res[0][0], res[0][1], res[0][2], res[0][3],
-            res[1][0], res[1][1], res[1][2], res[1][3],
-            res[2][0], res[2][1], res[2][2], res[2][3],
-            res[3][0], res[3][1], res[3][2], res[3][3],
-        )
+        return Matrix4x4(*[a * scalar for a in self.flat])
+
+    @staticmethod
+    def _from_flat(flat: list) -> 'Matrix4x4':
+        """Wrap a flat list of 16 entries without copying it."""
+        result = Matrix4x4.__new__(Matrix4x4)
+        result.flat = flat
+        return result
 
     def prod(self, other: 'Matrix4x4') -> 'Matrix4x4':
         """Multiply two 4x4 matrices."""
         if isinstance(other, Matrix4x4):
-            a = self.matrix
-            b = other.matrix
-            res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-            for i in range(4):
-                for j in range(4):
-                    for k in range(4):
-                        res[i][j] += a[i][k] * b[k][j]
             # Return a new Matrix4x4 object
             # with the result of the matrix multiplication
-            return Matrix4x4(
-                res[0][0], res[0][1], res[0][2], res[0][3],
-                res[1][0], res[1][1], res[1][2], res[1][3],
-                res[2][0], res[2][1], res[2][2], res[2][3],
-                res[3][0], res[3][1], res[3][2], res[3][3],
-            )
+            return Matrix4x4._from_flat(_prod_flat(self.flat, other.flat))
         else:
             raise TypeError(f'{other} is not a Matrix4x4')
 
+    def prod_into(self, other: 'Matrix4x4',
+                  out: 'Matrix4x4') -> 'Matrix4x4':
+        """
+        Multiply two 4x4 matrices and write the result into out.
+
+        out may be self or other. Return out.
+        """
+        if isinstance(other, Matrix4x4) and isinstance(out, Matrix4x4):
+            out.flat[:] = _prod_flat(self.flat, other.flat)
+            return out
+        else:
+            raise TypeError(f'{other} or {out} is not a Matrix4x4')
+
+    def imul(self, other: 'Matrix4x4') -> 'Matrix4x4':
+        """Multiply the matrix in place by other (self = self * other)."""
+        return self.prod_into(other, self)
+
+    @staticmethod
+    def chain(*matrices: 'Matrix4x4') -> 'Matrix4x4':
+        """
+        Multiply a sequence of 4x4 matrices from left to right.
+
+        Only the final product is wrapped in a Matrix4x4 object.
+        """
+        if not matrices:
+            raise ValueError("chain() needs at least one matrix.")
+        for m in matrices:
+            if not isinstance(m, Matrix4x4):
+                raise TypeError(f'{m} is not a Matrix4x4')
+        flat = list(matrices[0].flat)
+        for m in matrices[1:]:
+            flat = _prod_flat(flat, m.flat)
+        return Matrix4x4._from_flat(flat)
+
+    def transform_points(self, points, out=None):
+        """
+        Multiply every vector of a vertex buffer by the matrix.
+
+        points is a Vector4Array or an (N, 4) NumPy array. The result is
+        written into out (same kind and shape) when given, so per-frame
+        transforms can reuse one buffer; out may be points itself.
+        Return the transformed buffer, of the same kind as points.
+        """
+        import numpy as np
+        from Mathy import Vector4Array
+        wrap = isinstance(points, Vector4Array)
+        data = points.data if wrap else np.asarray(points, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(
+                f"Expected an array of shape (N, 4), got {data.shape}.")
+        if out is None:
+            out_data = np.empty_like(data)
+        else:
+            out_data = out.data if isinstance(out, Vector4Array) else out
+            if out_data.shape != data.shape:
+                raise ValueError("out must have the same shape as points.")
+        # Row vectors: (M v)^T = v^T M^T
+        m = np.array(self.flat, dtype=np.float64).reshape(4, 4)
+        np.matmul(data, m.T, out=out_data)
+        if out is not None:
+            return out
+        return Vector4Array._wrap(out_data) if wrap else out_data
+
     def determinant(self) -> float:
         """Calculate the determinant of a 4x4 matrix."""
-        a, b, c, d = self.matrix[0]
-        e, f, g, h = self.matrix[1]
-        i, j, k, l_ = self.matrix[2]
-        m, n, o, p = self.matrix[3]
-        # The determinant of a 4x4 matrix is calculated as
-        # det = a * det(mat1) − b * det(mat2) + c * det(mat3) - d * det(mat4)
-        # where mat1, mat2, mat3 and mat4 are 3x3 submatrices
-        # 1) Extract the submatrices from our 4x4 matrix
-        mat1 = Matrix3x3(f, g, h, j, k, l_, n, o, p)
-        mat2 = Matrix3x3(e, g, h, i, k, l_, m, o, p)
-        mat3 = Matrix3x3(e, f, h, i, j, l_, m, n, p)
-        mat4 = Matrix3x3(e, f, g, i, j, k, m, n, o)
-        # 2) Get the determinants of each submatrix
-        det1 = mat1.determinant()
-        det2 = mat2.determinant()
-        det3 = mat3.determinant()
-        det4 = mat4.determinant()
-        # 3) Apply the formula
-        return (a * det1 - b * det2 + c * det3 - d * det4)
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self.flat
+        # Laplace expansion along the first two rows: products of the 2x2
+        # minors of rows 0-1 and of the complementary minors of rows 2-3
+        s0 = a00 * a11 - a10 * a01
+        s1 = a00 * a12 - a10 * a02
+        s2 = a00 * a13 - a10 * a03
+        s3 = a01 * a12 - a11 * a02
+        s4 = a01 * a13 - a11 * a03
+        s5 = a02 * a13 - a12 * a03
+        c0 = a20 * a31 - a30 * a21
+        c1 = a20 * a32 - a30 * a22
+        c2 = a20 * a33 - a30 * a23
+        c3 = a21 * a32 - a31 * a22
+        c4 = a21 * a33 - a31 * a23
+        c5 = a22 * a33 - a32 * a23
+        return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+    def is_affine(self) -> bool:
+        """Check if the last row is (0, 0, 0, 1)."""
+        m = self.flat
+        return m[12] == 0 and m[13] == 0 and m[14] == 0 and m[15] == 1
+
+    def inverse(self) -> 'Matrix4x4':
+        """
+        Calculate the inverse of the matrix in closed form.
+
+        The adjugate is built from the twelve 2x2 minors shared with
+        determinant. Affine matrices, whose last row is (0, 0, 0, 1), take
+        a faster path: the 3x3 part is inverted and the translation is
+        moved back through it.
+        Raise a ValueError if the matrix is singular.
+        """
+        if self.is_affine():
+            return self._affine_inverse()
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self.flat
+        s0 = a00 * a11 - a10 * a01
+        s1 = a00 * a12 - a10 * a02
+        s2 = a00 * a13 - a10 * a03
+        s3 = a01 * a12 - a11 * a02
+        s4 = a01 * a13 - a11 * a03
+        s5 = a02 * a13 - a12 * a03
+        c0 = a20 * a31 - a30 * a21
+        c1 = a20 * a32 - a30 * a22
+        c2 = a20 * a33 - a30 * a23
+        c3 = a21 * a32 - a31 * a22
+        c4 = a21 * a33 - a31 * a23
+        c5 = a22 * a33 - a32 * a23
+        det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+        if abs(det) < 1e-12:
+            raise ValueError("Singular matrix is not invertible.")
+        k = 1 / det
+        return Matrix4x4._from_flat([
+            (a11 * c5 - a12 * c4 + a13 * c3) * k,
+            (-a01 * c5 + a02 * c4 - a03 * c3) * k,
+            (a31 * s5 - a32 * s4 + a33 * s3) * k,
+            (-a21 * s5 + a22 * s4 - a23 * s3) * k,
+            (-a10 * c5 + a12 * c2 - a13 * c1) * k,
+            (a00 * c5 - a02 * c2 + a03 * c1) * k,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * k,
+            (a20 * s5 - a22 * s2 + a23 * s1) * k,
+            (a10 * c4 - a11 * c2 + a13 * c0) * k,
+            (-a00 * c4 + a01 * c2 - a03 * c0) * k,
+            (a30 * s4 - a31 * s2 + a33 * s0) * k,
+            (-a20 * s4 + a21 * s2 - a23 * s0) * k,
+            (-a10 * c3 + a11 * c1 - a12 * c0) * k,
+            (a00 * c3 - a01 * c1 + a02 * c0) * k,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * k,
+            (a20 * s3 - a21 * s1 + a22 * s0) * k,
+        ])
+
+    def _affine_inverse(self) -> 'Matrix4x4':
+        """Invert an affine matrix through its 3x3 part."""
+        a, b, c, tx, d, e, f, ty, g, h, i, tz = self.flat[:12]
+        # Cofactors of the first column
+        A0 = e * i - f * h
+        A1 = f * g - d * i
+        A2 = d * h - e * g
+        det = a * A0 + b * A1 + c * A2
+        if abs(det) < 1e-12:
+            raise ValueError("Singular matrix is not invertible.")
+        k = 1 / det
+        r00, r01, r02 = A0 * k, (c * h - b * i) * k, (b * f - c * e) * k
+        r10, r11, r12 = A1 * k, (a * i - c * g) * k, (c * d - a * f) * k
+        r20, r21, r22 = A2 * k, (b * g - a * h) * k, (a * e - b * d) * k
+        return Matrix4x4._from_flat([
+            r00, r01, r02, -(r00 * tx + r01 * ty + r02 * tz),
+            r10, r11, r12, -(r10 * tx + r11 * ty + r12 * tz),
+            r20, r21, r22, -(r20 * tx + r21 * ty + r22 * tz),
+            0, 0, 0, 1
+        ])
+
+    def rigid_inverse(self) -> 'Matrix4x4':
+        """
+        Calculate the inverse of a rigid transformation.
+
+        The matrix must be a rotation followed by a translation, which is
+        not checked: the rotation is transposed and the translation moved
+        back through it, without any division.
+        """
+        a, b, c, tx, d, e, f, ty, g, h, i, tz = self.flat[:12]
+        return Matrix4x4._from_flat([
+            a, d, g, -(a * tx + d * ty + g * tz),
+            b, e, h, -(b * tx + e * ty + h * tz),
+            c, f, i, -(c * tx + f * ty + i * tz),
+            0, 0, 0, 1
+        ])
 
     def lerp(self, other: 'Matrix4x4', t: float) -> 'Matrix4x4':
         """Linearly interpolate between two 4x4 matrices."""
         if isinstance(other, Matrix4x4) and isinstance(t, (int, float)):
-            res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-            for i in range(4):
-                for j in range(4):
-                    res[i][j] = self.matrix[i][j] + t * (other.matrix.matrix[i][j] - self.matrix[i][j])
-            return Matrix4x4(
-                res[0][0], res[0][1], res[0][2], res[0][3],
-                res[1][0], res[1][1], res[1][2], res[1][3],
-                res[2][0], res[2][1], res[2][2], res[2][3],
-                res[3][0], res[3][1], res[3][2], res[3][3],
-            )
+            return Matrix4x4(*[a + t * (b - a)
+                               for a, b in zip(self.flat, other.flat)])
         else:
-            raise TypeError(f'{other} is not a Matrix4x4 or {t} is not a number.')
+            raise TypeError(f'{other} is not a Matrix4x4 or {t} is not a number.')  # noqa: E501
 
     def round(self, decimal: int) -> 'Matrix4x4':
         """Return a rounded approximation of the matrix's contents."""
         if (decimal >= 0 and isinstance(decimal, int)):
-            res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-            for i in range(4):
-                for j in range(4):
-                    res[i][j] = round(self.matrix[i][j], decimal)
-                    if abs(res[i][j]) < 10**(-decimal):
-                        res[i][j] = 0.0
-            return Matrix4x4(
-                res[0][0], res[0][1], res[0][2], res[0][3],
-                res[1][0], res[1][1], res[1][2], res[1][3],
-                res[2][0], res[2][1], res[2][2], res[2][3],
-                res[3][0], res[3][1], res[3][2], res[3][3],
-                )
+            res = []
+            for value in self.flat:
+                value = round(value, decimal)
+                if abs(value) < 10**(-decimal):
+                    value = 0.0
+                res.append(value)
+            return Matrix4x4(*res)
         else:
             if (decimal < 0):
                 raise ValueError(f'{decimal} should not be negative.')
@@ -156,6 +308,8 @@ class Matrix4x4:
 class TranslationMatrix4x4(Matrix4x4):
     """A class to represent a 4 by 4 translation matrix."""
 
+    __slots__ = ("a", "b", "c")
+
     def __init__(self, a, b, c):
         """Initialize a translation matrix."""
         super().__init__(
@@ -177,6 +331,8 @@ class RotationMatrix4x4_x(Matrix4x4):
         theta (float): Angle of rotation in degrees.
     """
 
+    __slots__ = ("t_radians",)
+
     def __init__(self, t_degrees):
         """Initialize a rotation matrix."""
         theta = deg_to_rad(t_degrees)  # Convert degrees to radians
@@ -197,6 +353,8 @@ class RotationMatrix4x4_y(Matrix4x4):
         theta (float): Angle of rotation in degrees.
     """
 
+    __slots__ = ("t_radians",)
+
     def __init__(self, t_degrees):
         """Initialize a rotation matrix."""
         theta = deg_to_rad(t_degrees)  # Convert degrees to radians
@@ -217,6 +375,8 @@ class RotationMatrix4x4_z(Matrix4x4):
         theta (float): Angle of rotation in degrees.
     """
 
+    __slots__ = ("t_radians",)
+
     def __init__(self, t_degrees):
         """Initialize a rotation matrix."""
         theta = deg_to_rad(t_degrees)  # Convert degrees to radians
@@ -232,6 +392,8 @@ class RotationMatrix4x4_z(Matrix4x4):
 class HomothetyMatrix4x4(Matrix4x4):
     """A class to represent a 4 by 4 homothety matrix."""
 
+    __slots__ = ("k",)
+
     def __init__(self, k):
         """Initialize a homotethy matrix."""
         super().__init__(
@@ -246,6 +408,8 @@ class HomothetyMatrix4x4(Matrix4x4):
 class AnisotropicMatrix4x4(Matrix4x4):
     """A class to represent an anisotropic scaling matrix."""
 
+    __slots__ = ("sx", "sy", "sz")
+
     def __init__(self, sx, sy, sz):
         """Initialize an anisotropic scaling matrix."""
         super().__init__(
@@ -262,12 +426,14 @@ class AnisotropicMatrix4x4(Matrix4x4):
 class TotalRotationMatrix4x4(Matrix4x4):
     """A class to represent a rotation matrix combining x, y, and z axes."""
 
+    __slots__ = ("rot_x", "rot_y", "rot_z")
+
     def __init__(self,
                  rot_x: RotationMatrix4x4_x,
                  rot_y: RotationMatrix4x4_y,
                  rot_z: RotationMatrix4x4_z):
         """Initialize a multi-axis rotation matrix."""
-        self.matrix = (rot_z.prod(rot_y)).prod(rot_x)
+        self.flat = Matrix4x4.chain(rot_z, rot_y, rot_x).flat
         self.rot_x = rot_x
         self.rot_y = rot_y
         self.rot_z = rot_z
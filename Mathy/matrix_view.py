@@ -0,0 +1,93 @@
+"""Defines nested-list views on the flat storage of square matrices."""
+
+
+class RowView:
+    """A view on one row of a flat, row-major matrix storage."""
+
+    __slots__ = ("flat", "offset", "size")
+
+    def __init__(self, flat: list, offset: int, size: int):
+        """Initialize a view on flat[offset:offset + size]."""
+        self.flat = flat
+        self.offset = offset
+        self.size = size
+
+    def _index(self, j: int) -> int:
+        """Return the flat index of column j."""
+        if j < 0:
+            j += self.size
+        if not 0 <= j < self.size:
+            raise IndexError("matrix column index out of range")
+        return self.offset + j
+
+    def __getitem__(self, j):
+        """Return the entry in column j (or a list for a slice)."""
+        if isinstance(j, slice):
+            return self.flat[self.offset:self.offset + self.size][j]
+        return self.flat[self._index(j)]
+
+    def __setitem__(self, j: int, value):
+        """Write the entry in column j into the matrix."""
+        self.flat[self._index(j)] = value
+
+    def __len__(self) -> int:
+        """Return the number of columns."""
+        return self.size
+
+    def __iter__(self):
+        """Iterate over the entries of the row."""
+        return iter(self.flat[self.offset:self.offset + self.size])
+
+    def __eq__(self, other) -> bool:
+        """Compare the row with any sequence, like a list would."""
+        return list(self) == list(other)
+
+    def __repr__(self):
+        """Return the row formatted as a list."""
+        return repr(self.flat[self.offset:self.offset + self.size])
+
+
+class MatrixView:
+    """
+    A view giving matrix[i][j] access to a flat, row-major storage.
+
+    Reads and writes go straight to the underlying matrix.
+    """
+
+    __slots__ = ("flat", "size")
+
+    def __init__(self, flat: list, size: int):
+        """Initialize a view on a size by size flat storage."""
+        self.flat = flat
+        self.size = size
+
+    def __getitem__(self, i):
+        """Return a view on row i (or a list of row views for a slice)."""
+        if isinstance(i, slice):
+            return [self[k] for k in range(self.size)[i]]
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("matrix row index out of range")
+        return RowView(self.flat, i * self.size, self.size)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.size
+
+    def __iter__(self):
+        """Iterate over the row views."""
+        return (self[i] for i in range(self.size))
+
+    def __eq__(self, other) -> bool:
+        """Compare the rows with any nested sequence, like a list would."""
+        return self.tolist() == [list(row) for row in other]
+
+    def tolist(self) -> list[list]:
+        """Return a copy of the matrix as nested lists."""
+        n = self.size
+        return [self.flat[i:i + n] for i in range(0, n * n, n)]
+
+    def __repr__(self):
+        """Return the matrix formatted as nested lists."""
+        return repr(self.tolist())
@@ -0,0 +1,90 @@
+"""Defines a Mesh class holding geometry shared between game objects."""
+
+import numpy as np
+
+from Mathy import Triangle3D, Vector3, Vector4Array
+
+
+class Mesh:
+    """
+    Immutable geometry, built once and shared by any number of objects.
+
+    A mesh holds the vertices, the indices and the texture coordinates of
+    a model, together with everything derived from them once for all: the
+    homogeneous vertices, the Triangle3D list, the vertex, index and
+    corner buffers of the renderer and the local bounding volumes.
+    Attributes cannot be reassigned and the NumPy buffers are read-only;
+    to edit the geometry, build a new Mesh.
+    """
+
+    __slots__ = ("name", "vertices", "indices", "uv", "homogeneous_vertices",
+                 "triangles", "vertex_buffer", "index_buffer",
+                 "corner_buffer", "bounding_box", "bounding_sphere")
+
+    def __init__(self, vertices: list[Vector3], indices: list[int],
+                 uv: list[tuple[float, float]] = None, name: str = "Mesh"):
+        """Build the mesh and its derived data."""
+        if uv is not None and len(uv) != len(vertices):
+            raise ValueError("uv must hold one (u, v) pair per vertex.")
+        vertices = tuple(vertices)
+        indices = tuple(indices[:len(indices) // 3 * 3])
+        uv = tuple(uv) if uv else None
+        homogeneous_vertices = tuple(v.homogenize() for v in vertices)
+        triangles = []
+        for i in range(0, len(indices), 3):
+            a, b, c = indices[i], indices[i + 1], indices[i + 2]
+            triangles.append(Triangle3D(
+                vertices[a].homogenize(), vertices[b].homogenize(),
+                vertices[c].homogenize(),
+                {"pa": a, "pb": b, "pc": c},
+                (uv[a], uv[b], uv[c]) if uv else ((0, 0), (0, 0), (0, 0))))
+        vertex_buffer = Vector4Array.from_vectors(homogeneous_vertices)
+        index_buffer = np.array(indices, dtype=np.intp).reshape(-1, 3)
+        corner_buffer = Vector4Array.from_vectors(
+            [p for t in triangles for p in t.get_vertices()])
+        for array in (vertex_buffer.data, index_buffer, corner_buffer.data):
+            array.flags.writeable = False
+
+        setattr_ = object.__setattr__
+        setattr_(self, "name", name)
+        setattr_(self, "vertices", vertices)
+        setattr_(self, "indices", indices)
+        setattr_(self, "uv", uv)
+        setattr_(self, "homogeneous_vertices", homogeneous_vertices)
+        setattr_(self, "triangles", tuple(triangles))
+        setattr_(self, "vertex_buffer", vertex_buffer)
+        setattr_(self, "index_buffer", index_buffer)
+        setattr_(self, "corner_buffer", corner_buffer)
+        setattr_(self, "bounding_box", None)
+        setattr_(self, "bounding_sphere", None)
+        if vertices:
+            self._compute_bounds()
+
+    def _compute_bounds(self):
+        """Compute the axis-aligned box and the sphere around it."""
+        xs = [v.x for v in self.vertices]
+        ys = [v.y for v in self.vertices]
+        zs = [v.z for v in self.vertices]
+        low = Vector3(min(xs), min(ys), min(zs))
+        high = Vector3(max(xs), max(ys), max(zs))
+        # The sphere is centered on the box, its radius is the distance to
+        # the farthest vertex
+        center = Vector3((low.x + high.x) / 2, (low.y + high.y) / 2,
+                         (low.z + high.z) / 2)
+        radius = max((v.x - center.x) ** 2 + (v.y - center.y) ** 2
+                     + (v.z - center.z) ** 2 for v in self.vertices) ** 0.5
+        object.__setattr__(self, "bounding_box", (low, high))
+        object.__setattr__(self, "bounding_sphere", (center, radius))
+
+    def __setattr__(self, name, value):
+        """Forbid reassigning the attributes of a built mesh."""
+        raise AttributeError("Mesh objects are immutable.")
+
+    def __delattr__(self, name):
+        """Forbid deleting the attributes of a built mesh."""
+        raise AttributeError("Mesh objects are immutable.")
+
+    def __repr__(self):
+        """Return a string representation of the mesh."""
+        return (f"Mesh({self.name!r}, {len(self.vertices)} vertices, "
+                f"{len(self.triangles)} triangles)")
@@ -0,0 +1,215 @@
+"""Functions to optimize the vertex and index lists of a mesh."""
+
+import math
+
+from Mathy import Vector3
+
+_NEIGHBOR_CELLS = [(i, j, k) for i in (-1, 0, 1)
+                   for j in (-1, 0, 1) for k in (-1, 0, 1)]
+
+
+def weld_vertices(
+    vertices: list[Vector3],
+    indices: list[int],
+    uv: list[tuple[float, float]] = None,
+    tolerance: float = 1e-6
+) -> tuple[list[Vector3], list[int], list, list[int]]:
+    """
+    Merge the vertices closer than tolerance to each other.
+
+    Two vertices are welded when every coordinate differs by at most
+    tolerance and, if uv is given, so do their texture coordinates.
+    Candidates are found with a hash grid of cell size tolerance, so the
+    pass is linear in the number of vertices.
+    Triangles collapsed by the weld are dropped.
+
+    Returns (vertices, indices, uv, remap) where remap[i] is the new index
+    of the old vertex i.
+    """
+    if tolerance <= 0:
+        raise ValueError("The tolerance must be positive.")
+    grid = {}
+    welded = []
+    welded_uv = [] if uv else None
+    remap = []
+    for i, vertex in enumerate(vertices):
+        p = (vertex.x, vertex.y, vertex.z)
+        t = uv[i] if uv else None
+        cell = (math.floor(p[0] / tolerance), math.floor(p[1] / tolerance),
+                math.floor(p[2] / tolerance))
+        match = None
+        for di, dj, dk in _NEIGHBOR_CELLS:
+            key = (cell[0] + di, cell[1] + dj, cell[2] + dk)
+            for candidate in grid.get(key, ()):
+                q = welded[candidate]
+                if (abs(p[0] - q.x) <= tolerance
+                        and abs(p[1] - q.y) <= tolerance
+                        and abs(p[2] - q.z) <= tolerance
+                        and (t is None
+                             or (abs(t[0] - welded_uv[candidate][0])
+                                 <= tolerance
+                                 and abs(t[1] - welded_uv[candidate][1])
+                                 <= tolerance))):
+                    match = candidate
+                    break
+            if match is not None:
+                break
+        if match is None:
+            match = len(welded)
+            welded.append(vertex)
+            if welded_uv is not None:
+                welded_uv.append(t)
+            grid.setdefault(cell, []).append(match)
+        remap.append(match)
+
+    new_indices = []
+    for i in range(0, len(indices) - len(indices) % 3, 3):
+        a = remap[indices[i]]
+        b = remap[indices[i + 1]]
+        c = remap[indices[i + 2]]
+        if a != b and b != c and a != c:
+            new_indices.extend((a, b, c))
+    return welded, new_indices, welded_uv, remap
+
+
+# Post-transform cache size the meshes are optimized for and measured with
+DEFAULT_CACHE_SIZE = 32
+
+# Scoring constants of Forsyth's linear-speed vertex cache optimization
+_CACHE_DECAY_POWER = 1.5
+_LAST_TRIANGLE_SCORE = 0.75
+_VALENCE_BOOST_SCALE = 2.0
+_VALENCE_BOOST_POWER = 0.5
+
+
+def average_cache_miss_ratio(indices: list[int],
+                             cache_size: int = DEFAULT_CACHE_SIZE) -> float:
+    """
+    Compute the average cache miss ratio (ACMR) of an index list.
+
+    A FIFO post-transform cache of cache_size vertices is simulated, and
+    the number of vertices transformed is divided by the number of
+    triangles. The ideal value for a regular grid is about 0.5 and the
+    worst is 3.
+    """
+    triangle_count = len(indices) // 3
+    if triangle_count == 0:
+        return 0.0
+    cache = []
+    cached = set()
+    misses = 0
+    for index in indices[:triangle_count * 3]:
+        if index not in cached:
+            misses += 1
+            cache.append(index)
+            cached.add(index)
+            if len(cache) > cache_size:
+                cached.discard(cache.pop(0))
+    return misses / triangle_count
+
+
+def _vertex_score(cache_position: int, remaining: int,
+                  cache_size: int) -> float:
+    """Return the Forsyth score of a vertex."""
+    if remaining == 0:
+        return -1.0
+    score = 0.0
+    if cache_position >= 0:
+        if cache_position < 3:
+            # The last triangle's vertices get a fixed score, so that
+            # strips are not favoured over fans
+            score = _LAST_TRIANGLE_SCORE
+        else:
+            scaler = 1.0 / (cache_size - 3)
+            score = (1.0 - (cache_position - 3) * scaler) \
+                ** _CACHE_DECAY_POWER
+    # Boost vertices with few triangles left, to finish them off first
+    return score + _VALENCE_BOOST_SCALE * remaining ** -_VALENCE_BOOST_POWER
+
+
+def optimize_vertex_cache(indices: list[int], vertex_count: int,
+                          cache_size: int = DEFAULT_CACHE_SIZE) -> list[int]:
+    """
+    Reorder triangles to improve post-transform vertex cache hits.
+
+    Implements Tom Forsyth's linear-speed vertex cache optimization:
+    triangles are emitted greedily by score, the score of a triangle being
+    the sum of its vertex scores, which favour vertices recently used
+    (still in a simulated LRU cache) and vertices with few triangles left.
+    Returns the reordered index list; triangles keep their winding.
+    """
+    if cache_size <= 3:
+        raise ValueError("The cache size must be greater than 3.")
+    triangle_count = len(indices) // 3
+    triangles = [tuple(indices[3 * t:3 * t + 3])
+                 for t in range(triangle_count)]
+    vertex_triangles = [[] for _ in range(vertex_count)]
+    for t, triangle in enumerate(triangles):
+        for v in triangle:
+            vertex_triangles[v].append(t)
+    cache_position = [-1] * vertex_count
+    vertex_scores = [_vertex_score(-1, len(vertex_triangles[v]), cache_size)
+                     for v in range(vertex_count)]
+    triangle_scores = [sum(vertex_scores[v] for v in triangle)
+                       for triangle in triangles]
+    emitted = [False] * triangle_count
+
+    result = []
+    cache = []
+    best = max(range(triangle_count), key=triangle_scores.__getitem__,
+               default=-1)
+    while best >= 0:
+        emitted[best] = True
+        triangle = triangles[best]
+        result.extend(triangle)
+        for v in triangle:
+            vertex_triangles[v].remove(best)
+        # Move the triangle's vertices to the front of the cache
+        cache = list(triangle) + [v for v in cache if v not in triangle]
+        evicted = cache[cache_size:]
+        cache = cache[:cache_size]
+        for v in evicted:
+            cache_position[v] = -1
+        # Update the scores of the vertices whose position changed
+        touched = set()
+        for position, v in enumerate(cache):
+            cache_position[v] = position
+        for v in cache + evicted:
+            vertex_scores[v] = _vertex_score(
+                cache_position[v], len(vertex_triangles[v]), cache_size)
+            touched.update(vertex_triangles[v])
+        # Pick the best triangle among those touching the cache
+        best = -1
+        best_score = -1.0
+        for t in touched:
+            score = sum(vertex_scores[v] for v in triangles[t])
+            triangle_scores[t] = score
+            if score > best_score:
+                best = t
+                best_score = score
+        if best < 0:
+            # Nothing left around the cache: restart from the best remaining
+            # triangle. The scores of the triangles not touched above are
+            # still up to date, as none of their vertices changed
+            best = max((t for t in range(triangle_count) if not emitted[t]),
+                       key=triangle_scores.__getitem__, default=-1)
+    return result
+
+
+def optimize_vertex_fetch(vertices: list, indices: list[int],
+                          uv: list = None) -> tuple[list, list[int], list]:
+    """
+    Renumber vertices in order of first use by the index list.
+
+    Vertices that are not referenced are dropped.
+    Returns (vertices, indices, uv).
+    """
+    remap = {}
+    new_indices = []
+    for index in indices:
+        if index not in remap:
+            remap[index] = len(remap)
+        new_indices.append(remap[index])
+    order = sorted(remap, key=remap.__getitem__)
+    new_uv = [uv[i] for i in order] if uv else uv
+    return [vertices[i] for i in order], new_indices, new_uv
@@ -11,32 +11,106 @@ class Projection:
     For a vertex in camera space, multiplying by the projection matrix will
     return a new vector in clip space, which can then be transformed
     to screen space.
+    The projection matrix is cached and only rebuilt after width, height,
+    fov, near_plane or far_plane is reassigned.
     """
 
     def __init__(self, width, height, fov, near_plane, far_plane):
         """Initialize the projection."""
+        # Incremented every time the projection matrix becomes stale
+        self.version = 0
+        self._projection_matrix = None
         self.width = width
         self.height = height
-        # Aspect ratio of the viewport (width/height)
-        self.aspect_ratio = width / height
         self.fov = fov  # Field of view in degrees
-        self.fovRad = fov * (pi / 180)
         self.near_plane = near_plane  # Near clipping plane distance
         self.far_plane = far_plane  # Far clipping plane distance
 
+    @property
+    def width(self):
+        """Return the viewport width."""
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        """Change the viewport width and invalidate the cached matrix."""
+        self._width = value
+        self.mark_dirty()
+
+    @property
+    def height(self):
+        """Return the viewport height."""
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        """Change the viewport height and invalidate the cached matrix."""
+        self._height = value
+        self.mark_dirty()
+
+    @property
+    def fov(self):
+        """Return the field of view in degrees."""
+        return self._fov
+
+    @fov.setter
+    def fov(self, value):
+        """Change the field of view and invalidate the cached matrix."""
+        self._fov = value
+        self.mark_dirty()
+
+    @property
+    def near_plane(self):
+        """Return the near clipping plane distance."""
+        return self._near_plane
+
+    @near_plane.setter
+    def near_plane(self, value):
+        """Move the near clipping plane and invalidate the cached matrix."""
+        self._near_plane = value
+        self.mark_dirty()
+
+    @property
+    def far_plane(self):
+        """Return the far clipping plane distance."""
+        return self._far_plane
+
+    @far_plane.setter
+    def far_plane(self, value):
+        """Move the far clipping plane and invalidate the cached matrix."""
+        self._far_plane = value
+        self.mark_dirty()
+
+    @property
+    def aspect_ratio(self):
+        """Aspect ratio of the viewport (width/height)."""
+        return self.width / self.height
+
+    @property
+    def fovRad(self):
+        """Field of view in radians."""
+        return self.fov * (pi / 180)
+
+    def mark_dirty(self):
+        """Invalidate the cached projection matrix."""
+        self._projection_matrix = None
+        self.version += 1
+
     def get_projection_matrix(self):
         """Return a projection matrix to switch from camera to clip space."""
+        if self._projection_matrix is not None:
+            return self._projection_matrix
         f = 1 / tan(self.fovRad / 2)
         nf = 1 / (self.near_plane - self.far_plane)
 
-        projection_matrix = Matrix4x4(
+        self._projection_matrix = Matrix4x4(
             f / self.aspect_ratio, 0, 0, 0,
             0, f, 0, 0,
             0, 0, (self.far_plane + self.near_plane) * nf, 2 * self.far_plane * self.near_plane * nf,  # noqa: E501
             0, 0, -1, 0
         )
 
-        return projection_matrix
+        return self._projection_matrix
 
     def get_screen_coordinates(self, vertex: Vector4):
         """
@@ -59,3 +133,34 @@ class Projection:
         y_screen = (1 - y_ndc)/2 * self.height
 
         return Vector4(x_screen, y_screen, z, 1)
+
+    def clip_to_screen(self, vertices, out=None):
+        """
+        Convert a batch of clip space vertices to screen coordinates.
+
+        Vectorized equivalent of get_screen_coordinates for a Vector4Array
+        or an (N, 4) array. The result, (x_screen, y_screen, z_ndc, 1) rows,
+        is written into out when given.
+        """
+        import numpy as np
+        from Mathy import Vector4Array
+        wrap = isinstance(vertices, Vector4Array)
+        clip = vertices.data if wrap else np.asarray(vertices, dtype=float)
+        if out is None:
+            result = np.empty_like(clip)
+        else:
+            result = out.data if isinstance(out, Vector4Array) else out
+        w = clip[:, 3]
+        valid = np.abs(w) > 1e-9
+        # Perform perspective division (vertices with w = 0 map to 0)
+        inverse_w = np.divide(1.0, w, out=np.zeros_like(w), where=valid)
+        x_ndc = clip[:, 0] * inverse_w
+        y_ndc = clip[:, 1] * inverse_w
+        result[:, 2] = clip[:, 2] * inverse_w
+        # Convert to screen coordinates
+        result[:, 0] = (x_ndc + 1) / 2 * self.width
+        result[:, 1] = (1 - y_ndc) / 2 * self.height
+        result[:, 3] = 1
+        if out is not None:
+            return out
+        return Vector4Array._wrap(result) if wrap else result
@@ -3,17 +3,25 @@
 import math
 from Mathy import Matrix4x4
 
+# Above this cosine of the angle between two rotations, slerp falls back to
+# a normalized linear interpolation, as the sine of the angle vanishes
+SLERP_THRESHOLD = 0.9995
+
 
 class Quaternion:
     """Define a quaternion class."""
 
+    __slots__ = ("w", "x", "y", "z")
+
     def __init__(self,
                  w: float | int,
                  x: float | int,
                  y: float | int,
                  z: float | int):
         """Initialize a quaternion with the given values."""
-        if all(isinstance(i, (int, float)) for i in [x, y, z, w]):
+        if (isinstance(w, (int, float)) and isinstance(x, (int, float))
+                and isinstance(y, (int, float))
+                and isinstance(z, (int, float))):
             self.w = w
             self.x = x
             self.y = y
@@ -93,17 +101,36 @@ class Quaternion:
             raise TypeError(f"{other} is not a Quaternion")
 
     def power(self, exponent: float | int) -> 'Quaternion':
-        """Raise the quaternion to a power and return a new Quaternion."""
+        """
+        Raise the quaternion to a real power and return a new Quaternion.
+
+        With q = |q| (cos(theta) + n sin(theta)), q^t is
+        |q|^t (cos(t theta) + n sin(t theta)): constant time, whatever the
+        exponent, and fractional exponents give a fraction of the rotation.
+        """
         if not isinstance(exponent, (int, float)):
             raise TypeError(f"{exponent} is not a number.")
         if exponent == 0:
             return Quaternion(1, 0, 0, 0)
-        result = self
-        for _ in range(int(abs(exponent)) - 1):
-            result = result.prod(self)
-        if exponent < 0:
-            return result.inverse
-        return result
+        n = self.norm
+        if n < 1e-9:
+            if exponent < 0:
+                raise ValueError("Null quaternion is not invertible.")
+            return Quaternion(0, 0, 0, 0)
+        v = (self.x**2 + self.y**2 + self.z**2)**0.5
+        theta = math.atan2(v, self.w)
+        r = n**exponent
+        angle = exponent * theta
+        if v < 1e-12:
+            # Real quaternion: no rotation axis. A negative one is a half
+            # turn about any axis, pick x so that the norm is kept
+            if self.w < 0:
+                return Quaternion(r * math.cos(angle), r * math.sin(angle),
+                                  0, 0)
+            return Quaternion(r * math.cos(angle), 0, 0, 0)
+        k = r * math.sin(angle) / v
+        return Quaternion(r * math.cos(angle), k * self.x, k * self.y,
+                          k * self.z)
 
     def euler_to_quaternion(angle_x, angle_y, angle_z) -> 'Quaternion':
         """Convert Euler angles (in radians) to a quaternion."""
@@ -137,24 +164,111 @@ class Quaternion:
             2*(x*z - w*y),       2*(y*z + w*x),       1 - 2*(x**2 + y**2), 0,
             0,                   0,                   0,                   1
         )
-        
-    def slerp(self, q2, t):
+
+    @staticmethod
+    def from_rotation_matrix(matrix: 'Matrix4x4') -> 'Quaternion':
+        """Convert the rotation part of a 4x4 matrix to a unit quaternion."""
+        m = matrix.flat
+        m00, m01, m02 = m[0], m[1], m[2]
+        m10, m11, m12 = m[4], m[5], m[6]
+        m20, m21, m22 = m[8], m[9], m[10]
+        trace = m00 + m11 + m22
+        # Divide by the largest of the four candidate terms, so that the
+        # square root never comes close to zero
+        if trace > 0:
+            s = 2 * (1 + trace) ** 0.5
+            q = Quaternion(s / 4, (m21 - m12) / s, (m02 - m20) / s,
+                           (m10 - m01) / s)
+        elif m00 > m11 and m00 > m22:
+            s = 2 * (1 + m00 - m11 - m22) ** 0.5
+            q = Quaternion((m21 - m12) / s, s / 4, (m01 + m10) / s,
+                           (m02 + m20) / s)
+        elif m11 > m22:
+            s = 2 * (1 + m11 - m00 - m22) ** 0.5
+            q = Quaternion((m02 - m20) / s, (m01 + m10) / s, s / 4,
+                           (m12 + m21) / s)
+        else:
+            s = 2 * (1 + m22 - m00 - m11) ** 0.5
+            q = Quaternion((m10 - m01) / s, (m02 + m20) / s,
+                           (m12 + m21) / s, s / 4)
+        return q.normalize()
+
+    def slerp(self, q2: 'Quaternion', t: float) -> 'Quaternion':
         """
-        Perform SLERP between two quaternions q1 and q2 at time t.  
-        q1, q2: Quaternions  
-        t: Interpolation factor (0 <= t <= 1)  
-        Returns interpolated Quaternion.
+        Spherically interpolate between two rotations at factor t.
+
+        The result turns at constant speed along the shortest arc from
+        self (t = 0) to q2 (t = 1). Nearly parallel rotations, for which
+        the arc angle is too small to divide by its sine, fall back to a
+        normalized linear interpolation. Both inputs are normalized.
         """
         if not isinstance(q2, Quaternion):
             raise TypeError(f"{q2} is not a Quaternion")
         if not (0 <= t <= 1):
             raise ValueError("Interpolation factor t must be in [0, 1]")
-        
         q1 = self.normalize()
         q2 = q2.normalize()
-        
-        delta_q = q2.prod(q1.inverse)
-        
-        q_t = delta_q.power(t)
-        
-        return q1.prod(q_t).normalize()
\ No newline at end of file
+        dot = q1.w * q2.w + q1.x * q2.x + q1.y * q2.y + q1.z * q2.z
+        if dot < 0:
+            # q and -q are the same rotation: take the shortest arc
+            q2 = Quaternion(-q2.w, -q2.x, -q2.y, -q2.z)
+            dot = -dot
+        if dot > SLERP_THRESHOLD:
+            k1, k2 = 1 - t, t
+        else:
+            theta = math.acos(dot)
+            sin_theta = math.sqrt(1 - dot * dot)
+            k1 = math.sin((1 - t) * theta) / sin_theta
+            k2 = math.sin(t * theta) / sin_theta
+        result = Quaternion(k1 * q1.w + k2 * q2.w, k1 * q1.x + k2 * q2.x,
+                            k1 * q1.y + k2 * q2.y, k1 * q1.z + k2 * q2.z)
+        return result.normalize()
+
+    @staticmethod
+    def slerp_many(q1s, q2s, ts):
+        """
+        Slerp N pairs of rotations at once.
+
+        q1s and q2s are sequences of Quaternion or (N, 4) arrays of
+        (w, x, y, z) rows, and ts is a factor for all pairs or an array of
+        N factors in [0, 1]. Every pair is interpolated like slerp, with
+        NumPy arrays instead of a Python loop.
+        Return an (N, 4) array of unit (w, x, y, z) rows.
+        """
+        import numpy as np
+
+        def as_array(quaternions):
+            if isinstance(quaternions, np.ndarray):
+                array = quaternions.astype(np.float64)
+            else:
+                array = np.array([(q.w, q.x, q.y, q.z)
+                                  if isinstance(q, Quaternion) else q
+                                  for q in quaternions], dtype=np.float64)
+            return array.reshape(-1, 4)
+
+        q1 = as_array(q1s)
+        q2 = as_array(q2s)
+        if q1.shape != q2.shape:
+            raise ValueError("q1s and q2s must hold as many quaternions.")
+        t = np.broadcast_to(np.asarray(ts, dtype=np.float64), len(q1))
+        if np.any((t < 0) | (t > 1)):
+            raise ValueError("Interpolation factor t must be in [0, 1]")
+        norms = np.concatenate((np.linalg.norm(q1, axis=1),
+                                np.linalg.norm(q2, axis=1)))
+        if np.any(norms < 1e-9):
+            raise ValueError("Cannot normalize a zero quaternion.")
+        q1 = q1 / np.linalg.norm(q1, axis=1)[:, None]
+        q2 = q2 / np.linalg.norm(q2, axis=1)[:, None]
+        dot = np.einsum("ij,ij->i", q1, q2)
+        # Shortest arc
+        q2 = np.where(dot[:, None] < 0, -q2, q2)
+        dot = np.abs(dot)
+        near = dot > SLERP_THRESHOLD
+        theta = np.arccos(np.minimum(dot, 1))
+        sin_theta = np.sqrt(np.maximum(1 - dot * dot, 0))
+        # Divide by 1 where the normalized lerp weights are used instead
+        safe = np.where(near, 1, sin_theta)
+        k1 = np.where(near, 1 - t, np.sin((1 - t) * theta) / safe)
+        k2 = np.where(near, t, np.sin(t * theta) / safe)
+        result = k1[:, None] * q1 + k2[:, None] * q2
+        return result / np.linalg.norm(result, axis=1)[:, None]
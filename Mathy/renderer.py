@@ -129,6 +129,21 @@ class Renderer:
         text_surface = font.render(text, True, color)
         self.screen.blit(text_surface, (int(position[0]), int(position[1])))
 
+    def draw_framebuffer(self, framebuffer, position=(0, 0)):
+        """
+        Draws the color plane of a FrameBuffer onto the screen.
+
+        The pixels are read directly from the frame buffer's memory,
+        without converting them to Python objects.
+
+        :param framebuffer: FrameBuffer whose color plane is displayed.
+        :param position: Tuple (x, y) of the top-left corner on the screen.
+        """
+        surface = pygame.image.frombuffer(
+            framebuffer.color, (framebuffer.width, framebuffer.height), "RGB"
+        )
+        self.screen.blit(surface, (int(position[0]), int(position[1])))
+
     def update(self):
         """Update the display window (flips the screen buffer)."""
         pygame.display.flip()
@@ -1,6 +1,12 @@
 """Defines a 3D renderer class."""
 
-from Mathy import HomogeneousVector4, Triangle3D, Vector3, barycentric_coordinates
+import numpy as np
+
+from Mathy import (HomogeneousVector4, Triangle3D, Vector4, Vector4Array,
+                   FrameBuffer)
+from Mathy.clipping import GUARD_BAND, clip_planes, clip_polygon, outcodes
+from Mathy.mesh_optimizer import DEFAULT_CACHE_SIZE, average_cache_miss_ratio
+from Mathy.triangle_setup import EPSILON, TriangleSetup
 
 class Renderer3D(object):
     """A class to contain render data."""
@@ -10,73 +16,490 @@ class Renderer3D(object):
         self.vertices = []
         self.indices = []
         self.triangles = []
-        self.z_buffer = []
-        self.framebuffer_color = []
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.texture = None  # Placeholder for texture data
+        # Triangle corners as one (3 * triangles, 4) vertex buffer,
+        # and a reusable output buffer for their world coordinates
+        self.corner_buffer = Vector4Array([])
+        self._world_corners = None
+        # Indexed pipeline: unique vertices, (triangles, 3) indices and the
+        # post-transform cache of their screen coordinates
+        self.vertex_buffer = Vector4Array([])
+        self.index_buffer = np.empty((0, 3), dtype=np.intp)
+        self._clip_vertices = None
+        self._screen_vertices = None
+        self._post_transform_key = None
+        self.stats = {"vertices_transformed": 0, "post_transform_hits": 0,
+                      "triangles_culled": 0, "objects_culled": 0,
+                      "triangles_clipped": 0, "triangles_outside": 0,
+                      "pixels_tested": 0, "triangles_occluded": 0,
+                      "fragments_skipped": 0}
+        # Reject whole objects outside the view frustum before vertex work
+        self.frustum_culling = True
+        # Clip x and y against guard_band times the viewport, not the screen
+        self.guard_band = GUARD_BAND
+        # Face culling: cull_mode is "none", "back" or "front", and
+        # front_face the winding of front faces as seen by the camera
+        self.cull_mode = "none"
+        self.front_face = "ccw"
+        # Allocated on first use, most game objects never rasterize
+        self._framebuffer = None
+        # Optional inclusive pixel rectangle (x0, x1, y0, y1) restricting
+        # rasterization, e.g. to one tile of the screen
+        self.scissor = None
+        # Skip triangles and tiles hidden according to the per-tile depth
+        # bounds of the frame buffer. Off by default, as the skipped pixels
+        # are left out of the pixels returned by rasterize_triangle
+        self.hierarchical_z = False
+
+    @property
+    def framebuffer(self) -> FrameBuffer:
+        """Return the depth and color buffers, allocating them if needed."""
+        if self._framebuffer is None:
+            self._framebuffer = FrameBuffer(self.screen_width,
+                                            self.screen_height)
+        return self._framebuffer
+
+    @property
+    def z_buffer(self) -> np.ndarray:
+        """Return a view on the depth plane indexed as [x][y]."""
+        return self.framebuffer.depth.T
+
+    @property
+    def framebuffer_color(self) -> np.ndarray:
+        """Return a view on the color plane indexed as [x][y]."""
+        return self.framebuffer.color.transpose(1, 0, 2)
 
     def clear(self):
         """Clear the renderer data."""
         self.vertices = []
         self.indices = []
         self.triangles = []
+        self.vertex_buffer = Vector4Array([])
+        self.index_buffer = np.empty((0, 3), dtype=np.intp)
+        self._post_transform_key = None
         self.clear_z_buffer()
+
+    def reset_stats(self):
+        """Reset the pipeline counters, typically at the start of a frame."""
+        for key in self.stats:
+            self.stats[key] = 0
         
     def clear_z_buffer(self):
-        # Initialize z-buffer and framebuffer for our screen size
-        self.z_buffer = []
-        self.framebuffer_color = []
-        for _ in range(self.screen_width):
-            self.z_buffer.append([float('inf')] * self.screen_height)
-            self.framebuffer_color.append([(0, 0, 0)] * self.screen_height)
+        """Reset the z-buffer and framebuffer in place for a new frame."""
+        self.framebuffer.clear()
 
     def convert_local_to_world(self, game_object):
         """Apply world coordinates to game object."""
-        model_matrix = game_object.transform.transform_matrix
+        model_matrix = game_object.transform.world_matrix
+        corners = game_object.renderer.corner_buffer
+        # Transform every corner with a single batched product
+        if (self._world_corners is None
+                or len(self._world_corners) != len(corners)):
+            self._world_corners = Vector4Array(np.empty((len(corners), 4)))
+        rows = model_matrix.transform_points(
+            corners, out=self._world_corners).data.tolist()
         triangles_world = []
-        for triangle in game_object.triangles:
-            pa = triangle.pa.multiply_by_matrix(model_matrix)
-            pb = triangle.pb.multiply_by_matrix(model_matrix)
-            pc = triangle.pc.multiply_by_matrix(model_matrix)
+        for i, triangle in enumerate(game_object.triangles):
+            pa = Vector4(*rows[3 * i])
+            pb = Vector4(*rows[3 * i + 1])
+            pc = Vector4(*rows[3 * i + 2])
             triangles_world.append(Triangle3D(pa, pb, pc, triangle.indices, triangle.uv))
         return triangles_world
     
     def set_mesh_data(self, gameobject):
         """Set mesh data for rendering."""
-        self.vertices = gameobject.homogeneous_vertices
-        self.indices = gameobject.indices
-        self.triangles = []
         self.texture = gameobject.texture
-        for i in range(0, len(self.indices) - 1, 3):
-            p1 = Vector3(self.vertices[self.indices[i]].x,
-                 self.vertices[self.indices[i]].y,
-                 self.vertices[self.indices[i]].z).homogenize()
-            p1_uv = gameobject.uv[self.indices[i]] if gameobject.uv else (0, 0)
-            p2 = Vector3(self.vertices[self.indices[i + 1]].x,
-                 self.vertices[self.indices[i + 1]].y,
-                 self.vertices[self.indices[i + 1]].z).homogenize()
-            p2_uv = gameobject.uv[self.indices[i + 1]] if gameobject.uv else (0, 0)
-            p3 = Vector3(self.vertices[self.indices[i + 2]].x,
-                 self.vertices[self.indices[i + 2]].y,
-                 self.vertices[self.indices[i + 2]].z).homogenize()
-            p3_uv = gameobject.uv[self.indices[i + 2]] if gameobject.uv else (0, 0)
-            self.triangles.append(Triangle3D(p1, p2, p3, {
-                "pa": self.indices[i],
-                "pb": self.indices[i + 1],
-                "pc": self.indices[i + 2]
-            }, (p1_uv, p2_uv, p3_uv)))
-        gameobject.triangles = self.triangles
+        self.set_mesh(gameobject.mesh)
+
+    def set_mesh(self, mesh):
+        """
+        Render a shared mesh.
+
+        The triangles and buffers of the mesh are referenced, not copied,
+        so any number of renderers can use the same mesh.
+        """
+        self.vertices = mesh.homogeneous_vertices
+        self.indices = mesh.indices
+        self.triangles = mesh.triangles
+        self.corner_buffer = mesh.corner_buffer
+        self.vertex_buffer = mesh.vertex_buffer
+        self.index_buffer = mesh.index_buffer
+        self._world_corners = None
+        self._clip_vertices = None
+        self._screen_vertices = None
+        self._post_transform_key = None
+
+    def average_cache_miss_ratio(self,
+                                 cache_size: int = DEFAULT_CACHE_SIZE
+                                 ) -> float:
+        """Return the ACMR of the index buffer for a FIFO vertex cache."""
+        return average_cache_miss_ratio(self.index_buffer.ravel().tolist(),
+                                        cache_size)
+
+    def is_in_frustum(self, game_object, camera, projection) -> bool:
+        """
+        Check if a game object may be visible from the camera.
+
+        The world bounding sphere is tested against the frustum planes
+        first. When it straddles a plane, the world-space box of the
+        object's bounding box is tested against that plane too.
+        The test is conservative: an object reported outside is never
+        visible, an object reported inside may still be off-screen.
+        """
+        center, radius = game_object.get_world_bounding_sphere()
+        planes = camera.get_frustum_planes(projection)
+        box = None
+        for a, b, c, d in planes:
+            distance = a * center.x + b * center.y + c * center.z + d
+            if distance < -radius:
+                return False
+            if distance < radius:
+                if box is None:
+                    box = self._world_box(game_object)
+                (x, y, z), (ex, ey, ez) = box
+                # Projection of the box extents on the plane normal
+                reach = abs(a) * ex + abs(b) * ey + abs(c) * ez
+                if a * x + b * y + c * z + d < -reach:
+                    return False
+        return True
+
+    @staticmethod
+    def _world_box(game_object):
+        """Return the center and half extents of the world-space box."""
+        low, high = game_object.bounding_box
+        m = game_object.transform.world_matrix.flat
+        cx, cy, cz = ((low.x + high.x) / 2, (low.y + high.y) / 2,
+                      (low.z + high.z) / 2)
+        hx, hy, hz = ((high.x - low.x) / 2, (high.y - low.y) / 2,
+                      (high.z - low.z) / 2)
+        center = (m[0] * cx + m[1] * cy + m[2] * cz + m[3],
+                  m[4] * cx + m[5] * cy + m[6] * cz + m[7],
+                  m[8] * cx + m[9] * cy + m[10] * cz + m[11])
+        extents = (abs(m[0]) * hx + abs(m[1]) * hy + abs(m[2]) * hz,
+                   abs(m[4]) * hx + abs(m[5]) * hy + abs(m[6]) * hz,
+                   abs(m[8]) * hx + abs(m[9]) * hy + abs(m[10]) * hz)
+        return center, extents
+
+    def _frustum_rejects(self, game_object, camera, projection) -> bool:
+        """Check if frustum culling rejects a game object, counting it."""
+        if (self.frustum_culling and len(self.vertex_buffer)
+                and not self.is_in_frustum(game_object, camera, projection)):
+            self.stats["objects_culled"] += 1
+            return True
+        return False
+
+    def process_vertices(self, game_object, camera, projection):
+        """
+        Transform and project the unique mesh vertices to screen space.
+
+        Every vertex of vertex_buffer goes through a single model, view and
+        projection product, whatever the number of triangles sharing it.
+        The result is kept in a post-transform cache and reused until the
+        transform, the camera or the projection changes.
+        Return a Vector4Array of (x_screen, y_screen, z_ndc, 1) rows,
+        indexed like vertex_buffer.
+        """
+        transform = game_object.transform
+        key = (transform, transform.world_version, camera, camera.version,
+               projection, projection.version)
+        if key == self._post_transform_key:
+            self.stats["post_transform_hits"] += 1
+            return self._screen_vertices
+        if (self._clip_vertices is None
+                or len(self._clip_vertices) != len(self.vertex_buffer)):
+            self._clip_vertices = Vector4Array(
+                np.empty((len(self.vertex_buffer), 4)))
+            self._screen_vertices = Vector4Array(
+                np.empty((len(self.vertex_buffer), 4)))
+        mvp = camera.get_view_projection_matrix(projection).prod(
+            transform.world_matrix)
+        mvp.transform_points(self.vertex_buffer, out=self._clip_vertices)
+        projection.clip_to_screen(self._clip_vertices,
+                                  out=self._screen_vertices)
+        self.stats["vertices_transformed"] += len(self.vertex_buffer)
+        self._post_transform_key = key
+        return self._screen_vertices
+
+    def _facing_sign(self):
+        """
+        Return the sign of the screen-space area of the faces to cull.
+
+        Screen y points down, so a triangle counter-clockwise as seen by
+        the camera has a negative signed area on screen.
+        Return 0 when culling is disabled.
+        """
+        if self.cull_mode == "none":
+            return 0
+        if self.cull_mode not in ("back", "front"):
+            raise ValueError(f"Unknown cull mode: {self.cull_mode}")
+        if self.front_face not in ("ccw", "cw"):
+            raise ValueError(f"Unknown front face winding: {self.front_face}")
+        front_sign = -1 if self.front_face == "ccw" else 1
+        return -front_sign if self.cull_mode == "back" else front_sign
+
+    @staticmethod
+    def _signed_areas(a, b, c):
+        """
+        Return twice the signed screen-space areas of triangles (a, b, c).
+
+        a, b and c are arrays of screen points, or single points, whose
+        first two columns are x and y.
+        """
+        return ((b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+                - (c[..., 0] - a[..., 0]) * (b[..., 1] - a[..., 1]))
+
+    def _culled(self, areas):
+        """
+        Return the mask of the signed areas discarded by face culling.
+
+        Degenerate faces are culled whenever culling is enabled; nothing
+        is culled when it is disabled.
+        """
+        sign = self._facing_sign()
+        if sign == 0:
+            return np.zeros(np.shape(areas), dtype=bool)
+        return np.asarray(areas) * sign >= 0
+
+    def cull_faces(self, screen_vertices, triangles=None, index_buffer=None):
+        """
+        Return the indices of the triangles kept by face culling.
+
+        The signed screen-space areas of the triangles of index_buffer
+        (all of them, or the given array of triangle indices) are computed
+        at once from the screen vertices, and the culled triangles are
+        counted in stats["triangles_culled"]. index_buffer defaults to the
+        renderer's.
+        """
+        if index_buffer is None:
+            index_buffer = self.index_buffer
+        if triangles is None:
+            triangles = np.arange(len(index_buffer))
+        if self._facing_sign() == 0:
+            return triangles
+        points = screen_vertices.data
+        index_buffer = index_buffer[triangles]
+        kept = triangles[~self._culled(self._signed_areas(
+            points[index_buffer[:, 0]], points[index_buffer[:, 1]],
+            points[index_buffer[:, 2]]))]
+        self.stats["triangles_culled"] += len(triangles) - len(kept)
+        return kept
+
+    def classify_triangles(self, clip_vertices, index_buffer=None):
+        """
+        Sort the triangles of index_buffer against the clip planes.
+
+        Return (inside, crossing, masks): the indices of the triangles
+        entirely inside the near and far planes and the guard band, the
+        indices of the triangles crossing at least one of these planes,
+        and for each crossing triangle the mask of the planes it crosses.
+        Triangles entirely outside one plane are dropped and counted in
+        stats["triangles_outside"]. index_buffer defaults to the
+        renderer's.
+        """
+        if index_buffer is None:
+            index_buffer = self.index_buffer
+        codes = outcodes(clip_vertices.data, clip_planes(self.guard_band))
+        corner_codes = codes[index_buffer]
+        crossed = corner_codes[:, 0] | corner_codes[:, 1] | corner_codes[:, 2]
+        outside = corner_codes[:, 0] & corner_codes[:, 1] & corner_codes[:, 2]
+        inside = np.flatnonzero(crossed == 0)
+        crossing = np.flatnonzero((crossed != 0) & (outside == 0))
+        self.stats["triangles_outside"] += int(np.count_nonzero(outside))
+        return inside, crossing, crossed[crossing]
+
+    def clip_triangle(self, clip_points, uvs, projection, mask=-1,
+                      indices=None):
+        """
+        Clip a clip-space triangle and return its screen-space pieces.
+
+        The triangle is clipped against the near and far planes and the
+        guard band (restricted to the planes set in mask), the resulting
+        convex polygon is projected and split into a triangle fan.
+        Corners are Vector4 screen coordinates like project_triangle's,
+        and every piece keeps the indices of the source triangle, with
+        its texture coordinates interpolated along the clipped edges.
+        Return an empty list if nothing is left or if the polygon is
+        discarded by face culling, which uses the signed area of the
+        whole polygon. Zero-area pieces are dropped.
+        """
+        if mask:
+            self.stats["triangles_clipped"] += 1
+        points, uvs = clip_polygon(clip_points, uvs,
+                                   clip_planes(self.guard_band), mask)
+        if not points:
+            return []
+        screen = projection.clip_to_screen(np.array(points))
+        # Fan piece k has twice the signed area of (0, k, k + 1); their sum
+        # is the shoelace area of the whole polygon, which gives its
+        # orientation even when the first piece is degenerate
+        areas = self._signed_areas(screen[0], screen[1:-1], screen[2:])
+        if self._culled(areas.sum()):
+            self.stats["triangles_culled"] += 1
+            return []
+        corners = [Vector4(*p) for p in screen.tolist()]
+        # Zero-area pieces, e.g. next to a corner lying on a clip plane,
+        # cover no pixel
+        return [Triangle3D(corners[0], corners[k], corners[k + 1], indices,
+                           (uvs[0], uvs[k], uvs[k + 1]))
+                for k in range(1, len(corners) - 1)
+                if abs(areas[k - 1]) > EPSILON]
+
+    def get_screen_triangles(self, game_object, camera, projection):
+        """
+        Return the mesh triangles in screen space through the index buffer.
+
+        Corners are looked up in the post-transform cache by vertex index,
+        so no vertex is transformed more than once per frame.
+        Objects outside the view frustum give no triangles, triangles
+        crossing the near or far plane or the guard band are clipped into
+        several ones, and triangles discarded by face culling are left out.
+        Triangles are returned in index buffer order.
+        """
+        if self._frustum_rejects(game_object, camera, projection):
+            return []
+        screen = self.process_vertices(game_object, camera, projection)
+        return self._assemble_triangles(self._clip_vertices, screen,
+                                        self.index_buffer, self.triangles,
+                                        projection)
+
+    def _assemble_triangles(self, clip_vertices, screen_vertices,
+                            index_buffer, source_triangles, projection):
+        """
+        Build the screen triangles of an index buffer.
+
+        Triangle t of index_buffer takes its indices and texture
+        coordinates from source_triangles[t % len(source_triangles)].
+        Triangles are clipped and culled, and returned in index order.
+        """
+        inside, crossing, masks = self.classify_triangles(clip_vertices,
+                                                          index_buffer)
+        kept = self.cull_faces(screen_vertices, inside, index_buffer)
+        count = len(source_triangles)
+        pieces = {}
+        corners = screen_vertices.data[index_buffer[kept]].tolist()
+        for (p1, p2, p3), t in zip(corners, kept.tolist()):
+            triangle = source_triangles[t % count]
+            pieces[t] = [Triangle3D(
+                Vector4(*p1), Vector4(*p2), Vector4(*p3),
+                triangle.indices,
+                triangle.uv
+            )]
+        clip = clip_vertices.data
+        for t, mask in zip(crossing.tolist(), masks.tolist()):
+            triangle = source_triangles[t % count]
+            points = [tuple(p) for p in clip[index_buffer[t]].tolist()]
+            pieces[t] = self.clip_triangle(
+                points, list(triangle.uv or [(0, 0)] * 3), projection, mask,
+                triangle.indices)
+        return [piece for t in sorted(pieces) for piece in pieces[t]]
+
+    @staticmethod
+    def _model_array(model_matrices) -> np.ndarray:
+        """Return model matrices as an (N, 4, 4) array."""
+        if isinstance(model_matrices, np.ndarray):
+            matrices = np.asarray(model_matrices, dtype=np.float64)
+        else:
+            matrices = np.array([m.flat for m in model_matrices],
+                                dtype=np.float64)
+        if matrices.size == 0:
+            return matrices.reshape(0, 4, 4)
+        return matrices.reshape(-1, 4, 4)
+
+    def cull_instances(self, mesh, model_matrices, camera,
+                       projection) -> np.ndarray:
+        """
+        Return the indices of the instances in the view frustum.
+
+        The bounding sphere of the mesh is moved by every model matrix at
+        once and tested against the frustum planes. Rejected instances are
+        counted in stats["objects_culled"].
+        """
+        matrices = self._model_array(model_matrices)
+        if not self.frustum_culling or mesh.bounding_sphere is None:
+            return np.arange(len(matrices))
+        center, radius = mesh.bounding_sphere
+        centers = (matrices[:, :3, :3] @ np.array([center.x, center.y,
+                                                    center.z])
+                   + matrices[:, :3, 3])
+        # Largest column norm: the largest scale factor of each instance
+        scales = np.sqrt(np.max(np.sum(matrices[:, :3, :3] ** 2, axis=1),
+                                axis=1))
+        planes = np.array(camera.get_frustum_planes(projection),
+                          dtype=np.float64)
+        distances = centers @ planes[:, :3].T + planes[:, 3]
+        visible = np.flatnonzero(
+            np.all(distances >= -(radius * scales)[:, None], axis=1))
+        self.stats["objects_culled"] += len(matrices) - len(visible)
+        return visible
+
+    def get_instance_triangles(self, mesh, model_matrices, camera,
+                               projection):
+        """
+        Return the screen triangles of many instances of a mesh.
+
+        model_matrices is a sequence of Matrix4x4 or an (N, 4, 4) array,
+        one model matrix per instance. Instances outside the view frustum
+        are rejected, then the vertices of all the others go through a
+        single batched model, view and projection product, and their
+        triangles are clipped and culled like get_screen_triangles'.
+        Triangles are returned instance by instance, in index order.
+        """
+        matrices = self._model_array(model_matrices)
+        matrices = matrices[self.cull_instances(mesh, matrices, camera,
+                                                projection)]
+        if not len(matrices) or not len(mesh.index_buffer):
+            return []
+        view_projection = np.array(
+            camera.get_view_projection_matrix(projection).flat,
+            dtype=np.float64).reshape(4, 4)
+        # (N, V, 4) clip-space vertices, flattened instance by instance
+        clip = np.einsum("nij,vj->nvi", view_projection @ matrices,
+                         mesh.vertex_buffer.data).reshape(-1, 4)
+        vertex_count = len(mesh.vertex_buffer)
+        self.stats["vertices_transformed"] += len(clip)
+        index_buffer = (mesh.index_buffer[None]
+                        + (np.arange(len(matrices)) * vertex_count)[:, None,
+                                                                   None])
+        clip_vertices = Vector4Array._wrap(clip)
+        screen = projection.clip_to_screen(clip_vertices)
+        return self._assemble_triangles(clip_vertices, screen,
+                                        index_buffer.reshape(-1, 3),
+                                        mesh.triangles, projection)
+
+    def draw_mesh(self, game_object, camera, projection, renderer):
+        """Draw the wireframe of the whole mesh with the indexed pipeline."""
+        for triangle in self.get_screen_triangles(game_object, camera,
+                                                  projection):
+            renderer.draw_triangle(
+                (triangle.pa.x, triangle.pa.y),
+                (triangle.pb.x, triangle.pb.y),
+                (triangle.pc.x, triangle.pc.y),
+                color=(0.5, 0.5, 0.5)
+            )
+
+    def draw_instances(self, mesh, model_matrices, camera, projection,
+                       renderer):
+        """Draw the wireframes of many instances of a mesh."""
+        for triangle in self.get_instance_triangles(mesh, model_matrices,
+                                                    camera, projection):
+            renderer.draw_triangle(
+                (triangle.pa.x, triangle.pa.y),
+                (triangle.pb.x, triangle.pb.y),
+                (triangle.pc.x, triangle.pc.y),
+                color=(0.5, 0.5, 0.5)
+            )
 
     def project_vertices(self, vertices, camera, projection):
         """Project vertices from 3D space to 2D screen space."""
         projected_vertices = []
+        # Fetched once, the camera caches it until the view changes
+        view_projection = camera.get_view_projection_matrix(projection)
         for vertex in vertices:
             vertex: HomogeneousVector4 = vertex
-            # Apply view transformation
-            view_vertex: HomogeneousVector4 = vertex.multiply_by_matrix(camera.get_view_matrix())  # noqa: E501
-            # Apply projection transformation
-            projected_vertex: HomogeneousVector4 = view_vertex.multiply_by_matrix(projection.get_projection_matrix())  # noqa: E501
+            # Apply view and projection transformations
+            projected_vertex: HomogeneousVector4 = vertex.multiply_by_matrix(view_projection)  # noqa: E501
             # Convert to screen coordinates
             screen_vertex = projection.get_screen_coordinates(projected_vertex)
             projected_vertices.append(screen_vertex)
@@ -84,34 +507,39 @@ class Renderer3D(object):
     
     def project_triangle(self, triangle, camera, projection):
         """Project a triangle from 3D space to 2D screen space."""
-        p1 = self.project_vertices([triangle.pa], camera, projection)[0]
-        p2 = self.project_vertices([triangle.pb], camera, projection)[0]
-        p3 = self.project_vertices([triangle.pc], camera, projection)[0]
+        p1, p2, p3 = self.project_vertices(
+            [triangle.pa, triangle.pb, triangle.pc], camera, projection)
         return (p1, p2, p3)
     
     def draw_2d_triangle(self, triangle,  camera, projection, renderer):
         """Draw a triangle in 2D space."""
-        p1, p2, p3 = self.project_triangle(triangle, camera, projection)
-        projected_triangle = Triangle3D(
-            Vector3(p1.x, p1.y, p1.z),
-            Vector3(p2.x, p2.y, p2.z),
-            Vector3(p3.x, p3.y, p3.z),
-            triangle.indices,
-            triangle.uv
-        )
-        renderer.draw_triangle(
-            (p1.x, p1.y),
-            (p2.x, p2.y),
-            (p3.x, p3.y),
-            color=(0.5, 0.5, 0.5)
-        )
-        # pixels = self.rasterize_triangle(projected_triangle)
-        # for x, y, color in pixels:
-        #     renderer.draw_point(x, y, color, radius=1)
-            
+        view_projection = camera.get_view_projection_matrix(projection)
+        clip_points = []
+        for vertex in (triangle.pa, triangle.pb, triangle.pc):
+            p = vertex.multiply_by_matrix(view_projection)
+            clip_points.append((p.x, p.y, p.z, p.w))
+        # Clip before the perspective divide, so that no corner behind the
+        # camera reaches the screen
+        codes = outcodes(np.array(clip_points),
+                         clip_planes(self.guard_band)).tolist()
+        if codes[0] & codes[1] & codes[2]:
+            self.stats["triangles_outside"] += 1
+            return
+        pieces = self.clip_triangle(
+            clip_points, list(triangle.uv or [(0, 0)] * 3), projection,
+            codes[0] | codes[1] | codes[2], triangle.indices)
+        for piece in pieces:
+            p1, p2, p3 = piece.get_vertices()
+            renderer.draw_triangle(
+                (p1.x, p1.y),
+                (p2.x, p2.y),
+                (p3.x, p3.y),
+                color=(0.5, 0.5, 0.5)
+            )
+
     def is_in_front_of_camera(self, z_pixel, x, y):
         """Check if the pixel is in front of the camera."""
-        return z_pixel < self.z_buffer[x][y]
+        return self.framebuffer.depth_test(x, y, z_pixel)
 
     def interpolate_texture_coordinates(self, lambda_A, lambda_B, lambda_C, uv1, uv2, uv3):
         """Interpolate texture coordinates based on barycentric coordinates."""
@@ -131,52 +559,240 @@ class Renderer3D(object):
         )
         return color_pixel
 
-    def rasterize_triangle(self, triangle):
-        # bounding box
+    def rasterize_triangle(self, triangle, mode="scalar"):
+        """
+        Rasterize a screen-space triangle into the z-buffer and framebuffer.
+
+        mode selects the implementation: "scalar" visits the bounding box
+        pixel by pixel, "vectorized" evaluates the whole bounding box at once
+        with NumPy, and "scanline" walks the edges to only evaluate the
+        covered span of each row, which pays off for thin or diagonal
+        triangles. All modes cover the same pixels. The array modes give
+        identical depths and colors; the scalar mode steps the barycentric
+        coordinates and the depth with additions, so its depths and colors
+        are equal to theirs up to rounding (one unit of color at most).
+        With hierarchical_z, the triangle is skipped in the depth tiles
+        that are known to hide it, and entirely if they all do.
+        Return the list of (x, y, color) covered by the triangle, whether
+        or not they pass the depth test; with hierarchical_z, the pixels
+        of the skipped tiles are left out even though they are covered.
+        """
+        if mode == "vectorized":
+            return self._rasterize_triangle_vectorized(triangle)
+        if mode == "scanline":
+            return self._rasterize_triangle_scanline(triangle)
+        if mode != "scalar":
+            raise ValueError(f"Unknown rasterization mode: {mode}")
         p1, p2, p3 = triangle.get_vertices()
-        xmin = min(p1.x, p2.x, p3.x)
-        xmax = max(p1.x, p2.x, p3.x)
-        ymin = min(p1.y, p2.y, p3.y)
-        ymax = max(p1.y, p2.y, p3.y)
+        setup = TriangleSetup(p1, p2, p3, triangle.uv)
+        box = self._screen_bounding_box(p1, p2, p3)
+        if box is None:
+            return []
+        x0, x1, y0, y1 = box
+        occluded = self._occluded_tiles(box, p1, p2, p3)
+        if occluded is not None and occluded.all():
+            self._count_occluded_triangle(box)
+            return []
+        if occluded is not None and occluded.any():
+            hidden = occluded.tolist()
+            size = self.framebuffer.tile_size
+            tile_x0 = x0 // size
+            tile_y0 = y0 // size
+        else:
+            hidden = None
+        skipped = 0
         pixels = []
+        # Values at the first pixel center, then stepped with additions:
+        # dx once per column, dy once per pixel
+        dA_dx, dB_dx, dC_dx, dz_dx = setup.dx
+        dA_dy, dB_dy, dC_dy, dz_dy = setup.dy
+        column_A, column_B, column_C = setup.barycentric(x0 + 0.5, y0 + 0.5)
+        column_z = setup.depth(x0 + 0.5, y0 + 0.5)
         # Cicle through each pixel in the bounding box
-        for x in range(int(xmin), int(xmax) + 1):
-            for y in range(int(ymin), int(ymax) + 1):
-            # Compute the pixel's center
-                center_x = x + 0.5
-                center_y = y + 0.5
-                # Determine if the pixel is inside the triangle using barycentric coordinates
-                p = Vector3(center_x, center_y, 0)
-                lambda_A, lambda_B, lambda_C = barycentric_coordinates(p, p1, p2, p3)
-                if (
-                    0 <= lambda_A <= 1 and
-                    0 <= lambda_B <= 1 and
-                    0 <= lambda_C <= 1 and
-                    # Due to floating point precision issues,
-                    # we allow a small tolerance for values extremely close to 1
-                    abs(lambda_A + lambda_B + lambda_C - 1) < 1e-8
-                ):
+        for x in range(x0, x1 + 1):
+            lambda_A, lambda_B, lambda_C = column_A, column_B, column_C
+            z_pixel = column_z
+            for y in range(y0, y1 + 1):
+                if (hidden is not None
+                        and hidden[y // size - tile_y0][x // size - tile_x0]):
+                    skipped += 1
+                elif (lambda_A >= -EPSILON and lambda_B >= -EPSILON
+                        and lambda_C >= -EPSILON):
                     # The pixel is inside the triangle, draw it based on its depth
-                    z_pixel = lambda_A * p1.z + lambda_B * p2.z + lambda_C * p3.z
                     if self.is_in_front_of_camera(z_pixel, x, y):
-                        self.z_buffer[x][y] = z_pixel
-                        # u_pixel, v_pixel = self.interpolate_texture_coordinates(
-                        #     lambda_A, lambda_B, lambda_C,
-                        #     triangle.uv[0], triangle.uv[1], triangle.uv[2]
+                        # u_pixel, v_pixel = setup.texture_coordinates(
+                        #     x + 0.5, y + 0.5
                         # )
                         color = self.interpolate_color (
                             lambda_A, lambda_B, lambda_C
                         )
-                        self.framebuffer_color[x][y] = color
-                        # # Clamp texture coordinates to [0, 1]
-                        # u_pixel = max(0, min(1, u_pixel))
-                        # v_pixel = max(0, min(1, v_pixel))
+                        self.framebuffer.set_pixel(x, y, z_pixel, color)
                         # # Compute the color based on texture coordinates
-                        # x_tex = int(u_pixel * (150 - 1))
-                        # y_tex = int(v_pixel * (150 - 1))
-                        # tex_index = y_tex * 150 + x_tex
-                        # self.framebuffer_color[x][y] = (
-                        #     self.texture[tex_index]
+                        # self.framebuffer.set_pixel(
+                        #     x, y, z_pixel,
+                        #     self.texture.sample(u_pixel, v_pixel)
                         # )
-                    pixels.append((x, y, self.framebuffer_color[x][y]))
-        return pixels
\ No newline at end of file
+                    pixels.append((x, y, self.framebuffer.get_color(x, y)))
+                lambda_A += dA_dy
+                lambda_B += dB_dy
+                lambda_C += dC_dy
+                z_pixel += dz_dy
+            column_A += dA_dx
+            column_B += dB_dx
+            column_C += dC_dx
+            column_z += dz_dx
+        self.stats["pixels_tested"] += (x1 - x0 + 1) * (y1 - y0 + 1) - skipped
+        self.stats["fragments_skipped"] += skipped
+        return pixels
+
+    def _screen_bounding_box(self, p1, p2, p3):
+        """
+        Return the pixel bounding box (x0, x1, y0, y1) of a triangle.
+
+        The box is clamped to the screen and to the scissor rectangle.
+        Return None if it is empty.
+        """
+        x0 = max(int(min(p1.x, p2.x, p3.x)), 0)
+        x1 = min(int(max(p1.x, p2.x, p3.x)), self.screen_width - 1)
+        y0 = max(int(min(p1.y, p2.y, p3.y)), 0)
+        y1 = min(int(max(p1.y, p2.y, p3.y)), self.screen_height - 1)
+        if self.scissor is not None:
+            sx0, sx1, sy0, sy1 = self.scissor
+            x0, x1 = max(x0, sx0), min(x1, sx1)
+            y0, y1 = max(y0, sy0), min(y1, sy1)
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, x1, y0, y1
+
+    def _rasterize_triangle_vectorized(self, triangle, collect=True):
+        """Rasterize a triangle with array operations over its bounding box."""
+        p1, p2, p3 = triangle.get_vertices()
+        setup = TriangleSetup(p1, p2, p3, triangle.uv)
+        box = self._screen_bounding_box(p1, p2, p3)
+        if box is None:
+            return [] if collect else 0
+        x0, x1, y0, y1 = box
+        occluded = self._occluded_tiles(box, p1, p2, p3)
+        if occluded is not None and occluded.all():
+            self._count_occluded_triangle(box)
+            return [] if collect else 0
+        # Pixel centers, x-major so the output order matches the scalar path
+        xs, ys = np.meshgrid(np.arange(x0, x1 + 1), np.arange(y0, y1 + 1),
+                             indexing="ij")
+        xs, ys = self._skip_occluded_fragments(xs.ravel(), ys.ravel(), box,
+                                               occluded)
+        return self._shade_pixels(xs, ys, setup, collect)
+
+    def _rasterize_triangle_scanline(self, triangle, collect=True):
+        """
+        Rasterize a triangle by walking its edges, one span per row.
+
+        Each barycentric coordinate is an edge function, linear in x along
+        a row, so the covered pixel centers form a single span bounded by
+        the edges. The spans of all rows are computed at once, widened by
+        one pixel to absorb rounding, and only their pixels are shaded.
+        """
+        p1, p2, p3 = triangle.get_vertices()
+        setup = TriangleSetup(p1, p2, p3, triangle.uv)
+        box = self._screen_bounding_box(p1, p2, p3)
+        if box is None:
+            return [] if collect else 0
+        x0, x1, y0, y1 = box
+        occluded = self._occluded_tiles(box, p1, p2, p3)
+        if occluded is not None and occluded.all():
+            self._count_occluded_triangle(box)
+            return [] if collect else 0
+        rows = np.arange(y0, y1 + 1)
+        center_y = rows + 0.5
+        left = np.full(rows.shape, -np.inf)
+        right = np.full(rows.shape, np.inf)
+        for slope, step, constant in (setup.lambda_A, setup.lambda_B,
+                                      setup.lambda_C):
+            # Inside when slope * x + offset >= 0, the offset growing by
+            # a constant step from row to row
+            offset = step * center_y + constant
+            if slope > 0:
+                left = np.maximum(left, -offset / slope)
+            elif slope < 0:
+                right = np.minimum(right, -offset / slope)
+            else:
+                # Edge parallel to the rows: the whole row is in or out
+                right[offset < -EPSILON] = -np.inf
+        # Pixel x is covered when its center x + 0.5 lies in [left, right]
+        with np.errstate(invalid="ignore"):
+            start = np.maximum(np.ceil(left - 0.5) - 1, x0)
+            stop = np.minimum(np.floor(right - 0.5) + 1, x1)
+        counts = np.clip(np.nan_to_num(stop - start + 1), 0, None).astype(
+            np.intp)
+        total = int(counts.sum())
+        if total == 0:
+            return [] if collect else 0
+        ys = np.repeat(rows, counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        xs = np.repeat(start.astype(np.intp), counts) + (
+            np.arange(total) - first)
+        # Back to x-major order, like the other modes
+        order = np.lexsort((ys, xs))
+        xs, ys = self._skip_occluded_fragments(xs[order], ys[order], box,
+                                               occluded)
+        return self._shade_pixels(xs, ys, setup, collect)
+
+    def _occluded_tiles(self, box, p1, p2, p3):
+        """
+        Return the mask of the depth tiles of box hiding the triangle.
+
+        Return None if hierarchical depth culling is disabled.
+        """
+        if not self.hierarchical_z:
+            return None
+        x0, x1, y0, y1 = box
+        # The interpolated depth never gets nearer than the nearest corner
+        return self.framebuffer.occluded_tiles(x0, x1, y0, y1,
+                                               min(p1.z, p2.z, p3.z))
+
+    def _count_occluded_triangle(self, box):
+        """Count a triangle rejected by the hierarchical depth buffer."""
+        x0, x1, y0, y1 = box
+        self.stats["triangles_occluded"] += 1
+        self.stats["fragments_skipped"] += (x1 - x0 + 1) * (y1 - y0 + 1)
+
+    def _skip_occluded_fragments(self, xs, ys, box, occluded):
+        """Drop the candidate pixels lying in occluded depth tiles."""
+        if occluded is None or not occluded.any():
+            return xs, ys
+        size = self.framebuffer.tile_size
+        keep = ~occluded[ys // size - box[2] // size,
+                         xs // size - box[0] // size]
+        self.stats["fragments_skipped"] += xs.size - int(keep.sum())
+        return xs[keep], ys[keep]
+
+    def _shade_pixels(self, xs, ys, setup, collect=True):
+        """
+        Shade the candidate pixels (xs, ys) of a set up triangle.
+
+        Pixels whose center is inside the triangle are depth tested and
+        written to the framebuffer.
+        Return the list of (x, y, color) of the covered pixels, or only
+        their number if collect is False.
+        """
+        self.stats["pixels_tested"] += xs.size
+        center_x = xs + 0.5
+        center_y = ys + 0.5
+        lambda_A, lambda_B, lambda_C = setup.barycentric(center_x, center_y)
+        inside = setup.inside(lambda_A, lambda_B, lambda_C)
+        if not inside.any():
+            return [] if collect else 0
+        lambda_A = lambda_A[inside]
+        lambda_B = lambda_B[inside]
+        lambda_C = lambda_C[inside]
+        xs = xs[inside]
+        ys = ys[inside]
+        # Depth test and masked write of the covered pixels
+        z_pixel = setup.depth(center_x[inside], center_y[inside])
+        colors = np.stack(
+            self.interpolate_color(lambda_A, lambda_B, lambda_C), axis=-1)
+        self.framebuffer.write(xs, ys, z_pixel, colors)
+        if not collect:
+            return xs.size
+        colors = self.framebuffer.color[ys, xs].tolist()
+        return list(zip(xs.tolist(), ys.tolist(), map(tuple, colors)))
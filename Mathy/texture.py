@@ -1 +1,85 @@
-gengar_tex = [(99, 91, 85), (103, 94, 87), (99, 91, 85), (91, 83, 78), (103, 94, 87), (103, 94, 87), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (78, 71, 58), (78, 71, 58), (100, 88, 63), (100, 88, 63), (100, 88, 63), (87, 80, 63), (106, 94, 69), (112, 101, 73), (106, 94, 69), (78, 71, 58), (54, 48, 43), (38, 29, 27), (83, 75, 74), (126, 105, 58), (137, 119, 19), (141, 134, 16), (141, 134, 16), (116, 112, 16), (45, 40, 15), (45, 40, 15), (45, 40, 15), (50, 50, 17), (50, 50, 17), (45, 40, 15), (57, 58, 16), (94, 90, 21), (107, 100, 17), (107, 100, 17), (107, 100, 17), (111, 101, 90), (78, 59, 51), (60, 22, 18), (83, 23, 19), (83, 23, 19), (85, 37, 23), (85, 37, 23), (85, 37, 23), (83, 23, 19), (83, 23, 19), (101, 27, 15), (115, 80, 68), (169, 160, 159), (169, 160, 159), (206, 157, 83), (158, 150, 19), (158, 150, 19), (189, 174, 25), (225, 208, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (214, 194, 34), (253, 239, 35), (244, 231, 37), (244, 231, 37), (244, 231, 37), (244, 231, 37), (225, 208, 34), (214, 194, 34), (189, 174, 25), (141, 71, 82), (147, 50, 81), (126, 51, 105), (70, 27, 59), (38, 29, 27), (131, 119, 90), (131, 119, 90), (100, 88, 63), (69, 63, 51), (67, 50, 22), (79, 61, 28), (79, 61, 28), (73, 56, 25), (73, 56, 25), (84, 67, 31), (79, 61, 28), (93, 69, 29), (93, 74, 37), (84, 67, 31), (79, 61, 28), (79, 61, 28), (79, 61, 28), (73, 56, 25), (60, 44, 19), (60, 44, 19), (73, 56, 25), (73, 56, 25), (79, 61, 28), (67, 50, 22), (84, 67, 31), (73, 56, 25), (60, 44, 19), (79, 61, 28), (93, 74, 37), (93, 69, 29), (84, 67, 31), (84, 67, 31), (84, 67, 31), (60, 44, 19), (36, 34, 14), (45, 40, 15), (60, 44, 19), (73, 56, 25), (73, 56, 25), (67, 50, 22), (87, 80, 63), (131, 119, 90), (131, 119, 90), (125, 117, 117), (135, 112, 105), (116, 108, 92), (135, 112, 105), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (99, 91, 85), (96, 87, 81), (96, 87, 81), (96, 87, 81), (87, 80, 63), (91, 83, 78), (87, 80, 63), (78, 71, 58), (91, 83, 78), (96, 87, 81), (99, 91, 85), (99, 91, 85), (96, 87, 81), (99, 91, 85), (103, 94, 87), (103, 94, 87), (87, 80, 63), (69, 63, 51), (87, 80, 63), (100, 88, 63), (106, 94, 69), (106, 94, 69), (114, 91, 48), (112, 101, 73), (112, 101, 73), (87, 80, 63), (69, 63, 51), (44, 36, 32), (47, 16, 39), (91, 83, 78), (126, 105, 58), (141, 134, 16), (141, 134, 16), (141, 134, 16), (137, 119, 19), (94, 90, 21), (69, 63, 14), (57, 58, 16), (50, 50, 17), (50, 50, 17), (50, 50, 17), (57, 58, 16), (94, 90, 21), (107, 100, 17), (107, 100, 17), (112, 101, 73), (99, 91, 85), (60, 22, 18), (85, 37, 23), (115, 80, 68), (91, 71, 61), (115, 80, 68), (115, 80, 68), (124, 91, 74), (112, 44, 23), (101, 27, 15), (101, 27, 15), (101, 27, 15), (140, 110, 95), (169, 160, 159), (162, 148, 139), (158, 150, 19), (189, 174, 25), (214, 194, 34), (233, 220, 34), (233, 220, 34), (225, 208, 34), (214, 194, 34), (233, 220, 34), (253, 239, 35), (253, 239, 35), (244, 231, 37), (244, 231, 37), (244, 231, 37), (233, 220, 34), (214, 194, 34), (189, 174, 25), (141, 71, 82), (141, 71, 82), (126, 51, 105), (70, 27, 59), (28, 27, 20), (131, 119, 90), (131, 119, 90), (130, 104, 87), (106, 94, 69), (83, 66, 57), (73, 56, 25), (67, 50, 22), (73, 56, 25), (73, 56, 25), (84, 67, 31), (84, 67, 31), (93, 74, 37), (93, 74, 37), (93, 69, 29), (79, 61, 28), (79, 61, 28), (79, 61, 28), (79, 61, 28), (67, 50, 22), (60, 44, 19), (73, 56, 25), (79, 61, 28), (79, 61, 28), (67, 50, 22), (84, 67, 31), (84, 67, 31), (67, 50, 22), (73, 56, 25), (93, 69, 29), (93, 69, 29), (84, 67, 31), (79, 61, 28), (84, 67, 31), (60, 44, 19), (45, 40, 15), (45, 40, 15), (60, 44, 19), (79, 61, 28), (73, 56, 25), (67, 50, 22), (69, 63, 51), (111, 101, 90), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (112, 101, 73), (111, 101, 90), (103, 94, 87), (106, 94, 69), (103, 94, 87), (99, 91, 85), (108, 89, 79), (99, 91, 85), (108, 89, 79), (96, 87, 81), (96, 87, 81), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (78, 71, 58), (69, 63, 51), (78, 71, 58), (78, 71, 58), (78, 71, 58), (69, 63, 51), (69, 63, 51), (78, 71, 58), (87, 80, 63), (100, 79, 40), (87, 80, 63), (100, 88, 63), (112, 101, 73), (112, 101, 73), (106, 94, 69), (78, 71, 58), (63, 54, 47), (50, 41, 35), (74, 66, 72), (104, 97, 103), (137, 127, 62), (141, 134, 16), (141, 134, 16), (141, 134, 16), (137, 119, 19), (107, 100, 17), (69, 63, 14), (77, 72, 17), (77, 72, 17), (69, 63, 14), (57, 58, 16), (69, 63, 14), (94, 90, 21), (107, 100, 17), (116, 112, 16), (116, 108, 92), (78, 59, 51), (67, 50, 22), (115, 87, 74), (124, 99, 84), (115, 80, 68), (91, 71, 61), (115, 80, 68), (115, 80, 68), (140, 110, 95), (112, 44, 23), (101, 27, 15), (83, 23, 19), (116, 58, 26), (162, 148, 139), (162, 148, 139), (189, 174, 25), (214, 194, 34), (233, 220, 34), (233, 220, 34), (233, 220, 34), (233, 220, 34), (214, 194, 34), (244, 231, 37), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (244, 231, 37), (233, 220, 34), (225, 208, 34), (189, 174, 25), (141, 71, 82), (141, 71, 82), (147, 50, 81), (81, 31, 68), (19, 18, 17), (112, 101, 73), (146, 133, 97), (131, 119, 90), (131, 119, 90), (112, 101, 73), (100, 88, 63), (83, 66, 57), (73, 56, 25), (73, 56, 25), (84, 67, 31), (84, 67, 31), (93, 69, 29), (100, 79, 40), (93, 74, 37), (84, 67, 31), (73, 56, 25), (84, 67, 31), (79, 61, 28), (67, 50, 22), (60, 44, 19), (67, 50, 22), (79, 61, 28), (79, 61, 28), (60, 44, 19), (84, 67, 31), (84, 67, 31), (67, 50, 22), (67, 50, 22), (79, 61, 28), (93, 69, 29), (84, 67, 31), (84, 67, 31), (84, 67, 31), (67, 50, 22), (45, 40, 15), (45, 40, 15), (67, 50, 22), (67, 50, 22), (60, 44, 19), (60, 35, 42), (60, 22, 18), (60, 35, 42), (60, 35, 42), (60, 35, 42), (60, 35, 42), (60, 35, 42), (60, 35, 42), (62, 44, 53), (63, 54, 47), (63, 54, 47), (69, 63, 51), (78, 71, 58), (91, 83, 78), (99, 91, 85), (111, 101, 90), (116, 108, 92), (111, 101, 90), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (103, 94, 87), (111, 101, 90), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (106, 94, 69), (99, 91, 85), (108, 89, 79), (96, 87, 81), (78, 71, 58), (78, 71, 58), (78, 71, 58), (69, 63, 51), (78, 71, 58), (78, 71, 58), (87, 80, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (69, 63, 51), (63, 54, 47), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (78, 71, 58), (93, 74, 37), (87, 80, 63), (87, 80, 63), (69, 63, 51), (50, 41, 35), (66, 54, 66), (104, 97, 103), (116, 107, 112), (137, 127, 62), (141, 134, 16), (141, 134, 16), (141, 134, 16), (91, 80, 16), (91, 80, 16), (50, 50, 17), (57, 58, 16), (77, 72, 17), (77, 72, 17), (77, 72, 17), (91, 80, 16), (94, 90, 21), (107, 100, 17), (126, 105, 58), (108, 89, 79), (60, 22, 18), (83, 66, 57), (118, 95, 83), (132, 105, 99), (115, 87, 74), (115, 80, 68), (115, 80, 68), (140, 110, 95), (115, 80, 68), (115, 80, 68), (101, 27, 15), (83, 23, 19), (112, 44, 23), (162, 148, 139), (184, 171, 173), (214, 194, 34), (233, 220, 34), (233, 220, 34), (244, 231, 37), (233, 220, 34), (233, 220, 34), (225, 208, 34), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (225, 208, 34), (214, 194, 34), (155, 83, 37), (141, 71, 82), (147, 50, 81), (81, 31, 68), (16, 13, 14), (106, 94, 69), (146, 133, 97), (131, 119, 90), (131, 119, 90), (131, 119, 90), (131, 119, 90), (116, 108, 92), (112, 101, 73), (100, 88, 63), (79, 61, 28), (84, 67, 31), (93, 69, 29), (100, 79, 40), (93, 69, 29), (84, 67, 31), (73, 56, 25), (84, 67, 31), (84, 67, 31), (79, 61, 28), (60, 44, 19), (67, 50, 22), (79, 61, 28), (79, 61, 28), (67, 50, 22), (79, 61, 28), (93, 69, 29), (73, 56, 25), (67, 50, 22), (79, 61, 28), (93, 69, 29), (93, 69, 29), (79, 61, 28), (84, 67, 31), (67, 50, 22), (45, 40, 15), (60, 44, 19), (60, 35, 42), (83, 23, 19), (70, 27, 59), (83, 23, 19), (83, 23, 19), (83, 23, 19), (60, 22, 18), (83, 23, 19), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 22, 18), (47, 16, 39), (60, 22, 18), (60, 22, 18), (38, 29, 27), (50, 41, 35), (96, 87, 81), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (103, 94, 87), (112, 101, 73), (103, 94, 87), (106, 94, 69), (99, 91, 85), (99, 91, 85), (99, 91, 85), (96, 87, 81), (96, 87, 81), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (87, 80, 63), (91, 83, 78), (87, 80, 63), (96, 87, 81), (78, 71, 58), (78, 71, 58), (63, 54, 47), (63, 54, 47), (69, 63, 51), (87, 80, 63), (87, 80, 63), (96, 87, 81), (99, 91, 85), (87, 80, 63), (69, 63, 51), (69, 63, 51), (63, 54, 47), (44, 36, 32), (83, 75, 74), (116, 107, 112), (125, 117, 117), (137, 119, 19), (141, 134, 16), (141, 134, 16), (141, 134, 16), (57, 58, 16), (77, 72, 17), (69, 63, 14), (57, 58, 16), (50, 50, 17), (69, 63, 14), (77, 72, 17), (91, 80, 16), (94, 90, 21), (107, 100, 17), (116, 108, 92), (83, 66, 57), (60, 22, 18), (78, 59, 51), (91, 55, 19), (85, 37, 23), (85, 37, 23), (85, 37, 23), (115, 80, 68), (124, 91, 74), (145, 91, 73), (145, 91, 73), (112, 44, 23), (83, 23, 19), (112, 44, 23), (169, 160, 159), (212, 200, 193), (232, 207, 90), (233, 220, 34), (244, 231, 37), (233, 220, 34), (233, 220, 34), (225, 208, 34), (233, 220, 34), (253, 239, 35), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (233, 220, 34), (214, 194, 34), (171, 99, 72), (141, 71, 82), (147, 50, 81), (81, 31, 68), (16, 13, 14), (106, 94, 69), (131, 119, 90), (130, 104, 87), (112, 101, 73), (126, 105, 58), (112, 101, 73), (106, 94, 69), (106, 94, 69), (100, 88, 63), (79, 61, 28), (84, 67, 31), (84, 67, 31), (93, 74, 37), (93, 69, 29), (93, 69, 29), (79, 61, 28), (79, 61, 28), (84, 67, 31), (84, 67, 31), (67, 50, 22), (67, 50, 22), (73, 56, 25), (84, 67, 31), (67, 50, 22), (79, 61, 28), (93, 74, 37), (84, 67, 31), (67, 50, 22), (79, 61, 28), (93, 69, 29), (93, 69, 29), (79, 61, 28), (84, 67, 31), (73, 56, 25), (45, 40, 15), (60, 44, 19), (85, 37, 23), (119, 38, 63), (147, 50, 81), (147, 50, 81), (147, 50, 81), (147, 50, 81), (147, 50, 81), (147, 50, 81), (147, 50, 81), (147, 50, 81), (119, 38, 63), (119, 38, 63), (119, 38, 63), (119, 38, 63), (119, 38, 63), (119, 38, 63), (81, 31, 68), (60, 22, 18), (16, 13, 14), (69, 63, 51), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (108, 89, 79), (99, 91, 85), (100, 88, 63), (96, 87, 81), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (78, 71, 58), (69, 63, 51), (69, 63, 51), (69, 63, 51), (78, 71, 58), (69, 63, 51), (69, 63, 51), (63, 54, 47), (69, 63, 51), (78, 71, 58), (78, 71, 58), (78, 71, 58), (87, 80, 63), (87, 80, 63), (87, 80, 63), (78, 71, 58), (63, 54, 47), (54, 48, 43), (69, 63, 51), (104, 97, 103), (116, 107, 112), (131, 119, 90), (141, 134, 16), (141, 134, 16), (141, 134, 16), (107, 100, 17), (50, 50, 17), (77, 72, 17), (57, 58, 16), (45, 40, 15), (36, 34, 14), (50, 50, 17), (57, 58, 16), (77, 72, 17), (94, 90, 21), (107, 100, 17), (116, 108, 92), (67, 50, 22), (60, 22, 18), (85, 37, 23), (83, 23, 19), (85, 37, 23), (85, 37, 23), (85, 37, 23), (101, 27, 15), (115, 80, 68), (140, 110, 95), (154, 128, 116), (120, 70, 32), (101, 27, 15), (118, 32, 19), (162, 148, 139), (222, 214, 215), (236, 224, 159), (233, 220, 34), (244, 231, 37), (244, 231, 37), (233, 220, 34), (214, 194, 34), (225, 208, 34), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (233, 220, 34), (225, 208, 34), (203, 142, 61), (145, 91, 73), (141, 71, 82), (81, 31, 68), (19, 18, 17), (100, 88, 63), (131, 119, 90), (106, 94, 69), (93, 74, 37), (93, 74, 37), (100, 79, 40), (107, 84, 42), (107, 84, 42), (100, 79, 40), (93, 74, 37), (84, 67, 31), (84, 67, 31), (93, 69, 29), (93, 74, 37), (93, 74, 37), (84, 67, 31), (79, 61, 28), (84, 67, 31), (84, 67, 31), (73, 56, 25), (60, 44, 19), (67, 50, 22), (84, 67, 31), (67, 50, 22), (73, 56, 25), (93, 74, 37), (93, 74, 37), (79, 61, 28), (67, 50, 22), (79, 61, 28), (93, 69, 29), (84, 67, 31), (84, 67, 31), (79, 61, 28), (60, 44, 19), (60, 44, 19), (81, 31, 68), (147, 50, 81), (170, 60, 99), (187, 66, 109), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (170, 60, 99), (170, 60, 99), (147, 50, 81), (119, 38, 63), (60, 22, 18), (16, 13, 14), (69, 63, 51), (116, 108, 92), (116, 108, 92), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (111, 101, 90), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (99, 91, 85), (99, 91, 85), (96, 87, 81), (78, 71, 58), (78, 71, 58), (84, 67, 31), (78, 71, 58), (78, 71, 58), (84, 67, 31), (78, 71, 58), (78, 71, 58), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (91, 83, 78), (100, 88, 63), (87, 80, 63), (91, 83, 78), (91, 83, 78), (69, 63, 51), (63, 54, 47), (69, 63, 51), (91, 83, 78), (116, 107, 112), (125, 117, 117), (131, 119, 90), (141, 134, 16), (141, 134, 16), (141, 134, 16), (107, 100, 17), (50, 50, 17), (69, 63, 14), (57, 58, 16), (50, 50, 17), (50, 50, 17), (45, 40, 15), (50, 50, 17), (77, 72, 17), (94, 90, 21), (94, 90, 21), (87, 80, 63), (45, 40, 15), (60, 22, 18), (85, 37, 23), (96, 76, 66), (96, 76, 66), (115, 80, 68), (116, 58, 26), (85, 37, 23), (112, 44, 23), (145, 91, 73), (156, 124, 106), (120, 70, 32), (118, 32, 19), (135, 37, 23), (166, 136, 121), (230, 225, 226), (236, 224, 159), (244, 231, 37), (244, 231, 37), (244, 231, 37), (225, 208, 34), (189, 174, 25), (225, 208, 34), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (233, 220, 34), (214, 194, 34), (175, 108, 37), (145, 91, 73), (87, 51, 61), (16, 13, 14), (83, 66, 57), (100, 88, 63), (73, 56, 25), (54, 48, 43), (93, 74, 37), (114, 91, 48), (121, 96, 51), (121, 96, 51), (107, 84, 42), (100, 79, 40), (84, 67, 31), (84, 67, 31), (79, 61, 28), (93, 74, 37), (93, 74, 37), (84, 67, 31), (79, 61, 28), (84, 67, 31), (84, 67, 31), (84, 67, 31), (60, 44, 19), (60, 44, 19), (84, 67, 31), (67, 50, 22), (67, 50, 22), (93, 74, 37), (93, 74, 37), (93, 69, 29), (73, 56, 25), (67, 50, 22), (84, 67, 31), (84, 67, 31), (79, 61, 28), (79, 61, 28), (60, 44, 19), (60, 44, 19), (119, 38, 63), (147, 50, 81), (170, 60, 99), (170, 60, 99), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (187, 66, 109), (170, 60, 99), (147, 50, 81), (147, 50, 81), (119, 38, 63), (60, 22, 18), (16, 13, 14), (83, 66, 57), (103, 94, 87), (103, 94, 87), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (96, 87, 81), (96, 87, 81), (91, 83, 78), (91, 83, 78), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (69, 63, 51), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (63, 54, 47), (63, 54, 47), (74, 66, 72), (103, 94, 87), (125, 117, 117), (125, 117, 117), (131, 119, 90), (141, 134, 16), (141, 134, 16), (141, 134, 16), (116, 112, 16), (107, 100, 17), (91, 80, 16), (69, 63, 14), (57, 58, 16), (50, 50, 17), (45, 40, 15), (50, 50, 17), (77, 72, 17), (94, 90, 21), (77, 72, 17), (57, 58, 16), (45, 40, 15), (60, 22, 18), (91, 71, 61), (115, 80, 68), (115, 87, 74), (116, 58, 26), (120, 70, 32), (116, 58, 26), (101, 27, 15), (145, 91, 73), (145, 91, 73), (112, 44, 23), (135, 37, 23), (153, 44, 28), (171, 99, 72), (230, 225, 226), (222, 214, 215), (244, 231, 37), (244, 231, 37), (244, 231, 37), (225, 208, 34), (214, 194, 34), (214, 194, 34), (244, 231, 37), (253, 239, 35), (253, 239, 35), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (233, 220, 34), (225, 208, 34), (171, 137, 26), (171, 99, 72), (141, 71, 82), (32, 22, 18), (45, 40, 15), (69, 63, 51), (69, 63, 51), (63, 54, 47), (93, 74, 37), (114, 91, 48), (114, 91, 48), (121, 96, 51), (114, 91, 48), (100, 79, 40), (93, 74, 37), (84, 67, 31), (79, 61, 28), (93, 74, 37), (93, 74, 37), (93, 69, 29), (84, 67, 31), (84, 67, 31), (84, 67, 31), (93, 74, 37), (73, 56, 25), (60, 44, 19), (84, 67, 31), (79, 61, 28), (60, 44, 19), (84, 67, 31), (93, 74, 37), (93, 74, 37), (93, 69, 29), (73, 56, 25), (79, 61, 28), (93, 69, 29), (79, 61, 28), (84, 67, 31), (67, 50, 22), (60, 35, 42), (119, 38, 63), (147, 50, 81), (170, 60, 99), (170, 60, 99), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (170, 60, 99), (170, 60, 99), (147, 50, 81), (147, 50, 81), (119, 38, 63), (47, 16, 39), (16, 13, 14), (63, 54, 47), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (83, 66, 57), (83, 66, 57), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (99, 91, 85), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (103, 94, 87), (103, 94, 87), (99, 91, 85), (69, 63, 51), (54, 48, 43), (63, 54, 47), (91, 83, 78), (104, 97, 103), (125, 117, 117), (132, 126, 124), (131, 119, 90), (141, 134, 16), (141, 134, 16), (137, 119, 19), (50, 50, 17), (77, 72, 17), (91, 80, 16), (77, 72, 17), (77, 72, 17), (69, 63, 14), (50, 50, 17), (50, 50, 17), (77, 72, 17), (94, 90, 21), (57, 58, 16), (57, 58, 16), (45, 40, 15), (60, 22, 18), (96, 76, 66), (124, 91, 74), (124, 99, 84), (115, 80, 68), (140, 110, 95), (145, 91, 73), (112, 44, 23), (112, 44, 23), (112, 44, 23), (135, 37, 23), (139, 59, 26), (153, 44, 28), (188, 85, 36), (222, 214, 215), (230, 225, 226), (248, 237, 107), (244, 231, 37), (244, 231, 37), (214, 194, 34), (214, 194, 34), (225, 208, 34), (244, 231, 37), (253, 239, 35), (253, 239, 35), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (244, 231, 37), (233, 220, 34), (206, 157, 83), (171, 99, 72), (141, 71, 82), (60, 35, 42), (36, 34, 14), (99, 91, 85), (116, 108, 92), (87, 80, 63), (93, 74, 37), (114, 91, 48), (114, 91, 48), (121, 96, 51), (121, 96, 51), (107, 84, 42), (100, 79, 40), (84, 67, 31), (84, 67, 31), (93, 74, 37), (93, 74, 37), (93, 74, 37), (93, 69, 29), (84, 67, 31), (79, 61, 28), (93, 74, 37), (84, 67, 31), (60, 44, 19), (79, 61, 28), (84, 67, 31), (67, 50, 22), (73, 56, 25), (93, 74, 37), (93, 74, 37), (93, 74, 37), (79, 61, 28), (73, 56, 25), (93, 74, 37), (84, 67, 31), (84, 67, 31), (79, 61, 28), (60, 35, 42), (119, 38, 63), (147, 50, 81), (170, 60, 99), (170, 60, 99), (187, 66, 109), (195, 69, 114), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (170, 60, 99), (170, 60, 99), (147, 50, 81), (147, 50, 81), (81, 31, 68), (34, 8, 17), (32, 22, 18), (87, 80, 63), (112, 101, 73), (112, 101, 73), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (100, 88, 63), (100, 88, 63), (100, 88, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (96, 87, 81), (54, 48, 43), (44, 36, 32), (42, 27, 52), (66, 54, 66), (96, 87, 81), (125, 117, 117), (132, 126, 124), (137, 127, 62), (141, 134, 16), (158, 150, 19), (107, 100, 17), (77, 72, 17), (91, 80, 16), (69, 63, 14), (77, 72, 17), (91, 80, 16), (94, 90, 21), (91, 80, 16), (69, 63, 14), (91, 80, 16), (94, 90, 21), (87, 80, 63), (50, 50, 17), (45, 40, 15), (60, 22, 18), (116, 58, 26), (116, 58, 26), (116, 58, 26), (120, 70, 32), (150, 119, 103), (145, 91, 73), (112, 44, 23), (112, 44, 23), (139, 59, 26), (163, 68, 30), (163, 68, 30), (163, 68, 30), (188, 85, 36), (212, 200, 193), (230, 225, 226), (248, 237, 107), (244, 231, 37), (233, 220, 34), (214, 194, 34), (225, 208, 34), (225, 208, 34), (233, 220, 34), (253, 239, 35), (253, 239, 35), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (244, 231, 37), (214, 194, 34), (171, 99, 72), (145, 91, 73), (87, 51, 61), (36, 34, 14), (99, 91, 85), (131, 119, 90), (87, 80, 63), (93, 74, 37), (114, 91, 48), (114, 91, 48), (121, 96, 51), (126, 105, 58), (107, 84, 42), (100, 79, 40), (93, 74, 37), (84, 67, 31), (84, 67, 31), (93, 74, 37), (93, 74, 37), (93, 74, 37), (93, 74, 37), (79, 61, 28), (84, 67, 31), (93, 74, 37), (79, 61, 28), (67, 50, 22), (84, 67, 31), (73, 56, 25), (67, 50, 22), (93, 69, 29), (93, 74, 37), (93, 74, 37), (93, 69, 29), (73, 56, 25), (93, 69, 29), (93, 69, 29), (93, 69, 29), (93, 69, 29), (85, 37, 23), (119, 38, 63), (147, 50, 81), (170, 60, 99), (187, 66, 109), (187, 66, 109), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (187, 66, 109), (170, 60, 99), (147, 50, 81), (147, 50, 81), (101, 27, 15), (34, 8, 17), (36, 34, 14), (106, 94, 69), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (108, 89, 79), (100, 88, 63), (100, 88, 63), (100, 88, 63), (100, 88, 63), (87, 80, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (83, 75, 74), (44, 36, 32), (44, 36, 32), (60, 35, 42), (63, 38, 70), (63, 38, 70), (116, 107, 112), (132, 126, 124), (137, 119, 19), (141, 134, 16), (158, 150, 19), (91, 80, 16), (57, 58, 16), (69, 63, 14), (50, 50, 17), (57, 58, 16), (91, 80, 16), (94, 90, 21), (94, 90, 21), (77, 72, 17), (94, 90, 21), (94, 90, 21), (87, 80, 63), (50, 50, 17), (45, 40, 15), (60, 44, 19), (116, 58, 26), (116, 58, 26), (112, 44, 23), (116, 58, 26), (145, 91, 73), (139, 59, 26), (116, 58, 26), (139, 59, 26), (176, 76, 32), (176, 76, 32), (188, 85, 36), (188, 85, 36), (188, 85, 36), (199, 184, 189), (240, 236, 236), (236, 224, 159), (244, 231, 37), (233, 220, 34), (214, 194, 34), (225, 208, 34), (225, 208, 34), (233, 220, 34), (253, 239, 35), (253, 239, 35), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (251, 239, 52), (232, 207, 90), (175, 108, 37), (145, 91, 73), (90, 62, 89), (32, 22, 18), (78, 71, 58), (131, 119, 90), (78, 71, 58), (84, 67, 31), (114, 91, 48), (114, 91, 48), (121, 96, 51), (126, 105, 58), (121, 96, 51), (107, 84, 42), (107, 84, 42), (93, 69, 29), (84, 67, 31), (100, 79, 40), (93, 74, 37), (93, 74, 37), (100, 79, 40), (84, 67, 31), (79, 61, 28), (100, 79, 40), (93, 74, 37), (67, 50, 22), (73, 56, 25), (84, 67, 31), (67, 50, 22), (79, 61, 28), (93, 74, 37), (93, 74, 37), (93, 74, 37), (79, 61, 28), (79, 61, 28), (93, 74, 37), (93, 69, 29), (93, 69, 29), (85, 37, 23), (147, 50, 81), (147, 50, 81), (170, 60, 99), (187, 66, 109), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (187, 66, 109), (187, 66, 109), (187, 66, 109), (170, 60, 99), (147, 50, 81), (119, 38, 63), (83, 23, 19), (34, 8, 17), (50, 41, 35), (112, 101, 73), (112, 101, 73), (116, 108, 92), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (108, 89, 79), (100, 88, 63), (100, 88, 63), (87, 80, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (99, 91, 85), (63, 54, 47), (44, 36, 32), (42, 27, 52), (62, 44, 53), (102, 72, 95), (90, 62, 89), (125, 117, 117), (132, 126, 124), (141, 134, 16), (141, 134, 16), (141, 134, 16), (91, 80, 16), (116, 112, 16), (77, 72, 17), (45, 40, 15), (45, 40, 15), (50, 50, 17), (77, 72, 17), (91, 80, 16), (91, 80, 16), (94, 90, 21), (107, 100, 17), (78, 71, 58), (57, 58, 16), (50, 50, 17), (91, 55, 19), (133, 79, 31), (133, 79, 31), (116, 58, 26), (139, 59, 26), (163, 68, 30), (139, 59, 26), (163, 68, 30), (176, 76, 32), (188, 85, 36), (205, 95, 40), (205, 95, 40), (205, 95, 40), (205, 95, 40), (212, 200, 193), (240, 236, 236), (247, 239, 183), (253, 239, 35), (225, 208, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (233, 220, 34), (253, 239, 35), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (251, 239, 52), (233, 220, 34), (203, 142, 61), (171, 99, 72), (141, 71, 82), (32, 22, 18), (69, 63, 51), (131, 119, 90), (78, 71, 58), (84, 67, 31), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (114, 91, 48), (114, 91, 48), (100, 79, 40), (84, 67, 31), (93, 74, 37), (100, 79, 40), (100, 79, 40), (100, 79, 40), (93, 74, 37), (79, 61, 28), (93, 74, 37), (100, 79, 40), (84, 67, 31), (67, 50, 22), (84, 67, 31), (79, 61, 28), (67, 50, 22), (93, 69, 29), (93, 74, 37), (93, 74, 37), (84, 67, 31), (79, 61, 28), (93, 69, 29), (93, 74, 37), (84, 67, 31), (85, 37, 23), (119, 38, 63), (147, 50, 81), (170, 60, 99), (187, 66, 109), (187, 66, 109), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (195, 69, 114), (170, 60, 99), (170, 60, 99), (147, 50, 81), (119, 38, 63), (83, 23, 19), (19, 18, 17), (67, 50, 22), (112, 101, 73), (116, 108, 92), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (96, 87, 81), (63, 54, 47), (66, 54, 66), (63, 54, 47), (74, 66, 72), (102, 72, 95), (86, 51, 85), (125, 117, 117), (131, 119, 90), (141, 134, 16), (141, 134, 16), (141, 134, 16), (116, 112, 16), (141, 134, 16), (77, 72, 17), (50, 50, 17), (57, 58, 16), (50, 50, 17), (57, 58, 16), (45, 40, 15), (57, 58, 16), (94, 90, 21), (94, 90, 21), (63, 54, 47), (73, 56, 25), (57, 58, 16), (107, 84, 42), (154, 128, 116), (143, 116, 106), (133, 79, 31), (155, 83, 37), (176, 76, 32), (176, 76, 32), (188, 85, 36), (204, 115, 48), (204, 115, 48), (204, 115, 48), (204, 115, 48), (204, 115, 48), (204, 115, 48), (212, 200, 193), (240, 236, 236), (247, 239, 183), (244, 231, 37), (225, 208, 34), (225, 208, 34), (225, 208, 34), (225, 208, 34), (225, 208, 34), (253, 239, 35), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (244, 231, 37), (196, 126, 44), (171, 99, 72), (141, 71, 82), (44, 36, 32), (54, 48, 43), (116, 108, 92), (87, 80, 63), (84, 67, 31), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (126, 105, 58), (121, 96, 51), (114, 91, 48), (114, 91, 48), (93, 74, 37), (93, 69, 29), (100, 79, 40), (100, 79, 40), (107, 84, 42), (100, 79, 40), (84, 67, 31), (84, 67, 31), (100, 79, 40), (100, 79, 40), (73, 56, 25), (67, 50, 22), (84, 67, 31), (73, 56, 25), (73, 56, 25), (93, 74, 37), (93, 74, 37), (93, 69, 29), (84, 67, 31), (84, 67, 31), (79, 61, 28), (60, 44, 19), (44, 36, 32), (60, 35, 42), (81, 31, 68), (119, 38, 63), (119, 38, 63), (147, 50, 81), (147, 50, 81), (170, 60, 99), (187, 66, 109), (187, 66, 109), (170, 60, 99), (170, 60, 99), (170, 60, 99), (147, 50, 81), (147, 50, 81), (119, 38, 63), (70, 27, 59), (60, 22, 18), (28, 27, 20), (45, 40, 15), (100, 88, 63), (116, 108, 92), (112, 101, 73), (116, 108, 92), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (108, 89, 79), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (83, 75, 74), (54, 48, 43), (83, 75, 74), (83, 75, 74), (116, 107, 112), (116, 107, 112), (117, 87, 103), (132, 126, 124), (131, 119, 90), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (141, 134, 16), (107, 100, 17), (69, 63, 14), (57, 58, 16), (57, 58, 16), (50, 50, 17), (57, 58, 16), (69, 63, 14), (94, 90, 21), (87, 80, 63), (67, 50, 22), (79, 61, 28), (69, 63, 14), (131, 119, 90), (144, 135, 137), (125, 117, 117), (155, 83, 37), (205, 95, 40), (188, 85, 36), (205, 95, 40), (204, 115, 48), (229, 173, 73), (226, 154, 51), (216, 133, 46), (216, 133, 46), (216, 133, 46), (216, 133, 46), (212, 200, 193), (240, 236, 236), (247, 239, 183), (244, 231, 37), (225, 208, 34), (233, 220, 34), (225, 208, 34), (214, 194, 34), (225, 208, 34), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (251, 239, 52), (244, 231, 37), (203, 142, 61), (171, 99, 72), (145, 91, 73), (60, 35, 42), (36, 34, 14), (111, 101, 90), (116, 108, 92), (100, 88, 63), (107, 84, 42), (121, 96, 51), (121, 96, 51), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (114, 91, 48), (107, 84, 42), (93, 69, 29), (100, 79, 40), (107, 84, 42), (107, 84, 42), (107, 84, 42), (93, 74, 37), (79, 61, 28), (93, 74, 37), (107, 84, 42), (93, 74, 37), (67, 50, 22), (73, 56, 25), (84, 67, 31), (73, 56, 25), (79, 61, 28), (93, 74, 37), (84, 67, 31), (79, 61, 28), (67, 50, 22), (50, 41, 35), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (60, 35, 42), (60, 35, 42), (60, 35, 42), (60, 35, 42), (87, 51, 61), (91, 71, 61), (87, 51, 61), (81, 31, 68), (70, 27, 59), (60, 35, 42), (60, 35, 42), (60, 35, 42), (60, 35, 42), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (60, 44, 19), (100, 88, 63), (116, 108, 92), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (91, 83, 78), (91, 83, 78), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (69, 63, 51), (50, 41, 35), (74, 66, 72), (91, 83, 78), (125, 117, 117), (132, 126, 124), (132, 126, 124), (132, 126, 124), (137, 127, 62), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (141, 134, 16), (116, 112, 16), (91, 80, 16), (77, 72, 17), (50, 50, 17), (50, 50, 17), (77, 72, 17), (77, 72, 17), (94, 90, 21), (78, 71, 58), (60, 44, 19), (79, 61, 28), (93, 74, 37), (144, 135, 137), (144, 135, 137), (140, 110, 95), (175, 108, 37), (204, 115, 48), (204, 115, 48), (216, 133, 46), (226, 154, 51), (229, 173, 73), (226, 154, 51), (226, 154, 51), (226, 154, 51), (226, 154, 51), (226, 154, 51), (230, 225, 226), (247, 245, 246), (247, 239, 183), (233, 220, 34), (225, 208, 34), (233, 220, 34), (225, 208, 34), (214, 194, 34), (225, 208, 34), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (203, 142, 61), (162, 87, 130), (150, 119, 103), (87, 51, 61), (32, 22, 18), (111, 101, 90), (132, 126, 124), (106, 94, 69), (100, 79, 40), (114, 91, 48), (121, 96, 51), (121, 96, 51), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (114, 91, 48), (93, 74, 37), (100, 79, 40), (107, 84, 42), (107, 84, 42), (107, 84, 42), (100, 79, 40), (84, 67, 31), (79, 61, 28), (100, 79, 40), (107, 84, 42), (93, 69, 29), (73, 56, 25), (73, 56, 25), (79, 61, 28), (73, 56, 25), (84, 67, 31), (79, 61, 28), (67, 50, 22), (50, 41, 35), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (54, 48, 43), (50, 41, 35), (62, 44, 53), (83, 66, 57), (78, 59, 51), (54, 48, 43), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (50, 41, 35), (100, 88, 63), (116, 108, 92), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (100, 88, 63), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (99, 91, 85), (63, 54, 47), (50, 41, 35), (74, 66, 72), (103, 94, 87), (132, 126, 124), (132, 126, 124), (132, 126, 124), (132, 126, 124), (137, 127, 62), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (141, 134, 16), (116, 112, 16), (91, 80, 16), (91, 80, 16), (91, 80, 16), (91, 80, 16), (69, 63, 14), (77, 72, 17), (94, 90, 21), (63, 54, 47), (67, 50, 22), (84, 67, 31), (106, 94, 69), (162, 148, 139), (132, 126, 124), (147, 115, 97), (204, 115, 48), (216, 133, 46), (206, 157, 83), (226, 154, 51), (229, 173, 73), (229, 173, 73), (226, 154, 51), (226, 154, 51), (226, 154, 51), (226, 154, 51), (229, 173, 73), (240, 236, 236), (247, 245, 246), (247, 239, 183), (233, 220, 34), (225, 208, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (225, 208, 34), (253, 239, 35), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (251, 239, 52), (204, 115, 48), (155, 66, 132), (151, 109, 135), (115, 87, 74), (19, 18, 17), (78, 71, 58), (131, 119, 90), (106, 94, 69), (100, 79, 40), (114, 91, 48), (121, 96, 51), (121, 96, 51), (114, 91, 48), (121, 96, 51), (121, 96, 51), (114, 91, 48), (114, 91, 48), (100, 79, 40), (93, 74, 37), (107, 84, 42), (107, 84, 42), (107, 84, 42), (107, 84, 42), (100, 79, 40), (84, 67, 31), (84, 67, 31), (107, 84, 42), (107, 84, 42), (93, 74, 37), (73, 56, 25), (73, 56, 25), (84, 67, 31), (73, 56, 25), (50, 41, 35), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (63, 54, 47), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (45, 40, 15), (44, 36, 32), (45, 40, 15), (87, 80, 63), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (108, 89, 79), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (96, 87, 81), (99, 91, 85), (99, 91, 85), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (91, 83, 78), (54, 48, 43), (62, 44, 53), (83, 75, 74), (116, 107, 112), (144, 135, 137), (132, 126, 124), (132, 126, 124), (125, 117, 117), (137, 127, 62), (158, 150, 19), (158, 150, 19), (158, 150, 19), (158, 150, 19), (158, 150, 19), (107, 100, 17), (91, 80, 16), (94, 90, 21), (94, 90, 21), (107, 100, 17), (107, 100, 17), (94, 90, 21), (100, 79, 40), (67, 50, 22), (91, 55, 19), (93, 69, 29), (116, 108, 92), (144, 135, 137), (125, 117, 117), (175, 108, 37), (216, 133, 46), (226, 154, 51), (229, 173, 73), (226, 154, 51), (229, 173, 73), (229, 173, 73), (226, 154, 51), (226, 154, 51), (216, 133, 46), (216, 133, 46), (226, 154, 51), (230, 225, 226), (247, 245, 246), (247, 239, 183), (233, 220, 34), (225, 208, 34), (233, 220, 34), (225, 208, 34), (214, 194, 34), (214, 194, 34), (244, 231, 37), (251, 239, 52), (253, 239, 35), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (253, 239, 35), (171, 99, 72), (155, 66, 132), (170, 60, 99), (141, 71, 82), (19, 18, 17), (44, 36, 32), (131, 119, 90), (131, 119, 90), (100, 79, 40), (107, 84, 42), (121, 96, 51), (121, 96, 51), (114, 91, 48), (114, 91, 48), (121, 96, 51), (121, 96, 51), (114, 91, 48), (114, 91, 48), (93, 74, 37), (107, 84, 42), (107, 84, 42), (107, 84, 42), (107, 84, 42), (107, 84, 42), (93, 74, 37), (79, 61, 28), (93, 69, 29), (107, 84, 42), (107, 84, 42), (93, 74, 37), (67, 50, 22), (60, 44, 19), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (50, 41, 35), (50, 41, 35), (54, 48, 43), (54, 48, 43), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (44, 36, 32), (45, 40, 15), (87, 80, 63), (112, 101, 73), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (78, 71, 58), (96, 87, 81), (99, 91, 85), (99, 91, 85), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (96, 87, 81), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (83, 75, 74), (54, 48, 43), (66, 54, 66), (86, 51, 85), (117, 87, 103), (132, 126, 124), (132, 126, 124), (125, 117, 117), (132, 126, 124), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (158, 150, 19), (141, 134, 16), (107, 100, 17), (91, 80, 16), (94, 90, 21), (106, 94, 69), (111, 101, 90), (116, 108, 92), (106, 94, 69), (78, 71, 58), (60, 44, 19), (91, 55, 19), (100, 79, 40), (131, 119, 90), (132, 126, 124), (130, 104, 87), (196, 126, 44), (226, 154, 51), (226, 154, 51), (229, 173, 73), (226, 154, 51), (229, 173, 73), (226, 154, 51), (216, 133, 46), (216, 133, 46), (216, 133, 46), (203, 142, 61), (216, 133, 46), (212, 200, 193), (240, 236, 236), (247, 239, 183), (225, 208, 34), (233, 220, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (214, 194, 34), (244, 231, 37), (251, 239, 52), (253, 239, 35), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (251, 239, 52), (248, 237, 107), (251, 239, 52), (204, 115, 48), (155, 66, 132), (155, 66, 132), (141, 71, 82), (32, 22, 18), (28, 27, 20), (131, 119, 90), (146, 133, 97), (100, 88, 63), (107, 84, 42), (121, 96, 51), (121, 96, 51), (114, 91, 48), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (114, 91, 48), (107, 84, 42), (100, 79, 40), (107, 84, 42), (114, 91, 48), (107, 84, 42), (114, 91, 48), (107, 84, 42), (84, 67, 31), (73, 56, 25), (93, 74, 37), (107, 84, 42), (84, 67, 31), (50, 41, 35), (44, 36, 32), (45, 40, 15), (50, 41, 35), (50, 41, 35), (50, 41, 35), (60, 44, 19), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (54, 48, 43), (63, 54, 47), (63, 54, 47), (63, 54, 47), (54, 48, 43), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 50, 17), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (44, 36, 32), (36, 34, 14), (78, 71, 58), (112, 101, 73), (112, 101, 73), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (28, 27, 20), (54, 48, 43), (78, 71, 58), (99, 91, 85), (111, 101, 90), (99, 91, 85), (96, 87, 81), (99, 91, 85), (96, 87, 81), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (69, 63, 51), (54, 48, 43), (91, 83, 78), (104, 97, 103), (116, 107, 112), (132, 126, 124), (132, 126, 124), (132, 126, 124), (132, 126, 124), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (158, 150, 19), (141, 134, 16), (107, 100, 17), (94, 90, 21), (96, 87, 81), (96, 87, 81), (104, 97, 103), (104, 97, 103), (96, 87, 81), (69, 63, 51), (50, 50, 17), (91, 55, 19), (114, 88, 18), (112, 101, 73), (116, 108, 92), (175, 108, 37), (226, 154, 51), (229, 173, 73), (216, 133, 46), (229, 173, 73), (229, 173, 73), (229, 173, 73), (226, 154, 51), (203, 142, 61), (216, 133, 46), (206, 157, 83), (203, 142, 61), (216, 133, 46), (229, 173, 73), (212, 200, 193), (236, 224, 159), (233, 220, 34), (233, 220, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (214, 194, 34), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (248, 237, 107), (248, 237, 107), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (196, 126, 44), (155, 66, 132), (155, 66, 132), (141, 71, 82), (32, 22, 18), (28, 27, 20), (131, 119, 90), (153, 143, 108), (131, 119, 90), (107, 84, 42), (121, 96, 51), (121, 96, 51), (107, 84, 42), (107, 84, 42), (126, 105, 58), (121, 96, 51), (114, 91, 48), (114, 91, 48), (107, 84, 42), (84, 67, 31), (100, 79, 40), (107, 84, 42), (114, 91, 48), (114, 91, 48), (114, 91, 48), (100, 79, 40), (79, 61, 28), (73, 56, 25), (79, 61, 28), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (54, 48, 43), (63, 54, 47), (69, 63, 51), (131, 119, 90), (131, 119, 90), (91, 71, 61), (63, 54, 47), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (44, 36, 32), (38, 29, 27), (69, 63, 51), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (100, 88, 63), (16, 13, 14), (23, 22, 18), (54, 48, 43), (83, 75, 74), (111, 101, 90), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (63, 54, 47), (60, 35, 42), (90, 62, 89), (104, 97, 103), (125, 117, 117), (144, 135, 137), (132, 126, 124), (132, 126, 124), (146, 133, 97), (141, 134, 16), (158, 150, 19), (158, 150, 19), (158, 150, 19), (153, 143, 108), (146, 133, 97), (106, 94, 69), (87, 80, 63), (66, 54, 66), (60, 35, 42), (70, 27, 59), (70, 27, 59), (62, 44, 53), (50, 50, 17), (73, 56, 25), (116, 58, 26), (133, 79, 31), (91, 80, 16), (121, 96, 51), (203, 142, 61), (226, 154, 51), (229, 173, 73), (216, 133, 46), (203, 142, 61), (226, 154, 51), (203, 142, 61), (206, 157, 83), (203, 142, 61), (204, 115, 48), (206, 157, 83), (196, 126, 44), (203, 142, 61), (206, 157, 83), (210, 181, 145), (236, 224, 159), (244, 231, 37), (233, 220, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (214, 194, 34), (251, 239, 52), (253, 239, 35), (253, 239, 35), (251, 239, 52), (251, 239, 52), (248, 237, 107), (248, 237, 107), (253, 239, 35), (253, 239, 35), (253, 239, 35), (226, 154, 51), (155, 66, 132), (155, 66, 132), (141, 71, 82), (38, 29, 27), (32, 22, 18), (131, 119, 90), (153, 143, 108), (146, 133, 97), (112, 101, 73), (121, 96, 51), (114, 91, 48), (100, 79, 40), (107, 84, 42), (126, 105, 58), (121, 96, 51), (114, 91, 48), (107, 84, 42), (93, 69, 29), (79, 61, 28), (93, 74, 37), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (114, 91, 48), (100, 79, 40), (79, 61, 28), (60, 44, 19), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (45, 40, 15), (44, 36, 32), (45, 40, 15), (44, 36, 32), (38, 29, 27), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (54, 48, 43), (69, 63, 51), (153, 143, 108), (162, 148, 139), (78, 71, 58), (54, 48, 43), (50, 41, 35), (44, 36, 32), (44, 36, 32), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (38, 29, 27), (32, 22, 18), (69, 63, 51), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (16, 13, 14), (23, 22, 18), (50, 41, 35), (104, 97, 103), (116, 108, 92), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (91, 83, 78), (54, 48, 43), (83, 75, 74), (111, 77, 111), (90, 62, 89), (117, 87, 103), (116, 107, 112), (125, 117, 117), (132, 126, 124), (146, 133, 97), (146, 133, 97), (146, 133, 97), (162, 148, 139), (162, 148, 139), (162, 148, 139), (132, 126, 124), (91, 83, 78), (78, 59, 51), (58, 21, 50), (47, 16, 39), (58, 21, 50), (58, 21, 50), (62, 44, 53), (50, 50, 17), (73, 56, 25), (116, 58, 26), (133, 79, 31), (93, 69, 29), (175, 108, 37), (229, 173, 73), (203, 142, 61), (175, 108, 37), (188, 85, 36), (175, 108, 37), (203, 142, 61), (204, 115, 48), (203, 142, 61), (196, 126, 44), (196, 126, 44), (206, 157, 83), (206, 157, 83), (226, 154, 51), (206, 157, 83), (210, 181, 145), (236, 224, 159), (251, 239, 52), (244, 231, 37), (233, 220, 34), (225, 208, 34), (214, 194, 34), (225, 208, 34), (251, 239, 52), (244, 231, 37), (253, 239, 35), (251, 239, 52), (251, 239, 52), (251, 239, 52), (248, 237, 107), (253, 239, 35), (251, 239, 52), (253, 239, 35), (229, 173, 73), (187, 66, 109), (155, 66, 132), (141, 71, 82), (38, 29, 27), (32, 22, 18), (131, 119, 90), (153, 143, 108), (153, 143, 108), (131, 119, 90), (114, 91, 48), (100, 79, 40), (107, 84, 42), (114, 91, 48), (114, 91, 48), (107, 84, 42), (114, 91, 48), (107, 84, 42), (107, 84, 42), (100, 79, 40), (79, 61, 28), (93, 74, 37), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (114, 91, 48), (93, 69, 29), (60, 44, 19), (44, 36, 32), (44, 36, 32), (50, 41, 35), (44, 36, 32), (38, 29, 27), (44, 36, 32), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (54, 48, 43), (69, 63, 51), (78, 71, 58), (50, 41, 35), (44, 36, 32), (38, 29, 27), (30, 31, 37), (28, 27, 20), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (30, 31, 37), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (19, 18, 17), (36, 34, 14), (100, 88, 63), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (100, 88, 63), (16, 13, 14), (28, 27, 20), (44, 36, 32), (83, 75, 74), (111, 101, 90), (83, 75, 74), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (83, 75, 74), (54, 48, 43), (90, 62, 89), (104, 97, 103), (111, 77, 111), (117, 87, 103), (117, 87, 103), (123, 100, 101), (132, 126, 124), (144, 135, 137), (144, 135, 137), (144, 135, 137), (144, 135, 137), (132, 126, 124), (116, 107, 112), (90, 62, 89), (66, 54, 66), (66, 54, 66), (58, 21, 50), (47, 16, 39), (58, 21, 50), (58, 21, 50), (63, 54, 47), (50, 50, 17), (69, 63, 51), (116, 58, 26), (120, 70, 32), (114, 88, 18), (226, 154, 51), (229, 173, 73), (226, 154, 51), (204, 115, 48), (175, 108, 37), (196, 126, 44), (204, 115, 48), (175, 108, 37), (196, 126, 44), (196, 126, 44), (216, 133, 46), (196, 126, 44), (204, 115, 48), (216, 133, 46), (210, 181, 145), (222, 214, 215), (236, 224, 159), (251, 239, 52), (251, 239, 52), (233, 220, 34), (225, 208, 34), (225, 208, 34), (214, 194, 34), (244, 231, 37), (244, 231, 37), (244, 231, 37), (253, 239, 35), (251, 239, 52), (251, 239, 52), (248, 237, 107), (251, 239, 52), (253, 239, 35), (251, 239, 52), (225, 208, 34), (187, 66, 109), (155, 66, 132), (141, 71, 82), (38, 29, 27), (23, 22, 18), (131, 119, 90), (153, 143, 108), (153, 143, 108), (146, 133, 97), (112, 101, 73), (100, 79, 40), (107, 84, 42), (121, 96, 51), (100, 79, 40), (93, 74, 37), (121, 96, 51), (126, 105, 58), (126, 105, 58), (121, 96, 51), (73, 56, 25), (73, 56, 25), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (100, 79, 40), (60, 44, 19), (50, 41, 35), (50, 41, 35), (44, 36, 32), (44, 36, 32), (44, 36, 32), (38, 29, 27), (44, 36, 32), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (30, 31, 37), (30, 31, 37), (38, 29, 27), (38, 29, 27), (50, 41, 35), (63, 54, 47), (54, 48, 43), (30, 31, 37), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (23, 22, 18), (28, 27, 20), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (44, 36, 32), (44, 36, 32), (50, 41, 35), (32, 22, 18), (23, 22, 18), (87, 80, 63), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (23, 22, 18), (63, 54, 47), (144, 135, 137), (54, 48, 43), (30, 31, 37), (44, 36, 32), (91, 83, 78), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (83, 75, 74), (74, 66, 72), (104, 97, 103), (123, 100, 101), (117, 87, 103), (102, 72, 95), (117, 87, 103), (116, 107, 112), (132, 126, 124), (144, 135, 137), (116, 107, 112), (111, 77, 111), (86, 51, 85), (90, 36, 80), (90, 36, 80), (58, 21, 50), (47, 16, 39), (60, 35, 42), (58, 21, 50), (47, 16, 39), (58, 21, 50), (58, 21, 50), (63, 54, 47), (50, 50, 17), (69, 63, 14), (116, 58, 26), (133, 79, 31), (154, 126, 20), (226, 154, 51), (226, 154, 51), (216, 133, 46), (226, 154, 51), (204, 115, 48), (204, 115, 48), (175, 108, 37), (175, 108, 37), (196, 126, 44), (196, 126, 44), (196, 126, 44), (204, 115, 48), (204, 115, 48), (216, 133, 46), (212, 200, 193), (222, 214, 215), (232, 207, 90), (251, 239, 52), (251, 239, 52), (244, 231, 37), (233, 220, 34), (225, 208, 34), (214, 194, 34), (244, 231, 37), (244, 231, 37), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (253, 239, 35), (233, 220, 34), (195, 69, 114), (167, 72, 145), (141, 71, 82), (38, 29, 27), (32, 22, 18), (131, 119, 90), (153, 143, 108), (153, 143, 108), (153, 143, 108), (131, 119, 90), (100, 79, 40), (107, 84, 42), (121, 96, 51), (107, 84, 42), (107, 84, 42), (126, 105, 58), (126, 105, 58), (126, 105, 58), (126, 105, 58), (93, 74, 37), (60, 44, 19), (79, 61, 28), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (107, 84, 42), (60, 44, 19), (50, 41, 35), (50, 41, 35), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (44, 36, 32), (30, 31, 37), (44, 36, 32), (54, 48, 43), (54, 48, 43), (30, 31, 37), (30, 31, 37), (26, 36, 49), (21, 25, 41), (19, 18, 32), (21, 25, 41), (19, 18, 32), (19, 18, 32), (21, 25, 41), (23, 22, 18), (28, 27, 20), (30, 31, 37), (28, 27, 20), (28, 27, 20), (28, 27, 20), (38, 29, 27), (50, 41, 35), (19, 18, 17), (32, 22, 18), (100, 88, 63), (112, 101, 73), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (28, 27, 20), (38, 29, 27), (69, 63, 51), (54, 48, 43), (19, 18, 17), (19, 18, 17), (69, 63, 51), (103, 94, 87), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (78, 71, 58), (91, 83, 78), (132, 126, 124), (144, 135, 137), (132, 126, 124), (116, 107, 112), (102, 72, 95), (102, 72, 95), (126, 94, 134), (111, 77, 111), (90, 36, 80), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (58, 21, 50), (47, 16, 39), (58, 21, 50), (58, 21, 50), (58, 21, 50), (58, 21, 50), (58, 21, 50), (63, 54, 47), (50, 50, 17), (69, 63, 51), (116, 58, 26), (155, 83, 37), (196, 126, 44), (203, 142, 61), (196, 126, 44), (204, 115, 48), (226, 154, 51), (216, 133, 46), (226, 154, 51), (203, 142, 61), (196, 126, 44), (175, 108, 37), (188, 85, 36), (188, 85, 36), (196, 126, 44), (203, 142, 61), (210, 181, 145), (212, 200, 193), (212, 200, 193), (232, 207, 90), (244, 231, 37), (251, 239, 52), (251, 239, 52), (233, 220, 34), (225, 208, 34), (214, 194, 34), (233, 220, 34), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (251, 239, 52), (251, 239, 52), (253, 239, 35), (253, 239, 35), (244, 231, 37), (204, 115, 48), (167, 72, 145), (141, 71, 82), (32, 22, 18), (28, 27, 20), (131, 119, 90), (153, 143, 108), (153, 143, 108), (153, 143, 108), (146, 133, 97), (100, 79, 40), (93, 74, 37), (114, 91, 48), (121, 96, 51), (121, 96, 51), (126, 105, 58), (126, 105, 58), (126, 105, 58), (126, 105, 58), (114, 91, 48), (79, 61, 28), (60, 44, 19), (84, 67, 31), (107, 84, 42), (114, 91, 48), (121, 96, 51), (121, 96, 51), (79, 61, 28), (44, 36, 32), (44, 36, 32), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (30, 31, 37), (30, 31, 37), (44, 36, 32), (44, 36, 32), (44, 36, 32), (30, 31, 37), (44, 36, 32), (54, 48, 43), (50, 41, 35), (30, 31, 37), (26, 36, 49), (44, 36, 32), (30, 31, 37), (21, 25, 41), (30, 31, 37), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (23, 22, 18), (38, 29, 27), (38, 29, 27), (16, 13, 14), (45, 40, 15), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (54, 48, 43), (38, 29, 27), (23, 22, 18), (30, 31, 37), (28, 27, 20), (19, 18, 17), (44, 36, 32), (91, 83, 78), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (96, 87, 81), (84, 67, 31), (99, 91, 85), (132, 126, 124), (144, 135, 137), (144, 135, 137), (132, 126, 124), (125, 117, 117), (116, 107, 112), (125, 117, 117), (86, 51, 85), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (47, 16, 39), (47, 16, 39), (58, 21, 50), (47, 16, 39), (58, 21, 50), (58, 21, 50), (70, 27, 59), (63, 54, 47), (50, 50, 17), (77, 72, 17), (116, 58, 26), (155, 83, 37), (175, 108, 37), (216, 133, 46), (216, 133, 46), (216, 133, 46), (226, 154, 51), (204, 115, 48), (216, 133, 46), (196, 126, 44), (188, 85, 36), (188, 85, 36), (175, 108, 37), (196, 126, 44), (203, 142, 61), (203, 142, 61), (210, 181, 145), (212, 200, 193), (212, 200, 193), (214, 194, 34), (233, 220, 34), (251, 239, 52), (251, 239, 52), (244, 231, 37), (233, 220, 34), (214, 194, 34), (225, 208, 34), (253, 239, 35), (244, 231, 37), (244, 231, 37), (244, 231, 37), (251, 239, 52), (251, 239, 52), (251, 239, 52), (253, 239, 35), (251, 239, 52), (251, 239, 52), (206, 157, 83), (187, 66, 109), (141, 71, 82), (32, 22, 18), (36, 34, 14), (146, 122, 111), (153, 143, 108), (153, 143, 108), (153, 143, 108), (146, 133, 97), (100, 88, 63), (84, 67, 31), (107, 84, 42), (114, 91, 48), (121, 96, 51), (126, 105, 58), (126, 105, 58), (126, 105, 58), (121, 96, 51), (114, 91, 48), (100, 79, 40), (79, 61, 28), (73, 56, 25), (93, 74, 37), (107, 84, 42), (121, 96, 51), (121, 96, 51), (100, 79, 40), (50, 41, 35), (26, 36, 49), (30, 31, 37), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (30, 31, 37), (30, 31, 37), (26, 36, 49), (38, 54, 68), (104, 97, 103), (125, 117, 117), (80, 86, 97), (38, 54, 68), (26, 36, 49), (26, 36, 49), (21, 25, 41), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (23, 22, 18), (28, 27, 20), (19, 18, 17), (9, 6, 9), (50, 41, 35), (106, 94, 69), (112, 101, 73), (106, 94, 69), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (23, 22, 18), (28, 27, 20), (19, 18, 17), (19, 18, 17), (23, 22, 18), (16, 13, 14), (23, 22, 18), (83, 75, 74), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (91, 83, 78), (78, 71, 58), (116, 107, 112), (125, 117, 117), (126, 94, 134), (102, 72, 95), (102, 72, 95), (104, 97, 103), (125, 117, 117), (144, 135, 137), (86, 51, 85), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (47, 16, 39), (47, 16, 39), (47, 16, 39), (58, 21, 50), (58, 21, 50), (58, 21, 50), (60, 35, 42), (63, 54, 47), (57, 58, 16), (77, 72, 17), (120, 70, 32), (176, 76, 32), (175, 108, 37), (203, 142, 61), (216, 133, 46), (216, 133, 46), (229, 173, 73), (226, 154, 51), (229, 173, 73), (196, 126, 44), (216, 133, 46), (203, 142, 61), (196, 126, 44), (203, 142, 61), (206, 157, 83), (203, 142, 61), (206, 157, 83), (206, 157, 83), (169, 160, 159), (184, 171, 173), (232, 207, 90), (251, 239, 52), (251, 239, 52), (251, 239, 52), (233, 220, 34), (214, 194, 34), (225, 208, 34), (253, 239, 35), (251, 239, 52), (244, 231, 37), (244, 231, 37), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (251, 239, 52), (232, 207, 90), (171, 99, 72), (145, 91, 73), (16, 13, 14), (44, 36, 32), (146, 133, 97), (153, 143, 108), (153, 143, 108), (153, 143, 108), (146, 133, 97), (100, 88, 63), (84, 67, 31), (100, 79, 40), (114, 91, 48), (107, 84, 42), (126, 105, 58), (126, 105, 58), (121, 96, 51), (114, 91, 48), (121, 96, 51), (114, 91, 48), (100, 79, 40), (93, 69, 29), (79, 61, 28), (84, 67, 31), (79, 61, 28), (67, 50, 22), (44, 36, 32), (30, 31, 37), (38, 54, 68), (38, 54, 68), (30, 31, 37), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (26, 36, 49), (26, 36, 49), (32, 44, 59), (38, 54, 68), (80, 86, 97), (80, 86, 97), (49, 70, 87), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (19, 18, 32), (28, 27, 20), (28, 27, 20), (19, 18, 17), (7, 9, 33), (7, 9, 33), (23, 22, 18), (78, 71, 58), (112, 101, 73), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (106, 94, 69), (100, 88, 63), (19, 18, 17), (23, 22, 18), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (83, 75, 74), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (91, 83, 78), (83, 75, 74), (102, 72, 95), (86, 51, 85), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (86, 51, 85), (111, 77, 111), (90, 36, 80), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (70, 27, 59), (47, 16, 39), (47, 16, 39), (58, 21, 50), (58, 21, 50), (58, 21, 50), (58, 21, 50), (63, 38, 70), (69, 63, 51), (69, 63, 51), (57, 58, 16), (114, 88, 18), (176, 76, 32), (196, 126, 44), (229, 173, 73), (216, 133, 46), (226, 154, 51), (232, 207, 90), (229, 173, 73), (216, 133, 46), (204, 115, 48), (226, 154, 51), (203, 142, 61), (203, 142, 61), (203, 142, 61), (210, 181, 145), (206, 157, 83), (206, 157, 83), (206, 157, 83), (162, 87, 130), (155, 66, 132), (184, 171, 173), (222, 214, 215), (247, 239, 183), (248, 237, 107), (248, 237, 107), (232, 207, 90), (214, 194, 34), (251, 239, 52), (244, 231, 37), (244, 231, 37), (244, 231, 37), (251, 239, 52), (251, 239, 52), (251, 239, 52), (248, 237, 107), (248, 237, 107), (248, 237, 107), (232, 207, 90), (163, 129, 109), (124, 99, 84), (12, 10, 12), (50, 41, 35), (146, 133, 97), (153, 143, 108), (153, 143, 108), (153, 143, 108), (153, 143, 108), (112, 101, 73), (93, 74, 37), (100, 79, 40), (107, 84, 42), (93, 74, 37), (114, 91, 48), (121, 96, 51), (121, 96, 51), (121, 96, 51), (121, 96, 51), (107, 84, 42), (79, 61, 28), (67, 50, 22), (50, 41, 35), (38, 29, 27), (23, 22, 18), (19, 18, 32), (19, 18, 32), (19, 18, 32), (32, 44, 59), (51, 77, 112), (32, 44, 59), (30, 31, 37), (30, 31, 37), (30, 31, 37), (26, 36, 49), (30, 31, 37), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (32, 44, 59), (32, 44, 59), (32, 44, 59), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (32, 44, 59), (26, 36, 49), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (21, 25, 41), (21, 25, 41), (21, 25, 41), (30, 31, 37), (30, 31, 37), (30, 31, 37), (19, 18, 32), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (45, 40, 15), (69, 63, 51), (79, 61, 28), (84, 67, 31), (78, 71, 58), (87, 80, 63), (106, 94, 69), (106, 94, 69), (100, 88, 63), (30, 31, 37), (23, 22, 18), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (23, 22, 18), (83, 75, 74), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (83, 75, 74), (62, 44, 53), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (70, 27, 59), (81, 31, 68), (90, 36, 80), (81, 31, 68), (81, 31, 68), (70, 27, 59), (58, 21, 50), (47, 16, 39), (47, 16, 39), (58, 21, 50), (58, 21, 50), (58, 21, 50), (58, 21, 50), (70, 27, 59), (63, 54, 47), (57, 58, 16), (57, 58, 16), (94, 90, 21), (155, 83, 37), (206, 157, 83), (229, 173, 73), (216, 133, 46), (216, 133, 46), (226, 154, 51), (226, 154, 51), (204, 115, 48), (216, 133, 46), (203, 142, 61), (162, 148, 139), (184, 171, 173), (210, 181, 145), (199, 184, 189), (199, 184, 189), (184, 171, 173), (162, 87, 130), (139, 58, 119), (126, 51, 105), (139, 58, 119), (192, 133, 184), (230, 225, 226), (240, 236, 236), (240, 236, 236), (212, 200, 193), (210, 181, 145), (236, 224, 159), (236, 224, 159), (236, 224, 159), (236, 224, 159), (236, 224, 159), (247, 239, 183), (247, 239, 183), (247, 239, 183), (247, 245, 246), (253, 252, 251), (240, 236, 236), (184, 171, 173), (132, 105, 99), (12, 10, 12), (54, 48, 43), (146, 133, 97), (153, 143, 108), (153, 143, 108), (153, 143, 108), (153, 143, 108), (131, 119, 90), (93, 74, 37), (84, 67, 31), (100, 79, 40), (100, 79, 40), (114, 91, 48), (121, 96, 51), (100, 79, 40), (93, 74, 37), (73, 56, 25), (44, 36, 32), (28, 27, 20), (19, 18, 32), (19, 18, 32), (19, 18, 32), (8, 14, 45), (8, 14, 45), (8, 20, 59), (8, 20, 59), (11, 26, 69), (49, 70, 87), (49, 70, 87), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (38, 54, 68), (49, 70, 87), (49, 70, 87), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (28, 27, 20), (30, 31, 37), (38, 29, 27), (30, 31, 37), (30, 31, 37), (19, 18, 32), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (19, 18, 17), (60, 44, 19), (67, 50, 22), (60, 44, 19), (60, 44, 19), (60, 44, 19), (73, 56, 25), (87, 80, 63), (100, 88, 63), (28, 27, 20), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (30, 31, 37), (91, 83, 78), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (62, 44, 53), (47, 16, 39), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (70, 27, 59), (81, 31, 68), (90, 36, 80), (81, 31, 68), (81, 31, 68), (58, 21, 50), (58, 21, 50), (47, 16, 39), (47, 16, 39), (60, 35, 42), (60, 35, 42), (58, 21, 50), (58, 21, 50), (63, 38, 70), (74, 66, 72), (57, 58, 16), (77, 72, 17), (94, 90, 21), (175, 108, 37), (206, 157, 83), (229, 173, 73), (216, 133, 46), (226, 154, 51), (226, 154, 51), (216, 133, 46), (216, 133, 46), (203, 142, 61), (162, 148, 139), (212, 200, 193), (222, 214, 215), (199, 184, 189), (184, 171, 173), (192, 133, 184), (162, 87, 130), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (139, 58, 119), (185, 88, 168), (192, 133, 184), (199, 184, 189), (199, 184, 189), (184, 171, 173), (222, 214, 215), (230, 225, 226), (222, 214, 215), (222, 214, 215), (222, 214, 215), (222, 214, 215), (230, 225, 226), (222, 214, 215), (222, 214, 215), (240, 236, 236), (222, 214, 215), (192, 133, 184), (162, 87, 130), (34, 8, 17), (44, 36, 32), (146, 133, 97), (153, 143, 108), (153, 143, 108), (153, 143, 108), (153, 143, 108), (131, 119, 90), (84, 67, 31), (84, 67, 31), (84, 67, 31), (84, 67, 31), (73, 56, 25), (60, 44, 19), (44, 36, 32), (54, 48, 43), (30, 31, 37), (21, 25, 41), (21, 25, 41), (8, 20, 59), (8, 20, 59), (8, 20, 59), (11, 26, 69), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 33, 95), (19, 50, 101), (51, 77, 112), (38, 54, 68), (26, 36, 49), (26, 36, 49), (32, 44, 59), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (49, 70, 87), (132, 126, 124), (80, 86, 97), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (30, 31, 37), (21, 25, 41), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (44, 36, 32), (30, 31, 37), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 14, 45), (7, 9, 33), (38, 29, 27), (60, 44, 19), (60, 44, 19), (67, 50, 22), (67, 50, 22), (60, 44, 19), (67, 50, 22), (69, 63, 51), (23, 22, 18), (19, 18, 17), (23, 22, 18), (19, 18, 17), (19, 18, 17), (19, 18, 17), (63, 54, 47), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (96, 87, 81), (58, 21, 50), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (81, 31, 68), (81, 31, 68), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (70, 27, 59), (58, 21, 50), (58, 21, 50), (47, 16, 39), (47, 16, 39), (60, 35, 42), (70, 27, 59), (58, 21, 50), (70, 27, 59), (63, 38, 70), (91, 83, 78), (57, 58, 16), (94, 90, 21), (137, 127, 62), (226, 154, 51), (216, 133, 46), (226, 154, 51), (226, 154, 51), (229, 173, 73), (226, 154, 51), (204, 115, 48), (175, 108, 37), (166, 136, 121), (199, 184, 189), (199, 184, 189), (192, 133, 184), (162, 87, 130), (139, 58, 119), (126, 51, 105), (139, 58, 119), (126, 51, 105), (139, 58, 119), (126, 51, 105), (111, 47, 96), (126, 51, 105), (139, 58, 119), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (185, 88, 168), (192, 133, 184), (192, 133, 184), (167, 72, 145), (155, 66, 132), (58, 21, 50), (16, 13, 14), (112, 101, 73), (153, 143, 108), (153, 143, 108), (153, 143, 108), (146, 133, 97), (112, 101, 73), (63, 54, 47), (54, 48, 43), (69, 63, 51), (54, 48, 43), (23, 22, 18), (19, 18, 32), (21, 25, 41), (11, 26, 69), (14, 40, 80), (14, 40, 80), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (51, 77, 112), (49, 70, 87), (32, 44, 59), (32, 44, 59), (38, 54, 68), (38, 54, 68), (38, 54, 68), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (125, 117, 117), (49, 70, 87), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (44, 36, 32), (44, 36, 32), (30, 31, 37), (8, 14, 45), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 14, 45), (8, 14, 45), (16, 13, 14), (45, 40, 15), (67, 50, 22), (79, 61, 28), (73, 56, 25), (73, 56, 25), (67, 50, 22), (60, 44, 19), (19, 18, 17), (23, 22, 18), (23, 22, 18), (19, 18, 17), (19, 18, 17), (44, 36, 32), (91, 83, 78), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (91, 83, 78), (58, 21, 50), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (62, 44, 53), (63, 38, 70), (81, 31, 68), (81, 31, 68), (90, 36, 80), (70, 27, 59), (58, 21, 50), (58, 21, 50), (47, 16, 39), (47, 16, 39), (62, 44, 53), (58, 21, 50), (58, 21, 50), (58, 21, 50), (81, 31, 68), (96, 87, 81), (69, 63, 51), (94, 90, 21), (153, 143, 108), (226, 154, 51), (216, 133, 46), (229, 173, 73), (229, 173, 73), (229, 173, 73), (203, 142, 61), (156, 124, 106), (162, 148, 139), (184, 171, 173), (192, 133, 184), (167, 72, 145), (155, 66, 132), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (155, 66, 132), (167, 72, 145), (167, 72, 145), (139, 58, 119), (139, 58, 119), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (185, 88, 168), (185, 88, 168), (185, 88, 168), (139, 58, 119), (90, 36, 80), (12, 10, 12), (63, 54, 47), (116, 108, 92), (99, 91, 85), (78, 71, 58), (54, 48, 43), (26, 36, 49), (21, 25, 41), (11, 26, 69), (32, 44, 59), (32, 44, 59), (11, 26, 69), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (34, 82, 150), (34, 82, 150), (34, 82, 150), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (14, 40, 80), (32, 44, 59), (38, 54, 68), (49, 70, 87), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (30, 31, 37), (30, 31, 37), (44, 36, 32), (26, 36, 49), (26, 36, 49), (8, 14, 45), (8, 14, 45), (21, 25, 41), (26, 36, 49), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 14, 45), (8, 14, 45), (16, 13, 14), (60, 44, 19), (67, 50, 22), (67, 50, 22), (73, 56, 25), (79, 61, 28), (79, 61, 28), (60, 44, 19), (23, 22, 18), (23, 22, 18), (23, 22, 18), (28, 27, 20), (54, 48, 43), (83, 75, 74), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (74, 66, 72), (58, 21, 50), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (60, 35, 42), (63, 54, 47), (83, 66, 57), (87, 51, 61), (81, 31, 68), (81, 31, 68), (70, 27, 59), (58, 21, 50), (47, 16, 39), (47, 16, 39), (47, 16, 39), (62, 44, 53), (58, 21, 50), (58, 21, 50), (58, 21, 50), (81, 31, 68), (104, 97, 103), (132, 126, 124), (146, 133, 97), (229, 173, 73), (226, 154, 51), (226, 154, 51), (229, 173, 73), (229, 173, 73), (203, 142, 61), (166, 136, 121), (169, 160, 159), (184, 171, 173), (185, 88, 168), (167, 72, 145), (167, 72, 145), (155, 66, 132), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (139, 58, 119), (167, 72, 145), (167, 72, 145), (155, 66, 132), (139, 58, 119), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (185, 88, 168), (185, 88, 168), (185, 88, 168), (155, 66, 132), (126, 51, 105), (47, 16, 39), (16, 13, 14), (21, 25, 41), (21, 25, 41), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (15, 28, 82), (15, 28, 82), (15, 33, 95), (19, 50, 101), (19, 50, 101), (19, 50, 101), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (34, 82, 150), (34, 82, 150), (34, 82, 150), (53, 105, 169), (53, 105, 169), (53, 105, 169), (53, 105, 169), (53, 105, 169), (51, 77, 112), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (30, 31, 37), (26, 36, 49), (44, 36, 32), (30, 31, 37), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 20, 59), (7, 9, 33), (36, 34, 14), (73, 56, 25), (60, 44, 19), (67, 50, 22), (73, 56, 25), (73, 56, 25), (45, 40, 15), (38, 29, 27), (50, 41, 35), (50, 41, 35), (69, 63, 51), (96, 87, 81), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (74, 66, 72), (58, 21, 50), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (81, 31, 68), (60, 35, 42), (50, 41, 35), (78, 59, 51), (91, 71, 61), (87, 51, 61), (70, 27, 59), (58, 21, 50), (47, 16, 39), (47, 16, 39), (47, 16, 39), (60, 35, 42), (62, 44, 53), (58, 21, 50), (58, 21, 50), (70, 27, 59), (87, 51, 61), (125, 117, 117), (199, 184, 189), (212, 200, 193), (212, 200, 193), (210, 181, 145), (169, 160, 159), (169, 160, 159), (169, 160, 159), (184, 171, 173), (199, 184, 189), (184, 171, 173), (185, 88, 168), (167, 72, 145), (185, 88, 168), (167, 72, 145), (155, 66, 132), (139, 58, 119), (126, 51, 105), (126, 51, 105), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (111, 47, 96), (126, 51, 105), (155, 66, 132), (167, 72, 145), (155, 66, 132), (139, 58, 119), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (155, 66, 132), (167, 72, 145), (167, 72, 145), (181, 106, 231), (185, 88, 168), (126, 51, 105), (90, 36, 80), (7, 9, 33), (8, 20, 59), (11, 26, 69), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 33, 95), (26, 61, 122), (34, 82, 150), (34, 82, 150), (34, 82, 150), (34, 82, 150), (26, 61, 122), (34, 82, 150), (53, 105, 169), (87, 134, 180), (53, 105, 169), (53, 105, 169), (53, 105, 169), (53, 105, 169), (34, 82, 150), (34, 82, 150), (65, 91, 129), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (38, 54, 68), (38, 54, 68), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (26, 36, 49), (30, 31, 37), (30, 31, 37), (26, 36, 49), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (8, 14, 45), (8, 20, 59), (8, 20, 59), (8, 20, 59), (14, 40, 80), (11, 26, 69), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 20, 59), (8, 20, 59), (32, 22, 18), (73, 56, 25), (67, 50, 22), (60, 44, 19), (67, 50, 22), (60, 44, 19), (45, 40, 15), (50, 41, 35), (54, 48, 43), (69, 63, 51), (91, 83, 78), (99, 91, 85), (99, 91, 85), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (62, 44, 53), (58, 21, 50), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (60, 35, 42), (50, 41, 35), (63, 54, 47), (78, 71, 58), (91, 83, 78), (62, 44, 53), (38, 29, 27), (38, 29, 27), (42, 27, 52), (48, 28, 68), (65, 39, 95), (63, 38, 70), (58, 21, 50), (58, 21, 50), (70, 27, 59), (87, 51, 61), (137, 127, 62), (199, 184, 189), (222, 214, 215), (230, 225, 226), (222, 214, 215), (222, 214, 215), (222, 214, 215), (222, 214, 215), (222, 214, 215), (199, 184, 189), (192, 133, 184), (185, 88, 168), (167, 72, 145), (185, 88, 168), (167, 72, 145), (155, 66, 132), (139, 58, 119), (126, 51, 105), (139, 58, 119), (139, 58, 119), (139, 58, 119), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (111, 47, 96), (139, 58, 119), (167, 72, 145), (167, 72, 145), (139, 58, 119), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (155, 66, 132), (167, 72, 145), (167, 72, 145), (185, 88, 168), (185, 88, 168), (155, 66, 132), (111, 47, 96), (34, 18, 44), (11, 26, 69), (15, 28, 82), (15, 28, 82), (11, 26, 69), (11, 26, 69), (11, 26, 69), (15, 28, 82), (15, 28, 82), (15, 28, 82), (14, 40, 80), (53, 105, 169), (87, 134, 180), (53, 105, 169), (53, 105, 169), (34, 82, 150), (53, 105, 169), (87, 134, 180), (53, 105, 169), (53, 105, 169), (53, 105, 169), (53, 105, 169), (34, 82, 150), (26, 61, 122), (26, 61, 122), (26, 61, 122), (49, 70, 87), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (32, 44, 59), (26, 36, 49), (11, 26, 69), (26, 36, 49), (21, 25, 41), (26, 36, 49), (49, 70, 87), (83, 75, 74), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (21, 25, 41), (21, 25, 41), (30, 31, 37), (30, 31, 37), (30, 31, 37), (26, 36, 49), (21, 25, 41), (8, 14, 45), (8, 20, 59), (8, 20, 59), (8, 20, 59), (14, 40, 80), (15, 28, 82), (8, 20, 59), (8, 14, 45), (7, 9, 33), (8, 20, 59), (14, 40, 80), (19, 18, 32), (60, 44, 19), (73, 56, 25), (60, 44, 19), (60, 44, 19), (67, 50, 22), (45, 40, 15), (116, 108, 92), (69, 63, 51), (69, 63, 51), (91, 83, 78), (99, 91, 85), (103, 94, 87), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (99, 91, 85), (63, 38, 70), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (90, 36, 80), (81, 31, 68), (38, 29, 27), (38, 29, 27), (63, 54, 47), (78, 71, 58), (83, 75, 74), (83, 75, 74), (50, 41, 35), (42, 27, 52), (74, 42, 102), (74, 42, 102), (74, 42, 102), (74, 42, 102), (74, 42, 102), (81, 31, 68), (70, 27, 59), (78, 59, 51), (137, 119, 19), (206, 157, 83), (222, 214, 215), (230, 225, 226), (230, 225, 226), (230, 225, 226), (230, 225, 226), (230, 225, 226), (222, 214, 215), (199, 184, 189), (192, 133, 184), (185, 88, 168), (167, 72, 145), (167, 72, 145), (155, 66, 132), (155, 66, 132), (139, 58, 119), (126, 51, 105), (139, 58, 119), (139, 58, 119), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (111, 47, 96), (126, 51, 105), (139, 58, 119), (167, 72, 145), (155, 66, 132), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (155, 66, 132), (167, 72, 145), (185, 88, 168), (185, 88, 168), (167, 72, 145), (126, 51, 105), (81, 31, 68), (8, 14, 45), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 33, 95), (87, 134, 180), (87, 134, 180), (53, 105, 169), (34, 82, 150), (53, 105, 169), (87, 134, 180), (34, 82, 150), (34, 82, 150), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (49, 70, 87), (32, 44, 59), (21, 25, 41), (21, 25, 41), (42, 27, 52), (54, 36, 85), (65, 39, 95), (48, 28, 68), (48, 28, 68), (21, 25, 41), (32, 44, 59), (104, 97, 103), (80, 86, 97), (32, 44, 59), (26, 36, 49), (26, 36, 49), (21, 25, 41), (26, 36, 49), (21, 25, 41), (21, 25, 41), (30, 31, 37), (30, 31, 37), (30, 31, 37), (26, 36, 49), (21, 25, 41), (8, 20, 59), (11, 26, 69), (11, 26, 69), (11, 26, 69), (14, 40, 80), (14, 40, 80), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 14, 45), (14, 40, 80), (21, 25, 41), (45, 40, 15), (79, 61, 28), (60, 44, 19), (45, 40, 15), (67, 50, 22), (45, 40, 15), (63, 54, 47), (78, 71, 58), (91, 83, 78), (87, 80, 63), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (96, 87, 81), (70, 27, 59), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (81, 31, 68), (38, 29, 27), (44, 36, 32), (69, 63, 51), (83, 75, 74), (83, 75, 74), (69, 63, 51), (54, 48, 43), (48, 28, 68), (74, 42, 102), (65, 39, 95), (74, 42, 102), (74, 42, 102), (82, 46, 109), (82, 46, 109), (82, 46, 109), (86, 51, 85), (107, 84, 42), (141, 134, 16), (210, 181, 145), (230, 225, 226), (230, 225, 226), (230, 225, 226), (230, 225, 226), (222, 214, 215), (199, 184, 189), (203, 142, 61), (171, 99, 72), (170, 60, 99), (167, 72, 145), (167, 72, 145), (155, 66, 132), (155, 66, 132), (139, 58, 119), (126, 51, 105), (139, 58, 119), (155, 66, 132), (139, 58, 119), (139, 58, 119), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (111, 47, 96), (126, 51, 105), (155, 66, 132), (155, 66, 132), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (167, 72, 145), (155, 66, 132), (155, 66, 132), (155, 66, 132), (167, 72, 145), (185, 88, 168), (185, 88, 168), (167, 72, 145), (111, 47, 96), (8, 14, 45), (8, 20, 59), (11, 26, 69), (8, 20, 59), (11, 26, 69), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (26, 61, 122), (34, 82, 150), (34, 82, 150), (26, 61, 122), (53, 105, 169), (34, 82, 150), (26, 61, 122), (19, 50, 101), (19, 50, 101), (26, 61, 122), (34, 82, 150), (26, 61, 122), (26, 61, 122), (26, 61, 122), (51, 77, 112), (56, 51, 91), (48, 28, 68), (48, 28, 68), (54, 36, 85), (82, 46, 109), (98, 57, 135), (110, 64, 149), (98, 57, 135), (96, 54, 125), (54, 36, 85), (21, 25, 41), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (26, 36, 49), (32, 44, 59), (26, 36, 49), (14, 40, 80), (19, 50, 101), (14, 40, 80), (14, 40, 80), (14, 40, 80), (19, 50, 101), (14, 40, 80), (8, 14, 45), (7, 9, 33), (8, 14, 45), (19, 50, 101), (14, 40, 80), (28, 27, 20), (79, 61, 28), (67, 50, 22), (45, 40, 15), (60, 44, 19), (60, 44, 19), (91, 83, 78), (99, 91, 85), (96, 87, 81), (87, 80, 63), (96, 87, 81), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (91, 83, 78), (70, 27, 59), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (81, 31, 68), (60, 22, 18), (44, 36, 32), (54, 48, 43), (83, 66, 57), (69, 63, 51), (50, 41, 35), (50, 41, 35), (48, 28, 68), (54, 36, 85), (65, 39, 95), (74, 42, 102), (82, 46, 109), (85, 50, 122), (98, 57, 135), (96, 54, 125), (96, 54, 125), (91, 52, 112), (91, 71, 61), (146, 133, 97), (222, 214, 215), (230, 225, 226), (230, 225, 226), (222, 214, 215), (210, 181, 145), (203, 142, 61), (188, 85, 36), (163, 68, 30), (153, 44, 28), (170, 60, 99), (167, 72, 145), (167, 72, 145), (155, 66, 132), (126, 51, 105), (126, 51, 105), (139, 58, 119), (155, 66, 132), (155, 66, 132), (139, 58, 119), (126, 51, 105), (111, 47, 96), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (126, 51, 105), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (155, 66, 132), (155, 66, 132), (167, 72, 145), (185, 88, 168), (185, 88, 168), (192, 133, 184), (139, 58, 119), (42, 27, 52), (8, 20, 59), (11, 26, 69), (11, 26, 69), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (19, 50, 101), (26, 61, 122), (26, 61, 122), (26, 61, 122), (26, 61, 122), (15, 33, 95), (15, 28, 82), (15, 28, 82), (65, 39, 95), (85, 50, 122), (82, 46, 109), (74, 42, 102), (82, 46, 109), (85, 50, 122), (98, 57, 135), (98, 57, 135), (110, 64, 149), (114, 66, 155), (110, 64, 149), (89, 54, 132), (42, 27, 52), (30, 31, 37), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (30, 31, 37), (30, 31, 37), (54, 48, 43), (32, 44, 59), (14, 40, 80), (15, 33, 95), (14, 40, 80), (19, 50, 101), (19, 50, 101), (19, 50, 101), (19, 50, 101), (8, 20, 59), (8, 14, 45), (7, 9, 33), (14, 40, 80), (51, 77, 112), (32, 22, 18), (67, 50, 22), (73, 56, 25), (60, 44, 19), (60, 44, 19), (67, 50, 22), (99, 91, 85), (99, 91, 85), (99, 91, 85), (87, 80, 63), (96, 87, 81), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (111, 101, 90), (83, 75, 74), (70, 27, 59), (70, 27, 59), (70, 27, 59), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (60, 35, 42), (32, 22, 18), (50, 41, 35), (63, 54, 47), (54, 48, 43), (50, 41, 35), (44, 36, 32), (48, 28, 68), (65, 39, 95), (74, 42, 102), (82, 46, 109), (85, 50, 122), (98, 57, 135), (110, 64, 149), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 59, 128), (101, 63, 111), (144, 135, 137), (212, 200, 193), (230, 225, 226), (212, 200, 193), (206, 157, 83), (171, 99, 72), (163, 68, 30), (135, 37, 23), (135, 37, 23), (170, 60, 99), (167, 72, 145), (167, 72, 145), (155, 66, 132), (126, 51, 105), (139, 58, 119), (155, 66, 132), (155, 66, 132), (139, 58, 119), (155, 66, 132), (155, 66, 132), (141, 71, 82), (111, 47, 96), (111, 47, 96), (111, 47, 96), (111, 47, 96), (126, 51, 105), (126, 51, 105), (126, 51, 105), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (192, 133, 184), (185, 88, 168), (185, 88, 168), (155, 66, 132), (70, 27, 59), (8, 14, 45), (11, 26, 69), (19, 50, 101), (26, 61, 122), (34, 82, 150), (26, 61, 122), (34, 82, 150), (53, 105, 169), (34, 82, 150), (65, 91, 129), (26, 61, 122), (26, 61, 122), (65, 91, 129), (65, 91, 129), (26, 61, 122), (19, 50, 101), (15, 33, 95), (11, 26, 69), (8, 20, 59), (8, 20, 59), (48, 28, 68), (74, 42, 102), (82, 46, 109), (82, 46, 109), (82, 46, 109), (85, 50, 122), (85, 50, 122), (98, 57, 135), (106, 61, 143), (97, 59, 142), (97, 59, 142), (106, 61, 143), (110, 64, 149), (110, 64, 149), (74, 42, 102), (32, 44, 59), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (38, 54, 68), (38, 54, 68), (32, 44, 59), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (19, 50, 101), (26, 61, 122), (11, 26, 69), (8, 14, 45), (7, 9, 33), (14, 40, 80), (53, 105, 169), (30, 31, 37), (60, 44, 19), (67, 50, 22), (60, 44, 19), (67, 50, 22), (73, 56, 25), (99, 91, 85), (99, 91, 85), (103, 94, 87), (87, 80, 63), (91, 83, 78), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (74, 66, 72), (58, 21, 50), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (38, 29, 27), (38, 29, 27), (50, 41, 35), (54, 48, 43), (54, 48, 43), (44, 36, 32), (74, 42, 102), (65, 39, 95), (74, 42, 102), (85, 50, 122), (98, 57, 135), (110, 64, 149), (115, 69, 162), (115, 69, 162), (114, 66, 155), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 59, 128), (126, 94, 134), (169, 160, 159), (206, 157, 83), (205, 95, 40), (163, 68, 30), (139, 59, 26), (112, 44, 23), (118, 32, 19), (139, 58, 119), (155, 66, 132), (167, 72, 145), (155, 66, 132), (126, 51, 105), (139, 58, 119), (139, 58, 119), (139, 58, 119), (155, 66, 132), (139, 58, 119), (162, 87, 130), (141, 71, 82), (141, 71, 82), (111, 47, 96), (111, 47, 96), (111, 47, 96), (111, 47, 96), (111, 47, 96), (126, 51, 105), (139, 58, 119), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (185, 88, 168), (185, 88, 168), (185, 88, 168), (155, 66, 132), (81, 31, 68), (8, 20, 59), (14, 40, 80), (26, 61, 122), (34, 82, 150), (34, 82, 150), (34, 82, 150), (53, 105, 169), (53, 105, 169), (53, 105, 169), (65, 91, 129), (65, 91, 129), (51, 77, 112), (51, 77, 112), (14, 40, 80), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (15, 28, 82), (54, 36, 85), (82, 46, 109), (96, 54, 125), (98, 57, 135), (106, 61, 143), (106, 61, 143), (106, 61, 143), (101, 62, 149), (104, 64, 154), (114, 66, 155), (110, 64, 149), (106, 61, 143), (97, 59, 142), (97, 59, 142), (101, 62, 149), (82, 46, 109), (26, 36, 49), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (30, 31, 37), (26, 36, 49), (38, 54, 68), (32, 44, 59), (14, 40, 80), (19, 50, 101), (19, 50, 101), (49, 70, 87), (19, 50, 101), (26, 61, 122), (14, 40, 80), (8, 14, 45), (7, 9, 33), (11, 26, 69), (87, 134, 180), (38, 54, 68), (36, 34, 14), (45, 40, 15), (36, 34, 14), (60, 44, 19), (67, 50, 22), (99, 91, 85), (99, 91, 85), (103, 94, 87), (91, 83, 78), (87, 80, 63), (99, 91, 85), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (103, 94, 87), (87, 51, 61), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (38, 29, 27), (32, 22, 18), (38, 29, 27), (50, 41, 35), (44, 36, 32), (42, 27, 52), (65, 39, 95), (65, 39, 95), (74, 42, 102), (85, 50, 122), (97, 59, 142), (104, 64, 154), (114, 66, 155), (114, 66, 155), (114, 66, 155), (114, 66, 155), (110, 64, 149), (110, 64, 149), (106, 61, 143), (106, 59, 128), (111, 68, 128), (141, 71, 82), (163, 68, 30), (139, 59, 26), (112, 44, 23), (101, 27, 15), (81, 31, 68), (126, 51, 105), (139, 58, 119), (167, 72, 145), (155, 66, 132), (126, 51, 105), (139, 58, 119), (139, 58, 119), (155, 66, 132), (155, 66, 132), (155, 66, 132), (162, 87, 130), (141, 71, 82), (111, 47, 96), (141, 71, 82), (126, 51, 105), (111, 47, 96), (111, 47, 96), (111, 47, 96), (111, 47, 96), (126, 51, 105), (139, 58, 119), (155, 66, 132), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (155, 66, 132), (167, 72, 145), (155, 66, 132), (167, 72, 145), (167, 72, 145), (167, 72, 145), (167, 72, 145), (81, 31, 68), (11, 26, 69), (26, 61, 122), (53, 105, 169), (53, 105, 169), (53, 105, 169), (53, 105, 169), (34, 82, 150), (53, 105, 169), (34, 82, 150), (26, 61, 122), (19, 50, 101), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (11, 26, 69), (54, 36, 85), (82, 46, 109), (96, 54, 125), (106, 61, 143), (110, 64, 149), (114, 66, 155), (114, 66, 155), (115, 69, 162), (115, 69, 162), (115, 69, 162), (107, 66, 159), (115, 69, 162), (115, 69, 162), (115, 69, 162), (110, 64, 149), (106, 61, 143), (106, 61, 143), (97, 59, 142), (85, 50, 122), (62, 44, 53), (91, 83, 78), (49, 70, 87), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (54, 48, 43), (38, 54, 68), (32, 44, 59), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (51, 77, 112), (19, 50, 101), (8, 14, 45), (7, 9, 33), (19, 18, 32), (87, 134, 180), (51, 77, 112), (32, 22, 18), (36, 34, 14), (36, 34, 14), (45, 40, 15), (60, 44, 19), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (69, 63, 51), (69, 63, 51), (78, 71, 58), (78, 71, 58), (83, 75, 74), (87, 80, 63), (78, 71, 58), (70, 27, 59), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (38, 29, 27), (16, 13, 14), (32, 22, 18), (44, 36, 32), (44, 36, 32), (42, 27, 52), (54, 36, 85), (65, 39, 95), (70, 46, 117), (89, 54, 132), (97, 59, 142), (101, 62, 149), (107, 66, 159), (114, 66, 155), (114, 66, 155), (104, 64, 154), (114, 66, 155), (115, 69, 162), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 59, 128), (111, 47, 96), (85, 37, 23), (85, 37, 23), (83, 23, 19), (81, 31, 68), (126, 51, 105), (155, 66, 132), (167, 72, 145), (155, 66, 132), (139, 58, 119), (139, 58, 119), (139, 58, 119), (162, 87, 130), (192, 133, 184), (162, 87, 130), (151, 109, 135), (141, 71, 82), (111, 47, 96), (126, 51, 105), (141, 71, 82), (145, 91, 73), (111, 47, 96), (90, 36, 80), (90, 36, 80), (111, 47, 96), (126, 51, 105), (139, 58, 119), (139, 58, 119), (139, 58, 119), (139, 58, 119), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (139, 58, 119), (139, 58, 119), (63, 38, 70), (15, 28, 82), (26, 61, 122), (34, 82, 150), (34, 82, 150), (34, 82, 150), (34, 82, 150), (34, 82, 150), (26, 61, 122), (15, 33, 95), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (54, 36, 85), (96, 54, 125), (106, 59, 128), (106, 61, 143), (110, 64, 149), (115, 69, 162), (120, 71, 164), (122, 73, 170), (120, 71, 164), (115, 69, 162), (115, 69, 162), (120, 71, 164), (115, 69, 162), (120, 71, 164), (115, 69, 162), (114, 66, 155), (101, 62, 149), (98, 57, 135), (97, 59, 142), (98, 57, 135), (89, 54, 132), (63, 38, 70), (83, 75, 74), (83, 75, 74), (49, 70, 87), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (38, 54, 68), (32, 44, 59), (26, 36, 49), (26, 36, 49), (32, 44, 59), (32, 44, 59), (19, 50, 101), (19, 50, 101), (19, 50, 101), (49, 70, 87), (51, 77, 112), (26, 61, 122), (8, 20, 59), (8, 14, 45), (8, 14, 45), (65, 91, 129), (51, 77, 112), (19, 18, 17), (36, 34, 14), (45, 40, 15), (60, 44, 19), (67, 50, 22), (69, 63, 51), (69, 63, 51), (69, 63, 51), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (78, 71, 58), (87, 80, 63), (91, 83, 78), (78, 71, 58), (70, 27, 59), (70, 27, 59), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (38, 29, 27), (38, 29, 27), (44, 36, 32), (50, 41, 35), (44, 36, 32), (38, 29, 27), (48, 28, 68), (65, 39, 95), (85, 50, 122), (89, 54, 132), (97, 59, 142), (101, 62, 149), (114, 66, 155), (115, 69, 162), (114, 66, 155), (114, 66, 155), (120, 71, 164), (122, 73, 170), (120, 71, 164), (120, 71, 164), (114, 66, 155), (110, 64, 149), (106, 59, 128), (91, 52, 112), (90, 36, 80), (70, 27, 59), (111, 47, 96), (139, 58, 119), (155, 66, 132), (155, 66, 132), (155, 66, 132), (139, 58, 119), (139, 58, 119), (155, 66, 132), (162, 87, 130), (199, 184, 189), (184, 171, 173), (184, 171, 173), (151, 109, 135), (126, 94, 134), (151, 109, 135), (111, 47, 96), (111, 47, 96), (111, 47, 96), (101, 63, 111), (91, 52, 112), (111, 47, 96), (96, 54, 125), (106, 59, 128), (106, 61, 143), (110, 64, 149), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 59, 128), (106, 59, 128), (96, 54, 125), (106, 59, 128), (106, 59, 128), (98, 57, 135), (106, 59, 128), (91, 52, 112), (74, 42, 102), (56, 51, 91), (19, 50, 101), (26, 61, 122), (34, 82, 150), (34, 82, 150), (19, 50, 101), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (15, 28, 82), (65, 39, 95), (98, 57, 135), (110, 64, 149), (115, 69, 162), (120, 71, 164), (120, 71, 164), (120, 71, 164), (122, 73, 170), (122, 73, 170), (120, 71, 164), (115, 69, 162), (120, 71, 164), (120, 71, 164), (115, 69, 162), (115, 69, 162), (104, 64, 154), (97, 59, 142), (97, 59, 142), (85, 50, 122), (85, 50, 122), (85, 50, 122), (74, 42, 102), (62, 44, 53), (91, 83, 78), (49, 70, 87), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (32, 44, 59), (26, 36, 49), (32, 44, 59), (32, 44, 59), (19, 50, 101), (19, 50, 101), (19, 50, 101), (51, 77, 112), (51, 77, 112), (11, 26, 69), (8, 14, 45), (7, 9, 33), (19, 50, 101), (51, 77, 112), (32, 22, 18), (67, 50, 22), (60, 44, 19), (67, 50, 22), (79, 61, 28), (87, 80, 63), (87, 80, 63), (87, 80, 63), (87, 80, 63), (91, 83, 78), (96, 87, 81), (96, 87, 81), (91, 83, 78), (96, 87, 81), (99, 91, 85), (83, 75, 74), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (50, 41, 35), (54, 48, 43), (50, 41, 35), (50, 41, 35), (44, 36, 32), (38, 29, 27), (48, 28, 68), (74, 42, 102), (75, 50, 126), (81, 54, 134), (87, 56, 139), (104, 64, 154), (115, 69, 162), (115, 69, 162), (115, 69, 162), (120, 71, 164), (122, 73, 170), (122, 73, 170), (122, 73, 170), (130, 76, 170), (130, 76, 170), (120, 71, 164), (114, 66, 155), (106, 61, 143), (106, 59, 128), (91, 52, 112), (90, 36, 80), (126, 51, 105), (155, 66, 132), (155, 66, 132), (139, 58, 119), (139, 58, 119), (139, 58, 119), (139, 58, 119), (167, 72, 145), (192, 133, 184), (144, 135, 137), (126, 94, 134), (126, 94, 134), (126, 94, 134), (111, 68, 128), (101, 63, 111), (101, 63, 111), (101, 63, 111), (91, 52, 112), (96, 54, 125), (91, 52, 112), (85, 50, 122), (85, 50, 122), (85, 50, 122), (96, 54, 125), (98, 57, 135), (106, 61, 143), (98, 57, 135), (98, 57, 135), (89, 54, 132), (89, 54, 132), (98, 57, 135), (106, 61, 143), (106, 61, 143), (106, 61, 143), (106, 61, 143), (120, 74, 147), (111, 68, 128), (101, 63, 111), (75, 50, 126), (51, 77, 112), (26, 61, 122), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (15, 28, 82), (65, 39, 95), (96, 54, 125), (106, 61, 143), (114, 66, 155), (115, 69, 162), (122, 73, 170), (130, 76, 170), (130, 76, 170), (122, 73, 170), (120, 71, 164), (115, 69, 162), (107, 66, 159), (115, 69, 162), (107, 66, 159), (107, 66, 159), (115, 69, 162), (107, 66, 159), (101, 62, 149), (97, 59, 142), (97, 59, 142), (85, 50, 122), (74, 42, 102), (74, 42, 102), (63, 38, 70), (69, 63, 51), (116, 108, 92), (80, 86, 97), (49, 70, 87), (49, 70, 87), (49, 70, 87), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (50, 41, 35), (32, 44, 59), (19, 50, 101), (19, 50, 101), (19, 50, 101), (26, 61, 122), (51, 77, 112), (11, 26, 69), (8, 14, 45), (7, 9, 33), (14, 40, 80), (19, 50, 101), (28, 27, 20), (73, 56, 25), (67, 50, 22), (73, 56, 25), (79, 61, 28), (83, 75, 74), (87, 80, 63), (87, 80, 63), (87, 80, 63), (96, 87, 81), (96, 87, 81), (91, 83, 78), (87, 80, 63), (91, 83, 78), (91, 83, 78), (74, 66, 72), (70, 27, 59), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (60, 35, 42), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (50, 41, 35), (38, 29, 27), (48, 28, 68), (65, 39, 95), (75, 50, 126), (89, 54, 132), (101, 62, 149), (115, 69, 162), (122, 73, 170), (122, 73, 170), (122, 73, 170), (125, 75, 175), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (130, 77, 180), (122, 73, 170), (122, 73, 170), (115, 69, 162), (114, 66, 155), (110, 64, 149), (96, 54, 125), (90, 36, 80), (126, 51, 105), (106, 59, 128), (106, 59, 128), (106, 59, 128), (111, 68, 128), (120, 74, 147), (120, 74, 147), (111, 68, 128), (111, 68, 128), (111, 68, 128), (111, 68, 128), (106, 59, 128), (91, 52, 112), (91, 52, 112), (96, 54, 125), (91, 52, 112), (91, 52, 112), (91, 52, 112), (82, 46, 109), (82, 46, 109), (74, 42, 102), (74, 42, 102), (82, 46, 109), (82, 46, 109), (82, 46, 109), (82, 46, 109), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (89, 54, 132), (98, 57, 135), (98, 57, 135), (106, 61, 143), (120, 74, 147), (120, 74, 147), (120, 74, 147), (120, 74, 147), (111, 68, 128), (82, 46, 109), (54, 36, 85), (48, 28, 68), (48, 28, 68), (65, 39, 95), (96, 54, 125), (106, 61, 143), (114, 66, 155), (114, 66, 155), (115, 69, 162), (120, 71, 164), (122, 73, 170), (130, 76, 170), (130, 76, 170), (122, 73, 170), (115, 69, 162), (104, 64, 154), (104, 64, 154), (101, 62, 149), (101, 62, 149), (101, 62, 149), (104, 64, 154), (104, 64, 154), (104, 64, 154), (101, 62, 149), (89, 54, 132), (70, 46, 117), (65, 39, 95), (54, 36, 85), (50, 41, 35), (111, 101, 90), (132, 126, 124), (80, 86, 97), (51, 77, 112), (49, 70, 87), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (32, 44, 59), (32, 44, 59), (14, 40, 80), (19, 50, 101), (19, 50, 101), (19, 50, 101), (19, 50, 101), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 20, 59), (14, 40, 80), (28, 27, 20), (67, 50, 22), (60, 44, 19), (67, 50, 22), (73, 56, 25), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (69, 63, 51), (63, 54, 47), (63, 54, 47), (63, 54, 47), (63, 54, 47), (63, 54, 47), (60, 35, 42), (81, 31, 68), (90, 36, 80), (81, 31, 68), (81, 31, 68), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (60, 35, 42), (50, 41, 35), (50, 41, 35), (50, 41, 35), (54, 48, 43), (44, 36, 32), (32, 22, 18), (48, 28, 68), (74, 42, 102), (85, 50, 122), (97, 59, 142), (107, 66, 159), (122, 73, 170), (125, 75, 175), (130, 77, 180), (125, 75, 175), (125, 75, 175), (130, 77, 180), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (125, 75, 175), (122, 73, 170), (120, 71, 164), (114, 66, 155), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (96, 54, 125), (106, 59, 128), (101, 63, 111), (106, 59, 128), (111, 68, 128), (120, 74, 147), (111, 68, 128), (111, 68, 128), (98, 57, 135), (96, 54, 125), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (82, 46, 109), (74, 42, 102), (82, 46, 109), (82, 46, 109), (82, 46, 109), (82, 46, 109), (70, 46, 117), (85, 50, 122), (85, 50, 122), (85, 50, 122), (70, 46, 117), (70, 46, 117), (75, 50, 126), (85, 50, 122), (97, 59, 142), (114, 66, 155), (130, 76, 170), (120, 74, 147), (120, 74, 147), (120, 74, 147), (120, 74, 147), (101, 63, 111), (96, 54, 125), (96, 54, 125), (106, 59, 128), (114, 66, 155), (120, 71, 164), (120, 71, 164), (120, 71, 164), (120, 71, 164), (125, 75, 175), (130, 77, 180), (125, 75, 175), (120, 71, 164), (107, 66, 159), (107, 66, 159), (104, 64, 154), (101, 62, 149), (92, 61, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (89, 54, 132), (70, 46, 117), (65, 39, 95), (48, 28, 68), (63, 54, 47), (132, 126, 124), (132, 126, 124), (80, 86, 97), (51, 77, 112), (51, 77, 112), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (38, 54, 68), (32, 44, 59), (26, 36, 49), (26, 36, 49), (32, 44, 59), (26, 36, 49), (14, 40, 80), (19, 50, 101), (19, 50, 101), (38, 54, 68), (19, 50, 101), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 20, 59), (14, 40, 80), (23, 22, 18), (67, 50, 22), (67, 50, 22), (73, 56, 25), (79, 61, 28), (38, 29, 27), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (38, 29, 27), (28, 27, 20), (28, 27, 20), (47, 16, 39), (81, 31, 68), (90, 36, 80), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (90, 36, 80), (81, 31, 68), (70, 27, 59), (50, 41, 35), (50, 41, 35), (50, 41, 35), (44, 36, 32), (63, 54, 47), (44, 36, 32), (32, 22, 18), (48, 28, 68), (74, 42, 102), (85, 50, 122), (97, 59, 142), (115, 69, 162), (125, 75, 175), (130, 77, 180), (130, 77, 180), (125, 75, 175), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 76, 170), (130, 76, 170), (120, 71, 164), (114, 66, 155), (115, 69, 162), (110, 64, 149), (98, 57, 135), (91, 52, 112), (91, 52, 112), (96, 54, 125), (106, 59, 128), (111, 68, 128), (120, 74, 147), (120, 74, 147), (120, 74, 147), (130, 76, 170), (114, 66, 155), (85, 50, 122), (82, 46, 109), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (89, 54, 132), (89, 54, 132), (85, 50, 122), (89, 54, 132), (85, 50, 122), (85, 50, 122), (85, 50, 122), (85, 50, 122), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (85, 50, 122), (97, 59, 142), (106, 61, 143), (97, 59, 142), (120, 74, 147), (120, 74, 147), (110, 64, 149), (110, 64, 149), (110, 64, 149), (115, 69, 162), (120, 71, 164), (122, 73, 170), (125, 75, 175), (130, 76, 170), (125, 75, 175), (130, 77, 180), (130, 77, 180), (130, 77, 180), (115, 69, 162), (101, 62, 149), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (104, 64, 154), (104, 64, 154), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (98, 57, 135), (85, 50, 122), (82, 46, 109), (48, 28, 68), (69, 63, 51), (132, 126, 124), (125, 117, 117), (51, 77, 112), (51, 77, 112), (49, 70, 87), (49, 70, 87), (38, 54, 68), (38, 54, 68), (38, 54, 68), (32, 44, 59), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (32, 44, 59), (26, 36, 49), (14, 40, 80), (14, 40, 80), (14, 40, 80), (14, 40, 80), (19, 50, 101), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 14, 45), (11, 26, 69), (19, 18, 32), (60, 44, 19), (60, 44, 19), (67, 50, 22), (67, 50, 22), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (32, 22, 18), (58, 21, 50), (90, 36, 80), (90, 36, 80), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (81, 31, 68), (70, 27, 59), (58, 21, 50), (44, 36, 32), (44, 36, 32), (50, 41, 35), (38, 29, 27), (50, 41, 35), (38, 29, 27), (32, 22, 18), (42, 27, 52), (74, 42, 102), (89, 54, 132), (101, 62, 149), (120, 71, 164), (125, 75, 175), (122, 73, 170), (130, 77, 180), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (125, 75, 175), (122, 73, 170), (122, 73, 170), (122, 73, 170), (110, 64, 149), (96, 54, 125), (82, 46, 109), (85, 50, 122), (91, 52, 112), (96, 54, 125), (120, 74, 147), (120, 74, 147), (130, 76, 170), (110, 64, 149), (89, 54, 132), (85, 50, 122), (85, 50, 122), (85, 50, 122), (82, 46, 109), (85, 50, 122), (89, 54, 132), (89, 54, 132), (89, 54, 132), (87, 56, 139), (89, 54, 132), (85, 50, 122), (85, 50, 122), (85, 50, 122), (89, 54, 132), (89, 54, 132), (85, 50, 122), (85, 50, 122), (85, 50, 122), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (75, 50, 126), (89, 54, 132), (87, 56, 139), (106, 61, 143), (122, 73, 170), (115, 69, 162), (120, 71, 164), (120, 71, 164), (122, 73, 170), (125, 75, 175), (125, 75, 175), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (134, 80, 184), (130, 77, 180), (107, 66, 159), (92, 61, 149), (92, 61, 149), (92, 61, 149), (95, 62, 152), (95, 62, 152), (107, 66, 159), (107, 66, 159), (114, 66, 155), (104, 64, 154), (101, 62, 149), (107, 66, 159), (106, 61, 143), (96, 54, 125), (85, 50, 122), (63, 38, 70), (96, 87, 81), (162, 148, 139), (132, 126, 124), (65, 91, 129), (51, 77, 112), (49, 70, 87), (49, 70, 87), (38, 54, 68), (38, 54, 68), (32, 44, 59), (32, 44, 59), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (54, 48, 43), (21, 25, 41), (14, 40, 80), (14, 40, 80), (14, 40, 80), (14, 40, 80), (14, 40, 80), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 14, 45), (11, 26, 69), (19, 18, 32), (60, 44, 19), (45, 40, 15), (36, 34, 14), (36, 34, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (32, 22, 18), (58, 21, 50), (81, 31, 68), (90, 36, 80), (90, 36, 80), (81, 31, 68), (90, 36, 80), (70, 27, 59), (60, 35, 42), (63, 54, 47), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (38, 29, 27), (44, 36, 32), (32, 22, 18), (32, 22, 18), (42, 27, 52), (74, 42, 102), (89, 54, 132), (101, 62, 149), (122, 73, 170), (122, 73, 170), (125, 75, 175), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (139, 82, 188), (139, 82, 188), (139, 82, 188), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (130, 77, 180), (122, 73, 170), (122, 73, 170), (125, 75, 175), (114, 66, 155), (98, 57, 135), (85, 50, 122), (82, 46, 109), (82, 46, 109), (96, 54, 125), (110, 64, 149), (114, 66, 155), (114, 66, 155), (106, 61, 143), (98, 57, 135), (85, 50, 122), (75, 50, 126), (85, 50, 122), (70, 46, 117), (85, 50, 122), (89, 54, 132), (97, 59, 142), (101, 62, 149), (101, 62, 149), (101, 62, 149), (87, 56, 139), (89, 54, 132), (89, 54, 132), (89, 54, 132), (81, 54, 134), (85, 50, 122), (81, 54, 134), (89, 54, 132), (89, 54, 132), (85, 50, 122), (70, 46, 117), (70, 46, 117), (75, 50, 126), (75, 50, 126), (81, 54, 134), (87, 56, 139), (92, 61, 149), (101, 62, 149), (110, 64, 149), (120, 71, 164), (122, 73, 170), (125, 75, 175), (125, 75, 175), (125, 75, 175), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (107, 68, 164), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (107, 68, 164), (120, 71, 164), (122, 73, 170), (114, 66, 155), (101, 62, 149), (104, 64, 154), (110, 64, 149), (98, 57, 135), (82, 46, 109), (66, 54, 66), (132, 126, 124), (184, 171, 173), (132, 126, 124), (65, 91, 129), (80, 86, 97), (49, 70, 87), (38, 54, 68), (32, 44, 59), (32, 44, 59), (26, 36, 49), (26, 36, 49), (26, 36, 49), (26, 36, 49), (21, 25, 41), (19, 18, 32), (19, 18, 17), (19, 18, 17), (21, 25, 41), (14, 40, 80), (14, 40, 80), (14, 40, 80), (14, 40, 80), (14, 40, 80), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 14, 45), (8, 20, 59), (19, 18, 32), (28, 27, 20), (36, 34, 14), (32, 22, 18), (32, 22, 18), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (47, 16, 39), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (60, 35, 42), (54, 48, 43), (44, 36, 32), (38, 29, 27), (38, 29, 27), (44, 36, 32), (50, 41, 35), (38, 29, 27), (28, 27, 20), (32, 22, 18), (42, 27, 52), (74, 42, 102), (89, 54, 132), (110, 64, 149), (120, 71, 164), (125, 75, 175), (134, 80, 184), (134, 80, 184), (139, 82, 188), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (130, 77, 180), (114, 72, 171), (122, 73, 170), (125, 75, 175), (120, 71, 164), (122, 73, 170), (115, 69, 162), (97, 59, 142), (96, 54, 125), (89, 54, 132), (85, 50, 122), (98, 57, 135), (114, 66, 155), (114, 66, 155), (101, 62, 149), (97, 59, 142), (89, 54, 132), (81, 54, 134), (75, 50, 126), (75, 50, 126), (85, 50, 122), (81, 54, 134), (81, 54, 134), (87, 56, 139), (92, 61, 149), (104, 64, 154), (101, 62, 149), (101, 62, 149), (97, 59, 142), (87, 56, 139), (97, 59, 142), (87, 56, 139), (87, 56, 139), (97, 59, 142), (97, 59, 142), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (97, 59, 142), (89, 54, 132), (87, 56, 139), (97, 59, 142), (97, 59, 142), (104, 64, 154), (107, 66, 159), (122, 73, 170), (125, 75, 175), (125, 75, 175), (130, 77, 180), (130, 77, 180), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (114, 72, 171), (92, 61, 149), (87, 56, 139), (87, 56, 139), (92, 61, 149), (95, 62, 152), (115, 69, 162), (122, 73, 170), (122, 73, 170), (114, 66, 155), (97, 59, 142), (97, 59, 142), (106, 61, 143), (96, 54, 125), (54, 36, 85), (63, 54, 47), (125, 117, 117), (132, 126, 124), (83, 75, 74), (38, 54, 68), (38, 54, 68), (26, 36, 49), (26, 36, 49), (26, 36, 49), (21, 25, 41), (21, 25, 41), (21, 25, 41), (21, 25, 41), (19, 18, 32), (7, 9, 33), (9, 6, 9), (9, 6, 9), (19, 18, 17), (8, 20, 59), (14, 40, 80), (11, 26, 69), (14, 40, 80), (11, 26, 69), (15, 28, 82), (11, 26, 69), (8, 14, 45), (7, 9, 33), (8, 14, 45), (8, 20, 59), (19, 18, 32), (45, 40, 15), (45, 40, 15), (32, 22, 18), (28, 27, 20), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (34, 18, 44), (70, 27, 59), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (32, 22, 18), (50, 41, 35), (54, 48, 43), (38, 29, 27), (44, 36, 32), (63, 54, 47), (63, 54, 47), (38, 29, 27), (38, 29, 27), (32, 22, 18), (42, 27, 52), (65, 39, 95), (98, 57, 135), (115, 69, 162), (125, 75, 175), (130, 77, 180), (134, 80, 184), (139, 82, 188), (139, 82, 188), (143, 84, 192), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (139, 82, 188), (130, 77, 180), (125, 75, 175), (116, 74, 177), (109, 70, 168), (114, 72, 171), (114, 72, 171), (101, 62, 149), (98, 57, 135), (98, 57, 135), (89, 54, 132), (89, 54, 132), (120, 71, 164), (122, 73, 170), (104, 64, 154), (87, 56, 139), (81, 54, 134), (81, 54, 134), (89, 54, 132), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (98, 57, 135), (88, 59, 145), (101, 62, 149), (101, 62, 149), (101, 62, 149), (97, 59, 142), (92, 61, 149), (95, 62, 152), (88, 59, 145), (92, 61, 149), (95, 62, 152), (95, 62, 152), (97, 59, 142), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (97, 59, 142), (97, 59, 142), (87, 56, 139), (81, 54, 134), (97, 59, 142), (104, 64, 154), (115, 69, 162), (115, 69, 162), (122, 73, 170), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (134, 80, 184), (139, 82, 188), (134, 80, 184), (114, 72, 171), (100, 65, 159), (88, 59, 145), (81, 54, 134), (88, 59, 145), (95, 62, 152), (115, 69, 162), (125, 75, 175), (122, 73, 170), (114, 66, 155), (97, 59, 142), (98, 57, 135), (98, 57, 135), (96, 54, 125), (42, 27, 52), (21, 25, 41), (66, 54, 66), (66, 54, 66), (26, 36, 49), (21, 25, 41), (21, 25, 41), (21, 25, 41), (19, 18, 32), (19, 18, 32), (19, 18, 32), (7, 9, 33), (7, 9, 33), (7, 9, 33), (9, 6, 9), (9, 6, 9), (7, 9, 33), (9, 6, 9), (19, 18, 17), (8, 20, 59), (14, 40, 80), (11, 26, 69), (11, 26, 69), (14, 40, 80), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (8, 14, 45), (8, 20, 59), (28, 27, 20), (84, 67, 31), (84, 67, 31), (60, 44, 19), (45, 40, 15), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (34, 8, 17), (58, 21, 50), (70, 27, 59), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (34, 8, 17), (38, 29, 27), (54, 48, 43), (38, 29, 27), (38, 29, 27), (63, 54, 47), (54, 48, 43), (38, 29, 27), (32, 22, 18), (32, 22, 18), (60, 35, 42), (74, 42, 102), (106, 61, 143), (120, 71, 164), (130, 77, 180), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 84, 192), (139, 82, 188), (139, 82, 188), (139, 82, 188), (134, 80, 184), (134, 80, 184), (130, 77, 180), (125, 75, 175), (125, 75, 175), (114, 72, 171), (114, 72, 171), (102, 67, 163), (95, 62, 152), (97, 59, 142), (89, 54, 132), (89, 54, 132), (89, 54, 132), (97, 59, 142), (101, 62, 149), (92, 61, 149), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (88, 59, 145), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (88, 59, 145), (101, 62, 149), (95, 62, 152), (104, 64, 154), (104, 64, 154), (104, 64, 154), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (95, 62, 152), (95, 62, 152), (92, 61, 149), (104, 64, 154), (104, 64, 154), (101, 62, 149), (104, 64, 154), (122, 73, 170), (122, 73, 170), (114, 72, 171), (130, 77, 180), (130, 77, 180), (125, 75, 175), (130, 77, 180), (130, 77, 180), (125, 75, 175), (121, 77, 182), (134, 80, 184), (139, 82, 188), (139, 82, 188), (134, 80, 184), (114, 72, 171), (107, 66, 159), (88, 59, 145), (81, 54, 134), (88, 59, 145), (95, 62, 152), (115, 69, 162), (125, 75, 175), (120, 71, 164), (110, 64, 149), (98, 57, 135), (85, 50, 122), (89, 54, 132), (82, 46, 109), (7, 9, 33), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (7, 9, 33), (8, 14, 45), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (9, 6, 9), (7, 9, 33), (9, 6, 9), (12, 10, 12), (19, 18, 32), (11, 26, 69), (11, 26, 69), (14, 40, 80), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (8, 14, 45), (8, 20, 59), (38, 29, 27), (107, 84, 42), (107, 84, 42), (84, 67, 31), (73, 56, 25), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (16, 13, 14), (47, 16, 39), (70, 27, 59), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (47, 16, 39), (12, 10, 12), (38, 29, 27), (38, 29, 27), (32, 22, 18), (44, 36, 32), (38, 29, 27), (32, 22, 18), (32, 22, 18), (32, 22, 18), (60, 35, 42), (74, 42, 102), (106, 61, 143), (122, 73, 170), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 84, 192), (139, 82, 188), (139, 82, 188), (139, 82, 188), (139, 82, 188), (134, 80, 184), (125, 75, 175), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (100, 65, 159), (97, 59, 142), (97, 59, 142), (89, 54, 132), (89, 54, 132), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (88, 59, 145), (88, 59, 145), (87, 56, 139), (88, 59, 145), (88, 59, 145), (95, 62, 152), (100, 65, 159), (100, 65, 159), (95, 62, 152), (92, 61, 149), (95, 62, 152), (107, 66, 159), (104, 64, 154), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (88, 59, 145), (92, 61, 149), (95, 62, 152), (100, 65, 159), (100, 65, 159), (107, 66, 159), (107, 68, 164), (122, 73, 170), (114, 72, 171), (114, 72, 171), (122, 73, 170), (122, 73, 170), (109, 70, 168), (121, 77, 182), (121, 77, 182), (125, 75, 175), (130, 77, 180), (121, 77, 182), (121, 77, 182), (121, 77, 182), (130, 77, 180), (134, 80, 184), (139, 82, 188), (134, 80, 184), (130, 77, 180), (109, 70, 168), (88, 59, 145), (88, 59, 145), (95, 62, 152), (107, 68, 164), (120, 71, 164), (122, 73, 170), (114, 66, 155), (106, 61, 143), (96, 54, 125), (85, 50, 122), (85, 50, 122), (48, 28, 68), (7, 9, 33), (8, 14, 45), (8, 14, 45), (8, 14, 45), (7, 9, 33), (8, 14, 45), (7, 9, 33), (8, 14, 45), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (9, 6, 9), (7, 9, 33), (9, 6, 9), (7, 9, 33), (12, 10, 12), (19, 18, 32), (11, 26, 69), (26, 36, 49), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (8, 14, 45), (8, 14, 45), (44, 36, 32), (100, 79, 40), (93, 74, 37), (93, 74, 37), (84, 67, 31), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (34, 8, 17), (70, 27, 59), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (58, 21, 50), (34, 8, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (38, 29, 27), (44, 36, 32), (32, 22, 18), (38, 29, 27), (38, 29, 27), (60, 35, 42), (82, 46, 109), (110, 64, 149), (122, 73, 170), (130, 77, 180), (130, 77, 180), (130, 77, 180), (139, 82, 188), (139, 82, 188), (139, 82, 188), (143, 84, 192), (143, 84, 192), (139, 82, 188), (139, 82, 188), (139, 82, 188), (134, 80, 184), (130, 77, 180), (116, 74, 177), (109, 70, 168), (107, 68, 164), (101, 62, 149), (97, 59, 142), (87, 56, 139), (81, 54, 134), (81, 54, 134), (75, 50, 126), (81, 54, 134), (75, 50, 126), (81, 54, 134), (81, 54, 134), (87, 56, 139), (88, 59, 145), (95, 62, 152), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (95, 62, 152), (100, 65, 159), (100, 65, 159), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (96, 64, 156), (95, 62, 152), (96, 64, 156), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (100, 65, 159), (100, 65, 159), (102, 67, 163), (107, 68, 164), (107, 68, 164), (107, 68, 164), (122, 73, 170), (130, 77, 180), (125, 75, 175), (122, 73, 170), (114, 72, 171), (107, 66, 159), (109, 70, 168), (114, 72, 171), (114, 72, 171), (114, 72, 171), (123, 80, 188), (129, 82, 192), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 84, 192), (139, 82, 188), (114, 72, 171), (88, 59, 145), (88, 59, 145), (104, 64, 154), (114, 72, 171), (122, 73, 170), (120, 71, 164), (110, 64, 149), (98, 57, 135), (85, 50, 122), (82, 46, 109), (65, 39, 95), (19, 18, 32), (7, 9, 33), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (7, 9, 33), (8, 14, 45), (7, 9, 33), (8, 14, 45), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (12, 10, 12), (19, 18, 32), (11, 26, 69), (11, 26, 69), (11, 26, 69), (14, 40, 80), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (44, 36, 32), (100, 79, 40), (100, 79, 40), (93, 74, 37), (93, 74, 37), (16, 13, 14), (16, 13, 14), (12, 10, 12), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (34, 8, 17), (58, 21, 50), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (47, 16, 39), (12, 10, 12), (16, 13, 14), (19, 18, 17), (28, 27, 20), (38, 29, 27), (32, 22, 18), (44, 36, 32), (60, 35, 42), (62, 44, 53), (82, 46, 109), (110, 64, 149), (122, 73, 170), (125, 75, 175), (130, 77, 180), (134, 80, 184), (139, 82, 188), (139, 82, 188), (139, 82, 188), (134, 84, 197), (143, 84, 192), (139, 82, 188), (139, 82, 188), (139, 82, 188), (139, 82, 188), (129, 82, 192), (114, 72, 171), (107, 68, 164), (104, 64, 154), (97, 59, 142), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (75, 50, 126), (75, 50, 126), (81, 54, 134), (87, 56, 139), (87, 56, 139), (88, 59, 145), (92, 61, 149), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (95, 62, 152), (96, 64, 156), (102, 67, 163), (102, 67, 163), (100, 65, 159), (95, 62, 152), (92, 61, 149), (92, 61, 149), (95, 62, 152), (95, 62, 152), (96, 64, 156), (100, 65, 159), (102, 67, 163), (107, 68, 164), (114, 72, 171), (114, 72, 171), (109, 70, 168), (114, 72, 171), (116, 74, 177), (121, 77, 182), (116, 74, 177), (114, 72, 171), (130, 77, 180), (125, 75, 175), (114, 72, 171), (114, 72, 171), (95, 62, 152), (102, 67, 163), (102, 67, 163), (100, 65, 159), (107, 68, 164), (121, 77, 182), (129, 82, 192), (134, 84, 197), (139, 82, 188), (134, 80, 184), (134, 80, 184), (139, 82, 188), (134, 80, 184), (107, 68, 164), (88, 59, 145), (88, 59, 145), (104, 64, 154), (114, 72, 171), (125, 75, 175), (122, 73, 170), (106, 61, 143), (96, 54, 125), (82, 46, 109), (54, 36, 85), (34, 18, 44), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 14, 45), (8, 20, 59), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (8, 14, 45), (7, 9, 33), (7, 9, 33), (19, 18, 32), (7, 9, 33), (19, 18, 32), (8, 14, 45), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 14, 45), (8, 14, 45), (7, 9, 33), (8, 14, 45), (60, 44, 19), (107, 84, 42), (107, 84, 42), (100, 79, 40), (78, 71, 58), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (47, 16, 39), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (58, 21, 50), (34, 8, 17), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (38, 29, 27), (50, 41, 35), (62, 44, 53), (66, 54, 66), (82, 46, 109), (97, 59, 142), (115, 69, 162), (130, 77, 180), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 84, 192), (143, 87, 202), (143, 84, 192), (139, 82, 188), (139, 82, 188), (134, 80, 184), (123, 80, 188), (123, 80, 188), (130, 77, 180), (122, 73, 170), (107, 66, 159), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (96, 64, 156), (96, 64, 156), (92, 61, 149), (92, 61, 149), (100, 65, 159), (95, 62, 152), (107, 66, 159), (109, 70, 168), (109, 70, 168), (102, 67, 163), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (96, 64, 156), (102, 67, 163), (107, 68, 164), (109, 70, 168), (109, 70, 168), (109, 70, 168), (109, 70, 168), (114, 72, 171), (116, 74, 177), (134, 80, 184), (134, 80, 184), (116, 74, 177), (116, 74, 177), (114, 72, 171), (107, 68, 164), (102, 67, 163), (88, 59, 145), (88, 59, 145), (100, 65, 159), (100, 65, 159), (102, 67, 163), (114, 72, 171), (121, 77, 182), (129, 82, 192), (143, 84, 192), (134, 80, 184), (130, 77, 180), (130, 77, 180), (121, 77, 182), (109, 70, 168), (92, 61, 149), (88, 59, 145), (107, 66, 159), (114, 72, 171), (125, 75, 175), (122, 73, 170), (106, 61, 143), (85, 50, 122), (65, 39, 95), (34, 18, 44), (8, 14, 45), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 20, 59), (34, 18, 44), (34, 18, 44), (34, 18, 44), (47, 16, 39), (47, 16, 39), (47, 16, 39), (19, 18, 32), (19, 18, 32), (21, 25, 41), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (8, 14, 45), (63, 54, 47), (100, 79, 40), (93, 74, 37), (87, 80, 63), (91, 83, 78), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (12, 10, 12), (34, 8, 17), (70, 27, 59), (90, 36, 80), (111, 47, 96), (90, 36, 80), (81, 31, 68), (58, 21, 50), (47, 16, 39), (44, 36, 32), (12, 10, 12), (9, 6, 9), (16, 13, 14), (38, 29, 27), (60, 35, 42), (62, 44, 53), (66, 54, 66), (74, 42, 102), (98, 57, 135), (120, 71, 164), (134, 80, 184), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 87, 202), (143, 87, 202), (143, 84, 192), (143, 84, 192), (139, 82, 188), (130, 77, 180), (114, 72, 171), (129, 82, 192), (148, 87, 194), (139, 82, 188), (122, 73, 170), (101, 62, 149), (97, 59, 142), (97, 59, 142), (97, 59, 142), (88, 59, 145), (97, 59, 142), (101, 62, 149), (95, 62, 152), (95, 62, 152), (95, 62, 152), (95, 62, 152), (107, 66, 159), (107, 68, 164), (100, 65, 159), (107, 68, 164), (107, 68, 164), (102, 67, 163), (114, 72, 171), (114, 72, 171), (109, 70, 168), (102, 67, 163), (96, 64, 156), (95, 62, 152), (88, 59, 145), (92, 61, 149), (92, 61, 149), (95, 62, 152), (100, 65, 159), (114, 72, 171), (116, 74, 177), (116, 74, 177), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (121, 77, 182), (121, 77, 182), (121, 77, 182), (114, 72, 171), (100, 65, 159), (95, 62, 152), (92, 61, 149), (88, 59, 145), (87, 56, 139), (102, 67, 163), (107, 68, 164), (102, 67, 163), (107, 68, 164), (116, 74, 177), (130, 77, 180), (134, 80, 184), (134, 80, 184), (121, 77, 182), (116, 74, 177), (109, 70, 168), (107, 68, 164), (92, 61, 149), (88, 59, 145), (107, 66, 159), (122, 73, 170), (122, 73, 170), (120, 71, 164), (96, 54, 125), (74, 42, 102), (42, 27, 52), (8, 14, 45), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (11, 26, 69), (11, 26, 69), (8, 20, 59), (48, 28, 68), (70, 27, 59), (48, 28, 68), (48, 28, 68), (42, 27, 52), (42, 27, 52), (30, 31, 37), (19, 18, 32), (8, 20, 59), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (21, 25, 41), (96, 87, 81), (111, 101, 90), (103, 94, 87), (103, 94, 87), (91, 83, 78), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (34, 8, 17), (58, 21, 50), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (58, 21, 50), (87, 51, 61), (126, 105, 58), (50, 41, 35), (9, 6, 9), (16, 13, 14), (38, 29, 27), (44, 36, 32), (62, 44, 53), (63, 54, 47), (63, 38, 70), (96, 54, 125), (122, 73, 170), (134, 80, 184), (130, 77, 180), (134, 80, 184), (134, 80, 184), (139, 82, 188), (148, 87, 194), (143, 87, 202), (143, 87, 202), (143, 87, 202), (134, 84, 197), (121, 77, 182), (134, 80, 184), (159, 93, 210), (153, 90, 201), (143, 84, 192), (139, 82, 188), (130, 77, 180), (115, 69, 162), (107, 66, 159), (104, 64, 154), (101, 62, 149), (104, 64, 154), (115, 69, 162), (107, 68, 164), (100, 65, 159), (95, 62, 152), (95, 62, 152), (107, 68, 164), (114, 72, 171), (114, 72, 171), (107, 68, 164), (100, 65, 159), (100, 65, 159), (107, 68, 164), (107, 68, 164), (109, 70, 168), (100, 65, 159), (96, 64, 156), (96, 64, 156), (95, 62, 152), (96, 64, 156), (95, 62, 152), (95, 62, 152), (102, 67, 163), (116, 74, 177), (123, 80, 188), (121, 77, 182), (123, 80, 188), (130, 77, 180), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (114, 72, 171), (114, 72, 171), (109, 70, 168), (96, 64, 156), (92, 61, 149), (88, 59, 145), (88, 59, 145), (96, 64, 156), (109, 70, 168), (102, 67, 163), (107, 68, 164), (114, 72, 171), (121, 77, 182), (121, 77, 182), (116, 74, 177), (116, 74, 177), (114, 72, 171), (100, 65, 159), (96, 64, 156), (88, 59, 145), (88, 59, 145), (107, 68, 164), (125, 75, 175), (122, 73, 170), (114, 66, 155), (85, 50, 122), (54, 36, 85), (7, 9, 33), (11, 26, 69), (15, 28, 82), (15, 28, 82), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 20, 59), (54, 36, 85), (54, 36, 85), (56, 51, 91), (63, 38, 70), (63, 38, 70), (42, 27, 52), (21, 25, 41), (19, 18, 32), (8, 20, 59), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (11, 26, 69), (8, 20, 59), (8, 14, 45), (8, 14, 45), (7, 9, 33), (7, 9, 33), (32, 44, 59), (116, 107, 112), (116, 107, 112), (116, 107, 112), (104, 97, 103), (91, 83, 78), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (47, 16, 39), (90, 36, 80), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (91, 71, 61), (91, 71, 61), (83, 66, 57), (63, 54, 47), (38, 29, 27), (32, 22, 18), (44, 36, 32), (54, 48, 43), (54, 48, 43), (63, 38, 70), (96, 54, 125), (115, 69, 162), (130, 77, 180), (130, 77, 180), (139, 82, 188), (139, 82, 188), (139, 82, 188), (143, 84, 192), (143, 87, 202), (143, 87, 202), (143, 84, 192), (121, 77, 182), (134, 80, 184), (159, 93, 210), (153, 90, 201), (148, 87, 194), (153, 90, 201), (153, 90, 201), (139, 82, 188), (125, 75, 175), (114, 72, 171), (107, 66, 159), (107, 66, 159), (115, 69, 162), (125, 75, 175), (109, 70, 168), (96, 64, 156), (101, 62, 149), (101, 62, 149), (107, 66, 159), (107, 68, 164), (107, 68, 164), (102, 67, 163), (96, 64, 156), (96, 64, 156), (100, 65, 159), (109, 70, 168), (109, 70, 168), (102, 67, 163), (102, 67, 163), (102, 67, 163), (100, 65, 159), (96, 64, 156), (96, 64, 156), (96, 64, 156), (100, 65, 159), (107, 68, 164), (114, 72, 171), (121, 77, 182), (121, 77, 182), (121, 77, 182), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (116, 74, 177), (114, 72, 171), (102, 67, 163), (96, 64, 156), (100, 65, 159), (100, 65, 159), (100, 65, 159), (116, 74, 177), (109, 70, 168), (107, 68, 164), (109, 70, 168), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (102, 67, 163), (95, 62, 152), (92, 61, 149), (88, 59, 145), (92, 61, 149), (120, 71, 164), (125, 75, 175), (120, 71, 164), (106, 61, 143), (74, 42, 102), (34, 18, 44), (8, 14, 45), (15, 28, 82), (15, 28, 82), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (11, 26, 69), (11, 26, 69), (56, 51, 91), (56, 51, 91), (54, 36, 85), (32, 44, 59), (42, 27, 52), (19, 18, 32), (16, 13, 14), (19, 18, 32), (8, 20, 59), (11, 26, 69), (8, 20, 59), (11, 26, 69), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (19, 18, 32), (74, 66, 72), (116, 107, 112), (116, 107, 112), (104, 97, 103), (99, 91, 85), (83, 75, 74), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (47, 16, 39), (70, 27, 59), (90, 36, 80), (90, 36, 80), (90, 36, 80), (70, 27, 59), (83, 66, 57), (87, 51, 61), (62, 44, 53), (83, 75, 74), (44, 36, 32), (16, 13, 14), (38, 29, 27), (44, 36, 32), (50, 41, 35), (62, 44, 53), (74, 42, 102), (85, 50, 122), (89, 54, 132), (98, 57, 135), (97, 59, 142), (97, 59, 142), (98, 57, 135), (97, 59, 142), (104, 64, 154), (104, 64, 154), (101, 62, 149), (101, 62, 149), (130, 76, 170), (134, 80, 184), (130, 77, 180), (148, 87, 194), (153, 90, 201), (143, 84, 192), (134, 80, 184), (130, 77, 180), (114, 72, 171), (100, 65, 159), (107, 66, 159), (125, 75, 175), (134, 80, 184), (114, 72, 171), (104, 64, 154), (107, 68, 164), (114, 72, 171), (107, 68, 164), (102, 67, 163), (100, 65, 159), (95, 62, 152), (95, 62, 152), (95, 62, 152), (102, 67, 163), (116, 74, 177), (116, 74, 177), (107, 68, 164), (107, 68, 164), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (107, 68, 164), (116, 74, 177), (121, 77, 182), (114, 72, 171), (109, 70, 168), (109, 70, 168), (114, 72, 171), (109, 70, 168), (109, 70, 168), (109, 70, 168), (109, 70, 168), (102, 67, 163), (109, 70, 168), (114, 72, 171), (114, 72, 171), (121, 77, 182), (121, 77, 182), (109, 70, 168), (109, 70, 168), (109, 70, 168), (107, 68, 164), (100, 65, 159), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (88, 59, 145), (95, 62, 152), (107, 66, 159), (115, 69, 162), (115, 69, 162), (98, 57, 135), (48, 28, 68), (7, 9, 33), (15, 28, 82), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (8, 20, 59), (11, 26, 69), (8, 20, 59), (11, 26, 69), (54, 36, 85), (48, 28, 68), (42, 27, 52), (34, 18, 44), (34, 18, 44), (34, 18, 44), (19, 18, 32), (19, 18, 32), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 20, 59), (8, 14, 45), (7, 9, 33), (7, 9, 33), (30, 31, 37), (99, 91, 85), (116, 107, 112), (104, 97, 103), (96, 87, 81), (83, 75, 74), (69, 63, 51), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (34, 8, 17), (58, 21, 50), (90, 36, 80), (111, 47, 96), (90, 36, 80), (81, 31, 68), (87, 51, 61), (87, 51, 61), (60, 35, 42), (74, 66, 72), (44, 36, 32), (32, 22, 18), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 32), (34, 18, 44), (42, 27, 52), (42, 27, 52), (48, 28, 68), (65, 39, 95), (82, 46, 109), (96, 54, 125), (97, 59, 142), (115, 69, 162), (125, 75, 175), (107, 68, 164), (109, 70, 168), (114, 72, 171), (116, 74, 177), (109, 70, 168), (107, 68, 164), (114, 72, 171), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (107, 68, 164), (102, 67, 163), (102, 67, 163), (109, 70, 168), (129, 82, 192), (123, 80, 188), (109, 70, 168), (109, 70, 168), (102, 67, 163), (109, 70, 168), (109, 70, 168), (109, 70, 168), (109, 70, 168), (109, 70, 168), (107, 68, 164), (114, 72, 171), (125, 75, 175), (114, 72, 171), (114, 72, 171), (114, 72, 171), (121, 77, 182), (109, 70, 168), (102, 67, 163), (102, 67, 163), (102, 67, 163), (107, 68, 164), (114, 72, 171), (114, 72, 171), (114, 72, 171), (116, 74, 177), (121, 77, 182), (114, 72, 171), (121, 77, 182), (116, 74, 177), (116, 74, 177), (109, 70, 168), (100, 65, 159), (96, 64, 156), (95, 62, 152), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (97, 59, 142), (104, 64, 154), (115, 69, 162), (110, 64, 149), (74, 42, 102), (7, 9, 33), (11, 26, 69), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (11, 26, 69), (48, 28, 68), (48, 28, 68), (58, 21, 50), (58, 21, 50), (42, 27, 52), (42, 27, 52), (42, 27, 52), (30, 31, 37), (19, 18, 32), (26, 36, 49), (21, 25, 41), (8, 20, 59), (21, 25, 41), (8, 20, 59), (8, 14, 45), (8, 14, 45), (7, 9, 33), (7, 9, 33), (16, 13, 14), (54, 48, 43), (69, 63, 51), (63, 54, 47), (54, 48, 43), (54, 48, 43), (50, 41, 35), (50, 41, 35), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (34, 8, 17), (58, 21, 50), (90, 36, 80), (90, 36, 80), (90, 36, 80), (81, 31, 68), (87, 51, 61), (87, 51, 61), (47, 16, 39), (62, 44, 53), (50, 41, 35), (28, 27, 20), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (30, 31, 37), (42, 27, 52), (63, 38, 70), (54, 36, 85), (74, 42, 102), (89, 54, 132), (97, 59, 142), (104, 64, 154), (104, 64, 154), (107, 66, 159), (109, 70, 168), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (121, 77, 182), (116, 74, 177), (116, 74, 177), (116, 74, 177), (121, 77, 182), (121, 77, 182), (116, 74, 177), (116, 74, 177), (121, 77, 182), (121, 77, 182), (123, 80, 188), (123, 80, 188), (116, 74, 177), (114, 72, 171), (116, 74, 177), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (121, 77, 182), (121, 77, 182), (109, 70, 168), (100, 65, 159), (100, 65, 159), (102, 67, 163), (114, 72, 171), (116, 74, 177), (114, 72, 171), (114, 72, 171), (116, 74, 177), (109, 70, 168), (114, 72, 171), (116, 74, 177), (114, 72, 171), (109, 70, 168), (96, 64, 156), (92, 61, 149), (92, 61, 149), (88, 59, 145), (92, 61, 149), (92, 61, 149), (88, 59, 145), (101, 62, 149), (110, 64, 149), (114, 66, 155), (96, 54, 125), (34, 18, 44), (8, 20, 59), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (11, 26, 69), (48, 28, 68), (54, 36, 85), (54, 36, 85), (54, 36, 85), (63, 38, 70), (48, 28, 68), (30, 31, 37), (21, 25, 41), (19, 18, 32), (38, 54, 68), (32, 44, 59), (26, 36, 49), (21, 25, 41), (38, 54, 68), (74, 66, 72), (32, 44, 59), (54, 48, 43), (30, 31, 37), (23, 22, 18), (44, 36, 32), (60, 44, 19), (67, 50, 22), (67, 50, 22), (67, 50, 22), (67, 50, 22), (67, 50, 22), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (47, 16, 39), (81, 31, 68), (90, 36, 80), (90, 36, 80), (90, 36, 80), (86, 51, 85), (78, 59, 51), (47, 16, 39), (47, 16, 39), (38, 29, 27), (19, 18, 17), (9, 6, 9), (9, 6, 9), (16, 13, 14), (23, 22, 18), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (36, 34, 14), (45, 40, 15), (45, 40, 15), (45, 40, 15), (50, 41, 35), (54, 48, 43), (63, 54, 47), (69, 63, 51), (74, 66, 72), (74, 66, 72), (86, 51, 85), (85, 50, 122), (89, 54, 132), (101, 62, 149), (107, 68, 164), (109, 70, 168), (109, 70, 168), (116, 74, 177), (121, 77, 182), (116, 74, 177), (121, 77, 182), (121, 77, 182), (116, 74, 177), (121, 77, 182), (123, 80, 188), (123, 80, 188), (129, 82, 192), (123, 80, 188), (129, 82, 192), (134, 84, 197), (123, 80, 188), (116, 74, 177), (116, 74, 177), (116, 74, 177), (114, 72, 171), (109, 70, 168), (116, 74, 177), (116, 74, 177), (114, 72, 171), (116, 74, 177), (114, 72, 171), (107, 68, 164), (107, 68, 164), (114, 72, 171), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (102, 67, 163), (109, 70, 168), (102, 67, 163), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (95, 62, 152), (107, 66, 159), (115, 69, 162), (115, 69, 162), (114, 66, 155), (106, 59, 128), (48, 28, 68), (7, 9, 33), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (11, 26, 69), (56, 51, 91), (56, 51, 91), (56, 51, 91), (38, 54, 68), (56, 51, 91), (32, 44, 59), (30, 31, 37), (21, 25, 41), (19, 18, 32), (32, 44, 59), (38, 54, 68), (38, 54, 68), (32, 44, 59), (83, 75, 74), (74, 66, 72), (74, 66, 72), (162, 148, 139), (132, 126, 124), (99, 91, 85), (87, 80, 63), (91, 83, 78), (101, 81, 71), (79, 61, 28), (73, 56, 25), (84, 67, 31), (79, 61, 28), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (12, 10, 12), (47, 16, 39), (81, 31, 68), (111, 47, 96), (90, 36, 80), (90, 36, 80), (86, 51, 85), (78, 59, 51), (34, 8, 17), (47, 16, 39), (38, 29, 27), (19, 18, 17), (9, 6, 9), (12, 10, 12), (23, 22, 18), (50, 41, 35), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (36, 34, 14), (36, 34, 14), (45, 40, 15), (45, 40, 15), (45, 40, 15), (50, 50, 17), (69, 63, 14), (77, 72, 17), (77, 72, 17), (84, 67, 31), (87, 80, 63), (99, 91, 85), (125, 117, 117), (132, 126, 124), (116, 107, 112), (111, 77, 111), (106, 59, 128), (98, 57, 135), (95, 62, 152), (109, 70, 168), (116, 74, 177), (114, 72, 171), (116, 74, 177), (121, 77, 182), (121, 77, 182), (121, 77, 182), (121, 77, 182), (123, 80, 188), (123, 80, 188), (123, 80, 188), (129, 82, 192), (123, 80, 188), (121, 77, 182), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (109, 70, 168), (114, 72, 171), (116, 74, 177), (116, 74, 177), (114, 72, 171), (114, 72, 171), (107, 66, 159), (96, 64, 156), (109, 70, 168), (121, 77, 182), (121, 77, 182), (114, 72, 171), (109, 70, 168), (114, 72, 171), (107, 68, 164), (96, 64, 156), (92, 61, 149), (107, 68, 164), (109, 70, 168), (95, 62, 152), (92, 61, 149), (92, 61, 149), (95, 62, 152), (114, 72, 171), (130, 77, 180), (130, 77, 180), (122, 73, 170), (110, 64, 149), (74, 42, 102), (7, 9, 33), (11, 26, 69), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (65, 39, 95), (56, 51, 91), (56, 51, 91), (56, 51, 91), (63, 38, 70), (32, 44, 59), (30, 31, 37), (23, 22, 18), (30, 31, 37), (66, 54, 66), (66, 54, 66), (74, 66, 72), (74, 66, 72), (66, 54, 66), (54, 48, 43), (54, 48, 43), (87, 80, 63), (144, 135, 137), (169, 160, 159), (125, 117, 117), (144, 135, 137), (144, 135, 137), (96, 87, 81), (83, 66, 57), (87, 80, 63), (91, 71, 61), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (12, 10, 12), (16, 13, 14), (102, 72, 95), (151, 109, 135), (111, 47, 96), (90, 36, 80), (86, 51, 85), (87, 51, 61), (47, 16, 39), (47, 16, 39), (38, 29, 27), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (9, 6, 9), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (45, 40, 15), (50, 50, 17), (57, 58, 16), (50, 50, 17), (50, 50, 17), (50, 50, 17), (77, 72, 17), (94, 90, 21), (107, 100, 17), (137, 119, 19), (141, 134, 16), (141, 134, 16), (137, 127, 62), (153, 143, 108), (184, 171, 173), (199, 184, 189), (184, 171, 173), (144, 135, 137), (126, 94, 134), (82, 46, 109), (85, 50, 122), (97, 59, 142), (104, 64, 154), (107, 66, 159), (114, 72, 171), (114, 72, 171), (109, 70, 168), (114, 72, 171), (116, 74, 177), (109, 70, 168), (107, 66, 159), (110, 64, 149), (98, 57, 135), (110, 64, 149), (120, 74, 147), (120, 74, 147), (126, 94, 134), (126, 94, 134), (126, 94, 134), (126, 94, 134), (126, 94, 134), (126, 94, 134), (120, 74, 147), (111, 77, 111), (101, 63, 111), (91, 52, 112), (91, 52, 112), (85, 50, 122), (85, 50, 122), (85, 50, 122), (81, 54, 134), (87, 56, 139), (87, 56, 139), (88, 59, 145), (95, 62, 152), (114, 72, 171), (114, 72, 171), (95, 62, 152), (95, 62, 152), (116, 74, 177), (134, 80, 184), (125, 75, 175), (125, 75, 175), (120, 71, 164), (96, 54, 125), (34, 18, 44), (8, 14, 45), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (56, 51, 91), (56, 51, 91), (56, 51, 91), (63, 38, 70), (32, 44, 59), (42, 27, 52), (19, 18, 32), (54, 48, 43), (99, 91, 85), (83, 75, 74), (99, 91, 85), (116, 107, 112), (91, 83, 78), (83, 75, 74), (99, 91, 85), (83, 75, 74), (78, 71, 58), (87, 80, 63), (116, 108, 92), (87, 80, 63), (162, 148, 139), (162, 148, 139), (125, 117, 117), (111, 101, 90), (96, 87, 81), (116, 108, 92), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (83, 75, 74), (144, 135, 137), (111, 47, 96), (126, 94, 134), (123, 100, 101), (62, 44, 53), (47, 16, 39), (32, 22, 18), (38, 29, 27), (23, 22, 18), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (19, 18, 17), (12, 10, 12), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (36, 34, 14), (45, 40, 15), (50, 50, 17), (57, 58, 16), (57, 58, 16), (57, 58, 16), (77, 72, 17), (107, 100, 17), (116, 112, 16), (141, 134, 16), (158, 150, 19), (189, 174, 25), (214, 194, 34), (225, 208, 34), (214, 194, 34), (206, 157, 83), (184, 171, 173), (212, 200, 193), (212, 200, 193), (222, 214, 215), (74, 66, 72), (16, 13, 14), (42, 27, 52), (90, 62, 89), (151, 109, 135), (126, 94, 134), (65, 39, 95), (48, 28, 68), (101, 63, 111), (126, 94, 134), (126, 94, 134), (144, 135, 137), (169, 160, 159), (199, 184, 189), (222, 214, 215), (222, 214, 215), (222, 214, 215), (222, 214, 215), (222, 214, 215), (212, 200, 193), (184, 171, 173), (169, 160, 159), (162, 148, 139), (144, 135, 137), (132, 126, 124), (125, 117, 117), (104, 97, 103), (99, 91, 85), (83, 75, 74), (74, 66, 72), (62, 44, 53), (42, 27, 52), (42, 27, 52), (42, 27, 52), (48, 28, 68), (54, 36, 85), (70, 46, 117), (107, 66, 159), (107, 68, 164), (107, 68, 164), (130, 77, 180), (130, 77, 180), (122, 73, 170), (120, 71, 164), (106, 61, 143), (65, 39, 95), (21, 25, 41), (56, 51, 91), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (15, 28, 82), (56, 51, 91), (56, 51, 91), (56, 51, 91), (56, 51, 91), (63, 38, 70), (42, 27, 52), (16, 13, 14), (83, 75, 74), (125, 117, 117), (54, 48, 43), (78, 71, 58), (99, 91, 85), (96, 87, 81), (83, 75, 74), (116, 108, 92), (111, 101, 90), (99, 91, 85), (78, 71, 58), (63, 54, 47), (78, 71, 58), (116, 108, 92), (116, 108, 92), (132, 126, 124), (116, 108, 92), (96, 87, 81), (83, 66, 57), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (66, 54, 66), (132, 126, 124), (102, 72, 95), (162, 148, 139), (144, 135, 137), (78, 59, 51), (62, 44, 53), (32, 22, 18), (32, 22, 18), (38, 29, 27), (19, 18, 17), (9, 6, 9), (9, 6, 9), (19, 18, 17), (28, 27, 20), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (23, 22, 18), (28, 27, 20), (36, 34, 14), (50, 50, 17), (69, 63, 14), (77, 72, 17), (69, 63, 14), (77, 72, 17), (94, 90, 21), (116, 112, 16), (137, 119, 19), (158, 150, 19), (189, 174, 25), (233, 220, 34), (244, 231, 37), (225, 208, 34), (233, 220, 34), (244, 231, 37), (229, 173, 73), (210, 181, 145), (212, 200, 193), (230, 225, 226), (87, 80, 63), (16, 13, 14), (32, 22, 18), (116, 107, 112), (240, 236, 236), (184, 171, 173), (54, 48, 43), (50, 41, 35), (184, 171, 173), (212, 200, 193), (222, 214, 215), (240, 236, 236), (240, 236, 236), (212, 200, 193), (169, 160, 159), (153, 143, 108), (146, 133, 97), (137, 127, 62), (137, 127, 62), (137, 110, 18), (107, 84, 42), (91, 80, 16), (93, 69, 29), (79, 61, 28), (73, 56, 25), (73, 56, 25), (45, 40, 15), (36, 34, 14), (36, 34, 14), (44, 36, 32), (44, 36, 32), (38, 29, 27), (38, 29, 27), (28, 27, 20), (28, 27, 20), (23, 22, 18), (19, 18, 32), (34, 18, 44), (48, 28, 68), (54, 36, 85), (82, 46, 109), (89, 54, 132), (97, 59, 142), (97, 59, 142), (82, 46, 109), (34, 18, 44), (42, 27, 52), (51, 77, 112), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 33, 95), (56, 51, 91), (90, 62, 89), (56, 51, 91), (32, 44, 59), (42, 27, 52), (19, 18, 32), (19, 18, 32), (38, 29, 27), (63, 54, 47), (54, 48, 43), (44, 36, 32), (79, 61, 28), (93, 74, 37), (78, 71, 58), (125, 117, 117), (116, 108, 92), (91, 83, 78), (87, 80, 63), (87, 80, 63), (78, 71, 58), (78, 71, 58), (78, 71, 58), (116, 108, 92), (99, 91, 85), (103, 94, 87), (83, 75, 74), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (63, 54, 47), (125, 117, 117), (116, 107, 112), (169, 160, 159), (125, 117, 117), (91, 83, 78), (66, 54, 66), (60, 35, 42), (19, 18, 32), (32, 22, 18), (32, 22, 18), (16, 13, 14), (9, 6, 9), (28, 27, 20), (28, 27, 20), (12, 10, 12), (12, 10, 12), (12, 10, 12), (19, 18, 17), (19, 18, 17), (19, 18, 17), (28, 27, 20), (36, 34, 14), (28, 27, 20), (28, 27, 20), (36, 34, 14), (45, 40, 15), (69, 63, 14), (77, 72, 17), (77, 72, 17), (91, 80, 16), (107, 100, 17), (116, 112, 16), (141, 134, 16), (158, 150, 19), (225, 208, 34), (244, 231, 37), (233, 220, 34), (189, 174, 25), (225, 208, 34), (248, 237, 107), (247, 239, 183), (232, 207, 90), (210, 181, 145), (230, 225, 226), (103, 94, 87), (16, 13, 14), (32, 22, 18), (125, 117, 117), (240, 236, 236), (162, 148, 139), (44, 36, 32), (83, 75, 74), (212, 200, 193), (222, 214, 215), (230, 225, 226), (184, 171, 173), (111, 101, 90), (84, 67, 31), (77, 72, 17), (94, 90, 21), (137, 119, 19), (171, 137, 26), (137, 119, 19), (189, 174, 25), (158, 150, 19), (107, 100, 17), (114, 88, 18), (107, 100, 17), (127, 100, 20), (107, 100, 17), (91, 80, 16), (69, 63, 14), (50, 50, 17), (36, 34, 14), (36, 34, 14), (36, 34, 14), (36, 34, 14), (36, 34, 14), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 17), (16, 13, 14), (12, 10, 12), (16, 13, 14), (34, 18, 44), (34, 18, 44), (34, 18, 44), (12, 10, 12), (8, 14, 45), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (15, 28, 82), (56, 51, 91), (54, 36, 85), (48, 28, 68), (34, 18, 44), (47, 16, 39), (34, 18, 44), (19, 18, 17), (23, 22, 18), (69, 63, 51), (87, 80, 63), (67, 50, 22), (77, 72, 17), (77, 72, 17), (69, 63, 14), (100, 88, 63), (116, 108, 92), (91, 83, 78), (83, 75, 74), (91, 83, 78), (78, 71, 58), (78, 71, 58), (69, 63, 51), (87, 80, 63), (91, 83, 78), (132, 126, 124), (116, 108, 92), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (28, 27, 20), (54, 48, 43), (125, 117, 117), (162, 148, 139), (169, 160, 159), (125, 117, 117), (91, 83, 78), (66, 54, 66), (74, 66, 72), (34, 18, 44), (34, 8, 17), (34, 8, 17), (34, 8, 17), (9, 6, 9), (38, 29, 27), (36, 34, 14), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (36, 34, 14), (36, 34, 14), (36, 34, 14), (36, 34, 14), (45, 40, 15), (50, 50, 17), (57, 58, 16), (69, 63, 14), (91, 80, 16), (94, 90, 21), (116, 112, 16), (141, 134, 16), (189, 174, 25), (214, 194, 34), (214, 194, 34), (189, 174, 25), (158, 150, 19), (214, 194, 34), (247, 239, 183), (255, 255, 255), (247, 239, 183), (210, 181, 145), (222, 214, 215), (111, 101, 90), (19, 18, 17), (38, 29, 27), (144, 135, 137), (240, 236, 236), (132, 126, 124), (38, 29, 27), (125, 117, 117), (222, 214, 215), (230, 225, 226), (169, 160, 159), (63, 54, 47), (57, 58, 16), (91, 80, 16), (107, 100, 17), (137, 119, 19), (137, 110, 18), (127, 100, 20), (114, 88, 18), (158, 150, 19), (141, 134, 16), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (127, 100, 20), (127, 100, 20), (127, 100, 20), (91, 80, 16), (69, 63, 14), (57, 58, 16), (57, 58, 16), (57, 58, 16), (50, 50, 17), (45, 40, 15), (28, 27, 20), (19, 18, 17), (16, 13, 14), (23, 22, 18), (23, 22, 18), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (9, 6, 9), (12, 10, 12), (7, 9, 33), (48, 28, 68), (82, 46, 109), (54, 36, 85), (15, 33, 95), (19, 50, 101), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (48, 28, 68), (48, 28, 68), (48, 28, 68), (58, 21, 50), (34, 18, 44), (47, 16, 39), (47, 16, 39), (19, 18, 17), (28, 27, 20), (67, 50, 22), (84, 67, 31), (91, 80, 16), (91, 80, 16), (77, 72, 17), (69, 63, 14), (69, 63, 14), (77, 72, 17), (100, 88, 63), (69, 63, 51), (78, 71, 58), (69, 63, 51), (91, 83, 78), (78, 71, 58), (69, 63, 51), (87, 80, 63), (103, 94, 87), (103, 94, 87), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (38, 29, 27), (44, 36, 32), (116, 107, 112), (169, 160, 159), (162, 148, 139), (125, 117, 117), (96, 87, 81), (66, 54, 66), (62, 44, 53), (34, 18, 44), (47, 16, 39), (34, 8, 17), (34, 8, 17), (9, 6, 9), (44, 36, 32), (36, 34, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (16, 13, 14), (19, 18, 17), (28, 27, 20), (36, 34, 14), (36, 34, 14), (45, 40, 15), (50, 50, 17), (50, 50, 17), (57, 58, 16), (57, 58, 16), (69, 63, 14), (91, 80, 16), (116, 112, 16), (171, 137, 26), (189, 174, 25), (214, 194, 34), (214, 194, 34), (189, 174, 25), (214, 194, 34), (225, 208, 34), (247, 239, 183), (253, 252, 251), (247, 239, 183), (206, 157, 83), (199, 184, 189), (111, 101, 90), (32, 22, 18), (44, 36, 32), (162, 148, 139), (230, 225, 226), (116, 107, 112), (44, 36, 32), (169, 160, 159), (240, 236, 236), (222, 214, 215), (87, 80, 63), (69, 63, 14), (94, 90, 21), (107, 100, 17), (137, 119, 19), (154, 126, 20), (127, 100, 20), (133, 79, 31), (137, 110, 18), (189, 174, 25), (171, 137, 26), (175, 108, 37), (137, 110, 18), (127, 100, 20), (127, 100, 20), (114, 88, 18), (91, 80, 16), (91, 80, 16), (91, 80, 16), (77, 72, 17), (77, 72, 17), (91, 80, 16), (91, 80, 16), (69, 63, 14), (50, 50, 17), (36, 34, 14), (28, 27, 20), (19, 18, 17), (16, 13, 14), (23, 22, 18), (19, 18, 17), (30, 31, 37), (28, 27, 20), (23, 22, 18), (16, 13, 14), (9, 6, 9), (28, 27, 20), (16, 13, 14), (47, 16, 39), (82, 46, 109), (111, 47, 96), (111, 47, 96), (126, 51, 105), (82, 46, 109), (74, 42, 102), (82, 46, 109), (74, 42, 102), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (48, 28, 68), (48, 28, 68), (48, 28, 68), (34, 18, 44), (58, 21, 50), (42, 27, 52), (44, 36, 32), (28, 27, 20), (69, 63, 14), (107, 100, 17), (137, 110, 18), (114, 88, 18), (91, 80, 16), (77, 72, 17), (69, 63, 14), (69, 63, 14), (57, 58, 16), (69, 63, 14), (69, 63, 14), (84, 67, 31), (69, 63, 14), (87, 80, 63), (87, 80, 63), (78, 71, 58), (96, 87, 81), (99, 91, 85), (103, 94, 87), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (19, 18, 17), (19, 18, 17), (23, 22, 18), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (28, 27, 20), (28, 27, 20), (91, 83, 78), (144, 135, 137), (151, 109, 135), (125, 117, 117), (91, 83, 78), (83, 75, 74), (62, 44, 53), (34, 18, 44), (60, 35, 42), (34, 8, 17), (34, 8, 17), (9, 6, 9), (50, 41, 35), (36, 34, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (23, 22, 18), (28, 27, 20), (36, 34, 14), (45, 40, 15), (50, 50, 17), (57, 58, 16), (57, 58, 16), (57, 58, 16), (77, 72, 17), (107, 100, 17), (107, 100, 17), (154, 126, 20), (189, 174, 25), (189, 174, 25), (214, 194, 34), (233, 220, 34), (251, 239, 52), (248, 237, 107), (233, 220, 34), (248, 237, 107), (236, 224, 159), (146, 133, 97), (169, 160, 159), (111, 101, 90), (38, 29, 27), (44, 36, 32), (144, 135, 137), (212, 200, 193), (83, 75, 74), (54, 48, 43), (212, 200, 193), (247, 245, 246), (184, 171, 173), (93, 69, 29), (107, 100, 17), (116, 112, 16), (116, 112, 16), (137, 119, 19), (137, 110, 18), (127, 100, 20), (175, 108, 37), (229, 173, 73), (248, 237, 107), (214, 194, 34), (196, 126, 44), (127, 100, 20), (114, 88, 18), (114, 88, 18), (91, 80, 16), (73, 56, 25), (67, 50, 22), (91, 80, 16), (91, 80, 16), (91, 80, 16), (107, 100, 17), (91, 80, 16), (77, 72, 17), (69, 63, 14), (50, 50, 17), (28, 27, 20), (19, 18, 17), (12, 10, 12), (23, 22, 18), (30, 31, 37), (96, 87, 81), (74, 66, 72), (28, 27, 20), (19, 18, 17), (12, 10, 12), (28, 27, 20), (12, 10, 12), (34, 18, 44), (74, 42, 102), (126, 51, 105), (126, 51, 105), (91, 52, 112), (82, 46, 109), (126, 51, 105), (111, 47, 96), (65, 39, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (48, 28, 68), (48, 28, 68), (48, 28, 68), (48, 28, 68), (54, 36, 85), (62, 44, 53), (44, 36, 32), (45, 40, 15), (114, 88, 18), (127, 100, 20), (114, 88, 18), (91, 80, 16), (114, 88, 18), (91, 80, 16), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (73, 56, 25), (69, 63, 14), (69, 63, 14), (84, 67, 31), (100, 88, 63), (111, 101, 90), (78, 71, 58), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (19, 18, 32), (19, 18, 17), (23, 22, 18), (23, 22, 18), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (28, 27, 20), (23, 22, 18), (16, 13, 14), (54, 48, 43), (111, 77, 111), (111, 77, 111), (104, 97, 103), (74, 66, 72), (83, 75, 74), (66, 54, 66), (62, 44, 53), (60, 35, 42), (34, 8, 17), (47, 16, 39), (12, 10, 12), (50, 41, 35), (45, 40, 15), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (23, 22, 18), (19, 18, 17), (23, 22, 18), (28, 27, 20), (36, 34, 14), (45, 40, 15), (45, 40, 15), (50, 50, 17), (69, 63, 14), (107, 100, 17), (141, 134, 16), (107, 100, 17), (137, 119, 19), (158, 150, 19), (158, 150, 19), (189, 174, 25), (244, 231, 37), (244, 231, 37), (244, 231, 37), (225, 208, 34), (244, 231, 37), (225, 208, 34), (131, 119, 90), (162, 148, 139), (116, 107, 112), (42, 27, 52), (63, 38, 70), (91, 52, 112), (101, 63, 111), (42, 27, 52), (74, 66, 72), (222, 214, 215), (240, 236, 236), (153, 143, 108), (94, 90, 21), (116, 112, 16), (116, 112, 16), (107, 100, 17), (127, 100, 20), (114, 88, 18), (120, 70, 32), (196, 126, 44), (232, 207, 90), (253, 252, 251), (247, 239, 183), (226, 154, 51), (133, 79, 31), (93, 69, 29), (91, 55, 19), (60, 44, 19), (45, 40, 15), (67, 50, 22), (127, 100, 20), (127, 100, 20), (107, 100, 17), (127, 100, 20), (94, 90, 21), (77, 72, 17), (69, 63, 14), (50, 50, 17), (45, 40, 15), (23, 22, 18), (16, 13, 14), (19, 18, 17), (44, 36, 32), (38, 29, 27), (30, 31, 37), (28, 27, 20), (19, 18, 17), (12, 10, 12), (16, 13, 14), (9, 6, 9), (70, 27, 59), (82, 46, 109), (111, 47, 96), (82, 46, 109), (126, 51, 105), (82, 46, 109), (126, 51, 105), (126, 51, 105), (65, 39, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (56, 51, 91), (54, 36, 85), (56, 51, 91), (56, 51, 91), (32, 44, 59), (32, 44, 59), (30, 31, 37), (50, 50, 17), (107, 100, 17), (107, 100, 17), (91, 80, 16), (91, 80, 16), (114, 88, 18), (91, 80, 16), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (73, 56, 25), (69, 63, 14), (69, 63, 14), (69, 63, 14), (73, 56, 25), (69, 63, 14), (69, 63, 14), (84, 67, 31), (69, 63, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 32), (23, 22, 18), (23, 22, 18), (19, 18, 17), (28, 27, 20), (28, 27, 20), (32, 22, 18), (16, 13, 14), (9, 6, 9), (34, 8, 17), (111, 47, 96), (126, 51, 105), (86, 51, 85), (62, 44, 53), (83, 75, 74), (74, 66, 72), (74, 66, 72), (62, 44, 53), (47, 16, 39), (58, 21, 50), (19, 18, 32), (50, 41, 35), (45, 40, 15), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (36, 34, 14), (36, 34, 14), (57, 58, 16), (116, 112, 16), (116, 112, 16), (116, 112, 16), (107, 100, 17), (116, 112, 16), (116, 112, 16), (116, 112, 16), (189, 174, 25), (233, 220, 34), (244, 231, 37), (233, 220, 34), (233, 220, 34), (189, 174, 25), (124, 99, 84), (144, 135, 137), (126, 94, 134), (85, 50, 122), (107, 68, 164), (109, 70, 168), (107, 66, 159), (85, 50, 122), (111, 77, 111), (230, 225, 226), (230, 225, 226), (146, 133, 97), (94, 90, 21), (107, 100, 17), (107, 100, 17), (107, 100, 17), (107, 100, 17), (79, 61, 28), (91, 55, 19), (196, 126, 44), (232, 207, 90), (247, 239, 183), (248, 237, 107), (216, 133, 46), (120, 70, 32), (91, 55, 19), (91, 55, 19), (60, 44, 19), (45, 40, 15), (91, 55, 19), (154, 126, 20), (137, 110, 18), (114, 88, 18), (94, 90, 21), (91, 80, 16), (77, 72, 17), (69, 63, 14), (50, 50, 17), (45, 40, 15), (28, 27, 20), (19, 18, 17), (19, 18, 17), (54, 48, 43), (30, 31, 37), (19, 18, 17), (19, 18, 17), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (90, 36, 80), (111, 47, 96), (82, 46, 109), (111, 47, 96), (111, 47, 96), (126, 51, 105), (126, 51, 105), (74, 42, 102), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (56, 51, 91), (56, 51, 91), (56, 51, 91), (56, 51, 91), (63, 38, 70), (26, 36, 49), (21, 25, 41), (60, 44, 19), (114, 88, 18), (114, 88, 18), (91, 80, 16), (91, 80, 16), (114, 88, 18), (114, 88, 18), (77, 72, 17), (69, 63, 14), (69, 63, 14), (69, 63, 14), (57, 58, 16), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (73, 56, 25), (67, 50, 22), (60, 44, 19), (60, 44, 19), (23, 22, 18), (19, 18, 17), (19, 18, 17), (19, 18, 17), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 17), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 17), (9, 6, 9), (9, 6, 9), (12, 10, 12), (90, 36, 80), (126, 51, 105), (63, 38, 70), (62, 44, 53), (74, 66, 72), (62, 44, 53), (66, 54, 66), (86, 51, 85), (74, 42, 102), (91, 52, 112), (48, 28, 68), (44, 36, 32), (36, 34, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (69, 63, 14), (107, 100, 17), (107, 100, 17), (107, 100, 17), (69, 63, 14), (77, 72, 17), (91, 80, 16), (116, 112, 16), (189, 174, 25), (244, 231, 37), (253, 239, 35), (244, 231, 37), (189, 174, 25), (94, 90, 21), (99, 91, 85), (132, 126, 124), (101, 63, 111), (109, 70, 168), (121, 77, 182), (123, 80, 188), (116, 74, 177), (114, 72, 171), (111, 68, 128), (212, 200, 193), (222, 214, 215), (137, 127, 62), (94, 90, 21), (107, 100, 17), (137, 119, 19), (158, 150, 19), (116, 112, 16), (84, 67, 31), (73, 56, 25), (175, 108, 37), (229, 173, 73), (214, 194, 34), (229, 173, 73), (175, 108, 37), (120, 70, 32), (91, 55, 19), (67, 50, 22), (60, 44, 19), (60, 44, 19), (137, 110, 18), (154, 126, 20), (137, 110, 18), (94, 90, 21), (77, 72, 17), (69, 63, 14), (57, 58, 16), (57, 58, 16), (50, 50, 17), (45, 40, 15), (28, 27, 20), (19, 18, 17), (19, 18, 17), (54, 48, 43), (44, 36, 32), (23, 22, 18), (19, 18, 17), (12, 10, 12), (12, 10, 12), (9, 6, 9), (34, 8, 17), (54, 36, 85), (74, 42, 102), (54, 36, 85), (74, 42, 102), (82, 46, 109), (65, 39, 95), (111, 47, 96), (111, 47, 96), (65, 39, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (56, 51, 91), (49, 70, 87), (56, 51, 91), (32, 44, 59), (32, 44, 59), (21, 25, 41), (19, 18, 32), (36, 34, 14), (93, 69, 29), (91, 80, 16), (93, 69, 29), (114, 88, 18), (107, 100, 17), (114, 88, 18), (91, 80, 16), (69, 63, 14), (69, 63, 14), (73, 56, 25), (67, 50, 22), (69, 63, 14), (67, 50, 22), (60, 44, 19), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 32), (23, 22, 18), (19, 18, 32), (23, 22, 18), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (23, 22, 18), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (70, 27, 59), (111, 47, 96), (42, 27, 52), (66, 54, 66), (90, 62, 89), (91, 52, 112), (96, 54, 125), (98, 57, 135), (98, 57, 135), (106, 61, 143), (54, 36, 85), (44, 36, 32), (45, 40, 15), (12, 10, 12), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (23, 22, 18), (19, 18, 17), (28, 27, 20), (36, 34, 14), (69, 63, 14), (94, 90, 21), (94, 90, 21), (77, 72, 17), (50, 50, 17), (57, 58, 16), (77, 72, 17), (141, 134, 16), (225, 208, 34), (244, 231, 37), (244, 231, 37), (233, 220, 34), (141, 134, 16), (73, 56, 25), (96, 87, 81), (96, 87, 81), (98, 57, 135), (116, 74, 177), (123, 80, 188), (123, 80, 188), (116, 74, 177), (116, 74, 177), (101, 62, 149), (169, 160, 159), (222, 214, 215), (131, 119, 90), (77, 72, 17), (137, 119, 19), (189, 174, 25), (141, 134, 16), (91, 80, 16), (79, 61, 28), (79, 61, 28), (133, 79, 31), (203, 142, 61), (226, 154, 51), (175, 108, 37), (155, 83, 37), (127, 100, 20), (93, 69, 29), (120, 70, 32), (114, 88, 18), (127, 100, 20), (154, 126, 20), (137, 119, 19), (127, 100, 20), (94, 90, 21), (77, 72, 17), (57, 58, 16), (50, 50, 17), (50, 50, 17), (45, 40, 15), (45, 40, 15), (28, 27, 20), (19, 18, 17), (19, 18, 17), (63, 54, 47), (50, 41, 35), (23, 22, 18), (19, 18, 32), (42, 27, 52), (34, 18, 44), (47, 16, 39), (48, 28, 68), (82, 46, 109), (126, 51, 105), (111, 47, 96), (65, 39, 95), (15, 33, 95), (19, 50, 101), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (56, 51, 91), (56, 51, 91), (56, 51, 91), (54, 36, 85), (21, 25, 41), (7, 9, 33), (16, 13, 14), (45, 40, 15), (93, 69, 29), (91, 80, 16), (114, 88, 18), (127, 100, 20), (127, 100, 20), (114, 88, 18), (114, 88, 18), (91, 80, 16), (69, 63, 14), (73, 56, 25), (67, 50, 22), (67, 50, 22), (60, 22, 18), (60, 22, 18), (60, 22, 18), (60, 35, 42), (67, 50, 22), (67, 50, 22), (60, 44, 19), (23, 22, 18), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (28, 27, 20), (28, 27, 20), (28, 27, 20), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (47, 16, 39), (70, 27, 59), (42, 27, 52), (91, 52, 112), (106, 59, 128), (98, 57, 135), (98, 57, 135), (106, 61, 143), (106, 61, 143), (110, 64, 149), (82, 46, 109), (30, 31, 37), (54, 48, 43), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (36, 34, 14), (57, 58, 16), (77, 72, 17), (57, 58, 16), (45, 40, 15), (45, 40, 15), (50, 50, 17), (57, 58, 16), (137, 119, 19), (189, 174, 25), (214, 194, 34), (225, 208, 34), (214, 194, 34), (94, 90, 21), (54, 48, 43), (91, 83, 78), (86, 51, 85), (107, 66, 159), (123, 80, 188), (129, 82, 192), (123, 80, 188), (121, 77, 182), (121, 77, 182), (104, 64, 154), (116, 107, 112), (212, 200, 193), (131, 119, 90), (77, 72, 17), (107, 100, 17), (137, 119, 19), (91, 80, 16), (50, 50, 17), (60, 44, 19), (67, 50, 22), (93, 69, 29), (171, 137, 26), (214, 194, 34), (171, 137, 26), (120, 70, 32), (127, 100, 20), (127, 100, 20), (114, 88, 18), (154, 126, 20), (154, 126, 20), (137, 119, 19), (127, 100, 20), (114, 88, 18), (91, 80, 16), (77, 72, 17), (57, 58, 16), (50, 50, 17), (45, 40, 15), (45, 40, 15), (36, 34, 14), (23, 22, 18), (16, 13, 14), (19, 18, 17), (63, 54, 47), (44, 36, 32), (19, 18, 17), (48, 28, 68), (106, 59, 128), (74, 42, 102), (63, 38, 70), (48, 28, 68), (90, 36, 80), (111, 47, 96), (126, 51, 105), (65, 39, 95), (15, 33, 95), (15, 33, 95), (19, 50, 101), (15, 33, 95), (19, 50, 101), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (56, 51, 91), (56, 51, 91), (56, 51, 91), (54, 36, 85), (8, 20, 59), (8, 14, 45), (7, 9, 33), (38, 29, 27), (84, 67, 31), (107, 100, 17), (127, 100, 20), (137, 110, 18), (127, 100, 20), (120, 70, 32), (93, 69, 29), (116, 58, 26), (93, 69, 29), (93, 69, 29), (73, 56, 25), (67, 50, 22), (60, 44, 19), (60, 22, 18), (60, 22, 18), (60, 44, 19), (79, 61, 28), (67, 50, 22), (60, 22, 18), (60, 22, 18), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (28, 27, 20), (23, 22, 18), (23, 22, 18), (32, 22, 18), (28, 27, 20), (28, 27, 20), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (16, 13, 14), (63, 38, 70), (96, 54, 125), (110, 64, 149), (110, 64, 149), (106, 61, 143), (110, 64, 149), (114, 66, 155), (115, 69, 162), (115, 69, 162), (89, 54, 132), (21, 25, 41), (63, 54, 47), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (23, 22, 18), (28, 27, 20), (28, 27, 20), (36, 34, 14), (36, 34, 14), (45, 40, 15), (50, 50, 17), (36, 34, 14), (36, 34, 14), (45, 40, 15), (45, 40, 15), (50, 50, 17), (116, 112, 16), (158, 150, 19), (158, 150, 19), (189, 174, 25), (137, 119, 19), (45, 40, 15), (63, 54, 47), (74, 66, 72), (89, 54, 132), (116, 74, 177), (129, 82, 192), (134, 84, 197), (123, 80, 188), (121, 77, 182), (123, 80, 188), (114, 72, 171), (101, 63, 111), (184, 171, 173), (132, 126, 124), (57, 58, 16), (57, 58, 16), (50, 50, 17), (45, 40, 15), (36, 34, 14), (36, 34, 14), (60, 44, 19), (93, 69, 29), (141, 134, 16), (189, 174, 25), (203, 142, 61), (93, 69, 29), (114, 88, 18), (137, 110, 18), (137, 110, 18), (154, 126, 20), (154, 126, 20), (137, 110, 18), (107, 100, 17), (94, 90, 21), (77, 72, 17), (69, 63, 14), (50, 50, 17), (50, 50, 17), (36, 34, 14), (28, 27, 20), (23, 22, 18), (19, 18, 17), (16, 13, 14), (19, 18, 17), (63, 54, 47), (30, 31, 37), (19, 18, 32), (85, 50, 122), (114, 66, 155), (106, 61, 143), (96, 54, 125), (82, 46, 109), (74, 42, 102), (90, 36, 80), (90, 36, 80), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (56, 51, 91), (56, 51, 91), (54, 36, 85), (11, 26, 69), (8, 14, 45), (8, 14, 45), (38, 29, 27), (100, 79, 40), (137, 119, 19), (154, 126, 20), (137, 119, 19), (137, 119, 19), (114, 88, 18), (120, 70, 32), (120, 70, 32), (116, 58, 26), (93, 69, 29), (93, 69, 29), (84, 67, 31), (73, 56, 25), (60, 44, 19), (60, 22, 18), (83, 23, 19), (93, 74, 37), (91, 80, 16), (85, 37, 23), (60, 22, 18), (60, 22, 18), (30, 31, 37), (38, 29, 27), (44, 36, 32), (30, 31, 37), (30, 31, 37), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 17), (9, 6, 9), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (63, 38, 70), (98, 57, 135), (110, 64, 149), (114, 66, 155), (115, 69, 162), (115, 69, 162), (115, 69, 162), (115, 69, 162), (115, 69, 162), (107, 66, 159), (97, 59, 142), (34, 18, 44), (63, 54, 47), (28, 27, 20), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (36, 34, 14), (36, 34, 14), (36, 34, 14), (36, 34, 14), (45, 40, 15), (45, 40, 15), (50, 50, 17), (94, 90, 21), (116, 112, 16), (141, 134, 16), (141, 134, 16), (69, 63, 14), (38, 29, 27), (54, 48, 43), (63, 38, 70), (104, 64, 154), (121, 77, 182), (129, 82, 192), (129, 82, 192), (123, 80, 188), (121, 77, 182), (123, 80, 188), (123, 80, 188), (91, 52, 112), (144, 135, 137), (144, 135, 137), (57, 58, 16), (57, 58, 16), (50, 50, 17), (45, 40, 15), (36, 34, 14), (32, 22, 18), (32, 22, 18), (45, 40, 15), (77, 72, 17), (171, 137, 26), (171, 137, 26), (137, 110, 18), (127, 100, 20), (154, 126, 20), (154, 126, 20), (137, 119, 19), (127, 100, 20), (114, 88, 18), (91, 80, 16), (77, 72, 17), (69, 63, 14), (57, 58, 16), (50, 50, 17), (45, 40, 15), (28, 27, 20), (23, 22, 18), (19, 18, 17), (19, 18, 17), (16, 13, 14), (23, 22, 18), (63, 54, 47), (19, 18, 17), (34, 18, 44), (89, 54, 132), (110, 64, 149), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 61, 143), (96, 54, 125), (91, 52, 112), (74, 42, 102), (65, 39, 95), (54, 36, 85), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 28, 82), (11, 26, 69), (42, 27, 52), (42, 27, 52), (8, 14, 45), (19, 18, 32), (79, 61, 28), (127, 100, 20), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 119, 19), (127, 100, 20), (107, 84, 42), (120, 70, 32), (121, 96, 51), (114, 91, 48), (100, 79, 40), (100, 79, 40), (84, 67, 31), (67, 50, 22), (60, 22, 18), (83, 23, 19), (107, 84, 42), (127, 100, 20), (91, 80, 16), (85, 37, 23), (85, 37, 23), (30, 31, 37), (30, 31, 37), (30, 31, 37), (30, 31, 37), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (9, 6, 9), (9, 6, 9), (28, 27, 20), (12, 10, 12), (9, 6, 9), (16, 13, 14), (48, 28, 68), (96, 54, 125), (106, 61, 143), (110, 64, 149), (115, 69, 162), (122, 73, 170), (120, 71, 164), (114, 72, 171), (122, 73, 170), (107, 68, 164), (107, 68, 164), (107, 68, 164), (54, 36, 85), (63, 54, 47), (50, 50, 17), (12, 10, 12), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (32, 22, 18), (36, 34, 14), (36, 34, 14), (45, 40, 15), (45, 40, 15), (57, 58, 16), (94, 90, 21), (107, 100, 17), (116, 112, 16), (91, 80, 16), (36, 34, 14), (38, 29, 27), (38, 29, 27), (63, 38, 70), (120, 71, 164), (129, 82, 192), (129, 82, 192), (129, 82, 192), (123, 80, 188), (121, 77, 182), (123, 80, 188), (129, 82, 192), (97, 59, 142), (80, 86, 97), (132, 126, 124), (63, 54, 47), (69, 63, 14), (57, 58, 16), (36, 34, 14), (28, 27, 20), (32, 22, 18), (32, 22, 18), (32, 22, 18), (45, 40, 15), (114, 88, 18), (137, 110, 18), (154, 126, 20), (154, 126, 20), (137, 119, 19), (137, 119, 19), (137, 110, 18), (127, 100, 20), (91, 80, 16), (91, 80, 16), (84, 67, 31), (73, 56, 25), (50, 50, 17), (45, 40, 15), (36, 34, 14), (28, 27, 20), (23, 22, 18), (16, 13, 14), (16, 13, 14), (9, 6, 9), (23, 22, 18), (50, 41, 35), (16, 13, 14), (54, 36, 85), (97, 59, 142), (104, 64, 154), (120, 71, 164), (114, 66, 155), (110, 64, 149), (114, 66, 155), (114, 66, 155), (110, 64, 149), (106, 61, 143), (98, 57, 135), (96, 54, 125), (82, 46, 109), (54, 36, 85), (11, 26, 69), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 28, 82), (48, 28, 68), (48, 28, 68), (48, 28, 68), (34, 18, 44), (8, 14, 45), (50, 41, 35), (127, 100, 20), (137, 119, 19), (137, 119, 19), (137, 110, 18), (137, 119, 19), (154, 126, 20), (137, 119, 19), (126, 105, 58), (114, 91, 48), (126, 105, 58), (121, 96, 51), (126, 105, 58), (121, 96, 51), (107, 84, 42), (84, 67, 31), (67, 50, 22), (60, 22, 18), (85, 37, 23), (114, 88, 18), (127, 100, 20), (127, 100, 20), (114, 88, 18), (30, 31, 37), (38, 29, 27), (30, 31, 37), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (23, 22, 18), (28, 27, 20), (16, 13, 14), (9, 6, 9), (28, 27, 20), (54, 48, 43), (12, 10, 12), (19, 18, 17), (63, 38, 70), (96, 54, 125), (97, 59, 142), (114, 66, 155), (115, 69, 162), (120, 71, 164), (125, 75, 175), (125, 75, 175), (114, 72, 171), (122, 73, 170), (109, 70, 168), (107, 68, 164), (114, 72, 171), (70, 46, 117), (54, 48, 43), (87, 80, 63), (28, 27, 20), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (32, 22, 18), (36, 34, 14), (45, 40, 15), (36, 34, 14), (36, 34, 14), (50, 50, 17), (69, 63, 14), (94, 90, 21), (77, 72, 17), (36, 34, 14), (23, 22, 18), (38, 29, 27), (101, 27, 15), (81, 31, 68), (91, 52, 112), (123, 80, 188), (129, 82, 192), (123, 80, 188), (123, 80, 188), (121, 77, 182), (123, 80, 188), (129, 82, 192), (107, 66, 159), (56, 51, 91), (116, 107, 112), (78, 71, 58), (50, 50, 17), (50, 50, 17), (45, 40, 15), (45, 40, 15), (69, 63, 14), (73, 56, 25), (36, 34, 14), (36, 34, 14), (45, 40, 15), (60, 44, 19), (79, 61, 28), (93, 69, 29), (93, 69, 29), (91, 80, 16), (127, 100, 20), (114, 88, 18), (77, 72, 17), (57, 58, 16), (57, 58, 16), (50, 50, 17), (45, 40, 15), (36, 34, 14), (28, 27, 20), (23, 22, 18), (19, 18, 17), (16, 13, 14), (12, 10, 12), (9, 6, 9), (38, 29, 27), (44, 36, 32), (7, 9, 33), (75, 50, 126), (101, 62, 149), (107, 66, 159), (120, 71, 164), (114, 66, 155), (115, 69, 162), (114, 66, 155), (114, 66, 155), (110, 64, 149), (114, 66, 155), (110, 64, 149), (106, 61, 143), (98, 57, 135), (96, 54, 125), (74, 42, 102), (48, 28, 68), (8, 20, 59), (15, 28, 82), (15, 28, 82), (15, 28, 82), (48, 28, 68), (48, 28, 68), (48, 28, 68), (34, 18, 44), (47, 16, 39), (79, 61, 28), (127, 100, 20), (127, 100, 20), (127, 100, 20), (127, 100, 20), (137, 110, 18), (137, 119, 19), (154, 126, 20), (137, 119, 19), (126, 105, 58), (126, 105, 58), (126, 105, 58), (126, 105, 58), (112, 101, 73), (121, 96, 51), (107, 84, 42), (79, 61, 28), (67, 50, 22), (60, 22, 18), (83, 23, 19), (85, 37, 23), (85, 37, 23), (85, 37, 23), (30, 31, 37), (38, 29, 27), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (32, 22, 18), (28, 27, 20), (19, 18, 17), (9, 6, 9), (12, 10, 12), (54, 48, 43), (50, 41, 35), (16, 13, 14), (65, 39, 95), (98, 57, 135), (106, 61, 143), (101, 62, 149), (115, 69, 162), (120, 71, 164), (122, 73, 170), (125, 75, 175), (122, 73, 170), (115, 69, 162), (115, 69, 162), (109, 70, 168), (107, 68, 164), (114, 72, 171), (101, 62, 149), (42, 27, 52), (100, 88, 63), (57, 58, 16), (12, 10, 12), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (36, 34, 14), (45, 40, 15), (36, 34, 14), (36, 34, 14), (36, 34, 14), (57, 58, 16), (69, 63, 14), (36, 34, 14), (19, 18, 17), (32, 22, 18), (85, 37, 23), (187, 66, 109), (130, 76, 170), (120, 71, 164), (129, 82, 192), (129, 82, 192), (129, 82, 192), (123, 80, 188), (123, 80, 188), (123, 80, 188), (121, 77, 182), (114, 72, 171), (82, 46, 109), (91, 83, 78), (83, 75, 74), (36, 34, 14), (45, 40, 15), (57, 58, 16), (91, 80, 16), (94, 90, 21), (91, 80, 16), (77, 72, 17), (50, 50, 17), (36, 34, 14), (60, 44, 19), (73, 56, 25), (67, 50, 22), (45, 40, 15), (60, 44, 19), (91, 80, 16), (91, 80, 16), (50, 50, 17), (28, 27, 20), (28, 27, 20), (36, 34, 14), (36, 34, 14), (36, 34, 14), (28, 27, 20), (23, 22, 18), (19, 18, 17), (16, 13, 14), (9, 6, 9), (12, 10, 12), (50, 41, 35), (28, 27, 20), (34, 18, 44), (87, 56, 139), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 66, 159), (104, 64, 154), (114, 66, 155), (107, 66, 159), (107, 66, 159), (114, 66, 155), (101, 62, 149), (97, 59, 142), (106, 61, 143), (106, 61, 143), (98, 57, 135), (85, 50, 122), (48, 28, 68), (8, 20, 59), (11, 26, 69), (15, 28, 82), (48, 28, 68), (48, 28, 68), (42, 27, 52), (34, 18, 44), (34, 18, 44), (93, 69, 29), (114, 88, 18), (120, 70, 32), (133, 79, 31), (133, 79, 31), (137, 110, 18), (154, 126, 20), (154, 126, 20), (154, 126, 20), (137, 119, 19), (126, 105, 58), (121, 96, 51), (121, 96, 51), (126, 105, 58), (126, 105, 58), (114, 91, 48), (91, 80, 16), (79, 61, 28), (67, 50, 22), (85, 37, 23), (83, 23, 19), (83, 23, 19), (83, 23, 19), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (23, 22, 18), (32, 22, 18), (19, 18, 17), (9, 6, 9), (9, 6, 9), (12, 10, 12), (44, 36, 32), (28, 27, 20), (63, 38, 70), (98, 57, 135), (106, 61, 143), (104, 64, 154), (115, 69, 162), (122, 73, 170), (122, 73, 170), (122, 73, 170), (122, 73, 170), (125, 75, 175), (107, 68, 164), (107, 66, 159), (115, 69, 162), (114, 72, 171), (122, 73, 170), (130, 77, 180), (54, 36, 85), (54, 48, 43), (54, 48, 43), (16, 13, 14), (9, 6, 9), (7, 9, 33), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (23, 22, 18), (28, 27, 20), (36, 34, 14), (36, 34, 14), (28, 27, 20), (28, 27, 20), (45, 40, 15), (36, 34, 14), (19, 18, 17), (23, 22, 18), (58, 21, 50), (139, 58, 119), (130, 76, 170), (150, 91, 210), (150, 91, 210), (134, 84, 197), (134, 84, 197), (129, 82, 192), (123, 80, 188), (123, 80, 188), (123, 80, 188), (123, 80, 188), (121, 77, 182), (101, 62, 149), (66, 54, 66), (91, 83, 78), (50, 41, 35), (45, 40, 15), (69, 63, 14), (91, 80, 16), (91, 80, 16), (77, 72, 17), (77, 72, 17), (69, 63, 14), (60, 44, 19), (60, 44, 19), (60, 44, 19), (60, 44, 19), (45, 40, 15), (45, 40, 15), (69, 63, 14), (69, 63, 14), (50, 50, 17), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (19, 18, 17), (16, 13, 14), (12, 10, 12), (9, 6, 9), (16, 13, 14), (50, 41, 35), (16, 13, 14), (54, 36, 85), (97, 59, 142), (92, 61, 149), (92, 61, 149), (95, 62, 152), (101, 62, 149), (104, 64, 154), (115, 69, 162), (107, 66, 159), (107, 66, 159), (104, 64, 154), (97, 59, 142), (97, 59, 142), (110, 64, 149), (114, 66, 155), (110, 64, 149), (98, 57, 135), (85, 50, 122), (65, 39, 95), (34, 18, 44), (34, 18, 44), (48, 28, 68), (48, 28, 68), (34, 18, 44), (8, 14, 45), (34, 18, 44), (101, 27, 15), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (153, 44, 28), (139, 59, 26), (133, 79, 31), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 110, 18), (126, 105, 58), (126, 105, 58), (126, 105, 58), (137, 110, 18), (127, 100, 20), (114, 88, 18), (79, 61, 28), (67, 50, 22), (91, 55, 19), (91, 55, 19), (91, 55, 19), (23, 22, 18), (28, 27, 20), (28, 27, 20), (23, 22, 18), (23, 22, 18), (28, 27, 20), (23, 22, 18), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (63, 38, 70), (96, 54, 125), (114, 66, 155), (104, 64, 154), (114, 66, 155), (122, 73, 170), (122, 73, 170), (120, 71, 164), (122, 73, 170), (125, 75, 175), (125, 75, 175), (107, 66, 159), (95, 62, 152), (115, 69, 162), (122, 73, 170), (125, 75, 175), (134, 80, 184), (114, 66, 155), (34, 18, 44), (28, 27, 20), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (7, 9, 33), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (23, 22, 18), (32, 22, 18), (19, 18, 17), (19, 18, 17), (16, 13, 14), (19, 18, 17), (34, 18, 44), (96, 54, 125), (125, 75, 175), (143, 84, 192), (165, 97, 218), (150, 91, 210), (143, 87, 202), (134, 84, 197), (129, 82, 192), (129, 82, 192), (129, 82, 192), (123, 80, 188), (134, 84, 197), (129, 82, 192), (123, 80, 188), (82, 46, 109), (74, 66, 72), (63, 54, 47), (28, 27, 20), (50, 50, 17), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (69, 63, 14), (67, 50, 22), (45, 40, 15), (60, 44, 19), (45, 40, 15), (36, 34, 14), (45, 40, 15), (45, 40, 15), (45, 40, 15), (45, 40, 15), (36, 34, 14), (28, 27, 20), (23, 22, 18), (23, 22, 18), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (9, 6, 9), (23, 22, 18), (44, 36, 32), (19, 18, 32), (70, 46, 117), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (104, 64, 154), (104, 64, 154), (104, 64, 154), (104, 64, 154), (101, 62, 149), (101, 62, 149), (97, 59, 142), (101, 62, 149), (114, 66, 155), (110, 64, 149), (110, 64, 149), (98, 57, 135), (96, 54, 125), (82, 46, 109), (48, 28, 68), (34, 18, 44), (42, 27, 52), (42, 27, 52), (19, 18, 32), (47, 16, 39), (118, 32, 19), (135, 37, 23), (135, 37, 23), (153, 44, 28), (135, 37, 23), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (139, 59, 26), (133, 79, 31), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 119, 19), (137, 119, 19), (137, 110, 18), (127, 100, 20), (114, 88, 18), (91, 55, 19), (67, 50, 22), (93, 69, 29), (114, 88, 18), (28, 27, 20), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (23, 22, 18), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (48, 28, 68), (96, 54, 125), (114, 66, 155), (120, 71, 164), (115, 69, 162), (115, 69, 162), (115, 69, 162), (115, 69, 162), (115, 69, 162), (122, 73, 170), (125, 75, 175), (122, 73, 170), (107, 66, 159), (96, 64, 156), (107, 68, 164), (114, 72, 171), (121, 77, 182), (130, 77, 180), (134, 80, 184), (89, 54, 132), (19, 18, 32), (16, 13, 14), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (34, 18, 44), (85, 50, 122), (121, 77, 182), (129, 82, 192), (150, 91, 210), (150, 91, 210), (143, 87, 202), (134, 84, 197), (134, 84, 197), (134, 84, 197), (134, 84, 197), (129, 82, 192), (134, 84, 197), (134, 84, 197), (134, 84, 197), (134, 84, 197), (109, 70, 168), (63, 38, 70), (69, 63, 51), (38, 29, 27), (36, 34, 14), (50, 50, 17), (50, 50, 17), (50, 50, 17), (67, 50, 22), (50, 50, 17), (45, 40, 15), (45, 40, 15), (60, 44, 19), (45, 40, 15), (45, 40, 15), (45, 40, 15), (36, 34, 14), (36, 34, 14), (45, 40, 15), (50, 50, 17), (36, 34, 14), (23, 22, 18), (23, 22, 18), (19, 18, 17), (12, 10, 12), (12, 10, 12), (12, 10, 12), (9, 6, 9), (9, 6, 9), (44, 36, 32), (28, 27, 20), (48, 28, 68), (87, 56, 139), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (95, 62, 152), (88, 59, 145), (97, 59, 142), (101, 62, 149), (101, 62, 149), (104, 64, 154), (114, 66, 155), (106, 61, 143), (97, 59, 142), (96, 54, 125), (82, 46, 109), (48, 28, 68), (34, 18, 44), (60, 35, 42), (44, 36, 32), (85, 37, 23), (135, 37, 23), (153, 44, 28), (135, 37, 23), (153, 44, 28), (135, 37, 23), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (139, 59, 26), (127, 100, 20), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 119, 19), (137, 110, 18), (114, 88, 18), (91, 55, 19), (91, 55, 19), (91, 55, 19), (23, 22, 18), (19, 18, 17), (23, 22, 18), (23, 22, 18), (19, 18, 17), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (19, 18, 32), (63, 38, 70), (98, 57, 135), (110, 64, 149), (120, 71, 164), (115, 69, 162), (107, 66, 159), (104, 64, 154), (104, 64, 154), (115, 69, 162), (115, 69, 162), (122, 73, 170), (125, 75, 175), (122, 73, 170), (107, 68, 164), (107, 66, 159), (102, 67, 163), (109, 70, 168), (114, 72, 171), (116, 74, 177), (121, 77, 182), (123, 80, 188), (97, 59, 142), (42, 27, 52), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (16, 13, 14), (23, 22, 18), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (34, 18, 44), (89, 54, 132), (121, 77, 182), (129, 82, 192), (143, 87, 202), (150, 91, 210), (143, 87, 202), (143, 87, 202), (129, 82, 192), (123, 80, 188), (123, 80, 188), (134, 84, 197), (134, 84, 197), (143, 87, 202), (143, 87, 202), (143, 87, 202), (143, 87, 202), (134, 84, 197), (96, 54, 125), (62, 44, 53), (54, 48, 43), (32, 22, 18), (28, 27, 20), (36, 34, 14), (45, 40, 15), (45, 40, 15), (36, 34, 14), (45, 40, 15), (45, 40, 15), (60, 44, 19), (45, 40, 15), (45, 40, 15), (45, 40, 15), (36, 34, 14), (36, 34, 14), (50, 50, 17), (57, 58, 16), (45, 40, 15), (23, 22, 18), (23, 22, 18), (16, 13, 14), (12, 10, 12), (12, 10, 12), (9, 6, 9), (9, 6, 9), (16, 13, 14), (44, 36, 32), (19, 18, 32), (70, 46, 117), (92, 61, 149), (92, 61, 149), (95, 62, 152), (92, 61, 149), (92, 61, 149), (88, 59, 145), (95, 62, 152), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (104, 64, 154), (104, 64, 154), (101, 62, 149), (101, 62, 149), (89, 54, 132), (85, 50, 122), (91, 52, 112), (63, 38, 70), (60, 35, 42), (73, 56, 25), (118, 32, 19), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (135, 37, 23), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (118, 32, 19), (135, 37, 23), (135, 37, 23), (133, 79, 31), (127, 100, 20), (137, 119, 19), (137, 119, 19), (137, 119, 19), (127, 100, 20), (93, 69, 29), (91, 55, 19), (19, 18, 17), (19, 18, 17), (23, 22, 18), (19, 18, 17), (19, 18, 17), (9, 6, 9), (9, 6, 9), (9, 6, 9), (16, 13, 14), (74, 42, 102), (106, 61, 143), (114, 66, 155), (120, 71, 164), (115, 69, 162), (115, 69, 162), (104, 64, 154), (101, 62, 149), (107, 66, 159), (95, 62, 152), (104, 64, 154), (115, 69, 162), (122, 73, 170), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (102, 67, 163), (107, 68, 164), (114, 72, 171), (121, 77, 182), (129, 82, 192), (129, 82, 192), (122, 73, 170), (89, 54, 132), (48, 28, 68), (19, 18, 32), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (63, 38, 70), (106, 61, 143), (121, 77, 182), (121, 77, 182), (134, 84, 197), (150, 91, 210), (150, 91, 210), (150, 91, 210), (134, 84, 197), (129, 82, 192), (123, 80, 188), (129, 82, 192), (129, 82, 192), (134, 84, 197), (134, 84, 197), (134, 84, 197), (150, 91, 210), (150, 91, 210), (150, 91, 210), (143, 87, 202), (65, 39, 95), (50, 41, 35), (50, 41, 35), (23, 22, 18), (28, 27, 20), (28, 27, 20), (36, 34, 14), (36, 34, 14), (36, 34, 14), (50, 50, 17), (50, 50, 17), (45, 40, 15), (45, 40, 15), (36, 34, 14), (36, 34, 14), (36, 34, 14), (45, 40, 15), (45, 40, 15), (36, 34, 14), (28, 27, 20), (23, 22, 18), (16, 13, 14), (12, 10, 12), (9, 6, 9), (12, 10, 12), (12, 10, 12), (38, 29, 27), (30, 31, 37), (48, 28, 68), (88, 59, 145), (95, 62, 152), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (92, 61, 149), (97, 59, 142), (97, 59, 142), (97, 59, 142), (89, 54, 132), (85, 50, 122), (85, 50, 122), (82, 46, 109), (63, 38, 70), (85, 37, 23), (135, 37, 23), (153, 44, 28), (153, 44, 28), (163, 68, 30), (155, 83, 37), (139, 59, 26), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (118, 32, 19), (135, 37, 23), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (135, 37, 23), (116, 58, 26), (133, 79, 31), (137, 110, 18), (137, 110, 18), (127, 100, 20), (114, 88, 18), (19, 18, 17), (19, 18, 17), (19, 18, 17), (19, 18, 17), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (48, 28, 68), (98, 57, 135), (110, 64, 149), (115, 69, 162), (122, 73, 170), (120, 71, 164), (120, 71, 164), (107, 66, 159), (107, 66, 159), (100, 65, 159), (95, 62, 152), (107, 66, 159), (115, 69, 162), (122, 73, 170), (122, 73, 170), (122, 73, 170), (114, 72, 171), (114, 72, 171), (114, 72, 171), (107, 68, 164), (107, 68, 164), (121, 77, 182), (129, 82, 192), (129, 82, 192), (129, 82, 192), (134, 84, 197), (134, 80, 184), (120, 71, 164), (96, 54, 125), (65, 39, 95), (48, 28, 68), (34, 18, 44), (16, 13, 14), (12, 10, 12), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (38, 29, 27), (54, 48, 43), (66, 54, 66), (104, 97, 103), (74, 66, 72), (63, 38, 70), (96, 54, 125), (114, 66, 155), (139, 82, 188), (159, 93, 210), (165, 97, 218), (165, 97, 218), (150, 91, 210), (134, 84, 197), (123, 80, 188), (116, 74, 177), (121, 77, 182), (121, 77, 182), (121, 77, 182), (129, 82, 192), (143, 87, 202), (150, 91, 210), (150, 91, 210), (150, 91, 210), (159, 93, 210), (134, 80, 184), (63, 38, 70), (50, 41, 35), (44, 36, 32), (23, 22, 18), (23, 22, 18), (23, 22, 18), (28, 27, 20), (36, 34, 14), (45, 40, 15), (45, 40, 15), (36, 34, 14), (36, 34, 14), (36, 34, 14), (28, 27, 20), (45, 40, 15), (36, 34, 14), (36, 34, 14), (28, 27, 20), (23, 22, 18), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (23, 22, 18), (54, 48, 43), (19, 18, 32), (85, 50, 122), (100, 65, 159), (96, 64, 156), (96, 64, 156), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (89, 54, 132), (89, 54, 132), (85, 50, 122), (91, 52, 112), (70, 27, 59), (101, 27, 15), (135, 37, 23), (118, 32, 19), (135, 37, 23), (139, 59, 26), (133, 79, 31), (139, 59, 26), (135, 37, 23), (135, 37, 23), (118, 32, 19), (118, 32, 19), (135, 37, 23), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (112, 44, 23), (120, 70, 32), (127, 100, 20), (137, 110, 18), (19, 18, 17), (19, 18, 17), (16, 13, 14), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (42, 27, 52), (85, 50, 122), (106, 61, 143), (114, 66, 155), (122, 73, 170), (122, 73, 170), (125, 75, 175), (125, 75, 175), (107, 66, 159), (107, 66, 159), (107, 68, 164), (107, 68, 164), (107, 68, 164), (109, 70, 168), (114, 72, 171), (125, 75, 175), (125, 75, 175), (116, 74, 177), (114, 72, 171), (114, 72, 171), (109, 70, 168), (109, 70, 168), (121, 77, 182), (121, 77, 182), (116, 74, 177), (116, 74, 177), (129, 82, 192), (139, 82, 188), (139, 82, 188), (148, 87, 194), (153, 90, 201), (148, 87, 194), (148, 87, 194), (120, 71, 164), (89, 54, 132), (85, 50, 122), (82, 46, 109), (54, 36, 85), (66, 54, 66), (184, 171, 173), (222, 214, 215), (169, 160, 159), (222, 214, 215), (230, 225, 226), (169, 160, 159), (103, 94, 87), (74, 66, 72), (90, 62, 89), (120, 74, 147), (139, 82, 188), (153, 90, 201), (153, 90, 201), (143, 87, 202), (134, 84, 197), (134, 84, 197), (123, 80, 188), (123, 80, 188), (129, 82, 192), (129, 82, 192), (143, 87, 202), (150, 91, 210), (150, 91, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (139, 82, 188), (63, 38, 70), (30, 31, 37), (38, 29, 27), (23, 22, 18), (19, 18, 17), (23, 22, 18), (28, 27, 20), (28, 27, 20), (23, 22, 18), (28, 27, 20), (36, 34, 14), (36, 34, 14), (36, 34, 14), (28, 27, 20), (28, 27, 20), (23, 22, 18), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (12, 10, 12), (19, 18, 17), (50, 50, 17), (69, 63, 51), (44, 36, 32), (54, 36, 85), (122, 73, 170), (100, 65, 159), (96, 64, 156), (100, 65, 159), (100, 65, 159), (96, 64, 156), (95, 62, 152), (92, 61, 149), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (88, 59, 145), (92, 61, 149), (88, 59, 145), (87, 56, 139), (89, 54, 132), (89, 54, 132), (89, 54, 132), (85, 50, 122), (85, 50, 122), (82, 46, 109), (70, 27, 59), (118, 32, 19), (135, 37, 23), (135, 37, 23), (118, 32, 19), (118, 32, 19), (118, 32, 19), (112, 44, 23), (118, 32, 19), (101, 27, 15), (118, 32, 19), (101, 27, 15), (101, 27, 15), (118, 32, 19), (101, 27, 15), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (118, 32, 19), (112, 44, 23), (16, 13, 14), (16, 13, 14), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (34, 18, 44), (85, 50, 122), (97, 59, 142), (114, 66, 155), (120, 71, 164), (122, 73, 170), (125, 75, 175), (125, 75, 175), (125, 75, 175), (107, 68, 164), (104, 64, 154), (109, 70, 168), (114, 72, 171), (109, 70, 168), (114, 72, 171), (109, 70, 168), (116, 74, 177), (130, 77, 180), (121, 77, 182), (116, 74, 177), (107, 68, 164), (107, 68, 164), (109, 70, 168), (107, 68, 164), (109, 70, 168), (109, 70, 168), (109, 70, 168), (130, 77, 180), (139, 82, 188), (130, 77, 180), (148, 87, 194), (153, 90, 201), (153, 90, 201), (148, 87, 194), (134, 80, 184), (123, 80, 188), (123, 80, 188), (123, 80, 188), (102, 67, 163), (63, 38, 70), (184, 171, 173), (247, 245, 246), (184, 171, 173), (230, 225, 226), (253, 252, 251), (253, 252, 251), (240, 236, 236), (212, 200, 193), (162, 148, 139), (83, 75, 74), (83, 75, 74), (90, 62, 89), (101, 63, 111), (111, 68, 128), (120, 74, 147), (130, 76, 170), (130, 76, 170), (134, 80, 184), (134, 80, 184), (153, 90, 201), (150, 91, 210), (159, 93, 210), (165, 97, 218), (172, 101, 223), (172, 101, 223), (165, 97, 218), (172, 101, 223), (148, 87, 194), (86, 51, 85), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (19, 18, 17), (23, 22, 18), (23, 22, 18), (28, 27, 20), (36, 34, 14), (26, 36, 49), (30, 31, 37), (19, 18, 17), (16, 13, 14), (19, 18, 17), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (16, 13, 14), (50, 50, 17), (126, 105, 58), (69, 63, 51), (34, 18, 44), (120, 71, 164), (130, 77, 180), (107, 68, 164), (96, 64, 156), (100, 65, 159), (100, 65, 159), (100, 65, 159), (96, 64, 156), (95, 62, 152), (95, 62, 152), (96, 64, 156), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (88, 59, 145), (87, 56, 139), (89, 54, 132), (89, 54, 132), (87, 56, 139), (89, 54, 132), (96, 54, 125), (74, 42, 102), (85, 37, 23), (175, 108, 37), (188, 85, 36), (153, 44, 28), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (118, 32, 19), (118, 32, 19), (118, 32, 19), (101, 27, 15), (101, 27, 15), (101, 27, 15), (83, 23, 19), (112, 44, 23), (93, 69, 29), (91, 55, 19), (112, 44, 23), (101, 27, 15), (101, 27, 15), (101, 27, 15), (101, 27, 15), (16, 13, 14), (16, 13, 14), (12, 10, 12), (9, 6, 9), (9, 6, 9), (34, 18, 44), (74, 42, 102), (98, 57, 135), (110, 64, 149), (114, 66, 155), (120, 71, 164), (122, 73, 170), (125, 75, 175), (125, 75, 175), (125, 75, 175), (107, 68, 164), (104, 64, 154), (115, 69, 162), (114, 72, 171), (114, 72, 171), (109, 70, 168), (109, 70, 168), (116, 74, 177), (130, 77, 180), (134, 80, 184), (123, 80, 188), (114, 72, 171), (107, 68, 164), (100, 65, 159), (96, 64, 156), (100, 65, 159), (102, 67, 163), (109, 70, 168), (125, 75, 175), (139, 82, 188), (134, 80, 184), (139, 82, 188), (148, 87, 194), (143, 84, 192), (109, 70, 168), (107, 68, 164), (114, 72, 171), (121, 77, 182), (139, 82, 188), (123, 80, 188), (82, 46, 109), (104, 97, 103), (230, 225, 226), (184, 171, 173), (230, 225, 226), (253, 252, 251), (253, 252, 251), (255, 255, 255), (255, 255, 255), (247, 245, 246), (169, 160, 159), (222, 214, 215), (199, 184, 189), (169, 160, 159), (132, 126, 124), (104, 97, 103), (91, 83, 78), (74, 66, 72), (74, 66, 72), (66, 54, 66), (86, 51, 85), (101, 63, 111), (101, 63, 111), (111, 68, 128), (111, 68, 128), (111, 68, 128), (111, 68, 128), (111, 68, 128), (102, 72, 95), (90, 62, 89), (66, 54, 66), (66, 54, 66), (44, 36, 32), (38, 29, 27), (38, 29, 27), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (36, 34, 14), (23, 22, 18), (16, 13, 14), (12, 10, 12), (19, 18, 17), (16, 13, 14), (16, 13, 14), (19, 18, 17), (19, 18, 17), (38, 29, 27), (69, 63, 51), (54, 48, 43), (34, 18, 44), (110, 64, 149), (159, 93, 210), (121, 77, 182), (114, 72, 171), (107, 68, 164), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (95, 62, 152), (95, 62, 152), (96, 64, 156), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (95, 62, 152), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (96, 64, 156), (88, 59, 145), (81, 54, 134), (81, 54, 134), (101, 62, 149), (114, 66, 155), (110, 64, 149), (98, 57, 135), (74, 42, 102), (115, 80, 68), (171, 137, 26), (196, 126, 44), (188, 85, 36), (163, 68, 30), (153, 44, 28), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (118, 32, 19), (118, 32, 19), (101, 27, 15), (101, 27, 15), (85, 37, 23), (91, 55, 19), (85, 37, 23), (83, 23, 19), (83, 23, 19), (83, 23, 19), (16, 13, 14), (12, 10, 12), (9, 6, 9), (9, 6, 9), (19, 18, 32), (82, 46, 109), (98, 57, 135), (106, 61, 143), (110, 64, 149), (115, 69, 162), (122, 73, 170), (125, 75, 175), (125, 75, 175), (125, 75, 175), (122, 73, 170), (109, 70, 168), (107, 66, 159), (107, 66, 159), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (121, 77, 182), (134, 80, 184), (139, 82, 188), (121, 77, 182), (107, 68, 164), (95, 62, 152), (95, 62, 152), (102, 67, 163), (107, 68, 164), (107, 68, 164), (114, 72, 171), (134, 80, 184), (139, 82, 188), (134, 80, 184), (148, 87, 194), (134, 80, 184), (107, 68, 164), (114, 72, 171), (121, 77, 182), (143, 84, 192), (159, 93, 210), (165, 97, 218), (134, 80, 184), (63, 38, 70), (169, 160, 159), (184, 171, 173), (230, 225, 226), (253, 252, 251), (253, 252, 251), (253, 252, 251), (255, 255, 255), (247, 245, 246), (184, 171, 173), (247, 245, 246), (255, 255, 255), (255, 255, 255), (253, 252, 251), (247, 245, 246), (230, 225, 226), (222, 214, 215), (212, 200, 193), (132, 126, 124), (169, 160, 159), (169, 160, 159), (162, 148, 139), (162, 148, 139), (169, 160, 159), (169, 160, 159), (169, 160, 159), (169, 160, 159), (162, 148, 139), (162, 148, 139), (222, 214, 215), (230, 225, 226), (184, 171, 173), (116, 107, 112), (54, 48, 43), (38, 29, 27), (28, 27, 20), (28, 27, 20), (28, 27, 20), (28, 27, 20), (23, 22, 18), (19, 18, 17), (16, 13, 14), (19, 18, 17), (19, 18, 17), (23, 22, 18), (28, 27, 20), (28, 27, 20), (38, 29, 27), (19, 18, 32), (48, 28, 68), (114, 66, 155), (159, 93, 210), (159, 93, 210), (134, 80, 184), (121, 77, 182), (114, 72, 171), (109, 70, 168), (109, 70, 168), (102, 67, 163), (100, 65, 159), (95, 62, 152), (95, 62, 152), (95, 62, 152), (96, 64, 156), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (95, 62, 152), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (92, 61, 149), (87, 56, 139), (88, 59, 145), (107, 66, 159), (114, 66, 155), (114, 66, 155), (106, 61, 143), (98, 57, 135), (82, 46, 109), (93, 69, 29), (171, 137, 26), (158, 150, 19), (171, 137, 26), (175, 108, 37), (163, 68, 30), (163, 68, 30), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (118, 32, 19), (101, 27, 15), (101, 27, 15), (83, 23, 19), (83, 23, 19), (91, 55, 19), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (54, 36, 85), (98, 57, 135), (106, 61, 143), (110, 64, 149), (114, 66, 155), (115, 69, 162), (125, 75, 175), (130, 77, 180), (122, 73, 170), (115, 69, 162), (107, 68, 164), (107, 66, 159), (107, 68, 164), (107, 66, 159), (107, 68, 164), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (114, 72, 171), (130, 77, 180), (134, 80, 184), (130, 77, 180), (114, 72, 171), (102, 67, 163), (95, 62, 152), (100, 65, 159), (109, 70, 168), (114, 72, 171), (122, 73, 170), (130, 77, 180), (134, 80, 184), (139, 82, 188), (148, 87, 194), (139, 82, 188), (125, 75, 175), (125, 75, 175), (134, 84, 197), (150, 91, 210), (165, 97, 218), (165, 97, 218), (159, 93, 210), (97, 59, 142), (74, 66, 72), (132, 126, 124), (230, 225, 226), (253, 252, 251), (253, 252, 251), (255, 255, 255), (255, 255, 255), (247, 245, 246), (199, 184, 189), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (184, 171, 173), (240, 236, 236), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (212, 200, 193), (212, 200, 193), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (222, 214, 215), (184, 171, 173), (99, 91, 85), (74, 66, 72), (54, 48, 43), (23, 22, 18), (19, 18, 32), (34, 18, 44), (34, 18, 44), (34, 18, 44), (34, 18, 44), (34, 18, 44), (42, 27, 52), (54, 36, 85), (96, 54, 125), (120, 71, 164), (148, 87, 194), (153, 90, 201), (165, 97, 218), (153, 90, 201), (134, 80, 184), (130, 77, 180), (114, 72, 171), (114, 72, 171), (116, 74, 177), (109, 70, 168), (102, 67, 163), (100, 65, 159), (96, 64, 156), (95, 62, 152), (96, 64, 156), (96, 64, 156), (95, 62, 152), (95, 62, 152), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (104, 64, 154), (115, 69, 162), (114, 66, 155), (114, 66, 155), (114, 66, 155), (106, 61, 143), (96, 54, 125), (90, 36, 80), (114, 88, 18), (158, 150, 19), (158, 150, 19), (158, 150, 19), (171, 137, 26), (196, 126, 44), (204, 115, 48), (176, 76, 32), (153, 44, 28), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (135, 37, 23), (101, 27, 15), (101, 27, 15), (101, 27, 15), (91, 55, 19), (9, 6, 9), (9, 6, 9), (16, 13, 14), (54, 36, 85), (81, 54, 134), (89, 54, 132), (106, 61, 143), (114, 66, 155), (114, 66, 155), (115, 69, 162), (125, 75, 175), (130, 77, 180), (114, 72, 171), (107, 66, 159), (107, 66, 159), (104, 64, 154), (107, 68, 164), (100, 65, 159), (96, 64, 156), (100, 65, 159), (107, 68, 164), (107, 68, 164), (109, 70, 168), (125, 75, 175), (130, 77, 180), (134, 80, 184), (134, 80, 184), (130, 77, 180), (114, 72, 171), (107, 66, 159), (114, 72, 171), (130, 77, 180), (125, 75, 175), (125, 75, 175), (130, 76, 170), (130, 76, 170), (139, 82, 188), (143, 84, 192), (139, 82, 188), (125, 75, 175), (116, 74, 177), (139, 82, 188), (153, 90, 201), (153, 90, 201), (150, 91, 210), (159, 93, 210), (143, 87, 202), (65, 39, 95), (74, 66, 72), (222, 214, 215), (253, 252, 251), (253, 252, 251), (253, 252, 251), (255, 255, 255), (240, 236, 236), (184, 171, 173), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (169, 160, 159), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (212, 200, 193), (212, 200, 193), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (184, 171, 173), (222, 214, 215), (144, 135, 137), (42, 27, 52), (98, 57, 135), (143, 84, 192), (148, 87, 194), (139, 82, 188), (134, 80, 184), (122, 73, 170), (139, 82, 188), (165, 97, 218), (172, 101, 223), (159, 93, 210), (153, 90, 201), (159, 93, 210), (165, 97, 218), (153, 90, 201), (139, 82, 188), (130, 77, 180), (114, 72, 171), (116, 74, 177), (121, 77, 182), (114, 72, 171), (102, 67, 163), (102, 67, 163), (107, 66, 159), (96, 64, 156), (96, 64, 156), (100, 65, 159), (100, 65, 159), (95, 62, 152), (95, 62, 152), (96, 64, 156), (96, 64, 156), (95, 62, 152), (95, 62, 152), (92, 61, 149), (88, 59, 145), (87, 56, 139), (87, 56, 139), (107, 66, 159), (115, 69, 162), (104, 64, 154), (110, 64, 149), (114, 66, 155), (110, 64, 149), (98, 57, 135), (91, 52, 112), (87, 51, 61), (127, 100, 20), (154, 126, 20), (171, 137, 26), (171, 137, 26), (158, 150, 19), (158, 150, 19), (171, 137, 26), (175, 108, 37), (163, 68, 30), (163, 68, 30), (153, 44, 28), (153, 44, 28), (135, 37, 23), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (118, 32, 19), (101, 27, 15), (9, 6, 9), (19, 18, 32), (74, 42, 102), (87, 56, 139), (88, 59, 145), (87, 56, 139), (97, 59, 142), (114, 66, 155), (114, 66, 155), (115, 69, 162), (125, 75, 175), (130, 77, 180), (115, 69, 162), (107, 66, 159), (104, 64, 154), (104, 64, 154), (107, 66, 159), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 66, 159), (107, 68, 164), (107, 68, 164), (122, 73, 170), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (125, 75, 175), (125, 75, 175), (134, 80, 184), (130, 77, 180), (125, 75, 175), (130, 76, 170), (130, 76, 170), (134, 80, 184), (139, 82, 188), (134, 80, 184), (130, 77, 180), (114, 72, 171), (121, 77, 182), (129, 82, 192), (123, 80, 188), (143, 87, 202), (150, 91, 210), (159, 93, 210), (114, 72, 171), (48, 28, 68), (132, 126, 124), (240, 236, 236), (253, 252, 251), (253, 252, 251), (255, 255, 255), (240, 236, 236), (184, 171, 173), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (240, 236, 236), (184, 171, 173), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (199, 184, 189), (222, 214, 215), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (240, 236, 236), (169, 160, 159), (169, 160, 159), (66, 54, 66), (96, 54, 125), (181, 106, 231), (188, 112, 237), (188, 112, 237), (172, 101, 223), (172, 101, 223), (165, 97, 218), (172, 101, 223), (181, 106, 231), (172, 101, 223), (159, 93, 210), (153, 90, 201), (159, 93, 210), (165, 97, 218), (153, 90, 201), (143, 84, 192), (130, 77, 180), (116, 74, 177), (121, 77, 182), (121, 77, 182), (116, 74, 177), (109, 70, 168), (107, 68, 164), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (96, 64, 156), (100, 65, 159), (96, 64, 156), (96, 64, 156), (95, 62, 152), (88, 59, 145), (88, 59, 145), (92, 61, 149), (107, 66, 159), (104, 64, 154), (104, 64, 154), (104, 64, 154), (110, 64, 149), (114, 66, 155), (106, 61, 143), (98, 57, 135), (91, 52, 112), (81, 31, 68), (112, 44, 23), (139, 59, 26), (139, 59, 26), (139, 59, 26), (155, 83, 37), (175, 108, 37), (154, 126, 20), (171, 137, 26), (196, 126, 44), (175, 108, 37), (163, 68, 30), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (135, 37, 23), (135, 37, 23), (19, 18, 17), (85, 50, 122), (92, 61, 149), (92, 61, 149), (92, 61, 149), (87, 56, 139), (97, 59, 142), (110, 64, 149), (114, 66, 155), (120, 71, 164), (122, 73, 170), (125, 75, 175), (115, 69, 162), (107, 66, 159), (104, 64, 154), (101, 62, 149), (104, 64, 154), (100, 65, 159), (100, 65, 159), (107, 66, 159), (107, 68, 164), (115, 69, 162), (122, 73, 170), (125, 75, 175), (134, 80, 184), (139, 82, 188), (130, 77, 180), (130, 76, 170), (130, 77, 180), (130, 77, 180), (125, 75, 175), (125, 75, 175), (122, 73, 170), (115, 69, 162), (122, 73, 170), (130, 76, 170), (130, 76, 170), (139, 82, 188), (148, 87, 194), (139, 82, 188), (114, 72, 171), (116, 74, 177), (129, 82, 192), (129, 82, 192), (143, 87, 202), (150, 91, 210), (150, 91, 210), (143, 87, 202), (101, 62, 149), (48, 28, 68), (132, 126, 124), (222, 214, 215), (253, 252, 251), (255, 255, 255), (230, 225, 226), (184, 171, 173), (247, 245, 246), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (230, 225, 226), (184, 171, 173), (253, 252, 251), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (184, 171, 173), (230, 225, 226), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (230, 225, 226), (104, 97, 103), (66, 54, 66), (96, 54, 125), (172, 101, 223), (188, 112, 237), (181, 106, 231), (181, 106, 231), (181, 106, 231), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (153, 90, 201), (153, 90, 201), (159, 93, 210), (159, 93, 210), (153, 90, 201), (143, 84, 192), (134, 80, 184), (123, 80, 188), (134, 84, 197), (129, 82, 192), (121, 77, 182), (114, 72, 171), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (107, 68, 164), (107, 68, 164), (107, 68, 164), (102, 67, 163), (96, 64, 156), (96, 64, 156), (100, 65, 159), (100, 65, 159), (96, 64, 156), (92, 61, 149), (92, 61, 149), (96, 64, 156), (107, 66, 159), (104, 64, 154), (107, 66, 159), (104, 64, 154), (101, 62, 149), (97, 59, 142), (110, 64, 149), (106, 61, 143), (98, 57, 135), (82, 46, 109), (70, 27, 59), (101, 27, 15), (118, 32, 19), (118, 32, 19), (135, 37, 23), (135, 37, 23), (135, 37, 23), (139, 59, 26), (175, 108, 37), (171, 137, 26), (171, 137, 26), (175, 108, 37), (163, 68, 30), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (153, 44, 28), (16, 13, 14), (54, 36, 85), (87, 56, 139), (95, 62, 152), (92, 61, 149), (92, 61, 149), (97, 59, 142), (106, 61, 143), (114, 66, 155), (114, 66, 155), (122, 73, 170), (125, 75, 175), (122, 73, 170), (107, 66, 159), (104, 64, 154), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 66, 159), (120, 71, 164), (122, 73, 170), (122, 73, 170), (125, 75, 175), (130, 76, 170), (130, 76, 170), (130, 76, 170), (120, 71, 164), (115, 69, 162), (114, 66, 155), (114, 66, 155), (114, 66, 155), (110, 64, 149), (106, 61, 143), (106, 61, 143), (120, 71, 164), (130, 76, 170), (130, 76, 170), (130, 77, 180), (148, 87, 194), (139, 82, 188), (109, 70, 168), (122, 73, 170), (139, 82, 188), (134, 84, 197), (134, 84, 197), (143, 87, 202), (143, 87, 202), (150, 91, 210), (143, 87, 202), (104, 64, 154), (48, 28, 68), (96, 87, 81), (199, 184, 189), (247, 245, 246), (230, 225, 226), (184, 171, 173), (253, 252, 251), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (222, 214, 215), (184, 171, 173), (253, 252, 251), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (184, 171, 173), (230, 225, 226), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (230, 225, 226), (144, 135, 137), (62, 44, 53), (85, 50, 122), (172, 101, 223), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (153, 90, 201), (159, 93, 210), (153, 90, 201), (153, 90, 201), (148, 87, 194), (143, 84, 192), (134, 80, 184), (134, 80, 184), (134, 84, 197), (139, 82, 188), (121, 77, 182), (116, 74, 177), (109, 70, 168), (107, 68, 164), (109, 70, 168), (109, 70, 168), (114, 72, 171), (109, 70, 168), (107, 68, 164), (107, 68, 164), (100, 65, 159), (100, 65, 159), (102, 67, 163), (102, 67, 163), (96, 64, 156), (92, 61, 149), (92, 61, 149), (96, 64, 156), (100, 65, 159), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (97, 59, 142), (101, 62, 149), (106, 61, 143), (98, 57, 135), (96, 54, 125), (74, 42, 102), (85, 37, 23), (116, 58, 26), (133, 79, 31), (120, 70, 32), (112, 44, 23), (118, 32, 19), (118, 32, 19), (135, 37, 23), (155, 83, 37), (154, 126, 20), (171, 137, 26), (171, 137, 26), (154, 126, 20), (175, 108, 37), (155, 83, 37), (139, 59, 26), (153, 44, 28), (9, 6, 9), (12, 10, 12), (34, 18, 44), (74, 42, 102), (92, 61, 149), (96, 64, 156), (88, 59, 145), (89, 54, 132), (97, 59, 142), (110, 64, 149), (120, 71, 164), (125, 75, 175), (122, 73, 170), (115, 69, 162), (104, 64, 154), (104, 64, 154), (107, 66, 159), (115, 69, 162), (122, 73, 170), (125, 75, 175), (125, 75, 175), (122, 73, 170), (115, 69, 162), (110, 64, 149), (106, 61, 143), (97, 59, 142), (98, 57, 135), (85, 50, 122), (82, 46, 109), (65, 39, 95), (63, 38, 70), (63, 38, 70), (86, 51, 85), (91, 52, 112), (106, 61, 143), (122, 73, 170), (122, 73, 170), (130, 76, 170), (134, 80, 184), (139, 82, 188), (114, 72, 171), (122, 73, 170), (130, 77, 180), (134, 80, 184), (143, 84, 192), (143, 87, 202), (143, 87, 202), (143, 87, 202), (143, 87, 202), (143, 87, 202), (130, 77, 180), (65, 39, 95), (66, 54, 66), (132, 126, 124), (169, 160, 159), (184, 171, 173), (253, 252, 251), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (222, 214, 215), (184, 171, 173), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (169, 160, 159), (230, 225, 226), (255, 255, 255), (255, 255, 255), (240, 236, 236), (199, 184, 189), (116, 107, 112), (63, 38, 70), (110, 64, 149), (165, 97, 218), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (188, 112, 237), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (153, 90, 201), (148, 87, 194), (148, 87, 194), (143, 84, 192), (134, 80, 184), (134, 84, 197), (134, 80, 184), (121, 77, 182), (121, 77, 182), (116, 74, 177), (109, 70, 168), (109, 70, 168), (109, 70, 168), (107, 68, 164), (107, 66, 159), (107, 68, 164), (107, 68, 164), (100, 65, 159), (102, 67, 163), (107, 68, 164), (107, 68, 164), (96, 64, 156), (92, 61, 149), (88, 59, 145), (96, 64, 156), (96, 64, 156), (101, 62, 149), (97, 59, 142), (97, 59, 142), (97, 59, 142), (97, 59, 142), (101, 62, 149), (106, 61, 143), (98, 57, 135), (98, 57, 135), (96, 54, 125), (81, 31, 68), (85, 37, 23), (120, 70, 32), (133, 79, 31), (133, 79, 31), (116, 58, 26), (118, 32, 19), (118, 32, 19), (139, 59, 26), (137, 110, 18), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (137, 110, 18), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (70, 46, 117), (100, 65, 159), (92, 61, 149), (87, 56, 139), (98, 57, 135), (106, 61, 143), (114, 66, 155), (122, 73, 170), (122, 73, 170), (120, 71, 164), (107, 66, 159), (107, 66, 159), (115, 69, 162), (122, 73, 170), (130, 77, 180), (125, 75, 175), (122, 73, 170), (120, 71, 164), (114, 66, 155), (106, 61, 143), (98, 57, 135), (74, 42, 102), (63, 38, 70), (60, 35, 42), (62, 44, 53), (78, 59, 51), (83, 66, 57), (83, 66, 57), (83, 66, 57), (90, 62, 89), (106, 61, 143), (122, 73, 170), (122, 73, 170), (130, 76, 170), (125, 75, 175), (120, 71, 164), (104, 64, 154), (109, 70, 168), (114, 72, 171), (125, 75, 175), (143, 87, 202), (153, 90, 201), (143, 87, 202), (134, 84, 197), (134, 84, 197), (143, 87, 202), (143, 87, 202), (134, 84, 197), (101, 62, 149), (65, 39, 95), (62, 44, 53), (104, 97, 103), (199, 184, 189), (230, 225, 226), (253, 252, 251), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (212, 200, 193), (184, 171, 173), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (255, 255, 255), (247, 245, 246), (169, 160, 159), (240, 236, 236), (240, 236, 236), (199, 184, 189), (125, 117, 117), (62, 44, 53), (74, 42, 102), (130, 77, 180), (181, 106, 231), (188, 112, 237), (181, 106, 231), (181, 106, 231), (188, 112, 237), (181, 106, 231), (181, 106, 231), (181, 106, 231), (181, 106, 231), (172, 101, 223), (165, 97, 218), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (153, 90, 201), (148, 87, 194), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (139, 82, 188), (134, 80, 184), (121, 77, 182), (116, 74, 177), (109, 70, 168), (114, 72, 171), (109, 70, 168), (107, 68, 164), (107, 68, 164), (107, 66, 159), (100, 65, 159), (102, 67, 163), (107, 68, 164), (107, 68, 164), (102, 67, 163), (96, 64, 156), (92, 61, 149), (88, 59, 145), (96, 64, 156), (107, 68, 164), (107, 66, 159), (101, 62, 149), (97, 59, 142), (88, 59, 145), (97, 59, 142), (101, 62, 149), (89, 54, 132), (98, 57, 135), (97, 59, 142), (96, 54, 125), (74, 42, 102), (60, 35, 42), (116, 58, 26), (112, 44, 23), (116, 58, 26), (120, 70, 32), (120, 70, 32), (116, 58, 26), (116, 58, 26), (137, 110, 18), (137, 119, 19), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (154, 126, 20), (12, 10, 12), (12, 10, 12), (16, 13, 14), (19, 18, 32), (75, 50, 126), (96, 64, 156), (96, 64, 156), (92, 61, 149), (87, 56, 139), (106, 61, 143), (110, 64, 149), (115, 69, 162), (125, 75, 175), (125, 75, 175), (120, 71, 164), (114, 72, 171), (115, 69, 162), (122, 73, 170), (125, 75, 175), (125, 75, 175), (122, 73, 170), (120, 71, 164), (110, 64, 149), (98, 57, 135), (48, 28, 68), (60, 35, 42), (78, 59, 51), (83, 66, 57), (91, 71, 61), (91, 71, 61), (83, 66, 57), (91, 71, 61), (91, 71, 61), (90, 62, 89), (114, 66, 155), (130, 76, 170), (130, 76, 170), (130, 77, 180), (122, 73, 170), (104, 64, 154), (92, 61, 149), (104, 64, 154), (107, 68, 164), (116, 74, 177), (143, 87, 202), (143, 87, 202), (143, 84, 192), (134, 80, 184), (129, 82, 192), (134, 84, 197), (123, 80, 188), (134, 84, 197), (143, 87, 202), (134, 84, 197), (104, 64, 154), (74, 42, 102), (66, 54, 66), (91, 83, 78), (144, 135, 137), (199, 184, 189), (222, 214, 215), (230, 225, 226), (247, 245, 246), (212, 200, 193), (199, 184, 189), (255, 255, 255), (255, 255, 255), (255, 255, 255), (253, 252, 251), (253, 252, 251), (247, 245, 246), (247, 245, 246), (222, 214, 215), (132, 126, 124), (144, 135, 137), (99, 91, 85), (62, 44, 53), (65, 39, 95), (110, 64, 149), (143, 87, 202), (181, 106, 231), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (181, 106, 231), (181, 106, 231), (181, 106, 231), (172, 101, 223), (165, 97, 218), (165, 97, 218), (172, 101, 223), (172, 101, 223), (159, 93, 210), (153, 90, 201), (153, 90, 201), (143, 84, 192), (143, 84, 192), (139, 82, 188), (130, 77, 180), (130, 77, 180), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (134, 80, 184), (130, 77, 180), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (107, 68, 164), (100, 65, 159), (102, 67, 163), (109, 70, 168), (107, 68, 164), (102, 67, 163), (102, 67, 163), (100, 65, 159), (95, 62, 152), (92, 61, 149), (96, 64, 156), (107, 68, 164), (107, 66, 159), (101, 62, 149), (101, 62, 149), (87, 56, 139), (87, 56, 139), (97, 59, 142), (87, 56, 139), (97, 59, 142), (106, 61, 143), (98, 57, 135), (85, 50, 122), (70, 27, 59), (93, 69, 29), (114, 88, 18), (112, 44, 23), (112, 44, 23), (112, 44, 23), (112, 44, 23), (133, 79, 31), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 119, 19), (9, 6, 9), (12, 10, 12), (16, 13, 14), (54, 36, 85), (88, 59, 145), (92, 61, 149), (95, 62, 152), (96, 64, 156), (92, 61, 149), (97, 59, 142), (114, 66, 155), (115, 69, 162), (120, 71, 164), (125, 75, 175), (122, 73, 170), (120, 71, 164), (120, 71, 164), (122, 73, 170), (125, 75, 175), (122, 73, 170), (115, 69, 162), (106, 61, 143), (82, 46, 109), (63, 38, 70), (38, 29, 27), (83, 66, 57), (96, 76, 66), (96, 76, 66), (91, 71, 61), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (96, 76, 66), (111, 68, 128), (130, 76, 170), (122, 73, 170), (130, 76, 170), (125, 75, 175), (107, 66, 159), (104, 64, 154), (104, 64, 154), (107, 66, 159), (116, 74, 177), (150, 91, 210), (153, 90, 201), (129, 82, 192), (121, 77, 182), (121, 77, 182), (121, 77, 182), (123, 80, 188), (129, 82, 192), (134, 84, 197), (143, 87, 202), (159, 93, 210), (150, 91, 210), (130, 77, 180), (97, 59, 142), (65, 39, 95), (63, 38, 70), (74, 66, 72), (91, 83, 78), (104, 97, 103), (103, 94, 87), (116, 107, 112), (169, 160, 159), (184, 171, 173), (169, 160, 159), (169, 160, 159), (132, 126, 124), (116, 107, 112), (116, 107, 112), (91, 83, 78), (66, 54, 66), (63, 38, 70), (96, 54, 125), (134, 80, 184), (172, 101, 223), (181, 106, 231), (181, 106, 231), (172, 101, 223), (181, 106, 231), (188, 112, 237), (181, 106, 231), (172, 101, 223), (172, 101, 223), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (159, 93, 210), (153, 90, 201), (153, 90, 201), (153, 90, 201), (143, 84, 192), (130, 77, 180), (120, 71, 164), (115, 69, 162), (122, 73, 170), (130, 77, 180), (134, 80, 184), (139, 82, 188), (139, 82, 188), (134, 80, 184), (130, 77, 180), (121, 77, 182), (125, 75, 175), (114, 72, 171), (107, 68, 164), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (102, 67, 163), (100, 65, 159), (102, 67, 163), (96, 64, 156), (88, 59, 145), (92, 61, 149), (100, 65, 159), (100, 65, 159), (101, 62, 149), (101, 62, 149), (88, 59, 145), (87, 56, 139), (81, 54, 134), (89, 54, 132), (97, 59, 142), (97, 59, 142), (85, 50, 122), (82, 46, 109), (63, 38, 70), (60, 44, 19), (127, 100, 20), (137, 110, 18), (127, 100, 20), (114, 88, 18), (127, 100, 20), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (9, 6, 9), (9, 6, 9), (19, 18, 32), (75, 50, 126), (92, 61, 149), (92, 61, 149), (92, 61, 149), (95, 62, 152), (96, 64, 156), (92, 61, 149), (101, 62, 149), (115, 69, 162), (115, 69, 162), (122, 73, 170), (120, 71, 164), (120, 71, 164), (122, 73, 170), (120, 71, 164), (115, 69, 162), (110, 64, 149), (97, 59, 142), (65, 39, 95), (48, 28, 68), (62, 44, 53), (83, 66, 57), (91, 71, 61), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (102, 72, 95), (120, 71, 164), (130, 76, 170), (130, 76, 170), (139, 82, 188), (125, 75, 175), (115, 69, 162), (104, 64, 154), (107, 66, 159), (114, 72, 171), (139, 82, 188), (143, 84, 192), (153, 90, 201), (134, 84, 197), (123, 80, 188), (114, 72, 171), (121, 77, 182), (134, 80, 184), (143, 84, 192), (143, 87, 202), (150, 91, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (134, 80, 184), (122, 73, 170), (106, 61, 143), (85, 50, 122), (74, 42, 102), (65, 39, 95), (65, 39, 95), (56, 51, 91), (65, 39, 95), (65, 39, 95), (65, 39, 95), (82, 46, 109), (96, 54, 125), (106, 61, 143), (130, 77, 180), (159, 93, 210), (181, 106, 231), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (165, 97, 218), (165, 97, 218), (172, 101, 223), (172, 101, 223), (165, 97, 218), (172, 101, 223), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (148, 87, 194), (143, 84, 192), (122, 73, 170), (106, 61, 143), (97, 59, 142), (98, 57, 135), (110, 64, 149), (120, 71, 164), (130, 77, 180), (134, 80, 184), (134, 80, 184), (130, 77, 180), (130, 77, 180), (125, 75, 175), (114, 72, 171), (114, 72, 171), (121, 77, 182), (130, 77, 180), (116, 74, 177), (107, 68, 164), (107, 68, 164), (100, 65, 159), (100, 65, 159), (100, 65, 159), (95, 62, 152), (92, 61, 149), (96, 64, 156), (100, 65, 159), (95, 62, 152), (95, 62, 152), (88, 59, 145), (81, 54, 134), (81, 54, 134), (87, 56, 139), (97, 59, 142), (97, 59, 142), (85, 50, 122), (74, 42, 102), (65, 39, 95), (60, 35, 42), (93, 69, 29), (137, 110, 18), (137, 119, 19), (137, 119, 19), (137, 119, 19), (137, 119, 19), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (9, 6, 9), (9, 6, 9), (38, 29, 27), (90, 62, 89), (91, 52, 112), (89, 54, 132), (87, 56, 139), (96, 64, 156), (96, 64, 156), (96, 64, 156), (95, 62, 152), (107, 66, 159), (115, 69, 162), (120, 71, 164), (120, 71, 164), (120, 71, 164), (122, 73, 170), (115, 69, 162), (110, 64, 149), (85, 50, 122), (63, 38, 70), (60, 35, 42), (69, 63, 51), (83, 66, 57), (91, 71, 61), (96, 76, 66), (91, 71, 61), (96, 76, 66), (101, 81, 71), (107, 85, 73), (108, 89, 79), (101, 81, 71), (96, 76, 66), (96, 76, 66), (91, 71, 61), (106, 59, 128), (120, 71, 164), (134, 80, 184), (148, 87, 194), (139, 82, 188), (130, 77, 180), (115, 69, 162), (109, 70, 168), (107, 68, 164), (125, 75, 175), (134, 80, 184), (134, 84, 197), (143, 87, 202), (134, 84, 197), (123, 80, 188), (129, 82, 192), (134, 84, 197), (134, 84, 197), (150, 91, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (165, 97, 218), (165, 97, 218), (150, 91, 210), (150, 91, 210), (159, 93, 210), (159, 93, 210), (150, 91, 210), (150, 91, 210), (143, 87, 202), (143, 87, 202), (150, 91, 210), (159, 93, 210), (165, 97, 218), (172, 101, 223), (172, 101, 223), (172, 101, 223), (181, 106, 231), (188, 112, 237), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (188, 112, 237), (172, 101, 223), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (165, 97, 218), (165, 97, 218), (159, 93, 210), (153, 90, 201), (153, 90, 201), (143, 84, 192), (130, 77, 180), (104, 64, 154), (89, 54, 132), (89, 54, 132), (91, 52, 112), (65, 39, 95), (82, 46, 109), (110, 64, 149), (120, 71, 164), (122, 73, 170), (122, 73, 170), (122, 73, 170), (130, 77, 180), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (125, 75, 175), (114, 72, 171), (109, 70, 168), (107, 68, 164), (100, 65, 159), (100, 65, 159), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 66, 159), (96, 64, 156), (88, 59, 145), (88, 59, 145), (87, 56, 139), (81, 54, 134), (87, 56, 139), (97, 59, 142), (87, 56, 139), (75, 50, 126), (74, 42, 102), (65, 39, 95), (58, 21, 50), (83, 23, 19), (112, 44, 23), (120, 70, 32), (127, 100, 20), (137, 119, 19), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (137, 110, 18), (9, 6, 9), (12, 10, 12), (69, 63, 51), (83, 66, 57), (78, 59, 51), (78, 59, 51), (87, 51, 61), (96, 54, 125), (96, 64, 156), (96, 64, 156), (100, 65, 159), (100, 65, 159), (107, 66, 159), (120, 71, 164), (122, 73, 170), (122, 73, 170), (122, 73, 170), (120, 71, 164), (96, 54, 125), (34, 18, 44), (54, 48, 43), (83, 66, 57), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (101, 81, 71), (96, 76, 66), (91, 71, 61), (83, 66, 57), (91, 52, 112), (114, 66, 155), (134, 80, 184), (148, 87, 194), (143, 84, 192), (143, 84, 192), (143, 84, 192), (125, 75, 175), (109, 70, 168), (125, 75, 175), (134, 80, 184), (123, 80, 188), (121, 77, 182), (143, 87, 202), (150, 91, 210), (143, 87, 202), (143, 87, 202), (150, 91, 210), (165, 97, 218), (159, 93, 210), (143, 87, 202), (143, 87, 202), (150, 91, 210), (150, 91, 210), (143, 87, 202), (134, 84, 197), (143, 87, 202), (134, 84, 197), (143, 87, 202), (143, 87, 202), (143, 87, 202), (159, 93, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (172, 101, 223), (172, 101, 223), (181, 106, 231), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (165, 97, 218), (172, 101, 223), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (148, 87, 194), (143, 84, 192), (134, 80, 184), (120, 71, 164), (97, 59, 142), (89, 54, 132), (85, 50, 122), (82, 46, 109), (47, 16, 39), (34, 8, 17), (70, 27, 59), (82, 46, 109), (110, 64, 149), (115, 69, 162), (115, 69, 162), (122, 73, 170), (125, 75, 175), (122, 73, 170), (122, 73, 170), (125, 75, 175), (122, 73, 170), (114, 72, 171), (114, 72, 171), (109, 70, 168), (100, 65, 159), (96, 64, 156), (100, 65, 159), (102, 67, 163), (100, 65, 159), (104, 64, 154), (95, 62, 152), (92, 61, 149), (92, 61, 149), (88, 59, 145), (87, 56, 139), (87, 56, 139), (81, 54, 134), (75, 50, 126), (70, 46, 117), (74, 42, 102), (65, 39, 95), (70, 27, 59), (60, 22, 18), (112, 44, 23), (118, 32, 19), (118, 32, 19), (116, 58, 26), (127, 100, 20), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (137, 110, 18), (137, 110, 18), (137, 110, 18), (9, 6, 9), (50, 41, 35), (87, 80, 63), (78, 59, 51), (78, 59, 51), (78, 59, 51), (69, 63, 51), (91, 52, 112), (96, 64, 156), (102, 67, 163), (102, 67, 163), (102, 67, 163), (100, 65, 159), (106, 61, 143), (114, 66, 155), (110, 64, 149), (96, 54, 125), (82, 46, 109), (63, 38, 70), (50, 41, 35), (83, 66, 57), (83, 66, 57), (91, 71, 61), (96, 76, 66), (101, 81, 71), (108, 89, 79), (108, 89, 79), (107, 85, 73), (101, 81, 71), (101, 81, 71), (107, 85, 73), (96, 76, 66), (91, 71, 61), (91, 71, 61), (91, 71, 61), (90, 62, 89), (106, 61, 143), (130, 76, 170), (143, 84, 192), (139, 82, 188), (148, 87, 194), (148, 87, 194), (130, 77, 180), (122, 73, 170), (122, 73, 170), (130, 77, 180), (125, 75, 175), (114, 72, 171), (143, 87, 202), (143, 87, 202), (143, 87, 202), (159, 93, 210), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (159, 93, 210), (143, 87, 202), (134, 84, 197), (134, 84, 197), (129, 82, 192), (129, 82, 192), (129, 82, 192), (134, 84, 197), (143, 87, 202), (143, 87, 202), (134, 84, 197), (150, 91, 210), (165, 97, 218), (165, 97, 218), (172, 101, 223), (181, 106, 231), (181, 106, 231), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (172, 101, 223), (181, 106, 231), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (159, 93, 210), (165, 97, 218), (159, 93, 210), (153, 90, 201), (153, 90, 201), (153, 90, 201), (143, 84, 192), (139, 82, 188), (130, 77, 180), (114, 66, 155), (97, 59, 142), (98, 57, 135), (96, 54, 125), (74, 42, 102), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (81, 31, 68), (96, 54, 125), (106, 61, 143), (114, 66, 155), (115, 69, 162), (115, 69, 162), (120, 71, 164), (122, 73, 170), (122, 73, 170), (114, 72, 171), (114, 72, 171), (114, 72, 171), (107, 68, 164), (102, 67, 163), (107, 68, 164), (102, 67, 163), (100, 65, 159), (92, 61, 149), (88, 59, 145), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (89, 54, 132), (81, 54, 134), (89, 54, 132), (85, 50, 122), (70, 46, 117), (70, 46, 117), (48, 28, 68), (60, 22, 18), (116, 58, 26), (120, 70, 32), (116, 58, 26), (118, 32, 19), (118, 32, 19), (116, 58, 26), (127, 100, 20), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (127, 100, 20), (137, 110, 18), (28, 27, 20), (78, 71, 58), (83, 66, 57), (78, 59, 51), (78, 59, 51), (83, 66, 57), (83, 66, 57), (96, 54, 125), (100, 65, 159), (102, 67, 163), (109, 70, 168), (109, 70, 168), (85, 50, 122), (48, 28, 68), (86, 51, 85), (86, 51, 85), (87, 51, 61), (78, 59, 51), (78, 59, 51), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (91, 71, 61), (107, 85, 73), (115, 92, 79), (108, 89, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (101, 81, 71), (96, 76, 66), (96, 76, 66), (101, 81, 71), (102, 72, 95), (101, 63, 111), (106, 59, 128), (120, 74, 147), (130, 76, 170), (134, 80, 184), (143, 84, 192), (148, 87, 194), (134, 80, 184), (122, 73, 170), (109, 70, 168), (114, 72, 171), (114, 72, 171), (116, 74, 177), (134, 84, 197), (143, 87, 202), (143, 87, 202), (159, 93, 210), (159, 93, 210), (159, 93, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (150, 91, 210), (134, 84, 197), (123, 80, 188), (121, 77, 182), (116, 74, 177), (114, 72, 171), (121, 77, 182), (134, 84, 197), (129, 82, 192), (129, 82, 192), (150, 91, 210), (165, 97, 218), (165, 97, 218), (172, 101, 223), (181, 106, 231), (181, 106, 231), (188, 112, 237), (188, 112, 237), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (153, 90, 201), (148, 87, 194), (153, 90, 201), (148, 87, 194), (143, 84, 192), (134, 80, 184), (115, 69, 162), (110, 64, 149), (106, 61, 143), (98, 57, 135), (74, 42, 102), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (47, 16, 39), (81, 31, 68), (96, 54, 125), (114, 66, 155), (115, 69, 162), (120, 71, 164), (122, 73, 170), (122, 73, 170), (114, 72, 171), (114, 72, 171), (114, 72, 171), (107, 68, 164), (107, 68, 164), (107, 68, 164), (100, 65, 159), (100, 65, 159), (95, 62, 152), (88, 59, 145), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (87, 56, 139), (89, 54, 132), (97, 59, 142), (89, 54, 132), (89, 54, 132), (98, 57, 135), (63, 38, 70), (34, 8, 17), (83, 23, 19), (101, 27, 15), (112, 44, 23), (118, 32, 19), (101, 27, 15), (101, 27, 15), (118, 32, 19), (116, 58, 26), (114, 88, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (137, 110, 18), (78, 71, 58), (83, 66, 57), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (97, 59, 142), (96, 64, 156), (92, 61, 149), (97, 59, 142), (91, 52, 112), (60, 35, 42), (54, 48, 43), (91, 71, 61), (96, 76, 66), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (101, 81, 71), (107, 85, 73), (101, 81, 71), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (91, 83, 78), (101, 63, 111), (85, 50, 122), (96, 54, 125), (98, 57, 135), (110, 64, 149), (114, 66, 155), (120, 71, 164), (134, 80, 184), (148, 87, 194), (139, 82, 188), (122, 73, 170), (107, 68, 164), (107, 68, 164), (107, 68, 164), (107, 68, 164), (116, 74, 177), (129, 82, 192), (129, 82, 192), (143, 87, 202), (134, 84, 197), (134, 84, 197), (143, 87, 202), (150, 91, 210), (150, 91, 210), (165, 97, 218), (159, 93, 210), (134, 84, 197), (129, 82, 192), (123, 80, 188), (121, 77, 182), (109, 70, 168), (109, 70, 168), (116, 74, 177), (121, 77, 182), (121, 77, 182), (134, 84, 197), (150, 91, 210), (165, 97, 218), (172, 101, 223), (181, 106, 231), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (181, 106, 231), (172, 101, 223), (172, 101, 223), (181, 106, 231), (181, 106, 231), (172, 101, 223), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (153, 90, 201), (153, 90, 201), (153, 90, 201), (139, 82, 188), (130, 76, 170), (120, 71, 164), (110, 64, 149), (110, 64, 149), (106, 59, 128), (65, 39, 95), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (47, 16, 39), (74, 42, 102), (106, 61, 143), (115, 69, 162), (115, 69, 162), (115, 69, 162), (115, 69, 162), (114, 72, 171), (109, 70, 168), (107, 68, 164), (107, 68, 164), (107, 68, 164), (107, 68, 164), (102, 67, 163), (95, 62, 152), (88, 59, 145), (92, 61, 149), (92, 61, 149), (95, 62, 152), (88, 59, 145), (88, 59, 145), (97, 59, 142), (98, 57, 135), (98, 57, 135), (98, 57, 135), (97, 59, 142), (74, 42, 102), (60, 22, 18), (60, 22, 18), (83, 23, 19), (83, 23, 19), (83, 23, 19), (101, 27, 15), (101, 27, 15), (101, 27, 15), (101, 27, 15), (118, 32, 19), (112, 44, 23), (133, 79, 31), (127, 100, 20), (127, 100, 20), (96, 76, 66), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (78, 59, 51), (78, 59, 51), (86, 51, 85), (86, 51, 85), (66, 54, 66), (78, 59, 51), (83, 66, 57), (83, 66, 57), (83, 66, 57), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (96, 76, 66), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (83, 75, 74), (83, 75, 74), (91, 83, 78), (99, 91, 85), (108, 89, 79), (101, 81, 71), (96, 87, 81), (111, 68, 128), (106, 61, 143), (101, 62, 149), (97, 59, 142), (98, 57, 135), (106, 61, 143), (110, 64, 149), (110, 64, 149), (120, 71, 164), (134, 80, 184), (134, 80, 184), (125, 75, 175), (107, 68, 164), (107, 68, 164), (109, 70, 168), (109, 70, 168), (109, 70, 168), (114, 72, 171), (114, 72, 171), (116, 74, 177), (121, 77, 182), (123, 80, 188), (129, 82, 192), (134, 84, 197), (143, 87, 202), (165, 97, 218), (150, 91, 210), (134, 84, 197), (123, 80, 188), (129, 82, 192), (134, 84, 197), (123, 80, 188), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (129, 82, 192), (150, 91, 210), (165, 97, 218), (172, 101, 223), (181, 106, 231), (172, 101, 223), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (148, 87, 194), (134, 80, 184), (125, 75, 175), (122, 73, 170), (114, 66, 155), (120, 71, 164), (114, 66, 155), (110, 64, 149), (96, 54, 125), (74, 42, 102), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (70, 27, 59), (85, 50, 122), (97, 59, 142), (101, 62, 149), (104, 64, 154), (107, 66, 159), (107, 68, 164), (107, 68, 164), (107, 68, 164), (109, 70, 168), (109, 70, 168), (107, 68, 164), (107, 66, 159), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (101, 62, 149), (97, 59, 142), (98, 57, 135), (85, 50, 122), (81, 54, 134), (88, 59, 145), (89, 54, 132), (42, 27, 52), (44, 36, 32), (60, 44, 19), (85, 37, 23), (83, 23, 19), (83, 23, 19), (83, 23, 19), (83, 23, 19), (101, 27, 15), (101, 27, 15), (101, 27, 15), (101, 27, 15), (112, 44, 23), (116, 58, 26), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (96, 76, 66), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (101, 81, 71), (108, 89, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (91, 83, 78), (96, 87, 81), (96, 87, 81), (96, 87, 81), (91, 83, 78), (102, 72, 95), (120, 74, 147), (114, 66, 155), (107, 66, 159), (107, 66, 159), (97, 59, 142), (98, 57, 135), (98, 57, 135), (106, 61, 143), (110, 64, 149), (120, 71, 164), (130, 77, 180), (134, 80, 184), (125, 75, 175), (107, 68, 164), (107, 68, 164), (114, 72, 171), (109, 70, 168), (102, 67, 163), (102, 67, 163), (102, 67, 163), (109, 70, 168), (114, 72, 171), (116, 74, 177), (121, 77, 182), (129, 82, 192), (150, 91, 210), (159, 93, 210), (150, 91, 210), (134, 84, 197), (123, 80, 188), (123, 80, 188), (134, 84, 197), (134, 84, 197), (123, 80, 188), (121, 77, 182), (116, 74, 177), (116, 74, 177), (116, 74, 177), (123, 80, 188), (129, 82, 192), (150, 91, 210), (165, 97, 218), (172, 101, 223), (172, 101, 223), (181, 106, 231), (188, 112, 237), (188, 112, 237), (188, 112, 237), (181, 106, 231), (172, 101, 223), (165, 97, 218), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (159, 93, 210), (153, 90, 201), (153, 90, 201), (153, 90, 201), (153, 90, 201), (139, 82, 188), (130, 77, 180), (130, 77, 180), (125, 75, 175), (120, 71, 164), (114, 66, 155), (114, 66, 155), (106, 61, 143), (110, 64, 149), (96, 54, 125), (91, 52, 112), (47, 16, 39), (9, 6, 9), (34, 8, 17), (9, 6, 9), (34, 8, 17), (9, 6, 9), (9, 6, 9), (34, 8, 17), (34, 8, 17), (34, 8, 17), (34, 8, 17), (54, 36, 85), (85, 50, 122), (98, 57, 135), (97, 59, 142), (101, 62, 149), (104, 64, 154), (107, 66, 159), (107, 66, 159), (107, 66, 159), (107, 68, 164), (107, 66, 159), (107, 66, 159), (107, 66, 159), (104, 64, 154), (104, 64, 154), (104, 64, 154), (101, 62, 149), (98, 57, 135), (85, 50, 122), (81, 54, 134), (88, 59, 145), (92, 61, 149), (92, 61, 149), (54, 36, 85), (7, 9, 33), (15, 28, 82), (48, 28, 68), (60, 35, 42), (60, 44, 19), (85, 37, 23), (83, 23, 19), (83, 23, 19), (101, 27, 15), (101, 27, 15), (101, 27, 15), (101, 27, 15), (101, 27, 15), (78, 59, 51), (83, 66, 57), (91, 71, 61), (91, 71, 61), (78, 59, 51), (78, 59, 51), (83, 66, 57), (83, 66, 57), (91, 71, 61), (96, 76, 66), (91, 71, 61), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (101, 81, 71), (108, 89, 79), (108, 89, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (91, 83, 78), (91, 83, 78), (96, 87, 81), (91, 83, 78), (91, 83, 78), (111, 68, 128), (114, 66, 155), (120, 71, 164), (122, 73, 170), (104, 64, 154), (101, 62, 149), (97, 59, 142), (98, 57, 135), (110, 64, 149), (120, 71, 164), (122, 73, 170), (130, 77, 180), (139, 82, 188), (134, 80, 184), (115, 69, 162), (109, 70, 168), (114, 72, 171), (109, 70, 168), (102, 67, 163), (102, 67, 163), (102, 67, 163), (109, 70, 168), (114, 72, 171), (116, 74, 177), (116, 74, 177), (123, 80, 188), (143, 87, 202), (143, 87, 202), (143, 87, 202), (134, 84, 197), (123, 80, 188), (121, 77, 182), (123, 80, 188), (123, 80, 188), (123, 80, 188), (121, 77, 182), (116, 74, 177), (116, 74, 177), (121, 77, 182), (123, 80, 188), (123, 80, 188), (143, 87, 202), (165, 97, 218), (172, 101, 223), (172, 101, 223), (181, 106, 231), (181, 106, 231), (181, 106, 231), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (172, 101, 223), (172, 101, 223), (159, 93, 210), (153, 90, 201), (148, 87, 194), (130, 77, 180), (134, 80, 184), (143, 84, 192), (139, 82, 188), (143, 84, 192), (148, 87, 194), (130, 77, 180), (120, 71, 164), (110, 64, 149), (101, 62, 149), (106, 61, 143), (106, 61, 143), (98, 57, 135), (106, 61, 143), (74, 42, 102), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (9, 6, 9), (12, 10, 12), (48, 28, 68), (82, 46, 109), (89, 54, 132), (97, 59, 142), (104, 64, 154), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 66, 159), (107, 66, 159), (115, 69, 162), (120, 71, 164), (120, 71, 164), (114, 66, 155), (110, 64, 149), (97, 59, 142), (89, 54, 132), (87, 56, 139), (95, 62, 152), (96, 64, 156), (92, 61, 149), (92, 61, 149), (85, 50, 122), (8, 14, 45), (11, 26, 69), (15, 28, 82), (42, 27, 52), (63, 54, 47), (78, 59, 51), (67, 50, 22), (67, 50, 22), (85, 37, 23), (83, 23, 19), (83, 23, 19), (83, 23, 19), (101, 27, 15), (83, 66, 57), (83, 66, 57), (78, 59, 51), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (83, 66, 57), (91, 71, 61), (91, 71, 61), (91, 71, 61), (91, 71, 61), (83, 66, 57), (91, 71, 61), (101, 81, 71), (91, 83, 78), (83, 75, 74), (91, 83, 78), (101, 81, 71), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (101, 81, 71), (96, 76, 66), (91, 83, 78), (91, 83, 78), (108, 89, 79), (107, 85, 73), (102, 72, 95), (110, 64, 149), (104, 64, 154), (115, 69, 162), (122, 73, 170), (107, 68, 164), (95, 62, 152), (88, 59, 145), (92, 61, 149), (114, 66, 155), (120, 71, 164), (130, 76, 170), (130, 76, 170), (134, 80, 184), (143, 84, 192), (122, 73, 170), (114, 72, 171), (114, 72, 171), (109, 70, 168), (114, 72, 171), (109, 70, 168), (107, 68, 164), (109, 70, 168), (116, 74, 177), (116, 74, 177), (121, 77, 182), (123, 80, 188), (134, 84, 197), (134, 84, 197), (129, 82, 192), (123, 80, 188), (123, 80, 188), (121, 77, 182), (121, 77, 182), (116, 74, 177), (116, 74, 177), (116, 74, 177), (123, 80, 188), (123, 80, 188), (121, 77, 182), (129, 82, 192), (134, 84, 197), (143, 87, 202), (159, 93, 210), (165, 97, 218), (165, 97, 218), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (148, 87, 194), (139, 82, 188), (134, 80, 184), (125, 75, 175), (134, 80, 184), (148, 87, 194), (148, 87, 194), (148, 87, 194), (148, 87, 194), (130, 76, 170), (122, 73, 170), (110, 64, 149), (110, 64, 149), (110, 64, 149), (114, 66, 155), (110, 64, 149), (106, 61, 143), (96, 54, 125), (34, 18, 44), (38, 29, 27), (38, 29, 27), (32, 22, 18), (32, 22, 18), (32, 22, 18), (34, 8, 17), (34, 8, 17), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (42, 27, 52), (74, 42, 102), (85, 50, 122), (97, 59, 142), (101, 62, 149), (104, 64, 154), (107, 66, 159), (107, 66, 159), (115, 69, 162), (120, 71, 164), (115, 69, 162), (114, 66, 155), (106, 61, 143), (97, 59, 142), (87, 56, 139), (92, 61, 149), (102, 67, 163), (100, 65, 159), (96, 64, 156), (92, 61, 149), (92, 61, 149), (87, 56, 139), (42, 27, 52), (8, 20, 59), (15, 33, 95), (48, 28, 68), (83, 66, 57), (91, 71, 61), (78, 59, 51), (78, 59, 51), (73, 56, 25), (67, 50, 22), (85, 37, 23), (85, 37, 23), (83, 23, 19), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (96, 76, 66), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (96, 76, 66), (107, 85, 73), (108, 89, 79), (96, 87, 81), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (108, 89, 79), (118, 95, 83), (118, 95, 83), (115, 87, 74), (111, 68, 128), (110, 64, 149), (101, 62, 149), (107, 66, 159), (107, 68, 164), (104, 64, 154), (88, 59, 145), (87, 56, 139), (88, 59, 145), (101, 62, 149), (115, 69, 162), (120, 71, 164), (130, 76, 170), (134, 80, 184), (139, 82, 188), (130, 77, 180), (122, 73, 170), (114, 72, 171), (114, 72, 171), (116, 74, 177), (114, 72, 171), (109, 70, 168), (109, 70, 168), (114, 72, 171), (121, 77, 182), (121, 77, 182), (121, 77, 182), (129, 82, 192), (129, 82, 192), (123, 80, 188), (116, 74, 177), (109, 70, 168), (116, 74, 177), (116, 74, 177), (116, 74, 177), (121, 77, 182), (116, 74, 177), (123, 80, 188), (121, 77, 182), (123, 80, 188), (134, 84, 197), (143, 87, 202), (129, 82, 192), (134, 84, 197), (143, 87, 202), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (159, 93, 210), (159, 93, 210), (165, 97, 218), (159, 93, 210), (159, 93, 210), (165, 97, 218), (153, 90, 201), (139, 82, 188), (125, 75, 175), (125, 75, 175), (139, 82, 188), (148, 87, 194), (153, 90, 201), (153, 90, 201), (148, 87, 194), (143, 84, 192), (134, 80, 184), (120, 71, 164), (115, 69, 162), (114, 66, 155), (114, 66, 155), (114, 66, 155), (110, 64, 149), (110, 64, 149), (98, 57, 135), (63, 38, 70), (62, 44, 53), (101, 81, 71), (96, 76, 66), (83, 66, 57), (78, 59, 51), (83, 66, 57), (83, 66, 57), (63, 54, 47), (54, 48, 43), (63, 54, 47), (78, 59, 51), (78, 59, 51), (90, 62, 89), (82, 46, 109), (85, 50, 122), (98, 57, 135), (101, 62, 149), (104, 64, 154), (115, 69, 162), (115, 69, 162), (107, 66, 159), (104, 64, 154), (101, 62, 149), (97, 59, 142), (88, 59, 145), (96, 64, 156), (100, 65, 159), (102, 67, 163), (87, 56, 139), (70, 46, 117), (81, 54, 134), (87, 56, 139), (87, 56, 139), (48, 28, 68), (8, 14, 45), (15, 33, 95), (15, 28, 82), (78, 59, 51), (91, 71, 61), (78, 59, 51), (78, 59, 51), (78, 59, 51), (63, 54, 47), (63, 54, 47), (67, 50, 22), (73, 56, 25), (78, 59, 51), (63, 54, 47), (78, 59, 51), (91, 71, 61), (96, 76, 66), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 66, 57), (91, 71, 61), (96, 76, 66), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (107, 85, 73), (108, 89, 79), (107, 85, 73), (108, 89, 79), (107, 85, 73), (101, 81, 71), (108, 89, 79), (107, 85, 73), (107, 85, 73), (115, 92, 79), (115, 92, 79), (115, 92, 79), (108, 89, 79), (111, 77, 111), (114, 66, 155), (97, 59, 142), (101, 62, 149), (115, 69, 162), (107, 66, 159), (95, 62, 152), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (104, 64, 154), (114, 66, 155), (120, 71, 164), (130, 77, 180), (139, 82, 188), (130, 77, 180), (122, 73, 170), (114, 72, 171), (109, 70, 168), (116, 74, 177), (121, 77, 182), (114, 72, 171), (109, 70, 168), (114, 72, 171), (116, 74, 177), (116, 74, 177), (121, 77, 182), (123, 80, 188), (123, 80, 188), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (116, 74, 177), (123, 80, 188), (123, 80, 188), (123, 80, 188), (123, 80, 188), (129, 82, 192), (129, 82, 192), (123, 80, 188), (121, 77, 182), (123, 80, 188), (134, 84, 197), (134, 84, 197), (143, 87, 202), (143, 87, 202), (134, 84, 197), (143, 87, 202), (143, 87, 202), (143, 87, 202), (153, 90, 201), (153, 90, 201), (153, 90, 201), (134, 80, 184), (139, 82, 188), (130, 77, 180), (130, 77, 180), (148, 87, 194), (153, 90, 201), (153, 90, 201), (143, 84, 192), (139, 82, 188), (139, 82, 188), (130, 76, 170), (114, 66, 155), (107, 66, 159), (107, 66, 159), (107, 66, 159), (101, 62, 149), (104, 64, 154), (104, 64, 154), (97, 59, 142), (82, 46, 109), (60, 35, 42), (96, 76, 66), (115, 87, 74), (101, 81, 71), (107, 85, 73), (115, 87, 74), (115, 87, 74), (107, 85, 73), (107, 85, 73), (101, 81, 71), (107, 85, 73), (107, 85, 73), (108, 89, 79), (102, 72, 95), (96, 54, 125), (89, 54, 132), (98, 57, 135), (101, 62, 149), (110, 64, 149), (104, 64, 154), (101, 62, 149), (97, 59, 142), (92, 61, 149), (95, 62, 152), (96, 64, 156), (102, 67, 163), (102, 67, 163), (102, 67, 163), (70, 46, 117), (19, 18, 32), (42, 27, 52), (54, 36, 85), (70, 46, 117), (54, 36, 85), (21, 25, 41), (56, 51, 91), (15, 28, 82), (62, 44, 53), (78, 59, 51), (78, 59, 51), (78, 59, 51), (63, 54, 47), (67, 50, 22), (63, 54, 47), (78, 59, 51), (63, 54, 47), (78, 59, 51), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (91, 71, 61), (83, 66, 57), (83, 66, 57), (91, 71, 61), (101, 81, 71), (108, 89, 79), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (107, 85, 73), (115, 92, 79), (108, 89, 79), (115, 87, 74), (115, 92, 79), (108, 89, 79), (107, 85, 73), (101, 81, 71), (120, 74, 147), (114, 66, 155), (101, 62, 149), (101, 62, 149), (104, 64, 154), (97, 59, 142), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (101, 62, 149), (110, 64, 149), (120, 71, 164), (130, 76, 170), (139, 82, 188), (134, 80, 184), (130, 77, 180), (122, 73, 170), (114, 72, 171), (116, 74, 177), (121, 77, 182), (121, 77, 182), (121, 77, 182), (116, 74, 177), (116, 74, 177), (116, 74, 177), (121, 77, 182), (123, 80, 188), (123, 80, 188), (116, 74, 177), (116, 74, 177), (121, 77, 182), (116, 74, 177), (121, 77, 182), (121, 77, 182), (121, 77, 182), (129, 82, 192), (134, 84, 197), (134, 84, 197), (129, 82, 192), (123, 80, 188), (114, 72, 171), (114, 72, 171), (121, 77, 182), (123, 80, 188), (134, 84, 197), (134, 84, 197), (134, 84, 197), (129, 82, 192), (134, 84, 197), (129, 82, 192), (139, 82, 188), (143, 87, 202), (148, 87, 194), (134, 80, 184), (114, 72, 171), (125, 75, 175), (134, 80, 184), (139, 82, 188), (148, 87, 194), (148, 87, 194), (139, 82, 188), (130, 77, 180), (130, 77, 180), (130, 76, 170), (115, 69, 162), (92, 61, 149), (95, 62, 152), (100, 65, 159), (100, 65, 159), (101, 62, 149), (101, 62, 149), (104, 64, 154), (106, 61, 143), (98, 57, 135), (63, 38, 70), (63, 54, 47), (101, 81, 71), (101, 81, 71), (107, 85, 73), (115, 87, 74), (124, 91, 74), (83, 66, 57), (38, 29, 27), (38, 29, 27), (44, 36, 32), (54, 48, 43), (54, 48, 43), (66, 54, 66), (90, 62, 89), (85, 50, 122), (89, 54, 132), (97, 59, 142), (101, 62, 149), (101, 62, 149), (95, 62, 152), (95, 62, 152), (102, 67, 163), (102, 67, 163), (102, 67, 163), (100, 65, 159), (96, 64, 156), (100, 65, 159), (70, 46, 117), (19, 18, 17), (30, 31, 37), (15, 28, 82), (15, 33, 95), (15, 28, 82), (15, 28, 82), (15, 33, 95), (15, 33, 95), (42, 27, 52), (63, 54, 47), (63, 54, 47), (63, 54, 47), (78, 59, 51), (78, 59, 51), (78, 59, 51), (63, 54, 47), (78, 59, 51), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (91, 71, 61), (91, 71, 61), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (83, 75, 74), (96, 76, 66), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (108, 89, 79), (107, 85, 73), (108, 89, 79), (108, 89, 79), (108, 89, 79), (111, 77, 111), (115, 69, 162), (97, 59, 142), (97, 59, 142), (101, 62, 149), (92, 61, 149), (87, 56, 139), (87, 56, 139), (88, 59, 145), (92, 61, 149), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 66, 159), (120, 71, 164), (120, 71, 164), (130, 77, 180), (134, 80, 184), (134, 80, 184), (125, 75, 175), (125, 75, 175), (130, 77, 180), (130, 77, 180), (121, 77, 182), (139, 82, 188), (129, 82, 192), (116, 74, 177), (114, 72, 171), (116, 74, 177), (116, 74, 177), (116, 74, 177), (114, 72, 171), (116, 74, 177), (121, 77, 182), (116, 74, 177), (121, 77, 182), (123, 80, 188), (123, 80, 188), (123, 80, 188), (123, 80, 188), (134, 84, 197), (143, 87, 202), (129, 82, 192), (114, 72, 171), (116, 74, 177), (116, 74, 177), (121, 77, 182), (129, 82, 192), (116, 74, 177), (116, 74, 177), (123, 80, 188), (121, 77, 182), (129, 82, 192), (143, 87, 202), (153, 90, 201), (134, 80, 184), (107, 68, 164), (100, 65, 159), (122, 73, 170), (139, 82, 188), (139, 82, 188), (143, 84, 192), (139, 82, 188), (130, 76, 170), (130, 76, 170), (130, 76, 170), (122, 73, 170), (109, 70, 168), (100, 65, 159), (96, 64, 156), (96, 64, 156), (96, 64, 156), (92, 61, 149), (88, 59, 145), (101, 62, 149), (101, 62, 149), (114, 66, 155), (96, 54, 125), (60, 35, 42), (96, 76, 66), (118, 95, 83), (118, 95, 83), (115, 92, 79), (107, 85, 73), (63, 54, 47), (9, 6, 9), (12, 10, 12), (9, 6, 9), (9, 6, 9), (16, 13, 14), (12, 10, 12), (19, 18, 17), (42, 27, 52), (48, 28, 68), (82, 46, 109), (92, 61, 149), (96, 64, 156), (100, 65, 159), (109, 70, 168), (109, 70, 168), (96, 64, 156), (95, 62, 152), (96, 64, 156), (96, 64, 156), (100, 65, 159), (75, 50, 126), (19, 18, 32), (30, 31, 37), (11, 26, 69), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (11, 26, 69), (63, 54, 47), (78, 59, 51), (78, 59, 51), (78, 59, 51), (83, 66, 57), (83, 66, 57), (78, 59, 51), (78, 59, 51), (91, 71, 61), (91, 71, 61), (96, 76, 66), (91, 71, 61), (96, 76, 66), (101, 81, 71), (96, 76, 66), (91, 71, 61), (96, 76, 66), (91, 71, 61), (91, 71, 61), (87, 80, 63), (101, 81, 71), (91, 71, 61), (91, 71, 61), (96, 76, 66), (91, 71, 61), (91, 71, 61), (91, 71, 61), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (108, 89, 79), (108, 89, 79), (101, 81, 71), (106, 61, 143), (114, 66, 155), (97, 59, 142), (97, 59, 142), (107, 66, 159), (92, 61, 149), (81, 54, 134), (81, 54, 134), (88, 59, 145), (95, 62, 152), (109, 70, 168), (109, 70, 168), (114, 72, 171), (122, 73, 170), (114, 66, 155), (110, 64, 149), (114, 66, 155), (130, 76, 170), (134, 80, 184), (134, 80, 184), (134, 80, 184), (143, 84, 192), (139, 82, 188), (130, 77, 180), (130, 77, 180), (121, 77, 182), (109, 70, 168), (109, 70, 168), (109, 70, 168), (102, 67, 163), (102, 67, 163), (102, 67, 163), (116, 74, 177), (116, 74, 177), (116, 74, 177), (121, 77, 182), (121, 77, 182), (123, 80, 188), (123, 80, 188), (123, 80, 188), (123, 80, 188), (143, 87, 202), (150, 91, 210), (129, 82, 192), (129, 82, 192), (129, 82, 192), (121, 77, 182), (121, 77, 182), (114, 72, 171), (116, 74, 177), (116, 74, 177), (121, 77, 182), (143, 84, 192), (153, 90, 201), (143, 87, 202), (107, 68, 164), (100, 65, 159), (107, 66, 159), (130, 77, 180), (139, 82, 188), (130, 77, 180), (125, 75, 175), (122, 73, 170), (115, 69, 162), (122, 73, 170), (122, 73, 170), (116, 74, 177), (114, 72, 171), (100, 65, 159), (95, 62, 152), (95, 62, 152), (92, 61, 149), (92, 61, 149), (87, 56, 139), (87, 56, 139), (97, 59, 142), (115, 69, 162), (114, 66, 155), (63, 38, 70), (78, 59, 51), (130, 104, 87), (140, 110, 95), (124, 99, 84), (108, 89, 79), (63, 54, 47), (9, 6, 9), (12, 10, 12), (9, 6, 9), (9, 6, 9), (16, 13, 14), (12, 10, 12), (9, 6, 9), (12, 10, 12), (16, 13, 14), (48, 28, 68), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (109, 70, 168), (70, 46, 117), (34, 18, 44), (65, 39, 95), (87, 56, 139), (96, 64, 156), (81, 54, 134), (19, 18, 32), (32, 22, 18), (8, 20, 59), (15, 33, 95), (15, 33, 95), (15, 28, 82), (15, 33, 95), (15, 33, 95), (15, 28, 82), (62, 44, 53), (78, 59, 51), (78, 59, 51), (66, 54, 66), (69, 63, 51), (78, 59, 51), (83, 66, 57), (83, 66, 57), (91, 71, 61), (96, 76, 66), (96, 76, 66), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 66, 57), (96, 76, 66), (107, 85, 73), (91, 71, 61), (96, 76, 66), (96, 76, 66), (107, 85, 73), (96, 76, 66), (96, 76, 66), (91, 71, 61), (91, 71, 61), (91, 71, 61), (91, 71, 61), (91, 71, 61), (101, 81, 71), (107, 85, 73), (96, 87, 81), (107, 85, 73), (108, 89, 79), (115, 92, 79), (102, 72, 95), (97, 59, 142), (114, 66, 155), (107, 66, 159), (107, 66, 159), (107, 68, 164), (100, 65, 159), (87, 56, 139), (87, 56, 139), (87, 56, 139), (95, 62, 152), (114, 72, 171), (116, 74, 177), (114, 72, 171), (130, 77, 180), (115, 69, 162), (101, 62, 149), (97, 59, 142), (110, 64, 149), (120, 71, 164), (130, 77, 180), (130, 77, 180), (134, 80, 184), (143, 84, 192), (130, 77, 180), (114, 72, 171), (114, 72, 171), (114, 72, 171), (114, 72, 171), (109, 70, 168), (102, 67, 163), (96, 64, 156), (96, 64, 156), (102, 67, 163), (109, 70, 168), (116, 74, 177), (123, 80, 188), (123, 80, 188), (134, 84, 197), (129, 82, 192), (123, 80, 188), (143, 87, 202), (150, 91, 210), (159, 93, 210), (150, 91, 210), (150, 91, 210), (150, 91, 210), (134, 84, 197), (134, 84, 197), (129, 82, 192), (129, 82, 192), (134, 84, 197), (134, 84, 197), (153, 90, 201), (159, 93, 210), (121, 77, 182), (96, 64, 156), (100, 65, 159), (122, 73, 170), (130, 77, 180), (130, 77, 180), (120, 71, 164), (107, 66, 159), (107, 66, 159), (115, 69, 162), (122, 73, 170), (125, 75, 175), (116, 74, 177), (109, 70, 168), (100, 65, 159), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (87, 56, 139), (81, 54, 134), (101, 62, 149), (120, 71, 164), (91, 52, 112), (60, 35, 42), (118, 95, 83), (130, 104, 87), (130, 104, 87), (124, 99, 84), (78, 59, 51), (12, 10, 12), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (19, 18, 32), (75, 50, 126), (100, 65, 159), (102, 67, 163), (102, 67, 163), (102, 67, 163), (54, 36, 85), (9, 6, 9), (9, 6, 9), (34, 18, 44), (54, 36, 85), (65, 39, 95), (16, 13, 14), (16, 13, 14), (9, 6, 9), (7, 9, 33), (7, 9, 33), (7, 9, 33), (8, 14, 45), (8, 20, 59), (8, 14, 45), (44, 36, 32), (63, 54, 47), (63, 54, 47), (63, 54, 47), (63, 54, 47), (63, 54, 47), (78, 59, 51), (78, 59, 51), (101, 81, 71), (101, 81, 71), (96, 76, 66), (83, 66, 57), (78, 59, 51), (83, 66, 57), (91, 71, 61), (101, 81, 71), (96, 76, 66), (91, 71, 61), (96, 76, 66), (96, 76, 66), (78, 71, 58), (74, 66, 72), (78, 71, 58), (83, 75, 74), (83, 75, 74), (83, 75, 74), (96, 76, 66), (96, 76, 66), (107, 85, 73), (108, 89, 79), (108, 89, 79), (115, 87, 74), (115, 92, 79), (115, 87, 74), (101, 63, 111), (115, 69, 162), (114, 66, 155), (115, 69, 162), (130, 77, 180), (109, 70, 168), (100, 65, 159), (87, 56, 139), (81, 54, 134), (87, 56, 139), (92, 61, 149), (114, 72, 171), (121, 77, 182), (114, 72, 171), (125, 75, 175), (122, 73, 170), (104, 64, 154), (101, 62, 149), (101, 62, 149), (115, 69, 162), (125, 75, 175), (125, 75, 175), (130, 77, 180), (134, 80, 184), (139, 82, 188), (125, 75, 175), (114, 72, 171), (114, 72, 171), (116, 74, 177), (116, 74, 177), (109, 70, 168), (102, 67, 163), (96, 64, 156), (102, 67, 163), (102, 67, 163), (102, 67, 163), (116, 74, 177), (123, 80, 188), (129, 82, 192), (129, 82, 192), (143, 87, 202), (159, 93, 210), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (150, 91, 210), (150, 91, 210), (159, 93, 210), (159, 93, 210), (148, 87, 194), (159, 93, 210), (153, 90, 201), (114, 72, 171), (95, 62, 152), (107, 68, 164), (125, 75, 175), (125, 75, 175), (125, 75, 175), (115, 69, 162), (101, 62, 149), (101, 62, 149), (107, 66, 159), (116, 74, 177), (129, 82, 192), (116, 74, 177), (107, 68, 164), (102, 67, 163), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (81, 54, 134), (75, 50, 126), (75, 50, 126), (104, 64, 154), (106, 61, 143), (70, 27, 59), (116, 58, 26), (155, 83, 37), (155, 83, 37), (155, 83, 37), (120, 70, 32), (60, 22, 18), (32, 22, 18), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (9, 6, 9), (12, 10, 12), (19, 18, 17), (9, 6, 9), (16, 13, 14), (54, 36, 85), (88, 59, 145), (102, 67, 163), (100, 65, 159), (48, 28, 68), (9, 6, 9), (9, 6, 9), (12, 10, 12), (12, 10, 12), (16, 13, 14), (16, 13, 14), (19, 18, 17), (16, 13, 14), (9, 6, 9), (12, 10, 12), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (19, 18, 17), (19, 18, 17), (19, 18, 17), (38, 29, 27), (44, 36, 32), (38, 29, 27), (44, 36, 32), (96, 76, 66), (96, 76, 66), (91, 71, 61), (83, 66, 57), (91, 71, 61), (96, 76, 66), (101, 81, 71), (83, 66, 57), (78, 59, 51), (78, 59, 51), (83, 66, 57), (83, 66, 57), (74, 66, 72), (74, 66, 72), (83, 66, 57), (83, 75, 74), (83, 75, 74), (101, 81, 71), (101, 81, 71), (107, 85, 73), (115, 92, 79), (118, 95, 83), (107, 85, 73), (115, 87, 74), (107, 85, 73), (101, 81, 71), (106, 61, 143), (120, 71, 164), (114, 66, 155), (122, 73, 170), (130, 77, 180), (107, 68, 164), (95, 62, 152), (87, 56, 139), (81, 54, 134), (81, 54, 134), (87, 56, 139), (107, 68, 164), (116, 74, 177), (114, 72, 171), (114, 72, 171), (114, 72, 171), (115, 69, 162), (101, 62, 149), (101, 62, 149), (115, 69, 162), (122, 73, 170), (130, 77, 180), (143, 84, 192), (148, 87, 194), (143, 84, 192), (139, 82, 188), (130, 77, 180), (125, 75, 175), (130, 77, 180), (130, 77, 180), (121, 77, 182), (114, 72, 171), (107, 68, 164), (102, 67, 163), (100, 65, 159), (100, 65, 159), (102, 67, 163), (114, 72, 171), (116, 74, 177), (143, 87, 202), (165, 97, 218), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (159, 93, 210), (159, 93, 210), (165, 97, 218), (159, 93, 210), (153, 90, 201), (159, 93, 210), (153, 90, 201), (107, 68, 164), (96, 64, 156), (125, 75, 175), (130, 77, 180), (125, 75, 175), (114, 72, 171), (107, 66, 159), (101, 62, 149), (100, 65, 159), (114, 72, 171), (123, 80, 188), (123, 80, 188), (116, 74, 177), (109, 70, 168), (102, 67, 163), (96, 64, 156), (95, 62, 152), (92, 61, 149), (95, 62, 152), (92, 61, 149), (87, 56, 139), (70, 46, 117), (70, 46, 117), (87, 56, 139), (106, 61, 143), (90, 36, 80), (112, 44, 23), (205, 95, 40), (205, 95, 40), (188, 85, 36), (176, 76, 32), (188, 85, 36), (163, 68, 30), (139, 59, 26), (116, 58, 26), (112, 44, 23), (85, 37, 23), (60, 22, 18), (60, 22, 18), (32, 22, 18), (16, 13, 14), (16, 13, 14), (16, 13, 14), (42, 27, 52), (65, 39, 95), (75, 50, 126), (34, 18, 44), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (9, 6, 9), (9, 6, 9), (12, 10, 12), (16, 13, 14), (32, 22, 18), (32, 22, 18), (32, 22, 18), (16, 13, 14), (12, 10, 12), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (16, 13, 14), (9, 6, 9), (9, 6, 9), (16, 13, 14), (12, 10, 12), (78, 59, 51), (83, 66, 57), (91, 71, 61), (96, 76, 66), (96, 76, 66), (101, 81, 71), (101, 81, 71), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (83, 66, 57), (91, 71, 61), (96, 76, 66), (101, 81, 71), (108, 89, 79), (107, 85, 73), (101, 81, 71), (108, 89, 79), (115, 92, 79), (118, 95, 83), (115, 92, 79), (115, 87, 74), (107, 85, 73), (101, 63, 111), (115, 69, 162), (120, 71, 164), (115, 69, 162), (122, 73, 170), (130, 77, 180), (107, 68, 164), (92, 61, 149), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (95, 62, 152), (109, 70, 168), (109, 70, 168), (107, 68, 164), (114, 72, 171), (122, 73, 170), (107, 66, 159), (101, 62, 149), (114, 66, 155), (120, 71, 164), (125, 75, 175), (134, 80, 184), (148, 87, 194), (148, 87, 194), (148, 87, 194), (143, 84, 192), (134, 80, 184), (130, 77, 180), (134, 80, 184), (143, 84, 192), (134, 80, 184), (121, 77, 182), (114, 72, 171), (109, 70, 168), (109, 70, 168), (114, 72, 171), (116, 74, 177), (121, 77, 182), (143, 87, 202), (172, 101, 223), (172, 101, 223), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (153, 90, 201), (153, 90, 201), (159, 93, 210), (153, 90, 201), (125, 75, 175), (125, 75, 175), (153, 90, 201), (130, 77, 180), (115, 69, 162), (115, 69, 162), (107, 68, 164), (107, 66, 159), (109, 70, 168), (121, 77, 182), (123, 80, 188), (116, 74, 177), (114, 72, 171), (109, 70, 168), (102, 67, 163), (100, 65, 159), (92, 61, 149), (92, 61, 149), (96, 64, 156), (95, 62, 152), (87, 56, 139), (75, 50, 126), (70, 46, 117), (81, 54, 134), (97, 59, 142), (82, 46, 109), (85, 37, 23), (188, 85, 36), (205, 95, 40), (188, 85, 36), (188, 85, 36), (205, 95, 40), (188, 85, 36), (176, 76, 32), (205, 95, 40), (205, 95, 40), (176, 76, 32), (176, 76, 32), (188, 85, 36), (163, 68, 30), (139, 59, 26), (139, 59, 26), (112, 44, 23), (85, 37, 23), (85, 37, 23), (85, 37, 23), (32, 22, 18), (19, 18, 17), (16, 13, 14), (16, 13, 14), (16, 13, 14), (9, 6, 9), (9, 6, 9), (16, 13, 14), (12, 10, 12), (19, 18, 17), (16, 13, 14), (16, 13, 14), (12, 10, 12), (32, 22, 18), (16, 13, 14), (16, 13, 14), (9, 6, 9), (12, 10, 12), (12, 10, 12), (12, 10, 12), (9, 6, 9), (16, 13, 14), (16, 13, 14), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (107, 85, 73), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (91, 71, 61), (83, 66, 57), (91, 71, 61), (96, 76, 66), (96, 76, 66), (107, 85, 73), (118, 95, 83), (124, 99, 84), (115, 92, 79), (115, 92, 79), (115, 87, 74), (101, 81, 71), (115, 87, 74), (124, 91, 74), (124, 99, 84), (115, 92, 79), (96, 54, 125), (122, 73, 170), (120, 71, 164), (122, 73, 170), (122, 73, 170), (114, 72, 171), (88, 59, 145), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (88, 59, 145), (102, 67, 163), (109, 70, 168), (102, 67, 163), (109, 70, 168), (116, 74, 177), (114, 72, 171), (114, 66, 155), (114, 66, 155), (115, 69, 162), (122, 73, 170), (130, 77, 180), (139, 82, 188), (143, 84, 192), (153, 90, 201), (143, 84, 192), (139, 82, 188), (139, 82, 188), (139, 82, 188), (148, 87, 194), (148, 87, 194), (148, 87, 194), (139, 82, 188), (130, 77, 180), (139, 82, 188), (139, 82, 188), (139, 82, 188), (143, 84, 192), (153, 90, 201), (165, 97, 218), (172, 101, 223), (165, 97, 218), (165, 97, 218), (172, 101, 223), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (159, 93, 210), (153, 90, 201), (153, 90, 201), (153, 90, 201), (153, 90, 201), (153, 90, 201), (148, 87, 194), (125, 75, 175), (122, 73, 170), (122, 73, 170), (114, 72, 171), (109, 70, 168), (114, 72, 171), (121, 77, 182), (114, 72, 171), (109, 70, 168), (107, 68, 164), (102, 67, 163), (102, 67, 163), (100, 65, 159), (96, 64, 156), (92, 61, 149), (92, 61, 149), (95, 62, 152), (88, 59, 145), (75, 50, 126), (70, 46, 117), (75, 50, 126), (97, 59, 142), (98, 57, 135), (81, 31, 68), (155, 83, 37), (188, 85, 36), (188, 85, 36), (188, 85, 36), (176, 76, 32), (176, 76, 32), (176, 76, 32), (188, 85, 36), (188, 85, 36), (176, 76, 32), (176, 76, 32), (205, 95, 40), (176, 76, 32), (176, 76, 32), (188, 85, 36), (188, 85, 36), (163, 68, 30), (176, 76, 32), (188, 85, 36), (163, 68, 30), (91, 55, 19), (74, 66, 72), (74, 66, 72), (54, 48, 43), (54, 48, 43), (63, 54, 47), (30, 31, 37), (23, 22, 18), (16, 13, 14), (12, 10, 12), (12, 10, 12), (12, 10, 12), (19, 18, 17), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (16, 13, 14), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 92, 79), (124, 99, 84), (124, 99, 84), (124, 99, 84), (124, 99, 84), (115, 92, 79), (107, 85, 73), (115, 92, 79), (124, 91, 74), (115, 92, 79), (115, 80, 68), (106, 61, 143), (122, 73, 170), (120, 71, 164), (122, 73, 170), (122, 73, 170), (104, 64, 154), (81, 54, 134), (75, 50, 126), (75, 50, 126), (81, 54, 134), (81, 54, 134), (88, 59, 145), (88, 59, 145), (100, 65, 159), (107, 68, 164), (96, 64, 156), (107, 68, 164), (116, 74, 177), (114, 72, 171), (120, 71, 164), (115, 69, 162), (114, 66, 155), (120, 71, 164), (122, 73, 170), (130, 77, 180), (139, 82, 188), (134, 80, 184), (134, 80, 184), (134, 80, 184), (139, 82, 188), (143, 84, 192), (148, 87, 194), (153, 90, 201), (153, 90, 201), (153, 90, 201), (148, 87, 194), (143, 84, 192), (130, 77, 180), (139, 82, 188), (153, 90, 201), (159, 93, 210), (165, 97, 218), (165, 97, 218), (159, 93, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (159, 93, 210), (153, 90, 201), (148, 87, 194), (153, 90, 201), (153, 90, 201), (148, 87, 194), (148, 87, 194), (148, 87, 194), (139, 82, 188), (130, 77, 180), (130, 77, 180), (130, 77, 180), (122, 73, 170), (116, 74, 177), (121, 77, 182), (121, 77, 182), (109, 70, 168), (107, 68, 164), (100, 65, 159), (100, 65, 159), (102, 67, 163), (100, 65, 159), (100, 65, 159), (95, 62, 152), (88, 59, 145), (87, 56, 139), (87, 56, 139), (81, 54, 134), (75, 50, 126), (75, 50, 126), (97, 59, 142), (110, 64, 149), (82, 46, 109), (87, 51, 61), (145, 91, 73), (175, 108, 37), (188, 85, 36), (188, 85, 36), (188, 85, 36), (188, 85, 36), (205, 95, 40), (205, 95, 40), (176, 76, 32), (176, 76, 32), (205, 95, 40), (176, 76, 32), (163, 68, 30), (176, 76, 32), (176, 76, 32), (163, 68, 30), (176, 76, 32), (188, 85, 36), (176, 76, 32), (120, 70, 32), (99, 91, 85), (116, 107, 112), (80, 86, 97), (91, 83, 78), (104, 97, 103), (96, 87, 81), (74, 66, 72), (48, 28, 68), (15, 33, 95), (15, 28, 82), (11, 26, 69), (8, 20, 59), (8, 14, 45), (7, 9, 33), (12, 10, 12), (19, 18, 17), (12, 10, 12), (9, 6, 9), (9, 6, 9), (9, 6, 9), (12, 10, 12), (83, 66, 57), (83, 66, 57), (96, 76, 66), (101, 81, 71), (115, 87, 74), (115, 87, 74), (115, 87, 74), (115, 87, 74), (115, 92, 79), (115, 92, 79), (115, 92, 79), (115, 92, 79), (108, 89, 79), (103, 94, 87), (118, 95, 83), (124, 99, 84), (118, 95, 83), (124, 99, 84), (124, 99, 84), (118, 95, 83), (115, 92, 79), (118, 95, 83), (115, 92, 79), (107, 85, 73), (102, 72, 95), (120, 74, 147), (122, 73, 170), (115, 69, 162), (107, 66, 159), (97, 59, 142), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (88, 59, 145), (92, 61, 149), (95, 62, 152), (102, 67, 163), (95, 62, 152), (107, 68, 164), (114, 72, 171), (116, 74, 177), (122, 73, 170), (114, 66, 155), (106, 61, 143), (114, 66, 155), (115, 69, 162), (122, 73, 170), (125, 75, 175), (125, 75, 175), (130, 77, 180), (125, 75, 175), (125, 75, 175), (134, 80, 184), (148, 87, 194), (148, 87, 194), (148, 87, 194), (148, 87, 194), (153, 90, 201), (143, 84, 192), (130, 77, 180), (134, 80, 184), (143, 84, 192), (159, 93, 210), (159, 93, 210), (165, 97, 218), (165, 97, 218), (165, 97, 218), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (143, 84, 192), (153, 90, 201), (148, 87, 194), (143, 84, 192), (148, 87, 194), (143, 84, 192), (130, 77, 180), (125, 75, 175), (134, 80, 184), (130, 77, 180), (116, 74, 177), (121, 77, 182), (121, 77, 182), (114, 72, 171), (109, 70, 168), (100, 65, 159), (96, 64, 156), (96, 64, 156), (100, 65, 159), (96, 64, 156), (96, 64, 156), (96, 64, 156), (96, 64, 156), (95, 62, 152), (88, 59, 145), (87, 56, 139), (75, 50, 126), (70, 46, 117), (97, 59, 142), (107, 66, 159), (98, 57, 135), (63, 38, 70), (91, 71, 61), (145, 91, 73), (124, 91, 74), (145, 91, 73), (171, 99, 72), (205, 95, 40), (205, 95, 40), (205, 95, 40), (188, 85, 36), (188, 85, 36), (205, 95, 40), (188, 85, 36), (176, 76, 32), (205, 95, 40), (205, 95, 40), (176, 76, 32), (176, 76, 32), (188, 85, 36), (176, 76, 32), (133, 79, 31), (116, 107, 112), (125, 117, 117), (104, 97, 103), (99, 91, 85), (116, 107, 112), (116, 107, 112), (96, 87, 81), (133, 79, 31), (139, 59, 26), (111, 47, 96), (86, 51, 85), (65, 39, 95), (65, 39, 95), (54, 36, 85), (54, 36, 85), (83, 75, 74), (63, 54, 47), (54, 48, 43), (63, 54, 47), (50, 41, 35), (23, 22, 18), (83, 66, 57), (83, 66, 57), (91, 71, 61), (115, 87, 74), (124, 91, 74), (115, 87, 74), (115, 80, 68), (115, 87, 74), (115, 92, 79), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (130, 104, 87), (130, 104, 87), (124, 99, 84), (115, 92, 79), (108, 89, 79), (108, 89, 79), (118, 95, 83), (111, 77, 111), (130, 76, 170), (122, 73, 170), (104, 64, 154), (87, 56, 139), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (92, 61, 149), (88, 59, 145), (92, 61, 149), (102, 67, 163), (96, 64, 156), (100, 65, 159), (107, 68, 164), (116, 74, 177), (130, 77, 180), (120, 71, 164), (101, 62, 149), (110, 64, 149), (114, 66, 155), (115, 69, 162), (115, 69, 162), (125, 75, 175), (125, 75, 175), (122, 73, 170), (125, 75, 175), (134, 80, 184), (143, 84, 192), (148, 87, 194), (143, 84, 192), (143, 84, 192), (153, 90, 201), (148, 87, 194), (143, 84, 192), (139, 82, 188), (143, 84, 192), (143, 84, 192), (153, 90, 201), (159, 93, 210), (159, 93, 210), (165, 97, 218), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (159, 93, 210), (153, 90, 201), (134, 80, 184), (143, 84, 192), (153, 90, 201), (148, 87, 194), (143, 84, 192), (148, 87, 194), (130, 77, 180), (125, 75, 175), (125, 75, 175), (130, 77, 180), (130, 77, 180), (123, 80, 188), (116, 74, 177), (107, 68, 164), (102, 67, 163), (100, 65, 159), (96, 64, 156), (96, 64, 156), (102, 67, 163), (100, 65, 159), (102, 67, 163), (96, 64, 156), (95, 62, 152), (100, 65, 159), (100, 65, 159), (95, 62, 152), (88, 59, 145), (81, 54, 134), (75, 50, 126), (87, 56, 139), (101, 62, 149), (110, 64, 149), (74, 42, 102), (62, 44, 53), (124, 91, 74), (124, 91, 74), (115, 87, 74), (124, 91, 74), (145, 91, 73), (171, 99, 72), (205, 95, 40), (205, 95, 40), (205, 95, 40), (188, 85, 36), (176, 76, 32), (176, 76, 32), (176, 76, 32), (176, 76, 32), (163, 68, 30), (176, 76, 32), (188, 85, 36), (176, 76, 32), (155, 83, 37), (140, 110, 95), (132, 105, 99), (132, 105, 99), (116, 107, 112), (125, 117, 117), (125, 117, 117), (132, 105, 99), (188, 85, 36), (188, 85, 36), (188, 85, 36), (188, 85, 36), (188, 85, 36), (176, 76, 32), (163, 68, 30), (120, 70, 32), (99, 91, 85), (91, 83, 78), (74, 66, 72), (83, 75, 74), (91, 83, 78), (74, 66, 72), (83, 66, 57), (83, 66, 57), (96, 76, 66), (101, 81, 71), (124, 91, 74), (115, 87, 74), (115, 87, 74), (115, 87, 74), (115, 87, 74), (115, 92, 79), (107, 85, 73), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (115, 87, 74), (118, 95, 83), (124, 99, 84), (115, 92, 79), (118, 95, 83), (118, 95, 83), (108, 89, 79), (118, 95, 83), (111, 77, 111), (122, 73, 170), (115, 69, 162), (101, 62, 149), (81, 54, 134), (75, 50, 126), (81, 54, 134), (75, 50, 126), (75, 50, 126), (70, 46, 117), (75, 50, 126), (88, 59, 145), (92, 61, 149), (88, 59, 145), (92, 61, 149), (100, 65, 159), (102, 67, 163), (96, 64, 156), (96, 64, 156), (109, 70, 168), (121, 77, 182), (121, 77, 182), (114, 66, 155), (110, 64, 149), (114, 66, 155), (114, 66, 155), (120, 71, 164), (130, 77, 180), (130, 77, 180), (130, 77, 180), (130, 77, 180), (134, 80, 184), (139, 82, 188), (143, 84, 192), (139, 82, 188), (143, 84, 192), (148, 87, 194), (148, 87, 194), (134, 80, 184), (139, 82, 188), (143, 84, 192), (139, 82, 188), (139, 82, 188), (143, 84, 192), (153, 90, 201), (148, 87, 194), (139, 82, 188), (134, 80, 184), (139, 82, 188), (148, 87, 194), (153, 90, 201), (143, 84, 192), (139, 82, 188), (153, 90, 201), (153, 90, 201), (143, 84, 192), (143, 84, 192), (139, 82, 188), (130, 77, 180), (125, 75, 175), (130, 77, 180), (134, 80, 184), (125, 75, 175), (114, 72, 171), (107, 68, 164), (100, 65, 159), (100, 65, 159), (96, 64, 156), (96, 64, 156), (100, 65, 159), (100, 65, 159), (102, 67, 163), (107, 68, 164), (102, 67, 163), (96, 64, 156), (100, 65, 159), (100, 65, 159), (95, 62, 152), (88, 59, 145), (87, 56, 139), (81, 54, 134), (81, 54, 134), (87, 56, 139), (97, 59, 142), (91, 52, 112), (62, 44, 53), (107, 85, 73), (118, 95, 83), (124, 99, 84), (124, 99, 84), (118, 95, 83), (118, 95, 83), (124, 99, 84), (145, 91, 73), (145, 91, 73), (145, 91, 73), (188, 85, 36), (205, 95, 40), (188, 85, 36), (176, 76, 32), (176, 76, 32), (176, 76, 32), (188, 85, 36), (188, 85, 36), (176, 76, 32), (176, 76, 32), (176, 76, 32), (155, 83, 37), (115, 80, 68), (108, 89, 79), (111, 101, 90), (118, 95, 83), (155, 83, 37), (176, 76, 32), (176, 76, 32), (176, 76, 32), (176, 76, 32), (176, 76, 32), (163, 68, 30), (133, 79, 31), (116, 107, 112), (104, 97, 103), (83, 75, 74), (91, 83, 78), (104, 97, 103), (91, 83, 78), (83, 66, 57), (91, 71, 61), (91, 71, 61), (96, 76, 66), (115, 87, 74), (107, 85, 73), (115, 87, 74), (115, 87, 74), (107, 85, 73), (107, 85, 73), (101, 81, 71), (96, 76, 66), (101, 81, 71), (101, 81, 71), (107, 85, 73), (115, 87, 74), (108, 89, 79), (115, 92, 79), (107, 85, 73), (115, 87, 74), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (101, 63, 111), (122, 73, 170), (114, 66, 155), (101, 62, 149), (87, 56, 139), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (88, 59, 145), (96, 64, 156), (95, 62, 152), (92, 61, 149), (100, 65, 159), (96, 64, 156), (96, 64, 156), (92, 61, 149), (107, 68, 164), (121, 77, 182), (121, 77, 182), (125, 75, 175), (115, 69, 162), (114, 66, 155), (114, 66, 155), (115, 69, 162), (130, 77, 180), (134, 80, 184), (139, 82, 188), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (148, 87, 194), (148, 87, 194), (148, 87, 194), (139, 82, 188), (134, 80, 184), (134, 80, 184), (139, 82, 188), (148, 87, 194), (143, 84, 192), (130, 77, 180), (125, 75, 175), (122, 73, 170), (114, 72, 171), (114, 72, 171), (122, 73, 170), (125, 75, 175), (134, 80, 184), (134, 80, 184), (148, 87, 194), (148, 87, 194), (148, 87, 194), (143, 84, 192), (143, 84, 192), (130, 77, 180), (130, 77, 180), (139, 82, 188), (139, 82, 188), (114, 72, 171), (107, 68, 164), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (102, 67, 163), (107, 68, 164), (102, 67, 163), (102, 67, 163), (107, 68, 164), (107, 66, 159), (96, 64, 156), (95, 62, 152), (92, 61, 149), (87, 56, 139), (81, 54, 134), (81, 54, 134), (97, 59, 142), (97, 59, 142), (96, 54, 125), (63, 38, 70), (83, 66, 57), (115, 92, 79), (118, 95, 83), (124, 91, 74), (124, 99, 84), (130, 104, 87), (124, 99, 84), (118, 95, 83), (118, 95, 83), (115, 87, 74), (124, 91, 74), (155, 83, 37), (145, 91, 73), (155, 83, 37), (188, 85, 36), (205, 95, 40), (205, 95, 40), (205, 95, 40), (176, 76, 32), (188, 85, 36), (205, 95, 40), (176, 76, 32), (120, 70, 32), (96, 76, 66), (101, 81, 71), (91, 71, 61), (116, 58, 26), (176, 76, 32), (188, 85, 36), (163, 68, 30), (176, 76, 32), (188, 85, 36), (176, 76, 32), (120, 70, 32), (99, 91, 85), (103, 94, 87), (104, 97, 103), (104, 97, 103), (104, 97, 103), (99, 91, 85), (91, 71, 61), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (107, 85, 73), (108, 89, 79), (108, 89, 79), (107, 85, 73), (96, 87, 81), (101, 81, 71), (107, 85, 73), (107, 85, 73), (101, 81, 71), (107, 85, 73), (115, 87, 74), (107, 85, 73), (108, 89, 79), (115, 92, 79), (115, 92, 79), (124, 99, 84), (124, 99, 84), (115, 92, 79), (102, 72, 95), (106, 59, 128), (120, 71, 164), (114, 66, 155), (101, 62, 149), (88, 59, 145), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (75, 50, 126), (75, 50, 126), (92, 61, 149), (96, 64, 156), (95, 62, 152), (92, 61, 149), (96, 64, 156), (96, 64, 156), (96, 64, 156), (95, 62, 152), (107, 68, 164), (116, 74, 177), (121, 77, 182), (125, 75, 175), (120, 71, 164), (110, 64, 149), (110, 64, 149), (114, 66, 155), (122, 73, 170), (139, 82, 188), (148, 87, 194), (148, 87, 194), (148, 87, 194), (143, 84, 192), (143, 84, 192), (148, 87, 194), (143, 84, 192), (139, 82, 188), (143, 84, 192), (130, 77, 180), (125, 75, 175), (139, 82, 188), (139, 82, 188), (153, 90, 201), (143, 84, 192), (139, 82, 188), (139, 82, 188), (134, 80, 184), (134, 80, 184), (134, 80, 184), (130, 77, 180), (125, 75, 175), (134, 80, 184), (143, 84, 192), (143, 84, 192), (148, 87, 194), (148, 87, 194), (134, 80, 184), (130, 77, 180), (139, 82, 188), (139, 82, 188), (130, 77, 180), (114, 72, 171), (100, 65, 159), (102, 67, 163), (102, 67, 163), (100, 65, 159), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 68, 164), (102, 67, 163), (100, 65, 159), (100, 65, 159), (100, 65, 159), (92, 61, 149), (88, 59, 145), (88, 59, 145), (81, 54, 134), (81, 54, 134), (87, 56, 139), (97, 59, 142), (101, 62, 149), (98, 57, 135), (65, 39, 95), (63, 54, 47), (108, 89, 79), (115, 87, 74), (115, 87, 74), (115, 87, 74), (124, 99, 84), (124, 99, 84), (124, 91, 74), (115, 87, 74), (115, 80, 68), (115, 80, 68), (115, 87, 74), (115, 87, 74), (115, 80, 68), (155, 83, 37), (188, 85, 36), (188, 85, 36), (205, 95, 40), (205, 95, 40), (205, 95, 40), (205, 95, 40), (205, 95, 40), (155, 83, 37), (101, 81, 71), (115, 87, 74), (101, 81, 71), (116, 58, 26), (163, 68, 30), (176, 76, 32), (163, 68, 30), (163, 68, 30), (176, 76, 32), (163, 68, 30), (116, 58, 26), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (83, 75, 74), (83, 75, 74), (91, 71, 61), (91, 71, 61), (96, 76, 66), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (101, 81, 71), (107, 85, 73), (96, 87, 81), (96, 87, 81), (108, 89, 79), (107, 85, 73), (107, 85, 73), (115, 92, 79), (115, 87, 74), (115, 87, 74), (115, 92, 79), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (118, 95, 83), (102, 72, 95), (106, 59, 128), (114, 66, 155), (114, 66, 155), (101, 62, 149), (88, 59, 145), (92, 61, 149), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (88, 59, 145), (100, 65, 159), (96, 64, 156), (95, 62, 152), (96, 64, 156), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 68, 164), (107, 68, 164), (114, 72, 171), (125, 75, 175), (130, 77, 180), (114, 66, 155), (106, 61, 143), (110, 64, 149), (120, 71, 164), (134, 80, 184), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (143, 84, 192), (125, 75, 175), (122, 73, 170), (130, 77, 180), (130, 77, 180), (134, 80, 184), (139, 82, 188), (148, 87, 194), (148, 87, 194), (148, 87, 194), (148, 87, 194), (139, 82, 188), (134, 80, 184), (139, 82, 188), (139, 82, 188), (143, 84, 192), (148, 87, 194), (148, 87, 194), (139, 82, 188), (134, 80, 184), (130, 77, 180), (125, 75, 175), (122, 73, 170), (125, 75, 175), (109, 70, 168), (102, 67, 163), (102, 67, 163), (100, 65, 159), (96, 64, 156), (96, 64, 156), (95, 62, 152), (92, 61, 149), (95, 62, 152), (96, 64, 156), (100, 65, 159), (100, 65, 159), (100, 65, 159), (96, 64, 156), (95, 62, 152), (88, 59, 145), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (101, 62, 149), (115, 69, 162), (106, 61, 143), (82, 46, 109), (62, 44, 53), (107, 85, 73), (108, 89, 79), (115, 92, 79), (115, 92, 79), (124, 99, 84), (130, 104, 87), (124, 99, 84), (115, 87, 74), (115, 80, 68), (115, 80, 68), (115, 80, 68), (96, 76, 66), (91, 71, 61), (96, 76, 66), (115, 80, 68), (115, 80, 68), (115, 80, 68), (145, 91, 73), (155, 83, 37), (155, 83, 37), (155, 83, 37), (133, 79, 31), (107, 85, 73), (115, 92, 79), (101, 81, 71), (116, 58, 26), (176, 76, 32), (205, 95, 40), (176, 76, 32), (163, 68, 30), (176, 76, 32), (188, 85, 36), (139, 59, 26), (91, 55, 19), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (91, 71, 61), (91, 71, 61), (91, 71, 61), (107, 84, 42), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (101, 81, 71), (91, 83, 78), (91, 83, 78), (101, 81, 71), (107, 85, 73), (115, 87, 74), (115, 92, 79), (108, 89, 79), (115, 87, 74), (115, 87, 74), (124, 91, 74), (124, 99, 84), (124, 99, 84), (118, 95, 83), (124, 99, 84), (102, 72, 95), (96, 54, 125), (110, 64, 149), (115, 69, 162), (104, 64, 154), (87, 56, 139), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (81, 54, 134), (87, 56, 139), (95, 62, 152), (95, 62, 152), (96, 64, 156), (107, 68, 164), (102, 67, 163), (107, 68, 164), (107, 68, 164), (107, 66, 159), (107, 66, 159), (109, 70, 168), (125, 75, 175), (130, 77, 180), (122, 73, 170), (106, 61, 143), (98, 57, 135), (110, 64, 149), (130, 76, 170), (130, 76, 170), (130, 76, 170), (130, 76, 170), (130, 77, 180), (134, 80, 184), (139, 82, 188), (139, 82, 188), (130, 77, 180), (125, 75, 175), (115, 69, 162), (122, 73, 170), (130, 77, 180), (130, 77, 180), (134, 80, 184), (130, 77, 180), (143, 84, 192), (139, 82, 188), (143, 84, 192), (143, 84, 192), (143, 84, 192), (139, 82, 188), (139, 82, 188), (148, 87, 194), (148, 87, 194), (143, 84, 192), (139, 82, 188), (130, 77, 180), (134, 80, 184), (125, 75, 175), (115, 69, 162), (122, 73, 170), (114, 72, 171), (109, 70, 168), (114, 72, 171), (102, 67, 163), (100, 65, 159), (92, 61, 149), (88, 59, 145), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (92, 61, 149), (95, 62, 152), (95, 62, 152), (88, 59, 145), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (70, 46, 117), (87, 56, 139), (101, 62, 149), (114, 66, 155), (96, 54, 125), (62, 44, 53), (107, 85, 73), (118, 95, 83), (124, 99, 84), (130, 104, 87), (124, 99, 84), (124, 99, 84), (124, 99, 84), (124, 99, 84), (115, 92, 79), (115, 92, 79), (115, 87, 74), (101, 81, 71), (101, 81, 71), (96, 76, 66), (115, 80, 68), (115, 87, 74), (115, 87, 74), (115, 80, 68), (124, 91, 74), (124, 91, 74), (115, 87, 74), (115, 87, 74), (107, 85, 73), (108, 89, 79), (107, 85, 73), (93, 69, 29), (163, 68, 30), (176, 76, 32), (163, 68, 30), (163, 68, 30), (176, 76, 32), (176, 76, 32), (163, 68, 30), (116, 58, 26), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (107, 85, 73), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (108, 89, 79), (108, 89, 79), (96, 87, 81), (91, 83, 78), (91, 83, 78), (108, 89, 79), (115, 87, 74), (115, 87, 74), (118, 95, 83), (115, 92, 79), (115, 92, 79), (124, 91, 74), (124, 91, 74), (124, 99, 84), (130, 104, 87), (130, 104, 87), (118, 95, 83), (90, 62, 89), (96, 54, 125), (110, 64, 149), (114, 66, 155), (104, 64, 154), (87, 56, 139), (81, 54, 134), (87, 56, 139), (92, 61, 149), (95, 62, 152), (88, 59, 145), (81, 54, 134), (81, 54, 134), (92, 61, 149), (96, 64, 156), (107, 68, 164), (114, 72, 171), (107, 68, 164), (114, 72, 171), (114, 72, 171), (109, 70, 168), (107, 68, 164), (109, 70, 168), (122, 73, 170), (122, 73, 170), (115, 69, 162), (101, 62, 149), (98, 57, 135), (98, 57, 135), (106, 61, 143), (120, 71, 164), (130, 76, 170), (120, 71, 164), (122, 73, 170), (120, 71, 164), (122, 73, 170), (130, 77, 180), (130, 76, 170), (122, 73, 170), (114, 66, 155), (114, 66, 155), (130, 76, 170), (134, 80, 184), (139, 82, 188), (139, 82, 188), (134, 80, 184), (134, 80, 184), (143, 84, 192), (143, 84, 192), (143, 84, 192), (139, 82, 188), (139, 82, 188), (143, 84, 192), (139, 82, 188), (139, 82, 188), (134, 80, 184), (130, 77, 180), (134, 80, 184), (122, 73, 170), (115, 69, 162), (122, 73, 170), (116, 74, 177), (114, 72, 171), (114, 72, 171), (109, 70, 168), (109, 70, 168), (96, 64, 156), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (88, 59, 145), (88, 59, 145), (92, 61, 149), (88, 59, 145), (87, 56, 139), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (87, 56, 139), (87, 56, 139), (101, 62, 149), (98, 57, 135), (63, 38, 70), (96, 76, 66), (115, 92, 79), (118, 95, 83), (130, 104, 87), (130, 104, 87), (124, 99, 84), (124, 99, 84), (115, 87, 74), (107, 85, 73), (108, 89, 79), (115, 92, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (107, 85, 73), (115, 87, 74), (124, 91, 74), (115, 87, 74), (115, 87, 74), (124, 91, 74), (124, 91, 74), (115, 87, 74), (101, 81, 71), (108, 89, 79), (108, 89, 79), (91, 71, 61), (139, 59, 26), (188, 85, 36), (188, 85, 36), (163, 68, 30), (176, 76, 32), (188, 85, 36), (176, 76, 32), (116, 58, 26), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (78, 59, 51), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (108, 89, 79), (108, 89, 79), (101, 81, 71), (101, 81, 71), (96, 87, 81), (115, 92, 79), (115, 92, 79), (124, 91, 74), (118, 95, 83), (118, 95, 83), (118, 95, 83), (115, 92, 79), (115, 92, 79), (124, 99, 84), (124, 99, 84), (124, 99, 84), (118, 95, 83), (90, 62, 89), (98, 57, 135), (110, 64, 149), (107, 66, 159), (104, 64, 154), (81, 54, 134), (75, 50, 126), (87, 56, 139), (92, 61, 149), (95, 62, 152), (95, 62, 152), (88, 59, 145), (88, 59, 145), (92, 61, 149), (96, 64, 156), (107, 66, 159), (109, 70, 168), (107, 66, 159), (114, 72, 171), (122, 73, 170), (122, 73, 170), (122, 73, 170), (122, 73, 170), (122, 73, 170), (115, 69, 162), (107, 66, 159), (106, 61, 143), (98, 57, 135), (98, 57, 135), (96, 54, 125), (106, 61, 143), (120, 74, 147), (130, 76, 170), (130, 76, 170), (120, 71, 164), (115, 69, 162), (120, 71, 164), (122, 73, 170), (130, 76, 170), (110, 64, 149), (106, 61, 143), (114, 66, 155), (120, 71, 164), (130, 76, 170), (122, 73, 170), (114, 66, 155), (110, 64, 149), (120, 71, 164), (130, 76, 170), (134, 80, 184), (139, 82, 188), (134, 80, 184), (130, 77, 180), (130, 76, 170), (130, 77, 180), (139, 82, 188), (134, 80, 184), (130, 76, 170), (115, 69, 162), (120, 71, 164), (122, 73, 170), (116, 74, 177), (114, 72, 171), (107, 68, 164), (107, 68, 164), (109, 70, 168), (107, 68, 164), (102, 67, 163), (95, 62, 152), (88, 59, 145), (88, 59, 145), (81, 54, 134), (88, 59, 145), (92, 61, 149), (92, 61, 149), (87, 56, 139), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (81, 54, 134), (81, 54, 134), (89, 54, 132), (96, 54, 125), (63, 38, 70), (91, 71, 61), (115, 92, 79), (118, 95, 83), (118, 95, 83), (130, 104, 87), (130, 104, 87), (124, 99, 84), (115, 87, 74), (115, 87, 74), (108, 89, 79), (108, 89, 79), (107, 85, 73), (108, 89, 79), (108, 89, 79), (101, 81, 71), (96, 76, 66), (107, 85, 73), (115, 87, 74), (115, 87, 74), (124, 91, 74), (124, 91, 74), (124, 91, 74), (124, 91, 74), (124, 91, 74), (115, 87, 74), (91, 71, 61), (120, 70, 32), (176, 76, 32), (176, 76, 32), (163, 68, 30), (163, 68, 30), (188, 85, 36), (176, 76, 32), (139, 59, 26), (83, 66, 57), (83, 66, 57), (83, 66, 57), (78, 59, 51), (78, 59, 51), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (108, 89, 79), (108, 89, 79), (96, 87, 81), (108, 89, 79), (96, 87, 81), (107, 85, 73), (107, 85, 73), (115, 92, 79), (115, 87, 74), (115, 87, 74), (118, 95, 83), (118, 95, 83), (115, 92, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (115, 92, 79), (115, 92, 79), (118, 95, 83), (90, 62, 89), (98, 57, 135), (106, 61, 143), (101, 62, 149), (101, 62, 149), (87, 56, 139), (81, 54, 134), (88, 59, 145), (88, 59, 145), (95, 62, 152), (96, 64, 156), (96, 64, 156), (96, 64, 156), (95, 62, 152), (100, 65, 159), (107, 68, 164), (107, 68, 164), (107, 68, 164), (114, 72, 171), (120, 71, 164), (120, 71, 164), (122, 73, 170), (122, 73, 170), (122, 73, 170), (114, 66, 155), (106, 61, 143), (98, 57, 135), (96, 54, 125), (96, 54, 125), (106, 59, 128), (96, 54, 125), (106, 59, 128), (106, 61, 143), (110, 64, 149), (110, 64, 149), (110, 64, 149), (120, 74, 147), (120, 71, 164), (110, 64, 149), (98, 57, 135), (89, 54, 132), (98, 57, 135), (106, 61, 143), (110, 64, 149), (114, 66, 155), (106, 61, 143), (89, 54, 132), (98, 57, 135), (114, 66, 155), (120, 71, 164), (130, 76, 170), (130, 76, 170), (130, 76, 170), (130, 76, 170), (134, 80, 184), (130, 76, 170), (120, 71, 164), (106, 61, 143), (114, 66, 155), (120, 71, 164), (120, 71, 164), (125, 75, 175), (109, 70, 168), (100, 65, 159), (107, 66, 159), (114, 72, 171), (114, 72, 171), (107, 68, 164), (96, 64, 156), (88, 59, 145), (92, 61, 149), (92, 61, 149), (92, 61, 149), (92, 61, 149), (88, 59, 145), (81, 54, 134), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (85, 50, 122), (63, 38, 70), (96, 76, 66), (130, 104, 87), (124, 99, 84), (115, 87, 74), (124, 99, 84), (124, 99, 84), (107, 85, 73), (115, 80, 68), (124, 91, 74), (124, 91, 74), (107, 85, 73), (96, 76, 66), (107, 85, 73), (107, 85, 73), (96, 76, 66), (96, 76, 66), (101, 81, 71), (115, 80, 68), (115, 80, 68), (124, 91, 74), (124, 91, 74), (124, 91, 74), (124, 91, 74), (124, 91, 74), (115, 87, 74), (91, 71, 61), (116, 58, 26), (176, 76, 32), (205, 95, 40), (176, 76, 32), (163, 68, 30), (176, 76, 32), (176, 76, 32), (139, 59, 26), (91, 55, 19), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 66, 57), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (115, 92, 79), (107, 85, 73), (101, 81, 71), (108, 89, 79), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (115, 92, 79), (115, 87, 74), (115, 92, 79), (115, 92, 79), (108, 89, 79), (108, 89, 79), (101, 63, 111), (106, 61, 143), (106, 61, 143), (101, 62, 149), (101, 62, 149), (101, 62, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (96, 64, 156), (100, 65, 159), (100, 65, 159), (100, 65, 159), (100, 65, 159), (107, 68, 164), (115, 69, 162), (122, 73, 170), (122, 73, 170), (122, 73, 170), (122, 73, 170), (120, 71, 164), (120, 71, 164), (115, 69, 162), (110, 64, 149), (96, 54, 125), (102, 72, 95), (117, 87, 103), (117, 87, 103), (111, 77, 111), (111, 68, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (106, 59, 128), (96, 54, 125), (96, 54, 125), (98, 57, 135), (98, 57, 135), (89, 54, 132), (89, 54, 132), (85, 50, 122), (96, 54, 125), (98, 57, 135), (110, 64, 149), (114, 66, 155), (106, 61, 143), (106, 61, 143), (114, 66, 155), (130, 76, 170), (130, 76, 170), (130, 76, 170), (134, 80, 184), (130, 76, 170), (130, 76, 170), (114, 66, 155), (98, 57, 135), (106, 61, 143), (114, 66, 155), (120, 71, 164), (120, 71, 164), (115, 69, 162), (114, 72, 171), (107, 66, 159), (107, 68, 164), (107, 68, 164), (107, 68, 164), (100, 65, 159), (95, 62, 152), (92, 61, 149), (95, 62, 152), (96, 64, 156), (92, 61, 149), (88, 59, 145), (81, 54, 134), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (75, 50, 126), (75, 50, 126), (81, 54, 134), (70, 46, 117), (82, 46, 109), (63, 38, 70), (101, 81, 71), (130, 104, 87), (124, 99, 84), (115, 87, 74), (118, 95, 83), (118, 95, 83), (115, 92, 79), (118, 95, 83), (124, 91, 74), (115, 87, 74), (115, 80, 68), (96, 76, 66), (96, 76, 66), (107, 85, 73), (115, 80, 68), (107, 85, 73), (115, 87, 74), (96, 76, 66), (115, 80, 68), (115, 92, 79), (124, 91, 74), (115, 87, 74), (115, 80, 68), (115, 80, 68), (107, 85, 73), (91, 71, 61), (116, 58, 26), (163, 68, 30), (188, 85, 36), (176, 76, 32), (163, 68, 30), (188, 85, 36), (204, 115, 48), (163, 68, 30), (116, 58, 26), (91, 71, 61), (91, 71, 61), (91, 71, 61), (83, 66, 57), (101, 81, 71), (96, 76, 66), (101, 81, 71), (107, 85, 73), (108, 89, 79), (107, 85, 73), (107, 85, 73), (108, 89, 79), (107, 85, 73), (107, 85, 73), (108, 89, 79), (118, 95, 83), (124, 99, 84), (130, 104, 87), (124, 99, 84), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (115, 92, 79), (108, 89, 79), (107, 85, 73), (101, 63, 111), (110, 64, 149), (97, 59, 142), (97, 59, 142), (101, 62, 149), (101, 62, 149), (101, 62, 149), (92, 61, 149), (88, 59, 145), (95, 62, 152), (96, 64, 156), (102, 67, 163), (102, 67, 163), (100, 65, 159), (100, 65, 159), (107, 66, 159), (114, 72, 171), (125, 75, 175), (125, 75, 175), (125, 75, 175), (122, 73, 170), (122, 73, 170), (115, 69, 162), (114, 66, 155), (106, 59, 128), (102, 72, 95), (135, 112, 105), (143, 116, 106), (143, 116, 106), (143, 116, 106), (132, 105, 99), (117, 87, 103), (111, 68, 128), (111, 68, 128), (96, 54, 125), (96, 54, 125), (96, 54, 125), (96, 54, 125), (96, 54, 125), (96, 54, 125), (85, 50, 122), (85, 50, 122), (96, 54, 125), (96, 54, 125), (96, 54, 125), (106, 61, 143), (110, 64, 149), (114, 66, 155), (130, 76, 170), (130, 76, 170), (130, 76, 170), (130, 76, 170), (120, 74, 147), (120, 74, 147), (111, 68, 128), (96, 54, 125), (91, 52, 112), (96, 54, 125), (106, 61, 143), (114, 66, 155), (115, 69, 162), (115, 69, 162), (122, 73, 170), (109, 70, 168), (107, 68, 164), (107, 68, 164), (102, 67, 163), (95, 62, 152), (88, 59, 145), (92, 61, 149), (95, 62, 152), (92, 61, 149), (88, 59, 145), (88, 59, 145), (81, 54, 134), (87, 56, 139), (87, 56, 139), (81, 54, 134), (75, 50, 126), (81, 54, 134), (87, 56, 139), (87, 56, 139), (70, 46, 117), (81, 54, 134), (81, 54, 134), (70, 46, 117), (74, 42, 102), (63, 38, 70), (101, 81, 71), (124, 99, 84), (118, 95, 83), (115, 87, 74), (124, 99, 84), (124, 99, 84), (130, 104, 87), (130, 104, 87), (140, 110, 95), (124, 91, 74), (124, 91, 74), (115, 80, 68), (91, 71, 61), (115, 80, 68), (107, 85, 73), (101, 81, 71), (107, 85, 73), (101, 81, 71), (107, 85, 73), (115, 92, 79), (115, 87, 74), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (93, 69, 29), (163, 68, 30), (188, 85, 36), (188, 85, 36), (163, 68, 30), (176, 76, 32), (176, 76, 32), (163, 68, 30), (116, 58, 26), (91, 71, 61), (96, 76, 66), (83, 66, 57), (83, 66, 57), (96, 76, 66), (96, 76, 66), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (107, 85, 73), (101, 81, 71), (108, 89, 79), (115, 92, 79), (118, 95, 83), (111, 101, 90), (132, 105, 99), (118, 95, 83), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (130, 104, 87), (130, 104, 87), (115, 92, 79), (101, 63, 111), (110, 64, 149), (98, 57, 135), (98, 57, 135), (97, 59, 142), (101, 62, 149), (107, 66, 159), (104, 64, 154), (101, 62, 149), (96, 64, 156), (100, 65, 159), (107, 66, 159), (107, 68, 164), (107, 68, 164), (107, 68, 164), (109, 70, 168), (122, 73, 170), (130, 77, 180), (125, 75, 175), (130, 77, 180), (125, 75, 175), (120, 71, 164), (114, 66, 155), (106, 59, 128), (101, 63, 111), (132, 105, 99), (156, 124, 106), (156, 124, 106), (146, 122, 111), (150, 119, 103), (147, 115, 97), (147, 115, 97), (140, 110, 95), (117, 87, 103), (111, 77, 111), (101, 63, 111), (96, 54, 125), (91, 52, 112), (96, 54, 125), (96, 54, 125), (91, 52, 112), (96, 54, 125), (106, 59, 128), (96, 54, 125), (106, 59, 128), (120, 74, 147), (120, 74, 147), (120, 74, 147), (120, 74, 147), (111, 68, 128), (111, 68, 128), (111, 68, 128), (106, 59, 128), (106, 59, 128), (101, 63, 111), (101, 63, 111), (102, 72, 95), (117, 87, 103), (111, 68, 128), (110, 64, 149), (114, 66, 155), (120, 71, 164), (125, 75, 175), (122, 73, 170), (114, 72, 171), (107, 68, 164), (96, 64, 156), (95, 62, 152), (92, 61, 149), (92, 61, 149), (95, 62, 152), (92, 61, 149), (88, 59, 145), (87, 56, 139), (87, 56, 139), (88, 59, 145), (88, 59, 145), (81, 54, 134), (81, 54, 134), (87, 56, 139), (88, 59, 145), (92, 61, 149), (75, 50, 126), (87, 56, 139), (87, 56, 139), (74, 42, 102), (65, 39, 95), (63, 38, 70), (96, 76, 66), (118, 95, 83), (118, 95, 83), (124, 99, 84), (130, 104, 87), (140, 110, 95), (130, 104, 87), (130, 104, 87), (147, 115, 97), (124, 99, 84), (124, 91, 74), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (91, 71, 61), (101, 81, 71), (108, 89, 79), (108, 89, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (139, 59, 26), (205, 95, 40), (188, 85, 36), (176, 76, 32), (176, 76, 32), (205, 95, 40), (188, 85, 36), (139, 59, 26), (93, 74, 37), (91, 71, 61), (63, 54, 47), (30, 31, 37), (101, 81, 71), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (96, 76, 66), (83, 75, 74), (91, 83, 78), (96, 87, 81), (118, 95, 83), (118, 95, 83), (118, 95, 83), (99, 91, 85), (103, 94, 87), (108, 89, 79), (101, 81, 71), (107, 85, 73), (115, 92, 79), (118, 95, 83), (124, 99, 84), (130, 104, 87), (130, 104, 87), (117, 87, 103), (106, 59, 128), (106, 61, 143), (98, 57, 135), (98, 57, 135), (97, 59, 142), (97, 59, 142), (104, 64, 154), (109, 70, 168), (114, 72, 171), (107, 68, 164), (107, 68, 164), (109, 70, 168), (109, 70, 168), (114, 72, 171), (114, 72, 171), (125, 75, 175), (130, 77, 180), (134, 80, 184), (125, 75, 175), (125, 75, 175), (122, 73, 170), (114, 66, 155), (106, 61, 143), (101, 63, 111), (135, 112, 105), (146, 122, 111), (154, 128, 116), (166, 136, 121), (154, 128, 116), (143, 116, 106), (143, 116, 106), (147, 115, 97), (140, 110, 95), (147, 115, 97), (140, 110, 95), (132, 105, 99), (132, 105, 99), (117, 87, 103), (111, 77, 111), (101, 63, 111), (101, 63, 111), (101, 63, 111), (101, 63, 111), (101, 63, 111), (101, 63, 111), (111, 68, 128), (101, 63, 111), (101, 63, 111), (101, 63, 111), (111, 77, 111), (101, 63, 111), (111, 77, 111), (111, 77, 111), (117, 87, 103), (117, 87, 103), (132, 105, 99), (132, 105, 99), (140, 110, 95), (132, 105, 99), (111, 68, 128), (110, 64, 149), (120, 71, 164), (122, 73, 170), (122, 73, 170), (122, 73, 170), (107, 68, 164), (96, 64, 156), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (95, 62, 152), (92, 61, 149), (88, 59, 145), (88, 59, 145), (92, 61, 149), (88, 59, 145), (81, 54, 134), (81, 54, 134), (87, 56, 139), (92, 61, 149), (95, 62, 152), (81, 54, 134), (81, 54, 134), (81, 54, 134), (65, 39, 95), (65, 39, 95), (63, 38, 70), (96, 76, 66), (115, 92, 79), (124, 91, 74), (124, 91, 74), (124, 99, 84), (140, 110, 95), (140, 110, 95), (130, 104, 87), (130, 104, 87), (124, 99, 84), (115, 92, 79), (107, 85, 73), (96, 76, 66), (101, 81, 71), (101, 81, 71), (101, 81, 71), (107, 85, 73), (99, 91, 85), (91, 83, 78), (91, 83, 78), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (91, 83, 78), (74, 66, 72), (91, 71, 61), (139, 59, 26), (176, 76, 32), (176, 76, 32), (163, 68, 30), (163, 68, 30), (188, 85, 36), (176, 76, 32), (139, 59, 26), (91, 55, 19), (44, 36, 32), (19, 18, 32), (7, 9, 33), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (83, 75, 74), (91, 83, 78), (108, 89, 79), (115, 92, 79), (115, 92, 79), (115, 92, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (130, 104, 87), (130, 104, 87), (130, 104, 87), (117, 87, 103), (111, 68, 128), (106, 61, 143), (97, 59, 142), (97, 59, 142), (97, 59, 142), (101, 62, 149), (104, 64, 154), (107, 68, 164), (115, 69, 162), (114, 72, 171), (109, 70, 168), (109, 70, 168), (114, 72, 171), (122, 73, 170), (122, 73, 170), (125, 75, 175), (125, 75, 175), (130, 77, 180), (122, 73, 170), (122, 73, 170), (115, 69, 162), (110, 64, 149), (106, 59, 128), (123, 100, 101), (154, 128, 116), (154, 128, 116), (154, 128, 116), (163, 129, 109), (146, 122, 111), (146, 122, 111), (146, 122, 111), (150, 119, 103), (150, 119, 103), (147, 115, 97), (140, 110, 95), (140, 110, 95), (147, 115, 97), (147, 115, 97), (147, 115, 97), (132, 105, 99), (132, 105, 99), (132, 105, 99), (135, 112, 105), (135, 112, 105), (123, 100, 101), (123, 100, 101), (132, 105, 99), (140, 110, 95), (143, 116, 106), (150, 119, 103), (156, 124, 106), (143, 116, 106), (146, 122, 111), (143, 116, 106), (147, 115, 97), (147, 115, 97), (140, 110, 95), (140, 110, 95), (147, 115, 97), (132, 105, 99), (106, 59, 128), (114, 66, 155), (120, 71, 164), (125, 75, 175), (125, 75, 175), (109, 70, 168), (95, 62, 152), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (92, 61, 149), (88, 59, 145), (88, 59, 145), (88, 59, 145), (88, 59, 145), (87, 56, 139), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (81, 54, 134), (87, 56, 139), (75, 50, 126), (65, 39, 95), (65, 39, 95), (63, 38, 70), (107, 85, 73), (115, 92, 79), (118, 95, 83), (115, 87, 74), (115, 87, 74), (115, 92, 79), (118, 95, 83), (118, 95, 83), (118, 95, 83), (115, 87, 74), (107, 85, 73), (107, 85, 73), (96, 76, 66), (101, 81, 71), (107, 85, 73), (108, 89, 79), (101, 81, 71), (108, 89, 79), (108, 89, 79), (108, 89, 79), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (91, 83, 78), (83, 75, 74), (96, 76, 66), (120, 70, 32), (188, 85, 36), (205, 95, 40), (176, 76, 32), (163, 68, 30), (176, 76, 32), (188, 85, 36), (163, 68, 30), (85, 37, 23), (7, 9, 33), (7, 9, 33), (7, 9, 33), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (115, 92, 79), (101, 81, 71), (96, 87, 81), (108, 89, 79), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 87, 74), (101, 81, 71), (96, 76, 66), (108, 89, 79), (115, 92, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (130, 104, 87), (130, 104, 87), (117, 87, 103), (106, 59, 128), (106, 61, 143), (98, 57, 135), (89, 54, 132), (101, 62, 149), (101, 62, 149), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 68, 164), (114, 72, 171), (114, 72, 171), (122, 73, 170), (122, 73, 170), (125, 75, 175), (122, 73, 170), (125, 75, 175), (125, 75, 175), (122, 73, 170), (115, 69, 162), (110, 64, 149), (106, 61, 143), (101, 63, 111), (135, 112, 105), (146, 122, 111), (146, 122, 111), (150, 119, 103), (140, 110, 95), (143, 116, 106), (154, 128, 116), (146, 122, 111), (146, 122, 111), (143, 116, 106), (143, 116, 106), (147, 115, 97), (132, 105, 99), (132, 105, 99), (150, 119, 103), (143, 116, 106), (135, 112, 105), (135, 112, 105), (143, 116, 106), (143, 116, 106), (143, 116, 106), (146, 122, 111), (150, 119, 103), (150, 119, 103), (156, 124, 106), (166, 136, 121), (163, 129, 109), (163, 129, 109), (156, 124, 106), (156, 124, 106), (163, 129, 109), (163, 129, 109), (156, 124, 106), (140, 110, 95), (140, 110, 95), (140, 110, 95), (132, 105, 99), (117, 87, 103), (106, 59, 128), (115, 69, 162), (125, 75, 175), (122, 73, 170), (115, 69, 162), (100, 65, 159), (92, 61, 149), (87, 56, 139), (87, 56, 139), (87, 56, 139), (88, 59, 145), (87, 56, 139), (81, 54, 134), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (81, 54, 134), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (70, 46, 117), (65, 39, 95), (65, 39, 95), (66, 54, 66), (115, 92, 79), (118, 95, 83), (130, 104, 87), (124, 99, 84), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (124, 99, 84), (118, 95, 83), (101, 81, 71), (107, 85, 73), (107, 85, 73), (91, 71, 61), (91, 71, 61), (96, 76, 66), (101, 81, 71), (115, 87, 74), (115, 87, 74), (108, 89, 79), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (91, 83, 78), (101, 81, 71), (133, 79, 31), (188, 85, 36), (205, 95, 40), (188, 85, 36), (176, 76, 32), (188, 85, 36), (205, 95, 40), (176, 76, 32), (112, 44, 23), (7, 9, 33), (7, 9, 33), (7, 9, 33), (107, 85, 73), (108, 89, 79), (107, 85, 73), (115, 92, 79), (115, 92, 79), (115, 92, 79), (108, 89, 79), (107, 85, 73), (96, 76, 66), (101, 81, 71), (107, 85, 73), (115, 92, 79), (115, 92, 79), (108, 89, 79), (108, 89, 79), (91, 83, 78), (108, 89, 79), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (124, 99, 84), (123, 100, 101), (106, 59, 128), (98, 57, 135), (89, 54, 132), (98, 57, 135), (101, 62, 149), (101, 62, 149), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 68, 164), (109, 70, 168), (122, 73, 170), (125, 75, 175), (125, 75, 175), (125, 75, 175), (122, 73, 170), (122, 73, 170), (122, 73, 170), (115, 69, 162), (114, 66, 155), (106, 61, 143), (101, 63, 111), (132, 105, 99), (146, 122, 111), (146, 122, 111), (146, 122, 111), (146, 122, 111), (143, 116, 106), (143, 116, 106), (143, 116, 106), (146, 122, 111), (146, 122, 111), (143, 116, 106), (150, 119, 103), (150, 119, 103), (140, 110, 95), (132, 105, 99), (135, 112, 105), (140, 110, 95), (135, 112, 105), (135, 112, 105), (135, 112, 105), (140, 110, 95), (143, 116, 106), (143, 116, 106), (143, 116, 106), (147, 115, 97), (150, 119, 103), (163, 129, 109), (163, 129, 109), (163, 129, 109), (163, 129, 109), (150, 119, 103), (150, 119, 103), (150, 119, 103), (147, 115, 97), (140, 110, 95), (140, 110, 95), (140, 110, 95), (147, 115, 97), (147, 115, 97), (111, 77, 111), (110, 64, 149), (122, 73, 170), (122, 73, 170), (120, 71, 164), (107, 66, 159), (92, 61, 149), (88, 59, 145), (88, 59, 145), (81, 54, 134), (87, 56, 139), (87, 56, 139), (75, 50, 126), (75, 50, 126), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (70, 46, 117), (65, 39, 95), (65, 39, 95), (87, 51, 61), (115, 92, 79), (124, 99, 84), (123, 100, 101), (124, 99, 84), (130, 104, 87), (124, 99, 84), (124, 99, 84), (124, 99, 84), (124, 99, 84), (103, 94, 87), (101, 81, 71), (96, 76, 66), (101, 81, 71), (101, 81, 71), (96, 76, 66), (101, 81, 71), (115, 92, 79), (124, 91, 74), (115, 87, 74), (115, 92, 79), (108, 89, 79), (107, 85, 73), (96, 87, 81), (101, 81, 71), (101, 81, 71), (101, 81, 71), (101, 81, 71), (115, 80, 68), (133, 79, 31), (155, 83, 37), (155, 83, 37), (176, 76, 32), (176, 76, 32), (176, 76, 32), (188, 85, 36), (139, 59, 26), (19, 18, 32), (30, 31, 37), (54, 48, 43), (107, 85, 73), (107, 85, 73), (101, 81, 71), (108, 89, 79), (118, 95, 83), (118, 95, 83), (118, 95, 83), (108, 89, 79), (107, 85, 73), (108, 89, 79), (118, 95, 83), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (96, 87, 81), (111, 101, 90), (140, 110, 95), (140, 110, 95), (140, 110, 95), (132, 105, 99), (117, 87, 103), (111, 77, 111), (96, 54, 125), (85, 50, 122), (85, 50, 122), (97, 59, 142), (101, 62, 149), (101, 62, 149), (104, 64, 154), (104, 64, 154), (104, 64, 154), (107, 66, 159), (107, 68, 164), (114, 72, 171), (122, 73, 170), (122, 73, 170), (125, 75, 175), (122, 73, 170), (122, 73, 170), (122, 73, 170), (120, 71, 164), (115, 69, 162), (106, 61, 143), (111, 77, 111), (146, 122, 111), (156, 124, 106), (154, 128, 116), (166, 136, 121), (154, 128, 116), (146, 122, 111), (146, 122, 111), (150, 119, 103), (146, 122, 111), (146, 122, 111), (150, 119, 103), (150, 119, 103), (143, 116, 106), (135, 112, 105), (143, 116, 106), (143, 116, 106), (143, 116, 106), (143, 116, 106), (143, 116, 106), (154, 128, 116), (154, 128, 116), (156, 124, 106), (147, 115, 97), (140, 110, 95), (150, 119, 103), (156, 124, 106), (163, 129, 109), (163, 129, 109), (156, 124, 106), (163, 129, 109), (156, 124, 106), (150, 119, 103), (140, 110, 95), (147, 115, 97), (150, 119, 103), (150, 119, 103), (156, 124, 106), (156, 124, 106), (156, 124, 106), (117, 87, 103), (106, 59, 128), (114, 66, 155), (120, 71, 164), (125, 75, 175), (107, 68, 164), (95, 62, 152), (88, 59, 145), (87, 56, 139), (81, 54, 134), (87, 56, 139), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (87, 56, 139), (87, 56, 139), (89, 54, 132), (87, 56, 139), (70, 46, 117), (65, 39, 95), (54, 36, 85), (66, 54, 66), (115, 92, 79), (118, 95, 83), (118, 95, 83), (116, 108, 92), (132, 105, 99), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (103, 94, 87), (96, 87, 81), (101, 81, 71), (96, 76, 66), (107, 85, 73), (107, 85, 73), (108, 89, 79), (118, 95, 83), (115, 92, 79), (101, 81, 71), (101, 81, 71), (108, 89, 79), (108, 89, 79), (99, 91, 85), (101, 81, 71), (96, 76, 66), (107, 85, 73), (107, 85, 73), (101, 81, 71), (96, 76, 66), (83, 66, 57), (78, 59, 51), (44, 36, 32), (32, 22, 18), (85, 37, 23), (120, 70, 32), (115, 80, 68), (83, 75, 74), (80, 86, 97), (99, 91, 85), (101, 81, 71), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 92, 79), (115, 92, 79), (115, 92, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (118, 95, 83), (132, 105, 99), (140, 110, 95), (140, 110, 95), (140, 110, 95), (117, 87, 103), (98, 57, 135), (97, 59, 142), (101, 62, 149), (97, 59, 142), (85, 50, 122), (85, 50, 122), (89, 54, 132), (87, 56, 139), (88, 59, 145), (104, 64, 154), (107, 66, 159), (104, 64, 154), (104, 64, 154), (107, 68, 164), (114, 72, 171), (122, 73, 170), (122, 73, 170), (120, 71, 164), (115, 69, 162), (120, 71, 164), (120, 71, 164), (115, 69, 162), (106, 59, 128), (117, 87, 103), (140, 110, 95), (150, 119, 103), (154, 128, 116), (154, 128, 116), (154, 128, 116), (150, 119, 103), (150, 119, 103), (150, 119, 103), (150, 119, 103), (143, 116, 106), (150, 119, 103), (156, 124, 106), (140, 110, 95), (132, 105, 99), (132, 105, 99), (135, 112, 105), (143, 116, 106), (143, 116, 106), (156, 124, 106), (154, 128, 116), (163, 129, 109), (166, 136, 121), (156, 124, 106), (150, 119, 103), (156, 124, 106), (156, 124, 106), (150, 119, 103), (156, 124, 106), (156, 124, 106), (163, 129, 109), (163, 129, 109), (156, 124, 106), (147, 115, 97), (147, 115, 97), (150, 119, 103), (156, 124, 106), (150, 119, 103), (150, 119, 103), (150, 119, 103), (132, 105, 99), (106, 59, 128), (106, 61, 143), (120, 71, 164), (125, 75, 175), (107, 68, 164), (92, 61, 149), (88, 59, 145), (87, 56, 139), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (87, 56, 139), (81, 54, 134), (87, 56, 139), (70, 46, 117), (65, 39, 95), (65, 39, 95), (66, 54, 66), (118, 95, 83), (115, 92, 79), (118, 95, 83), (124, 99, 84), (124, 99, 84), (118, 95, 83), (124, 99, 84), (111, 101, 90), (111, 101, 90), (103, 94, 87), (99, 91, 85), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (107, 85, 73), (96, 76, 66), (96, 76, 66), (91, 83, 78), (91, 83, 78), (91, 83, 78), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (91, 71, 61), (83, 66, 57), (44, 36, 32), (26, 36, 49), (74, 66, 72), (80, 86, 97), (99, 91, 85), (99, 91, 85), (104, 97, 103), (116, 107, 112), (104, 97, 103), (101, 81, 71), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 92, 79), (115, 92, 79), (124, 99, 84), (124, 99, 84), (124, 99, 84), (130, 104, 87), (124, 99, 84), (118, 95, 83), (115, 92, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (111, 101, 90), (103, 94, 87), (118, 95, 83), (130, 104, 87), (117, 87, 103), (102, 72, 95), (101, 63, 111), (85, 50, 122), (97, 59, 142), (87, 56, 139), (81, 54, 134), (75, 50, 126), (81, 54, 134), (81, 54, 134), (92, 61, 149), (104, 64, 154), (107, 66, 159), (107, 66, 159), (107, 66, 159), (115, 69, 162), (115, 69, 162), (115, 69, 162), (114, 66, 155), (110, 64, 149), (106, 61, 143), (106, 61, 143), (106, 59, 128), (117, 87, 103), (124, 99, 84), (147, 115, 97), (156, 124, 106), (150, 119, 103), (146, 122, 111), (156, 124, 106), (156, 124, 106), (150, 119, 103), (147, 115, 97), (140, 110, 95), (143, 116, 106), (150, 119, 103), (156, 124, 106), (150, 119, 103), (132, 105, 99), (123, 100, 101), (123, 100, 101), (140, 110, 95), (147, 115, 97), (156, 124, 106), (156, 124, 106), (163, 129, 109), (163, 129, 109), (163, 129, 109), (163, 129, 109), (156, 124, 106), (150, 119, 103), (125, 117, 117), (146, 122, 111), (163, 129, 109), (163, 129, 109), (163, 129, 109), (163, 129, 109), (150, 119, 103), (147, 115, 97), (150, 119, 103), (150, 119, 103), (150, 119, 103), (150, 119, 103), (147, 115, 97), (150, 119, 103), (111, 77, 111), (110, 64, 149), (120, 71, 164), (125, 75, 175), (122, 73, 170), (107, 66, 159), (87, 56, 139), (81, 54, 134), (87, 56, 139), (87, 56, 139), (87, 56, 139), (87, 56, 139), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (81, 54, 134), (81, 54, 134), (70, 46, 117), (65, 39, 95), (54, 36, 85), (78, 59, 51), (115, 92, 79), (115, 87, 74), (107, 85, 73), (108, 89, 79), (118, 95, 83), (111, 101, 90), (123, 100, 101), (111, 101, 90), (103, 94, 87), (111, 101, 90), (103, 94, 87), (115, 92, 79), (115, 92, 79), (108, 89, 79), (108, 89, 79), (101, 81, 71), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (91, 83, 78), (83, 75, 74), (96, 87, 81), (108, 89, 79), (96, 76, 66), (83, 75, 74), (96, 76, 66), (91, 71, 61), (62, 44, 53), (19, 18, 32), (32, 44, 59), (80, 86, 97), (104, 97, 103), (116, 107, 112), (104, 97, 103), (104, 97, 103), (116, 107, 112), (104, 97, 103), (107, 85, 73), (107, 85, 73), (108, 89, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (130, 104, 87), (124, 99, 84), (124, 99, 84), (124, 99, 84), (124, 99, 84), (124, 99, 84), (118, 95, 83), (118, 95, 83), (124, 99, 84), (124, 99, 84), (103, 94, 87), (99, 91, 85), (124, 99, 84), (140, 110, 95), (140, 110, 95), (124, 99, 84), (111, 77, 111), (101, 63, 111), (104, 64, 154), (95, 62, 152), (88, 59, 145), (88, 59, 145), (87, 56, 139), (88, 59, 145), (87, 56, 139), (88, 59, 145), (104, 64, 154), (107, 68, 164), (115, 69, 162), (107, 66, 159), (104, 64, 154), (106, 61, 143), (98, 57, 135), (91, 52, 112), (91, 52, 112), (101, 63, 111), (117, 87, 103), (140, 110, 95), (130, 104, 87), (150, 119, 103), (156, 124, 106), (140, 110, 95), (147, 115, 97), (150, 119, 103), (150, 119, 103), (156, 124, 106), (156, 124, 106), (156, 124, 106), (156, 124, 106), (150, 119, 103), (150, 119, 103), (150, 119, 103), (140, 110, 95), (132, 105, 99), (132, 105, 99), (140, 110, 95), (147, 115, 97), (156, 124, 106), (156, 124, 106), (156, 124, 106), (163, 129, 109), (166, 136, 121), (166, 136, 121), (163, 129, 109), (143, 116, 106), (116, 107, 112), (116, 107, 112), (143, 116, 106), (163, 129, 109), (163, 129, 109), (166, 136, 121), (163, 129, 109), (156, 124, 106), (156, 124, 106), (150, 119, 103), (147, 115, 97), (147, 115, 97), (156, 124, 106), (156, 124, 106), (111, 68, 128), (110, 64, 149), (115, 69, 162), (122, 73, 170), (125, 75, 175), (122, 73, 170), (104, 64, 154), (87, 56, 139), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (87, 56, 139), (81, 54, 134), (81, 54, 134), (75, 50, 126), (75, 50, 126), (70, 46, 117), (75, 50, 126), (75, 50, 126), (75, 50, 126), (81, 54, 134), (85, 50, 122), (74, 42, 102), (54, 36, 85), (91, 71, 61), (118, 95, 83), (115, 92, 79), (115, 87, 74), (108, 89, 79), (115, 92, 79), (103, 94, 87), (111, 101, 90), (111, 101, 90), (111, 101, 90), (118, 95, 83), (115, 92, 79), (108, 89, 79), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (107, 85, 73), (108, 89, 79), (101, 81, 71), (101, 81, 71), (96, 76, 66), (83, 75, 74), (83, 75, 74), (101, 81, 71), (108, 89, 79), (101, 81, 71), (87, 80, 63), (107, 85, 73), (96, 76, 66), (44, 36, 32), (7, 9, 33), (19, 18, 32), (66, 54, 66), (104, 97, 103), (116, 107, 112), (104, 97, 103), (99, 91, 85), (104, 97, 103), (99, 91, 85), (108, 89, 79), (108, 89, 79), (115, 92, 79), (124, 99, 84), (118, 95, 83), (124, 99, 84), (124, 99, 84), (124, 99, 84), (130, 104, 87), (130, 104, 87), (130, 104, 87), (118, 95, 83), (115, 87, 74), (115, 92, 79), (118, 95, 83), (118, 95, 83), (130, 104, 87), (130, 104, 87), (130, 104, 87), (132, 105, 99), (140, 110, 95), (130, 104, 87), (123, 100, 101), (117, 87, 103), (111, 68, 128), (97, 59, 142), (97, 59, 142), (97, 59, 142), (87, 56, 139), (87, 56, 139), (92, 61, 149), (81, 54, 134), (87, 56, 139), (104, 64, 154), (107, 66, 159), (110, 64, 149), (97, 59, 142), (96, 54, 125), (91, 52, 112), (101, 63, 111), (123, 100, 101), (135, 112, 105), (143, 116, 106), (140, 110, 95), (140, 110, 95), (150, 119, 103), (146, 122, 111), (150, 119, 103), (147, 115, 97), (150, 119, 103), (150, 119, 103), (156, 124, 106), (156, 124, 106), (150, 119, 103), (146, 122, 111), (143, 116, 106), (150, 119, 103), (150, 119, 103), (150, 119, 103), (140, 110, 95), (140, 110, 95), (147, 115, 97), (150, 119, 103), (156, 124, 106), (163, 129, 109), (156, 124, 106), (156, 124, 106), (163, 129, 109), (163, 129, 109), (166, 136, 121), (146, 122, 111), (116, 107, 112), (116, 107, 112), (135, 112, 105), (150, 119, 103), (163, 129, 109), (163, 129, 109), (156, 124, 106), (147, 115, 97), (147, 115, 97), (147, 115, 97), (150, 119, 103), (143, 116, 106), (143, 116, 106), (143, 116, 106), (106, 59, 128), (97, 59, 142), (110, 64, 149), (115, 69, 162), (125, 75, 175), (122, 73, 170), (115, 69, 162), (104, 64, 154), (92, 61, 149), (87, 56, 139), (81, 54, 134), (81, 54, 134), (88, 59, 145), (87, 56, 139), (81, 54, 134), (75, 50, 126), (75, 50, 126), (75, 50, 126), (75, 50, 126), (70, 46, 117), (70, 46, 117), (89, 54, 132), (89, 54, 132), (82, 46, 109), (65, 39, 95), (107, 85, 73), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (115, 92, 79), (108, 89, 79), (111, 101, 90), (123, 100, 101), (124, 99, 84), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (108, 89, 79), (107, 85, 73), (115, 87, 74), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 87, 81), (99, 91, 85), (96, 87, 81), (96, 76, 66), (101, 81, 71), (87, 80, 63), (96, 76, 66), (101, 81, 71), (96, 76, 66), (30, 31, 37), (7, 9, 33), (7, 9, 33), (21, 25, 41), (74, 66, 72), (104, 97, 103), (104, 97, 103), (104, 97, 103), (80, 86, 97), (99, 91, 85), (108, 89, 79), (96, 87, 81), (108, 89, 79), (124, 99, 84), (124, 99, 84), (130, 104, 87), (124, 99, 84), (124, 99, 84), (132, 105, 99), (140, 110, 95), (130, 104, 87), (124, 99, 84), (118, 95, 83), (118, 95, 83), (118, 95, 83), (124, 99, 84), (130, 104, 87), (124, 99, 84), (130, 104, 87), (140, 110, 95), (140, 110, 95), (147, 115, 97), (147, 115, 97), (140, 110, 95), (123, 100, 101), (117, 87, 103), (101, 63, 111), (91, 52, 112), (82, 46, 109), (82, 46, 109), (89, 54, 132), (87, 56, 139), (97, 59, 142), (101, 62, 149), (104, 64, 154), (106, 61, 143), (96, 54, 125), (91, 52, 112), (117, 87, 103), (132, 105, 99), (150, 119, 103), (154, 128, 116), (154, 128, 116), (146, 122, 111), (150, 119, 103), (156, 124, 106), (156, 124, 106), (146, 122, 111), (143, 116, 106), (140, 110, 95), (147, 115, 97), (150, 119, 103), (140, 110, 95), (132, 105, 99), (135, 112, 105), (135, 112, 105), (135, 112, 105), (140, 110, 95), (147, 115, 97), (143, 116, 106), (140, 110, 95), (140, 110, 95), (150, 119, 103), (156, 124, 106), (163, 129, 109), (163, 129, 109), (156, 124, 106), (150, 119, 103), (143, 116, 106), (146, 122, 111), (135, 112, 105), (143, 116, 106), (143, 116, 106), (143, 116, 106), (150, 119, 103), (156, 124, 106), (146, 122, 111), (143, 116, 106), (135, 112, 105), (140, 110, 95), (147, 115, 97), (150, 119, 103), (135, 112, 105), (135, 112, 105), (135, 112, 105), (111, 68, 128), (98, 57, 135), (106, 61, 143), (110, 64, 149), (115, 69, 162), (115, 69, 162), (107, 66, 159), (104, 64, 154), (92, 61, 149), (88, 59, 145), (88, 59, 145), (87, 56, 139), (88, 59, 145), (87, 56, 139), (81, 54, 134), (75, 50, 126), (75, 50, 126), (81, 54, 134), (75, 50, 126), (75, 50, 126), (89, 54, 132), (98, 57, 135), (98, 57, 135), (82, 46, 109), (86, 51, 85), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 87, 74), (115, 92, 79), (118, 95, 83), (108, 89, 79), (108, 89, 79), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (115, 87, 74), (118, 95, 83), (115, 92, 79), (107, 85, 73), (96, 76, 66), (91, 71, 61), (96, 76, 66), (83, 75, 74), (96, 76, 66), (96, 76, 66), (30, 31, 37), (7, 9, 33), (7, 9, 33), (7, 9, 33), (30, 31, 37), (83, 75, 74), (104, 97, 103), (116, 107, 112), (99, 91, 85), (99, 91, 85), (103, 94, 87), (99, 91, 85), (99, 91, 85), (124, 99, 84), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (124, 99, 84), (124, 99, 84), (124, 91, 74), (118, 95, 83), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (140, 110, 95), (140, 110, 95), (147, 115, 97), (147, 115, 97), (140, 110, 95), (147, 115, 97), (140, 110, 95), (132, 105, 99), (117, 87, 103), (102, 72, 95), (91, 52, 112), (82, 46, 109), (98, 57, 135), (110, 64, 149), (106, 61, 143), (98, 57, 135), (101, 63, 111), (111, 77, 111), (123, 100, 101), (135, 112, 105), (143, 116, 106), (156, 124, 106), (154, 128, 116), (146, 122, 111), (146, 122, 111), (146, 122, 111), (143, 116, 106), (146, 122, 111), (146, 122, 111), (150, 119, 103), (143, 116, 106), (143, 116, 106), (143, 116, 106), (140, 110, 95), (132, 105, 99), (132, 105, 99), (135, 112, 105), (132, 105, 99), (135, 112, 105), (143, 116, 106), (147, 115, 97), (140, 110, 95), (147, 115, 97), (150, 119, 103), (156, 124, 106), (163, 129, 109), (156, 124, 106), (156, 124, 106), (154, 128, 116), (146, 122, 111), (143, 116, 106), (135, 112, 105), (143, 116, 106), (140, 110, 95), (135, 112, 105), (146, 122, 111), (146, 122, 111), (146, 122, 111), (125, 117, 117), (135, 112, 105), (146, 122, 111), (154, 128, 116), (146, 122, 111), (135, 112, 105), (135, 112, 105), (163, 129, 109), (126, 94, 134), (106, 59, 128), (98, 57, 135), (106, 61, 143), (114, 66, 155), (114, 66, 155), (107, 66, 159), (104, 64, 154), (92, 61, 149), (87, 56, 139), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (81, 54, 134), (75, 50, 126), (81, 54, 134), (87, 56, 139), (89, 54, 132), (98, 57, 135), (97, 59, 142), (97, 59, 142), (98, 57, 135), (91, 52, 112), (90, 62, 89), (118, 95, 83), (118, 95, 83), (108, 89, 79), (108, 89, 79), (108, 89, 79), (115, 92, 79), (108, 89, 79), (103, 94, 87), (115, 92, 79), (118, 95, 83), (115, 92, 79), (115, 87, 74), (118, 95, 83), (115, 92, 79), (103, 94, 87), (108, 89, 79), (108, 89, 79), (115, 87, 74), (107, 85, 73), (101, 81, 71), (115, 92, 79), (118, 95, 83), (115, 92, 79), (101, 81, 71), (96, 76, 66), (91, 71, 61), (91, 71, 61), (91, 71, 61), (96, 76, 66), (96, 76, 66), (62, 44, 53), (7, 9, 33), (7, 9, 33), (7, 9, 33), (7, 9, 33), (32, 44, 59), (80, 86, 97), (116, 107, 112), (99, 91, 85), (80, 86, 97), (111, 101, 90), (103, 94, 87), (103, 94, 87), (132, 105, 99), (140, 110, 95), (140, 110, 95), (130, 104, 87), (130, 104, 87), (124, 99, 84), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (130, 104, 87), (140, 110, 95), (130, 104, 87), (130, 104, 87), (140, 110, 95), (147, 115, 97), (140, 110, 95), (147, 115, 97), (150, 119, 103), (143, 116, 106), (143, 116, 106), (143, 116, 106), (146, 122, 111), (146, 122, 111), (123, 100, 101), (111, 77, 111), (102, 72, 95), (111, 77, 111), (111, 77, 111), (117, 87, 103), (132, 105, 99), (135, 112, 105), (143, 116, 106), (146, 122, 111), (146, 122, 111), (146, 122, 111), (154, 128, 116), (146, 122, 111), (132, 126, 124), (146, 122, 111), (143, 116, 106), (154, 128, 116), (154, 128, 116), (140, 110, 95), (140, 110, 95), (143, 116, 106), (143, 116, 106), (143, 116, 106), (135, 112, 105), (135, 112, 105), (146, 122, 111), (135, 112, 105), (143, 116, 106), (143, 116, 106), (143, 116, 106), (140, 110, 95), (147, 115, 97), (150, 119, 103), (163, 129, 109), (163, 129, 109), (156, 124, 106), (156, 124, 106), (154, 128, 116), (156, 124, 106), (143, 116, 106), (135, 112, 105), (125, 117, 117), (143, 116, 106), (135, 112, 105), (135, 112, 105), (146, 122, 111), (146, 122, 111), (125, 117, 117), (125, 117, 117), (125, 117, 117), (146, 122, 111), (150, 119, 103), (150, 119, 103), (143, 116, 106), (150, 119, 103), (143, 116, 106), (111, 77, 111), (96, 54, 125), (98, 57, 135), (106, 61, 143), (110, 64, 149), (104, 64, 154), (92, 61, 149), (87, 56, 139), (81, 54, 134), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (75, 50, 126), (87, 56, 139), (101, 62, 149), (89, 54, 132), (89, 54, 132), (106, 61, 143), (106, 61, 143), (98, 57, 135), (91, 52, 112), (102, 72, 95), (124, 99, 84), (124, 99, 84), (118, 95, 83), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (118, 95, 83), (118, 95, 83), (124, 99, 84), (118, 95, 83), (115, 92, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (118, 95, 83), (118, 95, 83), (115, 92, 79), (115, 92, 79), (108, 89, 79), (115, 87, 74), (115, 92, 79), (115, 92, 79), (101, 81, 71), (96, 76, 66), (91, 71, 61), (91, 71, 61), (83, 66, 57), (83, 66, 57), (83, 75, 74), (83, 66, 57), (30, 31, 37), (7, 9, 33), (7, 9, 33), (7, 9, 33), (16, 13, 14), (66, 54, 66), (74, 66, 72), (66, 54, 66), (26, 36, 49), (111, 101, 90), (123, 100, 101), (116, 108, 92), (132, 105, 99), (140, 110, 95), (147, 115, 97), (140, 110, 95), (130, 104, 87), (130, 104, 87), (140, 110, 95), (140, 110, 95), (140, 110, 95), (147, 115, 97), (132, 105, 99), (132, 105, 99), (140, 110, 95), (130, 104, 87), (140, 110, 95), (140, 110, 95), (147, 115, 97), (140, 110, 95), (140, 110, 95), (150, 119, 103), (143, 116, 106), (135, 112, 105), (135, 112, 105), (135, 112, 105), (135, 112, 105), (135, 112, 105), (135, 112, 105), (143, 116, 106), (146, 122, 111), (156, 124, 106), (143, 116, 106), (146, 122, 111), (143, 116, 106), (135, 112, 105), (135, 112, 105), (143, 116, 106), (143, 116, 106), (146, 122, 111), (132, 126, 124), (146, 122, 111), (143, 116, 106), (135, 112, 105), (143, 116, 106), (166, 136, 121), (166, 136, 121), (143, 116, 106), (143, 116, 106), (150, 119, 103), (146, 122, 111), (146, 122, 111), (143, 116, 106), (143, 116, 106), (150, 119, 103), (143, 116, 106), (135, 112, 105), (143, 116, 106), (150, 119, 103), (156, 124, 106), (156, 124, 106), (163, 129, 109), (166, 136, 121), (166, 136, 121), (163, 129, 109), (154, 128, 116), (154, 128, 116), (156, 124, 106), (156, 124, 106), (154, 128, 116), (132, 126, 124), (146, 122, 111), (143, 116, 106), (143, 116, 106), (154, 128, 116), (154, 128, 116), (156, 124, 106), (143, 116, 106), (143, 116, 106), (147, 115, 97), (156, 124, 106), (154, 128, 116), (146, 122, 111), (150, 119, 103), (150, 119, 103), (135, 112, 105), (123, 100, 101), (101, 63, 111), (98, 57, 135), (106, 61, 143), (101, 62, 149), (97, 59, 142), (81, 54, 134), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (81, 54, 134), (87, 56, 139), (87, 56, 139), (88, 59, 145), (81, 54, 134), (75, 50, 126), (89, 54, 132), (89, 54, 132), (98, 57, 135), (96, 54, 125), (91, 52, 112), (102, 72, 95), (118, 95, 83), (124, 99, 84), (118, 95, 83), (96, 87, 81), (108, 89, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (118, 95, 83), (124, 99, 84), (124, 99, 84), (115, 92, 79), (118, 95, 83), (124, 99, 84), (124, 99, 84), (124, 99, 84), (115, 92, 79), (115, 87, 74), (115, 87, 74), (107, 85, 73), (107, 85, 73), (107, 85, 73), (115, 87, 74), (96, 76, 66), (107, 85, 73), (101, 81, 71), (96, 76, 66), (91, 71, 61), (83, 75, 74), (74, 66, 72), (91, 71, 61), (69, 63, 51), (30, 31, 37), (19, 18, 32), (7, 9, 33), (7, 9, 33), (19, 18, 32), (19, 18, 32), (7, 9, 33), (7, 9, 33), (111, 101, 90), (132, 105, 99), (143, 116, 106), (135, 112, 105), (140, 110, 95), (150, 119, 103), (150, 119, 103), (147, 115, 97), (147, 115, 97), (156, 124, 106), (156, 124, 106), (147, 115, 97), (147, 115, 97), (140, 110, 95), (132, 105, 99), (140, 110, 95), (140, 110, 95), (140, 110, 95), (147, 115, 97), (156, 124, 106), (150, 119, 103), (143, 116, 106), (143, 116, 106), (143, 116, 106), (146, 122, 111), (143, 116, 106), (125, 117, 117), (125, 117, 117), (116, 107, 112), (135, 112, 105), (125, 117, 117), (143, 116, 106), (146, 122, 111), (143, 116, 106), (154, 128, 116), (146, 122, 111), (143, 116, 106), (135, 112, 105), (143, 116, 106), (146, 122, 111), (146, 122, 111), (132, 105, 99), (123, 100, 101), (132, 105, 99), (132, 105, 99), (135, 112, 105), (143, 116, 106), (150, 119, 103), (146, 122, 111), (154, 128, 116), (154, 128, 116), (154, 128, 116), (146, 122, 111), (150, 119, 103), (143, 116, 106), (140, 110, 95), (135, 112, 105), (135, 112, 105), (135, 112, 105), (143, 116, 106), (154, 128, 116), (166, 136, 121), (163, 129, 109), (166, 136, 121), (163, 129, 109), (154, 128, 116), (143, 116, 106), (146, 122, 111), (154, 128, 116), (154, 128, 116), (154, 128, 116), (154, 128, 116), (146, 122, 111), (143, 116, 106), (150, 119, 103), (156, 124, 106), (166, 136, 121), (163, 129, 109), (150, 119, 103), (150, 119, 103), (147, 115, 97), (154, 128, 116), (154, 128, 116), (146, 122, 111), (146, 122, 111), (154, 128, 116), (146, 122, 111), (146, 122, 111), (123, 100, 101), (111, 68, 128), (98, 57, 135), (97, 59, 142), (87, 56, 139), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (81, 54, 134), (87, 56, 139), (88, 59, 145), (97, 59, 142), (87, 56, 139), (75, 50, 126), (75, 50, 126), (81, 54, 134), (85, 50, 122), (85, 50, 122), (85, 50, 122), (91, 52, 112), (101, 81, 71), (108, 89, 79), (118, 95, 83), (118, 95, 83), (108, 89, 79), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (118, 95, 83), (115, 92, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (115, 92, 79), (115, 92, 79), (115, 92, 79), (124, 91, 74), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (108, 89, 79), (107, 85, 73), (115, 87, 74), (107, 85, 73), (101, 81, 71), (91, 71, 61), (96, 76, 66), (96, 76, 66), (91, 71, 61), (91, 71, 61), (69, 63, 51), (54, 48, 43), (50, 41, 35), (30, 31, 37), (19, 18, 32), (7, 9, 33), (7, 9, 33), (7, 9, 33), (132, 105, 99), (143, 116, 106), (143, 116, 106), (135, 112, 105), (143, 116, 106), (147, 115, 97), (150, 119, 103), (150, 119, 103), (150, 119, 103), (156, 124, 106), (150, 119, 103), (150, 119, 103), (143, 116, 106), (143, 116, 106), (150, 119, 103), (150, 119, 103), (143, 116, 106), (150, 119, 103), (150, 119, 103), (156, 124, 106), (156, 124, 106), (163, 129, 109), (146, 122, 111), (132, 126, 124), (154, 128, 116), (154, 128, 116), (132, 126, 124), (132, 126, 124), (132, 126, 124), (125, 117, 117), (146, 122, 111), (146, 122, 111), (146, 122, 111), (154, 128, 116), (166, 136, 121), (154, 128, 116), (154, 128, 116), (154, 128, 116), (156, 124, 106), (154, 128, 116), (146, 122, 111), (132, 105, 99), (123, 100, 101), (135, 112, 105), (143, 116, 106), (150, 119, 103), (150, 119, 103), (143, 116, 106), (143, 116, 106), (154, 128, 116), (154, 128, 116), (163, 129, 109), (154, 128, 116), (156, 124, 106), (143, 116, 106), (143, 116, 106), (143, 116, 106), (135, 112, 105), (132, 105, 99), (143, 116, 106), (154, 128, 116), (166, 136, 121), (166, 136, 121), (163, 129, 109), (156, 124, 106), (143, 116, 106), (135, 112, 105), (143, 116, 106), (154, 128, 116), (154, 128, 116), (154, 128, 116), (146, 122, 111), (146, 122, 111), (143, 116, 106), (140, 110, 95), (147, 115, 97), (156, 124, 106), (163, 129, 109), (150, 119, 103), (147, 115, 97), (156, 124, 106), (154, 128, 116), (146, 122, 111), (143, 116, 106), (156, 124, 106), (166, 136, 121), (166, 136, 121), (154, 128, 116), (146, 122, 111), (135, 112, 105), (111, 68, 128), (98, 57, 135), (89, 54, 132), (75, 50, 126), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (70, 46, 117), (85, 50, 122), (81, 54, 134), (75, 50, 126), (65, 39, 95), (65, 39, 95), (74, 42, 102), (75, 50, 126), (85, 50, 122), (82, 46, 109), (90, 62, 89), (108, 89, 79), (103, 94, 87), (118, 95, 83), (115, 92, 79), (115, 92, 79), (124, 99, 84), (124, 99, 84), (118, 95, 83), (115, 92, 79), (108, 89, 79), (115, 92, 79), (115, 92, 79), (118, 95, 83), (115, 92, 79), (108, 89, 79), (115, 92, 79), (118, 95, 83), (124, 99, 84), (124, 99, 84), (107, 85, 73), (107, 85, 73), (107, 85, 73), (115, 87, 74), (107, 85, 73), (107, 85, 73), (115, 87, 74), (101, 81, 71), (96, 76, 66), (96, 76, 66), (96, 76, 66), (87, 80, 63), (91, 71, 61), (83, 75, 74), (83, 66, 57), (69, 63, 51), (83, 66, 57), (78, 59, 51), (63, 54, 47), (63, 54, 47), (54, 48, 43), (50, 41, 35), (143, 116, 106), (146, 122, 111), (143, 116, 106), (132, 105, 99), (140, 110, 95), (132, 105, 99), (147, 115, 97), (150, 119, 103), (150, 119, 103), (156, 124, 106), (156, 124, 106), (150, 119, 103), (150, 119, 103), (146, 122, 111), (156, 124, 106), (154, 128, 116), (156, 124, 106), (146, 122, 111), (154, 128, 116), (163, 129, 109), (156, 124, 106), (166, 136, 121), (166, 136, 121), (162, 148, 139), (162, 148, 139), (162, 148, 139), (162, 148, 139), (144, 135, 137), (132, 126, 124), (154, 128, 116), (166, 136, 121), (166, 136, 121), (166, 136, 121), (162, 148, 139), (166, 136, 121), (166, 136, 121), (166, 136, 121), (162, 148, 139), (166, 136, 121), (166, 136, 121), (154, 128, 116), (143, 116, 106), (135, 112, 105), (125, 117, 117), (146, 122, 111), (154, 128, 116), (146, 122, 111), (143, 116, 106), (143, 116, 106), (154, 128, 116), (166, 136, 121), (166, 136, 121), (163, 129, 109), (156, 124, 106), (143, 116, 106), (146, 122, 111), (146, 122, 111), (135, 112, 105), (135, 112, 105), (143, 116, 106), (166, 136, 121), (166, 136, 121), (166, 136, 121), (163, 129, 109), (163, 129, 109), (156, 124, 106), (143, 116, 106), (135, 112, 105), (143, 116, 106), (146, 122, 111), (146, 122, 111), (146, 122, 111), (143, 116, 106), (143, 116, 106), (143, 116, 106), (150, 119, 103), (156, 124, 106), (163, 129, 109), (156, 124, 106), (150, 119, 103), (156, 124, 106), (143, 116, 106), (135, 112, 105), (143, 116, 106), (156, 124, 106), (163, 129, 109), (154, 128, 116), (154, 128, 116), (154, 128, 116), (146, 122, 111), (132, 105, 99), (111, 77, 111), (96, 54, 125), (85, 50, 122), (85, 50, 122), (82, 46, 109), (82, 46, 109), (82, 46, 109), (74, 42, 102), (82, 46, 109), (91, 52, 112), (82, 46, 109), (65, 39, 95), (65, 39, 95), (54, 36, 85), (65, 39, 95), (82, 46, 109), (82, 46, 109), (74, 42, 102), (90, 62, 89), (108, 89, 79), (124, 99, 84), (118, 95, 83), (124, 99, 84), (115, 92, 79), (118, 95, 83), (124, 99, 84), (115, 92, 79), (108, 89, 79), (108, 89, 79), (118, 95, 83), (124, 99, 84), (124, 99, 84), (118, 95, 83), (118, 95, 83), (130, 104, 87), (140, 110, 95), (130, 104, 87), (115, 87, 74), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (96, 76, 66), (101, 81, 71), (101, 81, 71), (87, 80, 63), (83, 75, 74), (83, 75, 74), (83, 66, 57), (78, 59, 51), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (83, 66, 57), (135, 112, 105), (135, 112, 105), (135, 112, 105), (132, 105, 99), (132, 105, 99), (130, 104, 87), (140, 110, 95), (140, 110, 95), (147, 115, 97), (150, 119, 103), (150, 119, 103), (150, 119, 103), (156, 124, 106), (146, 122, 111), (156, 124, 106), (156, 124, 106), (154, 128, 116), (154, 128, 116), (166, 136, 121), (163, 129, 109), (156, 124, 106), (163, 129, 109), (166, 136, 121), (162, 148, 139), (162, 148, 139), (169, 160, 159), (162, 148, 139), (144, 135, 137), (144, 135, 137), (166, 136, 121), (166, 136, 121), (162, 148, 139), (162, 148, 139), (162, 148, 139), (162, 148, 139), (144, 135, 137), (144, 135, 137), (162, 148, 139), (162, 148, 139), (166, 136, 121), (162, 148, 139), (154, 128, 116), (146, 122, 111), (154, 128, 116), (154, 128, 116), (166, 136, 121), (154, 128, 116), (146, 122, 111), (156, 124, 106), (166, 136, 121), (166, 136, 121), (166, 136, 121), (166, 136, 121), (166, 136, 121), (154, 128, 116), (154, 128, 116), (154, 128, 116), (146, 122, 111), (143, 116, 106), (154, 128, 116), (166, 136, 121), (166, 136, 121), (163, 129, 109), (163, 129, 109), (163, 129, 109), (156, 124, 106), (156, 124, 106), (150, 119, 103), (150, 119, 103), (163, 129, 109), (154, 128, 116), (146, 122, 111), (146, 122, 111), (146, 122, 111), (143, 116, 106), (143, 116, 106), (143, 116, 106), (146, 122, 111), (156, 124, 106), (156, 124, 106), (154, 128, 116), (150, 119, 103), (146, 122, 111), (154, 128, 116), (154, 128, 116), (163, 129, 109), (156, 124, 106), (143, 116, 106), (154, 128, 116), (154, 128, 116), (146, 122, 111), (146, 122, 111), (116, 107, 112), (111, 77, 111), (101, 63, 111), (91, 52, 112), (91, 52, 112), (90, 62, 89), (102, 72, 95), (102, 72, 95), (102, 72, 95), (101, 63, 111), (91, 52, 112), (91, 52, 112), (86, 51, 85), (86, 51, 85), (90, 62, 89), (90, 62, 89), (91, 52, 112), (85, 50, 122), (90, 62, 89), (130, 104, 87), (132, 105, 99), (130, 104, 87), (118, 95, 83), (118, 95, 83), (124, 99, 84), (124, 99, 84), (124, 99, 84), (118, 95, 83), (108, 89, 79), (108, 89, 79), (124, 99, 84), (124, 99, 84), (124, 99, 84), (130, 104, 87), (130, 104, 87), (124, 99, 84), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (96, 76, 66), (107, 85, 73), (107, 85, 73), (107, 85, 73), (107, 85, 73), (101, 81, 71), (101, 81, 71), (96, 76, 66), (83, 75, 74), (83, 75, 74), (96, 76, 66), (91, 71, 61), (83, 66, 57), (78, 59, 51), (78, 59, 51), (83, 66, 57), (91, 71, 61), (91, 71, 61)]
\ No newline at end of file
+"""Defines a texture class and the textures shipped with Mathy."""
+
+import os
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+
+class Texture:
+    """
+    A class to represent an RGB texture.
+
+    Textures are stored on disk as (height, width, 3) uint8 .npy files and
+    only loaded, memory-mapped, the first time their pixels are accessed.
+    """
+
+    def __init__(self, path: str, width: int = None, height: int = None):
+        """Initialize a texture from the path of a .npy file."""
+        self.path = path
+        self._width = width
+        self._height = height
+        self._pixels = None
+
+    @classmethod
+    def from_pixels(cls, pixels, width: int, height: int) -> 'Texture':
+        """Build an in-memory texture from a flat, row-major RGB sequence."""
+        import numpy as np
+        texture = cls(None, width, height)
+        texture._pixels = np.asarray(pixels, dtype=np.uint8).reshape(
+            height, width, 3)
+        return texture
+
+    @property
+    def pixels(self):
+        """Return the (height, width, 3) uint8 array of the texture."""
+        if self._pixels is None:
+            import numpy as np
+            pixels = np.load(self.path, mmap_mode="r")
+            if pixels.ndim != 3 or pixels.shape[2] != 3:
+                raise ValueError(
+                    f"{self.path} is not a (height, width, 3) RGB texture.")
+            self._pixels = pixels
+            self._height, self._width = pixels.shape[:2]
+        return self._pixels
+
+    @property
+    def width(self) -> int:
+        """Return the width of the texture in pixels."""
+        if self._width is None:
+            self.pixels
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Return the height of the texture in pixels."""
+        if self._height is None:
+            self.pixels
+        return self._height
+
+    def __repr__(self):
+        """Return a string representation of the texture."""
+        return f"Texture({self.path!r}, {self.width}, {self.height})"
+
+    def __len__(self) -> int:
+        """Return the number of texels."""
+        return self.width * self.height
+
+    def __getitem__(self, index: int) -> tuple[int, int, int]:
+        """Return the texel at a flat row-major index (y * width + x)."""
+        y, x = divmod(index, self.width)
+        return self.get_pixel(x, y)
+
+    def get_pixel(self, x: int, y: int) -> tuple[int, int, int]:
+        """Return the RGB color of texel (x, y)."""
+        r, g, b = self.pixels[y, x].tolist()
+        return (r, g, b)
+
+    def sample(self, u: float, v: float) -> tuple[int, int, int]:
+        """Return the nearest texel for (u, v) clamped to [0, 1]."""
+        u = max(0, min(1, u))
+        v = max(0, min(1, v))
+        return self.get_pixel(int(u * (self.width - 1)),
+                              int(v * (self.height - 1)))
+
+
+gengar_tex = Texture(os.path.join(ASSETS_DIR, "gengar.npy"), 150, 150)
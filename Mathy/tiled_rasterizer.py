@@ -0,0 +1,197 @@
+"""Defines a tile-based rasterizer running on a pool of processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from Mathy import FrameBuffer, Renderer3D, Triangle3D, Vector3
+from Mathy.triangle_setup import TriangleSetup
+
+
+class _TileWorker:
+    """Rasterizes the triangles of one tile into shared frame planes."""
+
+    def __init__(self, width, height, depth_name, color_name, mode):
+        """Attach to the shared depth and color planes."""
+        # Keep the shared memory objects alive as long as the views
+        self.depth_memory = shared_memory.SharedMemory(name=depth_name)
+        self.color_memory = shared_memory.SharedMemory(name=color_name)
+        self.renderer = Renderer3D(width, height)
+        self.renderer._framebuffer = FrameBuffer.from_arrays(
+            np.ndarray((height, width), np.float32,
+                       buffer=self.depth_memory.buf),
+            np.ndarray((height, width, 3), np.uint8,
+                       buffer=self.color_memory.buf))
+        self.mode = mode
+
+    def rasterize(self, tile, triangles):
+        """
+        Rasterize triangles, in order, clipped to the tile rectangle.
+
+        Each triangle is a ((x, y, z) * 3, uv) tuple.
+        Return the number of pixels covered, whether or not they pass the
+        depth test, like the length of Renderer3D.rasterize_triangle.
+        """
+        renderer = self.renderer
+        renderer.scissor = tile
+        # Other processes may have written or cleared this tile since this
+        # worker last saw it: refresh its hierarchical depth bounds
+        renderer.framebuffer.mark_depth_dirty(*tile)
+        rasterize = (renderer._rasterize_triangle_scanline
+                     if self.mode == "scanline"
+                     else renderer._rasterize_triangle_vectorized)
+        covered = 0
+        for corners, uv in triangles:
+            triangle = Triangle3D(*(Vector3(*p) for p in corners), None, uv)
+            covered += rasterize(triangle, collect=False)
+        return covered
+
+    def close(self):
+        """Detach from the shared planes."""
+        self.renderer._framebuffer = None
+        self.depth_memory.close()
+        self.color_memory.close()
+
+
+# The worker of the current pool process
+_worker = None
+
+
+def _init_worker(*args):
+    """Create the tile worker of a pool process."""
+    global _worker
+    _worker = _TileWorker(*args)
+
+
+def _rasterize_tile(tile, triangles):
+    """Rasterize a tile in a pool process."""
+    return _worker.rasterize(tile, triangles)
+
+
+class TiledRasterizer:
+    """
+    A rasterizer splitting the screen into tiles rendered in parallel.
+
+    Screen-space triangles are binned into the square tiles their bounding
+    box overlaps, then every tile is rasterized by a pool of processes into
+    depth and color planes in shared memory. Tiles never overlap and each
+    one draws its triangles in submission order, so the result is
+    deterministic and identical to Renderer3D.rasterize_triangle in
+    "vectorized" or "scanline" mode called on the same triangles in order.
+    The stepped "scalar" mode, rasterize_triangle's default, is not
+    available: its values would depend on where each tile starts. Against
+    that mode, the result has the same coverage, with depths and colors
+    equal up to rounding.
+    With workers set to 0, the tiles are rendered in the calling process.
+    Call close(), or use the rasterizer as a context manager, to stop the
+    pool and free the shared memory.
+    """
+
+    def __init__(self, width: int, height: int, tile_size: int = 64,
+                 workers: int = None, mode: str = "scanline",
+                 clear_color: tuple[int, int, int] = (0, 0, 0)):
+        """Allocate the shared frame planes and start the process pool."""
+        if mode not in ("vectorized", "scanline"):
+            raise ValueError(f"Unknown rasterization mode: {mode}")
+        if tile_size <= 0:
+            raise ValueError("The tile size must be positive.")
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self._depth_memory = shared_memory.SharedMemory(
+            create=True, size=width * height * 4)
+        self._color_memory = shared_memory.SharedMemory(
+            create=True, size=width * height * 3)
+        self.framebuffer = FrameBuffer.from_arrays(
+            np.ndarray((height, width), np.float32,
+                       buffer=self._depth_memory.buf),
+            np.ndarray((height, width, 3), np.uint8,
+                       buffer=self._color_memory.buf),
+            clear_color)
+        self.framebuffer.clear()
+        worker_args = (width, height, self._depth_memory.name,
+                       self._color_memory.name, mode)
+        if workers == 0:
+            self._pool = None
+            self._local_worker = _TileWorker(*worker_args)
+        else:
+            self._pool = ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=worker_args)
+            self._local_worker = None
+
+    def __enter__(self):
+        """Return the rasterizer itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the rasterizer."""
+        self.close()
+
+    def close(self):
+        """Stop the process pool and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._local_worker is not None:
+            self._local_worker.close()
+            self._local_worker = None
+        if self.framebuffer is not None:
+            self.framebuffer = None
+            for memory in (self._depth_memory, self._color_memory):
+                memory.close()
+                memory.unlink()
+
+    def clear(self):
+        """Reset the shared depth and color planes for a new frame."""
+        self.framebuffer.clear()
+
+    def bin_triangles(self, triangles) -> dict:
+        """
+        Sort screen-space triangles into the tiles they overlap.
+
+        Return a dict mapping the (column, row) of every non-empty tile to
+        the list of its triangles, in submission order, as
+        ((x, y, z) * 3, uv) tuples.
+        Degenerate triangles raise a ValueError, like rasterize_triangle.
+        """
+        size = self.tile_size
+        bins = {}
+        for triangle in triangles:
+            p1, p2, p3 = triangle.get_vertices()
+            TriangleSetup(p1, p2, p3)
+            x0 = max(int(min(p1.x, p2.x, p3.x)), 0)
+            x1 = min(int(max(p1.x, p2.x, p3.x)), self.width - 1)
+            y0 = max(int(min(p1.y, p2.y, p3.y)), 0)
+            y1 = min(int(max(p1.y, p2.y, p3.y)), self.height - 1)
+            if x0 > x1 or y0 > y1:
+                continue
+            item = (((p1.x, p1.y, p1.z), (p2.x, p2.y, p2.z),
+                     (p3.x, p3.y, p3.z)), triangle.uv)
+            for row in range(y0 // size, y1 // size + 1):
+                for column in range(x0 // size, x1 // size + 1):
+                    bins.setdefault((column, row), []).append(item)
+        return bins
+
+    def tile_rectangle(self, column: int, row: int) -> tuple:
+        """Return the inclusive pixel rectangle (x0, x1, y0, y1) of a tile."""
+        size = self.tile_size
+        return (column * size, min((column + 1) * size, self.width) - 1,
+                row * size, min((row + 1) * size, self.height) - 1)
+
+    def rasterize(self, triangles) -> int:
+        """
+        Rasterize screen-space triangles into the shared frame buffer.
+
+        Return the number of pixels covered, counted once per triangle,
+        whether or not they pass the depth test.
+        """
+        bins = self.bin_triangles(triangles)
+        tiles = [(self.tile_rectangle(*key), bins[key])
+                 for key in sorted(bins)]
+        if self._pool is None:
+            return sum(self._local_worker.rasterize(tile, items)
+                       for tile, items in tiles)
+        futures = [self._pool.submit(_rasterize_tile, tile, items)
+                   for tile, items in tiles]
+        return sum(future.result() for future in futures)
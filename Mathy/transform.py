@@ -1,51 +1,337 @@
 """Defines a Transform class containing a GameObject's geometry data."""
 
 
-from Mathy import (TranslationMatrix4x4,
-                   RotationMatrix4x4_x,
-                   RotationMatrix4x4_y,
-                   RotationMatrix4x4_z,
-                   TotalRotationMatrix4x4,
-                   HomothetyMatrix4x4,
-                   AnisotropicMatrix4x4,
-                   Quaternion
+from Mathy import (Matrix4x4,
+                   Quaternion,
+                   Vector3,
+                   deg_to_rad
                    )
 
 
 class Transform:
-    """A class to represent a game object's position, rotation and scale."""
+    """
+    A class to represent a game object's position, rotation and scale.
+
+    The transform is stored decomposed: a position, a unit quaternion
+    rotation and a per-axis scale. The model matrix T * R * S is rebuilt in
+    closed form, only when one of them changed since the last request.
+    version is incremented on every change, so that downstream caches can
+    key on (transform, transform.version) instead of comparing matrices.
+    Call mark_dirty() after mutating position, rotation or scale in place.
+
+    Transforms form a hierarchy: the world matrix of a transform is the
+    world matrix of its parent times its own model matrix. It is cached
+    too, and a change only invalidates the subtree of the transform that
+    changed; world_version is incremented whenever the world matrix
+    becomes stale, including when an ancestor moved.
+    The inverse matrices are cached the same way, next to the matrices.
+    """
 
     def __init__(self):
         """Initialize a transform."""
-        self.transform_matrix = HomothetyMatrix4x4(1)
+        # Incremented every time the model matrix becomes stale
+        self.version = 0
+        self._transform_matrix = None
+        self._dirty = True
+        self._inverse_matrix = None
+        self._inverse_dirty = True
+        # Incremented every time the world matrix becomes stale
+        self.world_version = 0
+        self._world_matrix = None
+        self._world_dirty = True
+        self._world_inverse_matrix = None
+        self._world_inverse_dirty = True
+        self._parent = None
+        self._children = []
+        self._position = Vector3(0, 0, 0)
+        self._rotation = Quaternion(1, 0, 0, 0)
+        self._scale = Vector3(1, 1, 1)
+
+    @property
+    def position(self) -> Vector3:
+        """Return the position."""
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector3):
+        """Move the transform and invalidate the cached matrix."""
+        self._position = value
+        self.mark_dirty()
+
+    @property
+    def rotation(self) -> Quaternion:
+        """Return the rotation as a unit quaternion."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: Quaternion):
+        """Change the rotation and invalidate the cached matrix."""
+        self._rotation = value.normalize()
+        self.mark_dirty()
+
+    @property
+    def scale(self) -> Vector3:
+        """Return the scale factors along the local x, y and z axes."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: Vector3):
+        """Change the scale and invalidate the cached matrix."""
+        self._scale = value
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Invalidate the cached model matrix and the subtree world matrices."""
+        self._dirty = True
+        self._inverse_dirty = True
+        self.version += 1
+        self._invalidate_world()
+
+    def _invalidate_world(self):
+        """Invalidate the world matrices of the transform and its subtree."""
+        # A stale world matrix implies stale world matrices below it, as
+        # they are only refreshed after their ancestors: stop there. The
+        # same holds for the world inverses, refreshed separately
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if (node._world_dirty and node._world_inverse_dirty
+                    and node is not self):
+                continue
+            node._world_dirty = True
+            node._world_inverse_dirty = True
+            node.world_version += 1
+            stack.extend(node._children)
+
+    @property
+    def parent(self) -> 'Transform':
+        """Return the parent transform, or None for a root."""
+        return self._parent
+
+    @property
+    def children(self) -> tuple['Transform', ...]:
+        """Return the child transforms."""
+        return tuple(self._children)
+
+    def set_parent(self, parent: 'Transform'):
+        """
+        Attach the transform to a parent, or detach it with None.
+
+        The local position, rotation and scale are kept, so the world
+        matrix changes to follow the new parent.
+        """
+        if parent is not None and not isinstance(parent, Transform):
+            raise TypeError(f"{parent} is not a Transform")
+        node = parent
+        while node is not None:
+            if node is self:
+                raise ValueError("A transform cannot be its own ancestor.")
+            node = node._parent
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+        self._invalidate_world()
+
+    @property
+    def world_matrix(self) -> Matrix4x4:
+        """
+        Return the local-to-world matrix.
+
+        Only the transforms changed since the last request, and their
+        descendants, are recomputed. The matrix must not be mutated in
+        place.
+        """
+        if self._world_dirty:
+            if self._parent is None:
+                self._world_matrix = self.transform_matrix
+            else:
+                self._world_matrix = self._parent.world_matrix.prod(
+                    self.transform_matrix)
+            self._world_dirty = False
+        return self._world_matrix
+
+    @property
+    def world_inverse_matrix(self) -> Matrix4x4:
+        """
+        Return the world-to-local matrix, the inverse of world_matrix.
+
+        It is cached like world_matrix, and built from the cached inverses
+        of the transform and its ancestors, without any matrix inversion.
+        """
+        if self._world_inverse_dirty:
+            if self._parent is None:
+                self._world_inverse_matrix = self.inverse_matrix
+            else:
+                self._world_inverse_matrix = self.inverse_matrix.prod(
+                    self._parent.world_inverse_matrix)
+            self._world_inverse_dirty = False
+        return self._world_inverse_matrix
+
+    def _rotation_entries(self) -> tuple:
+        """Return the rotation matrix of the quaternion, row by row."""
+        q = self._rotation
+        w, x, y, z = q.w, q.x, q.y, q.z
+        # Scaled by 2 / |q|^2 so that a slightly denormalized quaternion
+        # still gives a rotation
+        s = 2 / (w * w + x * x + y * y + z * z)
+        xs, ys, zs = x * s, y * s, z * s
+        wx, wy, wz = w * xs, w * ys, w * zs
+        xx, xy, xz = x * xs, x * ys, x * zs
+        yy, yz, zz = y * ys, y * zs, z * zs
+        return (1 - yy - zz, xy - wz, xz + wy,
+                xy + wz, 1 - xx - zz, yz - wx,
+                xz - wy, yz + wx, 1 - xx - yy)
+
+    @property
+    def transform_matrix(self) -> Matrix4x4:
+        """
+        Return the model matrix T * R * S.
+
+        The matrix is cached: it must not be mutated in place.
+        """
+        if self._dirty:
+            r00, r01, r02, r10, r11, r12, r20, r21, r22 = \
+                self._rotation_entries()
+            sx, sy, sz = self._scale.x, self._scale.y, self._scale.z
+            p = self._position
+            self._transform_matrix = Matrix4x4._from_flat([
+                r00 * sx, r01 * sy, r02 * sz, p.x,
+                r10 * sx, r11 * sy, r12 * sz, p.y,
+                r20 * sx, r21 * sy, r22 * sz, p.z,
+                0, 0, 0, 1
+            ])
+            self._dirty = False
+        return self._transform_matrix
+
+    @property
+    def inverse_matrix(self) -> Matrix4x4:
+        """
+        Return the inverse of the model matrix, S^-1 * R^T * T^-1.
+
+        It is built in closed form from the position, rotation and scale,
+        and cached until they change. The matrix must not be mutated in
+        place. Raise a ValueError if a scale factor is zero.
+        """
+        if self._inverse_dirty:
+            r00, r01, r02, r10, r11, r12, r20, r21, r22 = \
+                self._rotation_entries()
+            s = self._scale
+            if abs(s.x) < 1e-12 or abs(s.y) < 1e-12 or abs(s.z) < 1e-12:
+                raise ValueError("Cannot invert a transform with a null "
+                                 "scale.")
+            ix, iy, iz = 1 / s.x, 1 / s.y, 1 / s.z
+            # Rows of S^-1 * R^T: the columns of R divided by the scale
+            a, b, c = r00 * ix, r10 * ix, r20 * ix
+            d, e, f = r01 * iy, r11 * iy, r21 * iy
+            g, h, i = r02 * iz, r12 * iz, r22 * iz
+            p = self._position
+            self._inverse_matrix = Matrix4x4._from_flat([
+                a, b, c, -(a * p.x + b * p.y + c * p.z),
+                d, e, f, -(d * p.x + e * p.y + f * p.z),
+                g, h, i, -(g * p.x + h * p.y + i * p.z),
+                0, 0, 0, 1
+            ])
+            self._inverse_dirty = False
+        return self._inverse_matrix
+
+    @transform_matrix.setter
+    def transform_matrix(self, matrix: Matrix4x4):
+        """
+        Decompose a model matrix into position, rotation and scale.
+
+        The matrix must be a translation, a rotation and a scale composed
+        as T * R * S; any shear is lost. A mirroring is kept as a negative
+        x scale.
+        """
+        if not isinstance(matrix, Matrix4x4):
+            raise TypeError(f"{matrix} is not a Matrix4x4")
+        m = matrix.flat
+        sx = (m[0] ** 2 + m[4] ** 2 + m[8] ** 2) ** 0.5
+        sy = (m[1] ** 2 + m[5] ** 2 + m[9] ** 2) ** 0.5
+        sz = (m[2] ** 2 + m[6] ** 2 + m[10] ** 2) ** 0.5
+        if min(sx, sy, sz) < 1e-9:
+            raise ValueError("Cannot decompose a matrix with a null scale.")
+        det = (m[0] * (m[5] * m[10] - m[6] * m[9])
+               - m[1] * (m[4] * m[10] - m[6] * m[8])
+               + m[2] * (m[4] * m[9] - m[5] * m[8]))
+        if det < 0:
+            sx = -sx
+        rotation = Matrix4x4(
+            m[0] / sx, m[1] / sy, m[2] / sz, 0,
+            m[4] / sx, m[5] / sy, m[6] / sz, 0,
+            m[8] / sx, m[9] / sy, m[10] / sz, 0,
+            0, 0, 0, 1
+        )
+        self._position = Vector3(m[3], m[7], m[11])
+        self._rotation = Quaternion.from_rotation_matrix(rotation)
+        self._scale = Vector3(sx, sy, sz)
+        self.mark_dirty()
 
     def translate(self, a, b, c):
-        """Apply translation."""
-        translation = TranslationMatrix4x4(a, b, c)
-        self.transform_matrix = self.transform_matrix.prod(translation)
+        """Apply translation along the local (rotated and scaled) axes."""
+        # M * T(a, b, c) = T(p + R * S * (a, b, c)) * R * S
+        m = self.transform_matrix.flat
+        p = self._position
+        self.position = Vector3(p.x + m[0] * a + m[1] * b + m[2] * c,
+                                p.y + m[4] * a + m[5] * b + m[6] * c,
+                                p.z + m[8] * a + m[9] * b + m[10] * c)
 
     def lerp(self, other, t: float):
-        self.transform_matrix = self.transform_matrix.lerp(other, t)
+        """
+        Interpolate towards another transform or model matrix.
+
+        Position and scale are interpolated linearly and the rotation along
+        the shortest arc.
+        """
+        if isinstance(other, Matrix4x4):
+            target = Transform()
+            target.transform_matrix = other
+            other = target
+        elif not isinstance(other, Transform):
+            raise TypeError(f"{other} is not a Transform or a Matrix4x4")
+        p1, p2 = self._position, other.position
+        self.position = Vector3(p1.x + t * (p2.x - p1.x),
+                                p1.y + t * (p2.y - p1.y),
+                                p1.z + t * (p2.z - p1.z))
+        s1, s2 = self._scale, other.scale
+        self.scale = Vector3(s1.x + t * (s2.x - s1.x),
+                             s1.y + t * (s2.y - s1.y),
+                             s1.z + t * (s2.z - s1.z))
+        q1, q2 = self._rotation, other.rotation
+        if q1.w * q2.w + q1.x * q2.x + q1.y * q2.y + q1.z * q2.z < 0:
+            # q and -q are the same rotation: take the shortest arc
+            q2 = Quaternion(-q2.w, -q2.x, -q2.y, -q2.z)
+        self.rotation = Quaternion(q1.w + t * (q2.w - q1.w),
+                                   q1.x + t * (q2.x - q1.x),
+                                   q1.y + t * (q2.y - q1.y),
+                                   q1.z + t * (q2.z - q1.z))
 
     def rotate(self, angle_x, angle_y, angle_z):
-        """Apply rotation using Euler angles."""
-        rot_x = RotationMatrix4x4_x(angle_x)
-        rot_y = RotationMatrix4x4_y(angle_y)
-        rot_z = RotationMatrix4x4_z(angle_z)
-        rotation = TotalRotationMatrix4x4(rot_x, rot_y, rot_z)
-        self.transform_matrix = self.transform_matrix.prod(rotation.matrix)
+        """
+        Apply rotation using Euler angles, in degrees.
+
+        The rotations are applied about the local x, then y, then z axes,
+        like the product Rz * Ry * Rx.
+        """
+        rotation = Quaternion.euler_to_quaternion(deg_to_rad(angle_x),
+                                                  deg_to_rad(angle_y),
+                                                  deg_to_rad(angle_z))
+        self.rotation = self._rotation.prod(rotation)
 
     def rotate_quaternion(self, quaternion: 'Quaternion'):
         """Apply rotation using Quaternion."""
-        rotation_matrix = quaternion.to_rotation_matrix()
-        self.transform_matrix = self.transform_matrix.prod(rotation_matrix)
+        if not isinstance(quaternion, Quaternion):
+            raise TypeError(f"{quaternion} is not a Quaternion")
+        self.rotation = self._rotation.prod(quaternion.normalize())
 
     def homothetic_scale(self, k):
         """Apply homothety."""
-        homothety = HomothetyMatrix4x4(k)
-        self.transform_matrix = self.transform_matrix.prod(homothety)
+        s = self._scale
+        self.scale = Vector3(s.x * k, s.y * k, s.z * k)
 
     def anisotropic_scale(self, sx, sy, sz):
         """Apply anisotropic scaling."""
-        anisotropic = AnisotropicMatrix4x4(sx, sy, sz)
-        self.transform_matrix = self.transform_matrix.prod(anisotropic)
+        s = self._scale
+        self.scale = Vector3(s.x * sx, s.y * sy, s.z * sz)
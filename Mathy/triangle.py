@@ -126,7 +126,7 @@ class Triangle3D(Triangle):
         self.pa = pa
         self.pb = pb
         self.pc = pc
-        self.indices = indices or {pa: 0, pb: 1, pc: 2}
+        self.indices = indices or {"pa": 0, "pb": 1, "pc": 2}
         self.uv = uv or ((0, 0), (0, 0), (0, 0))
 
     def side_lengths(self) -> Vector3:
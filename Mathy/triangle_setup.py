@@ -0,0 +1,104 @@
+"""Defines the per-triangle setup used by the rasterizers."""
+
+# Barycentric coordinates down to -EPSILON count as inside, so that pixel
+# centers lying on an edge are covered whatever the rounding of the
+# evaluation order
+EPSILON = 1e-9
+
+
+class TriangleSetup:
+    """
+    Precomputed constants for rasterizing one screen-space triangle.
+
+    The barycentric coordinates, the depth and the texture coordinates are
+    affine functions of the pixel position: each one is stored as a plane
+    f(x, y) = a * x + b * y + c, computed once per triangle.
+    Stepping one pixel along x or y then adds a constant (dx or dy) to
+    every value, and evaluating a batch of pixels is a multiply-add on
+    arrays, without computing any determinant or building any vector.
+    """
+
+    __slots__ = ("lambda_A", "lambda_B", "lambda_C", "z", "u", "v")
+
+    def __init__(self, p1, p2, p3, uv=None):
+        """
+        Set up the triangle with screen-space corners p1, p2 and p3.
+
+        p1, p2 and p3 need x, y and z attributes and uv, if given, holds
+        the (u, v) coordinates of the three corners.
+        """
+        xA, yA = p1.x, p1.y
+        xB, yB = p2.x, p2.y
+        xC, yC = p3.x, p3.y
+        # Determinant of the barycentric system, as in
+        # barycentric_coordinates
+        det = (xA - xC) * (yB - yC) - (xB - xC) * (yA - yC)
+        if abs(det) < 1e-9:
+            raise ValueError("Degenerate triangle: points are collinear")
+        inv_det = 1 / det
+        # Cramer's rule, expanded as planes in x and y
+        a_A = (yB - yC) * inv_det
+        b_A = -(xB - xC) * inv_det
+        c_A = ((xB - xC) * yC - xC * (yB - yC)) * inv_det
+        a_B = -(yA - yC) * inv_det
+        b_B = (xA - xC) * inv_det
+        c_B = (xC * (yA - yC) - (xA - xC) * yC) * inv_det
+        self.lambda_A = (a_A, b_A, c_A)
+        self.lambda_B = (a_B, b_B, c_B)
+        self.lambda_C = (-a_A - a_B, -b_A - b_B, 1 - c_A - c_B)
+        self.z = self._attribute_plane(p1.z, p2.z, p3.z)
+        if uv is None:
+            self.u = self.v = None
+        else:
+            self.u = self._attribute_plane(uv[0][0], uv[1][0], uv[2][0])
+            self.v = self._attribute_plane(uv[0][1], uv[1][1], uv[2][1])
+
+    def _attribute_plane(self, fA: float, fB: float,
+                         fC: float) -> tuple[float, float, float]:
+        """Return the plane interpolating three corner values."""
+        return tuple(fA * kA + fB * kB + fC * kC for kA, kB, kC
+                     in zip(self.lambda_A, self.lambda_B, self.lambda_C))
+
+    @property
+    def dx(self) -> tuple[float, float, float, float]:
+        """Return the steps of (λA, λB, λC, z) for one pixel along x."""
+        return (self.lambda_A[0], self.lambda_B[0], self.lambda_C[0],
+                self.z[0])
+
+    @property
+    def dy(self) -> tuple[float, float, float, float]:
+        """Return the steps of (λA, λB, λC, z) for one pixel along y."""
+        return (self.lambda_A[1], self.lambda_B[1], self.lambda_C[1],
+                self.z[1])
+
+    @staticmethod
+    def _evaluate(plane, x, y):
+        """Evaluate a plane at (x, y), scalars or arrays."""
+        a, b, c = plane
+        return a * x + b * y + c
+
+    def barycentric(self, x, y):
+        """
+        Return the barycentric coordinates (λA, λB, λC) of (x, y).
+
+        x and y may be scalars or arrays of positions.
+        """
+        return (self._evaluate(self.lambda_A, x, y),
+                self._evaluate(self.lambda_B, x, y),
+                self._evaluate(self.lambda_C, x, y))
+
+    def depth(self, x, y):
+        """Return the interpolated depth at (x, y)."""
+        return self._evaluate(self.z, x, y)
+
+    def texture_coordinates(self, x, y):
+        """Return the interpolated (u, v) at (x, y)."""
+        if self.u is None:
+            raise ValueError("The triangle has no texture coordinates.")
+        return self._evaluate(self.u, x, y), self._evaluate(self.v, x, y)
+
+    @staticmethod
+    def inside(lambda_A, lambda_B, lambda_C):
+        """Check if barycentric coordinates are inside the triangle."""
+        return ((lambda_A >= -EPSILON) & (lambda_B >= -EPSILON)
+                & (lambda_C >= -EPSILON))
@@ -4,6 +4,8 @@
 class Vector2:
     """A class to represent a 2D vector."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float | int, y: float | int):
         """Initialize a 2D vector with the given x and y components."""
         self.x = x
@@ -63,9 +65,9 @@ class Vector2:
         """
         from Mathy import Matrix2x2
         if isinstance(matrix, Matrix2x2):
-            a = matrix.matrix
-            new_x = a[0][0] * self.x + a[0][1] * self.y
-            new_y = a[1][0] * self.x + a[1][1] * self.y
+            a00, a01, a10, a11 = matrix.flat
+            new_x = a00 * self.x + a01 * self.y
+            new_y = a10 * self.x + a11 * self.y
             return Vector2(new_x, new_y)
         else:
             raise TypeError(f"{matrix} is not a Matrix2x2")
@@ -4,9 +4,12 @@
 class Vector3:
     """A class to represent a 3D vector."""
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float | int, y: float | int, z: float | int):
         """Initialize a 3D vector with the given x and y components."""
-        if all(isinstance(i, (int, float)) for i in [x, y, z]):
+        if (isinstance(x, (int, float)) and isinstance(y, (int, float))
+                and isinstance(z, (int, float))):
             self.x = x
             self.y = y
             self.z = z
@@ -73,10 +76,11 @@ class Vector3:
         """
         from Mathy import Matrix3x3
         if isinstance(matrix, Matrix3x3):
-            a = matrix.matrix
-            new_x = a[0][0] * self.x + a[0][1] * self.y + a[0][2] * self.z
-            new_y = a[1][0] * self.x + a[1][1] * self.y + a[1][2] * self.z
-            new_z = a[2][0] * self.x + a[2][1] * self.y + a[2][2] * self.z
+            a00, a01, a02, a10, a11, a12, a20, a21, a22 = matrix.flat
+            x, y, z = self.x, self.y, self.z
+            new_x = a00 * x + a01 * y + a02 * z
+            new_y = a10 * x + a11 * y + a12 * z
+            new_z = a20 * x + a21 * y + a22 * z
             return Vector3(new_x, new_y, new_z)
         else:
             raise TypeError(f"{matrix} is not a Matrix3x3")
@@ -114,6 +118,8 @@ class HomogeneousVector3(Vector3):
     The projective space considered here is the projective plane.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y):
         """Initialize a Vector3 in homogeneous coordinates."""
         super().__init__(x, y, 1)
@@ -1,13 +1,19 @@
 """Defines vector class for spatial geometry."""
 
+from Mathy import Matrix4x4
+
 
 class Vector4:
     """A class to represent a 4-dimensional vector."""
 
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x: float | int, y: float | int, z: float | int,
                  w: float | int):
         """Initialize a 4D vector with the given components."""
-        if all(isinstance(i, (int, float)) for i in [x, y, z, w]):
+        if (isinstance(x, (int, float)) and isinstance(y, (int, float))
+                and isinstance(z, (int, float))
+                and isinstance(w, (int, float))):
             self.x = x
             self.y = y
             self.z = z
@@ -55,13 +61,13 @@ class Vector4:
 
         Return the resulting Vector4.
         """
-        from Mathy import Matrix4x4
         if isinstance(matrix, Matrix4x4):
-            a = matrix.matrix
-            new_x = a[0][0] * self.x + a[0][1] * self.y + a[0][2] * self.z + a[0][3] * self.w  # noqa: E501
-            new_y = a[1][0] * self.x + a[1][1] * self.y + a[1][2] * self.z + a[1][3] * self.w  # noqa: E501
-            new_z = a[2][0] * self.x + a[2][1] * self.y + a[2][2] * self.z + a[2][3] * self.w  # noqa: E501
-            new_w = a[3][0] * self.x + a[3][1] * self.y + a[3][2] * self.z + a[3][3] * self.w  # noqa: E501
+            a = matrix.flat
+            x, y, z, w = self.x, self.y, self.z, self.w
+            new_x = a[0] * x + a[1] * y + a[2] * z + a[3] * w
+            new_y = a[4] * x + a[5] * y + a[6] * z + a[7] * w
+            new_z = a[8] * x + a[9] * y + a[10] * z + a[11] * w
+            new_w = a[12] * x + a[13] * y + a[14] * z + a[15] * w
             return Vector4(new_x, new_y, new_z, new_w)
         else:
             raise TypeError(f"{matrix} is not a Matrix4x4")
@@ -105,6 +111,8 @@ class HomogeneousVector4(Vector4):
     The projective space considered here is the projective plane.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, z):
         """Initialize a Vector4 in homogeneous coordinates."""
         super().__init__(x, y, z, 1)
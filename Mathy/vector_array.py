@@ -0,0 +1,211 @@
+"""Defines contiguous batches of 3D and 4D vectors backed by NumPy."""
+
+import numpy as np
+
+from Mathy import Vector3, Vector4, Matrix3x3, Matrix4x4
+
+
+class _VectorArray:
+    """Shared behaviour of the fixed-width vector batch classes."""
+
+    size = 0
+    vector_class = None
+    matrix_class = None
+
+    def __init__(self, data):
+        """Initialize the batch from an (N, size) array-like of numbers."""
+        try:
+            array = np.array(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError("All components must be floats or ints.")
+        if array.size == 0:
+            array = array.reshape(0, self.size)
+        if array.ndim != 2 or array.shape[1] != self.size:
+            raise ValueError(
+                f"Expected an array of shape (N, {self.size}), "
+                f"got {array.shape}.")
+        self.data = array
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Build a batch from a sequence of vector objects."""
+        return cls([[getattr(v, c) for c in cls._components]
+                    for v in vectors])
+
+    @classmethod
+    def _wrap(cls, array):
+        """Wrap an existing float64 array without copying it."""
+        result = cls.__new__(cls)
+        result.data = array
+        return result
+
+    def to_vectors(self) -> list:
+        """Convert the batch back to a list of vector objects."""
+        return [self.vector_class(*row) for row in self.data.tolist()]
+
+    def __len__(self) -> int:
+        """Return the number of vectors in the batch."""
+        return self.data.shape[0]
+
+    def __getitem__(self, index: int):
+        """Return the vector at the given index as a vector object."""
+        return self.vector_class(*self.data[index].tolist())
+
+    def __repr__(self):
+        """Return a string representation of the batch."""
+        return f"{type(self).__name__}({self.data.tolist()})"
+
+    def __eq__(self, other) -> bool:
+        """Check if two batches are equal."""
+        if isinstance(other, type(self)):
+            return (self.data.shape == other.data.shape
+                    and bool(np.all(np.abs(self.data - other.data) < 1e-9)))
+        else:
+            raise TypeError(f"{other} is not a {type(self).__name__}")
+
+    def _check(self, other):
+        """Raise a TypeError if other is not a batch of the same kind."""
+        if not isinstance(other, type(self)):
+            raise TypeError(f"{other} is not a {type(self).__name__}")
+        if len(other) != len(self):
+            raise ValueError("Both batches must contain the same number "
+                             "of vectors.")
+
+    @property
+    def norm(self) -> np.ndarray:
+        """Calculate the norm of every vector (accessible as a property)."""
+        return np.sqrt(np.einsum("ij,ij->i", self.data, self.data))
+
+    def add(self, other):
+        """Add two batches element-wise and return a new batch."""
+        self._check(other)
+        return self._wrap(self.data + other.data)
+
+    def subtract(self, other):
+        """
+        Subtract another batch from the current batch element-wise.
+
+        Return the result as a new batch.
+        """
+        self._check(other)
+        return self._wrap(self.data - other.data)
+
+    def scalar_product(self, other) -> np.ndarray:
+        """Calculate the scalar (dot) product of each pair of vectors."""
+        self._check(other)
+        return np.einsum("ij,ij->i", self.data, other.data)
+
+    def multiply_by_scalar(self, factor):
+        """
+        Multiply the batch by a scalar.
+
+        The factor may also be an array of N scalars, one per vector.
+        """
+        if isinstance(factor, (float, int)):
+            return self._wrap(self.data * factor)
+        try:
+            factors = np.asarray(factor, dtype=np.float64)
+        except (TypeError, ValueError):
+            factors = None
+        if factors is None or factors.shape != (len(self),):
+            raise TypeError(f"{factor} is not a float, an int or an array "
+                            "of one scalar per vector.")
+        return self._wrap(self.data * factors[:, None])
+
+    def multiply_by_matrix(self, matrix):
+        """
+        Multiply every vector of the batch by a square matrix.
+
+        Return the resulting batch.
+        """
+        if isinstance(matrix, Matrix4x4) and self.size == 4:
+            return matrix.transform_points(self)
+        if isinstance(matrix, self.matrix_class):
+            m = np.array(matrix.flat, dtype=np.float64).reshape(
+                self.size, self.size)
+            return self._wrap(self.data @ m.T)
+        else:
+            name = self.matrix_class.__name__
+            raise TypeError(f"{matrix} is not a {name}")
+
+    def normalize(self):
+        """
+        Normalize every vector of the batch.
+
+        The new vectors have the same direction and a length of 1.
+        """
+        n = self.norm
+        if np.any(n < 1e-9):
+            raise ValueError("Cannot normalize a zero vector.")
+        return self._wrap(self.data / n[:, None])
+
+
+class Vector3Array(_VectorArray):
+    """A class to represent an (N, 3) batch of 3D vectors."""
+
+    size = 3
+    vector_class = Vector3
+    matrix_class = Matrix3x3
+    _components = ("x", "y", "z")
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return a view on the x components."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return a view on the y components."""
+        return self.data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """Return a view on the z components."""
+        return self.data[:, 2]
+
+    def cross_product(self, other: 'Vector3Array') -> 'Vector3Array':
+        """Generate the cross product of each pair of 3D vectors."""
+        self._check(other)
+        return self._wrap(np.cross(self.data, other.data))
+
+    def homogenize(self) -> 'Vector4Array':
+        """Convert the batch to 4D homogeneous vectors (w = 1)."""
+        result = np.ones((len(self), 4), dtype=np.float64)
+        result[:, :3] = self.data
+        return Vector4Array._wrap(result)
+
+
+class Vector4Array(_VectorArray):
+    """A class to represent an (N, 4) batch of 4D vectors."""
+
+    size = 4
+    vector_class = Vector4
+    matrix_class = Matrix4x4
+    _components = ("x", "y", "z", "w")
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return a view on the x components."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return a view on the y components."""
+        return self.data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """Return a view on the z components."""
+        return self.data[:, 2]
+
+    @property
+    def w(self) -> np.ndarray:
+        """Return a view on the w components."""
+        return self.data[:, 3]
+
+    def dehomogenize(self) -> Vector3Array:
+        """Divide every vector by its w component and drop it."""
+        w = self.data[:, 3]
+        if np.any(np.abs(w) < 1e-9):
+            raise ValueError("Cannot dehomogenize a vector with w = 0.")
+        return Vector3Array._wrap(self.data[:, :3] / w[:, None])
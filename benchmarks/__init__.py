@@ -0,0 +1 @@
+"""Marks the current directory as a package."""
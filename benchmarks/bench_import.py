@@ -0,0 +1,44 @@
+"""
+Measure the time taken by `import Mathy` in a fresh interpreter.
+
+Run from the repository root with:
+    python -m benchmarks.bench_import
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+SCENARIOS = {
+    "import Mathy": "import Mathy",
+    "geometry only": "from Mathy import Vector3, Matrix4x4, Quaternion",
+    "everything": "from Mathy import *",
+}
+
+
+def time_import(statement):
+    """Return the best wall time of statement in a new process, in ms."""
+    code = ("import time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print((time.perf_counter() - start) * 1e3)")
+    timings = []
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    for _ in range(REPEAT):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                env=env, capture_output=True, text=True,
+                                check=True).stdout
+        timings.append(float(output.split()[-1]))
+    return min(timings)
+
+
+def main():
+    """Print the import time of each scenario."""
+    for name, statement in SCENARIOS.items():
+        print(f"{name:<14} {time_import(statement):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
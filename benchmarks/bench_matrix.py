@@ -0,0 +1,80 @@
+"""
+Compare the Matrix4x4 product variants with the former triple-loop product,
+and the determinant and inverse variants with the former determinant.
+
+Run from the repository root with:
+    python -m benchmarks.bench_matrix
+"""
+
+import timeit
+
+from Mathy import (Matrix3x3,
+                   Matrix4x4,
+                   RotationMatrix4x4_x,
+                   RotationMatrix4x4_y,
+                   RotationMatrix4x4_z,
+                   TranslationMatrix4x4)
+
+NUMBER = 20000
+
+
+def loop_prod(m1, m2):
+    """Reproduce the former Matrix4x4.prod (triple loop, nested lists)."""
+    a = m1.matrix.tolist()
+    b = m2.matrix.tolist()
+    res = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+    for i in range(4):
+        for j in range(4):
+            for k in range(4):
+                res[i][j] += a[i][k] * b[k][j]
+    return Matrix4x4(
+        res[0][0], res[0][1], res[0][2], res[0][3],
+        res[1][0], res[1][1], res[1][2], res[1][3],
+        res[2][0], res[2][1], res[2][2], res[2][3],
+        res[3][0], res[3][1], res[3][2], res[3][3],
+    )
+
+
+def submatrix_determinant(m):
+    """Reproduce the former Matrix4x4.determinant (four Matrix3x3)."""
+    a, b, c, d, e, f, g, h, i, j, k, l_, m_, n, o, p = m.flat
+    return (a * Matrix3x3(f, g, h, j, k, l_, n, o, p).determinant()
+            - b * Matrix3x3(e, g, h, i, k, l_, m_, o, p).determinant()
+            + c * Matrix3x3(e, f, h, i, j, l_, m_, n, p).determinant()
+            - d * Matrix3x3(e, f, g, i, j, k, m_, n, o).determinant())
+
+
+def per_call(function):
+    """Return the best time of one call, in microseconds."""
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER * 1e6  # noqa: E501
+
+
+def main():
+    """Print the time of each product variant."""
+    a = RotationMatrix4x4_x(30)
+    b = RotationMatrix4x4_y(45)
+    c = RotationMatrix4x4_z(60)
+    d = TranslationMatrix4x4(1, 2, 3)
+    out = Matrix4x4(*[0] * 16)
+    rigid = Matrix4x4.chain(d, c, b, a)
+    general = Matrix4x4(2, 1, 0, 3, 1, 4, 1, 0, 0, 2, 5, 1, 1, 0, 2, 6)
+    cases = {
+        "loop prod (former)": lambda: loop_prod(a, b),
+        "prod": lambda: a.prod(b),
+        "prod_into": lambda: a.prod_into(b, out),
+        "4 matrices, loop prod": lambda: loop_prod(
+            loop_prod(loop_prod(d, c), b), a),
+        "4 matrices, prod": lambda: d.prod(c).prod(b).prod(a),
+        "4 matrices, chain": lambda: Matrix4x4.chain(d, c, b, a),
+        "determinant (former)": lambda: submatrix_determinant(general),
+        "determinant": lambda: general.determinant(),
+        "inverse": lambda: general.inverse(),
+        "inverse, affine": lambda: rigid.inverse(),
+        "rigid_inverse": lambda: rigid.rigid_inverse(),
+    }
+    for name, function in cases.items():
+        print(f"{name:<24} {per_call(function):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
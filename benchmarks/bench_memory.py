@@ -0,0 +1,54 @@
+"""
+Measure the memory footprint and allocation time of the small value types.
+
+Run from the repository root with:
+    python -m benchmarks.bench_memory
+"""
+
+import timeit
+import tracemalloc
+
+from Mathy import Vector2, Vector3, Vector4, Quaternion
+from Mathy import Matrix2x2, Matrix3x3, Matrix4x4
+
+COUNT = 10000
+FACTORIES = {
+    "Vector2": lambda: Vector2(1.0, 2.0),
+    "Vector3": lambda: Vector3(1.0, 2.0, 3.0),
+    "Vector4": lambda: Vector4(1.0, 2.0, 3.0, 4.0),
+    "Quaternion": lambda: Quaternion(1.0, 0.0, 0.0, 0.0),
+    "Matrix2x2": lambda: Matrix2x2(1.0, 2.0, 3.0, 4.0),
+    "Matrix3x3": lambda: Matrix3x3(*[float(i) for i in range(9)]),
+    "Matrix4x4": lambda: Matrix4x4(*[float(i) for i in range(16)]),
+}
+
+
+def bytes_per_instance(factory):
+    """Return the memory allocated per live instance, in bytes."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory() for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "lineno"))
+    # Discount the list holding the instances
+    total -= instances.__sizeof__()
+    return total / COUNT
+
+
+def seconds_per_instance(factory):
+    """Return the best time to create one instance, in seconds."""
+    return min(timeit.repeat(factory, number=COUNT, repeat=5)) / COUNT
+
+
+def main():
+    """Print memory and allocation time for every type."""
+    print(f"{'type':<11} {'bytes':>8} {'alloc (ns)':>11}")
+    for name, factory in FACTORIES.items():
+        size = bytes_per_instance(factory)
+        time = seconds_per_instance(factory) * 1e9
+        print(f"{name:<11} {size:>8.0f} {time:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
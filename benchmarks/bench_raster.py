@@ -0,0 +1,74 @@
+"""
+Compare the rasterization modes of Renderer3D across triangle shapes.
+
+For each shape, print the bounding box area, the number of pixels tested
+by the scanline mode, the number of covered pixels and the time of each
+mode.
+
+Run from the repository root with:
+    python -m benchmarks.bench_raster
+"""
+
+import timeit
+
+from Mathy import Renderer3D, Triangle3D, Vector3
+
+WIDTH = 400
+HEIGHT = 300
+MODES = ("scalar", "vectorized", "scanline")
+# The scalar mode is much slower, it is only timed on small triangles
+SCALAR_MAX_AREA = 20000
+
+SHAPES = {
+    "small": Triangle3D(Vector3(10.2, 10.7, 0.5), Vector3(40.1, 12.3, 0.5),
+                        Vector3(22.8, 38.4, 0.5)),
+    "large": Triangle3D(Vector3(5.3, 5.1, 0.5), Vector3(390.7, 20.2, 0.5),
+                        Vector3(150.4, 290.6, 0.5)),
+    "thin diagonal": Triangle3D(Vector3(1.0, 1.0, 0.5),
+                                Vector3(398.0, 296.0, 0.5),
+                                Vector3(396.0, 298.0, 0.5)),
+    "thin horizontal": Triangle3D(Vector3(1.0, 100.2, 0.5),
+                                  Vector3(398.0, 101.7, 0.5),
+                                  Vector3(5.0, 103.1, 0.5)),
+    "sliver": Triangle3D(Vector3(3.0, 2.0, 0.5), Vector3(397.0, 150.0, 0.5),
+                         Vector3(4.0, 297.0, 0.5)),
+}
+
+
+def per_call(function, number):
+    """Return the best time of one call, in milliseconds."""
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3  # noqa: E501
+
+
+def main():
+    """Print the coverage cost of each mode for each triangle shape."""
+    renderer = Renderer3D(WIDTH, HEIGHT)
+    print(f"{'shape':<16} {'bbox':>7} {'spans':>7} {'covered':>7}"
+          + "".join(f" {mode:>11}" for mode in MODES))
+    for name, triangle in SHAPES.items():
+        points = triangle.get_vertices()
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
+        bbox = ((int(max(xs)) - int(min(xs)) + 1)
+                * (int(max(ys)) - int(min(ys)) + 1))
+        renderer.clear_z_buffer()
+        renderer.reset_stats()
+        covered = len(renderer.rasterize_triangle(triangle, mode="scanline"))
+        tested = renderer.stats["pixels_tested"]
+        times = []
+        for mode in MODES:
+            if mode == "scalar" and bbox > SCALAR_MAX_AREA:
+                times.append("-")
+                continue
+
+            def run():
+                renderer.clear_z_buffer()
+                renderer.rasterize_triangle(triangle, mode=mode)
+
+            times.append(f"{per_call(run, 3):.2f} ms")
+        print(f"{name:<16} {bbox:>7} {tested:>7} {covered:>7}"
+              + "".join(f" {t:>11}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
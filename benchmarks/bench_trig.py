@@ -0,0 +1,62 @@
+"""
+Compare the accuracy and speed of the trigonometry backends.
+
+Run from the repository root with:
+    python -m benchmarks.bench_trig
+"""
+
+import math
+import timeit
+
+import numpy as np
+
+from Mathy import math_utils
+
+BACKENDS = ("taylor", "horner", "math")
+SCALAR_CALLS = 20000
+ARRAY_SIZE = 100000
+
+
+def max_error(backend, angles):
+    """Return the largest sin/cos deviation from the math module."""
+    math_utils.set_trig_backend(backend)
+    error = 0.0
+    for x in angles:
+        error = max(error,
+                    abs(math_utils.sin(x) - math.sin(x)),
+                    abs(math_utils.cos(x) - math.cos(x)))
+    return error
+
+
+def time_scalar(backend, angles):
+    """Return the mean time of one sin call on Python floats, in seconds."""
+    math_utils.set_trig_backend(backend)
+    sin = math_utils.sin
+    total = timeit.timeit(lambda: [sin(x) for x in angles], number=1)
+    return total / len(angles)
+
+
+def time_array(backend, angles):
+    """Return the time of one sin call on a NumPy array, in seconds."""
+    math_utils.set_trig_backend(backend)
+    return min(timeit.repeat(lambda: math_utils.sin(angles),
+                             number=1, repeat=5))
+
+
+def main():
+    """Print an accuracy-vs-speed table for every backend."""
+    previous = math_utils.get_trig_backend()
+    angles = np.linspace(-4 * math.pi, 4 * math.pi, SCALAR_CALLS).tolist()
+    array = np.linspace(-4 * math.pi, 4 * math.pi, ARRAY_SIZE)
+    print(f"{'backend':<8} {'max error':>12} {'scalar (us)':>12} "
+          f"{'array of ' + str(ARRAY_SIZE) + ' (ms)':>22}")
+    for backend in BACKENDS:
+        error = max_error(backend, angles)
+        scalar = time_scalar(backend, angles) * 1e6
+        vector = time_array(backend, array) * 1e3
+        print(f"{backend:<8} {error:>12.2e} {scalar:>12.3f} {vector:>22.3f}")
+    math_utils.set_trig_backend(previous)
+
+
+if __name__ == "__main__":
+    main()
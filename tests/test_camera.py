@@ -0,0 +1,94 @@
+"""Tests for verifying proper Camera and Projection caching."""
+
+from Mathy import Camera, Projection, Vector3, HomogeneousVector4
+
+
+def make_scene():
+    """Return an example camera and projection."""
+    camera = Camera(Vector3(0, 0, 5), Vector3(0, 0, 0), Vector3(0, 1, 0))
+    projection = Projection(800, 600, 60, 0.1, 100)
+    return camera, projection
+
+
+def test_default_target():
+    """Test that a camera can be built without a target."""
+    camera = Camera()
+    assert camera.target == Vector3(0, 0, -1)
+
+
+def test_view_matrix_cache():
+    """Test that the view matrix is cached until the camera changes."""
+    camera, _ = make_scene()
+    view = camera.get_view_matrix()
+    assert camera.get_view_matrix() is view
+    version = camera.version
+    camera.position = Vector3(1, 0, 5)
+    assert camera.version > version
+    new_view = camera.get_view_matrix()
+    assert new_view is not view
+    assert new_view == Camera(Vector3(1, 0, 5), Vector3(0, 0, 0)).get_view_matrix()  # noqa: E501
+    # In-place changes need an explicit invalidation
+    camera.up.x = 1
+    camera.mark_dirty()
+    assert camera.get_view_matrix() is not new_view
+
+
+def test_projection_matrix_cache():
+    """Test that the projection matrix is cached until a parameter changes."""
+    _, projection = make_scene()
+    matrix = projection.get_projection_matrix()
+    assert projection.get_projection_matrix() is matrix
+    for name, value in (("fov", 90), ("near_plane", 1), ("far_plane", 50),
+                        ("width", 640), ("height", 480)):
+        setattr(projection, name, value)
+        assert projection.get_projection_matrix() is not matrix
+        matrix = projection.get_projection_matrix()
+    assert projection.aspect_ratio == 640 / 480
+    assert matrix == Projection(640, 480, 90, 1, 50).get_projection_matrix()
+
+
+def test_view_projection_matrix():
+    """Test get_view_projection_matrix() against separate products."""
+    camera, projection = make_scene()
+    combined = camera.get_view_projection_matrix(projection)
+    expected = projection.get_projection_matrix().prod(
+        camera.get_view_matrix())
+    assert combined == expected
+    assert camera.get_view_projection_matrix(projection) is combined
+    # Changing either side rebuilds the product
+    projection.fov = 45
+    assert camera.get_view_projection_matrix(projection) is not combined
+    combined = camera.get_view_projection_matrix(projection)
+    camera.look_at(Vector3(1, 1, 0))
+    assert camera.get_view_projection_matrix(projection) is not combined
+    # Vertices project the same way through the combined matrix
+    vertex = HomogeneousVector4(0.5, -0.25, 1)
+    separate = vertex.multiply_by_matrix(camera.get_view_matrix())
+    separate = separate.multiply_by_matrix(projection.get_projection_matrix())
+    assert vertex.multiply_by_matrix(
+        camera.get_view_projection_matrix(projection)) == separate
+
+
+def test_frustum_planes():
+    """Test the frustum planes extracted from the view-projection matrix."""
+    camera, projection = make_scene()
+    planes = camera.get_frustum_planes(projection)
+    assert camera.get_frustum_planes(projection) is planes
+    assert len(planes) == 6
+
+    def distances(x, y, z):
+        return [a * x + b * y + c * z + d for a, b, c, d in planes]
+
+    # The camera looks down -z from z = 5
+    assert all(d > 0 for d in distances(0, 0, 0))
+    near, far = distances(0, 0, 0)[4:]
+    assert abs(near - (5 - 0.1)) < 1e-9
+    assert abs(far - (100 - 5)) < 1e-9
+    assert distances(0, 0, 6)[4] < 0
+    assert distances(0, 0, -200)[5] < 0
+    for point in [(-100, 0, 0), (100, 0, 0)]:
+        assert min(distances(*point)[0:2]) < 0
+    for point in [(0, -100, 0), (0, 100, 0)]:
+        assert min(distances(*point)[2:4]) < 0
+    projection.far_plane = 300
+    assert camera.get_frustum_planes(projection) is not planes
@@ -0,0 +1,78 @@
+"""Tests for verifying proper clip-space clipping functionality."""
+
+import numpy as np
+from Mathy import Camera, Cube, Projection, Vector3
+from Mathy.clipping import clip_planes, clip_polygon, outcodes
+
+
+def test_outcodes():
+    """Test the outcodes of points against the clip planes."""
+    planes = clip_planes(2.0)
+    points = np.array([[0, 0, 0, 1],     # inside
+                       [0, 0, -2, 1],    # behind the near plane
+                       [0, 0, 2, 1],     # beyond the far plane
+                       [1.5, 0, 0, 1],   # off-screen, inside the guard band
+                       [3, -3, 0, 1]])   # outside the guard band
+    assert outcodes(points, planes).tolist() == [0, 1, 2, 0, 8 | 16]
+
+
+def test_clip_polygon_near_plane():
+    """Test clipping a triangle with one corner behind the near plane."""
+    planes = clip_planes()
+    points = [(0, 0, -3, 1), (0, 0, 1, 1), (1, 0, 1, 1)]
+    uvs = [(0, 0), (1, 0), (1, 1)]
+    clipped, clipped_uvs = clip_polygon(points, uvs, planes)
+    # One corner is cut off: the triangle becomes a quad
+    assert len(clipped) == len(clipped_uvs) == 4
+    for p in clipped:
+        assert p[2] + p[3] >= -1e-12
+    # The edges from the first corner are cut halfway (z from -3 to 1)
+    assert clipped[0] == (0, 0, -1, 1)
+    assert clipped_uvs[0] == (0.5, 0)
+    assert clipped[3] == (0.5, 0, -1, 1)
+    assert clipped_uvs[3] == (0.5, 0.5)
+
+
+def test_clip_polygon_corner_on_plane():
+    """Test that a corner lying on a clip plane is not duplicated."""
+    planes = clip_planes()
+    # The first corner is on the near plane (z = -w)
+    points = [(0, 0, -1, 1), (1, 0, -3, 1), (0, 1, 0.5, 1)]
+    uvs = [(0, 0), (1, 0), (0, 1)]
+    clipped, clipped_uvs = clip_polygon(points, uvs, planes, mask=1)
+    assert len(clipped) == len(clipped_uvs) == 3
+    assert len(set(clipped)) == 3
+    assert clipped[0] == points[0] and clipped[2] == points[2]
+    # Only the edge from the second corner to the third one is cut
+    assert np.allclose(clipped[1], (3 / 7, 4 / 7, -1, 1))
+    assert np.allclose(clipped_uvs[1], (3 / 7, 4 / 7))
+
+
+def test_clip_polygon_outside_and_mask():
+    """Test that masked planes are ignored and empty results."""
+    planes = clip_planes()
+    points = [(0, 0, -3, 1), (1, 0, -3, 1), (0, 1, -3, 1)]
+    uvs = [(0, 0)] * 3
+    assert clip_polygon(points, uvs, planes) == ([], [])
+    # Without the near plane, nothing is clipped
+    clipped, _ = clip_polygon(points, uvs, planes, mask=~1)
+    assert clipped == points
+
+
+def test_camera_inside_mesh_is_bounded():
+    """Test that triangles around the camera give bounded coordinates."""
+    cube = Cube()
+    cube.transform.homothetic_scale(10)
+    camera = Camera(Vector3(0, 0, 1), Vector3(0, 0, 0), Vector3(0, 1, 0))
+    projection = Projection(64, 48, 60, 0.1, 100)
+    renderer = cube.renderer
+    triangles = renderer.get_screen_triangles(cube, camera, projection)
+    assert triangles
+    assert renderer.stats["triangles_clipped"] > 0
+    for triangle in triangles:
+        for p in triangle.get_vertices():
+            assert -64 - 1e-6 <= p.x <= 2 * 64 + 1e-6
+            assert -48 - 1e-6 <= p.y <= 2 * 48 + 1e-6
+            assert -1 - 1e-9 <= p.z <= 1 + 1e-9
+        for u, v in triangle.uv:
+            assert -1e-9 <= u <= 1 + 1e-9 and -1e-9 <= v <= 1 + 1e-9
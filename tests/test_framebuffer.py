@@ -0,0 +1,95 @@
+"""Tests for verifying proper FrameBuffer functionality."""
+
+import numpy as np
+import pytest
+from Mathy import FrameBuffer
+
+
+def test_constructor():
+    """Test FrameBuffer constructor and plane layout."""
+    fb = FrameBuffer(4, 3)
+    assert fb.depth.shape == (3, 4) and fb.depth.dtype == np.float32
+    assert fb.color.shape == (3, 4, 3) and fb.color.dtype == np.uint8
+    assert fb.color.flags["C_CONTIGUOUS"]
+    assert np.all(np.isinf(fb.depth))
+    # Invalid types and sizes
+    with pytest.raises(TypeError):
+        FrameBuffer(4.0, 3)
+    with pytest.raises(ValueError):
+        FrameBuffer(0, 3)
+
+
+def test_set_pixel():
+    """Test set_pixel(), get_depth(), get_color() and depth_test()."""
+    fb = FrameBuffer(4, 3)
+    assert fb.depth_test(3, 1, 0.5)
+    fb.set_pixel(3, 1, 0.5, (10.4, 300, -2))
+    # Row-major storage, color rounded and clamped
+    assert fb.depth[1, 3] == 0.5
+    assert fb.get_depth(3, 1) == 0.5
+    assert fb.get_color(3, 1) == (10, 255, 0)
+    assert not fb.depth_test(3, 1, 0.7)
+    assert fb.depth_test(3, 1, 0.2)
+
+
+def test_write():
+    """Test write() method with and without depth test."""
+    fb = FrameBuffer(4, 3)
+    fb.set_pixel(0, 0, 0.5, (1, 1, 1))
+    written = fb.write([0, 1], [0, 2], [0.7, 0.7], [[9, 9, 9], [8, 8, 8]])
+    assert written.tolist() == [False, True]
+    assert fb.get_color(0, 0) == (1, 1, 1)
+    assert fb.get_color(1, 2) == (8, 8, 8)
+    written = fb.write([0], [0], [0.9], [[7, 7, 7]], depth_test=False)
+    assert written.tolist() == [True]
+    assert fb.get_depth(0, 0) == pytest.approx(0.9)
+
+
+def test_clear():
+    """Test that clear() resets the planes in place."""
+    fb = FrameBuffer(4, 3, clear_color=(255, 255, 255))
+    depth, color = fb.depth, fb.color
+    fb.set_pixel(2, 2, 0.1, (0, 0, 0))
+    fb.clear()
+    assert fb.depth is depth and fb.color is color
+    assert np.all(np.isinf(fb.depth))
+    assert np.all(fb.color == 255)
+
+
+def test_from_arrays():
+    """Test building a frame buffer on existing planes without copies."""
+    depth = np.zeros((3, 4), dtype=np.float32)
+    color = np.zeros((3, 4, 3), dtype=np.uint8)
+    framebuffer = FrameBuffer.from_arrays(depth, color, (1, 2, 3))
+    assert (framebuffer.width, framebuffer.height) == (4, 3)
+    framebuffer.clear()
+    assert np.all(depth == np.inf)
+    assert tuple(color[2, 3]) == (1, 2, 3)
+    with pytest.raises(TypeError):
+        FrameBuffer.from_arrays(depth.astype(np.float64), color)
+    with pytest.raises(ValueError):
+        FrameBuffer.from_arrays(depth, color[:2])
+
+
+def test_tile_depth_bounds():
+    """Test the per-tile depth bounds of the hierarchical buffer."""
+    fb = FrameBuffer(20, 10, tile_size=8)
+    low, high = fb.tile_depth_bounds()
+    assert low.shape == high.shape == (2, 3)
+    assert np.all(high == np.inf)
+    fb.write(np.arange(8), np.zeros(8, dtype=int), np.full(8, 0.5),
+             np.zeros((8, 3)))
+    fb.set_pixel(19, 9, 0.25, (0, 0, 0))
+    low, high = fb.tile_depth_bounds()
+    assert low[0, 0] == 0.5 and high[0, 0] == np.inf
+    assert low[1, 2] == 0.25 and high[1, 2] == np.inf
+    # Fill the last (partial) tile entirely
+    fb.depth[8:, 16:] = 0.75
+    fb.mark_depth_dirty(16, 19, 8, 9)
+    low, high = fb.tile_depth_bounds()
+    assert low[1, 2] == high[1, 2] == 0.75
+    assert fb.occluded_tiles(10, 19, 5, 9, 0.8).tolist() == [
+        [False, False], [False, True]]
+    assert not fb.occluded_tiles(16, 19, 8, 9, 0.75).any()
+    fb.clear()
+    assert np.all(fb.tile_depth_bounds()[1] == np.inf)
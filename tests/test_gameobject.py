@@ -0,0 +1,90 @@
+"""Tests for verifying proper GameObject functionality."""
+
+import pytest
+from Mathy import Airplane, Cube, GameObject, Mesh, Vector3
+
+
+def test_bounding_box():
+    """Test the local bounding box of the cube."""
+    cube = Cube()
+    low, high = cube.bounding_box
+    assert low == Vector3(-1, -1, -1)
+    assert high == Vector3(1, 1, 1)
+    assert cube.bounding_box is cube.bounding_box
+
+
+def test_bounding_sphere():
+    """Test that the bounding sphere contains every vertex."""
+    airplane = Airplane()
+    center, radius = airplane.bounding_sphere
+    for vertex in airplane.vertices:
+        assert vertex.subtract(center).norm <= radius + 1e-9
+
+
+def test_world_bounding_sphere():
+    """Test the world bounding sphere after translation and scaling."""
+    cube = Cube()
+    cube.transform.translate(1, 2, 3)
+    cube.transform.homothetic_scale(2)
+    center, radius = cube.get_world_bounding_sphere()
+    model = cube.transform.transform_matrix
+    expected = Vector3(0, 0, 0).homogenize().multiply_by_matrix(model)
+    assert center == Vector3(expected.x, expected.y, expected.z)
+    assert abs(radius - 2 * 3 ** 0.5) < 1e-9
+    assert cube.get_world_bounding_sphere() is not None
+
+
+def test_invalidate_bounds():
+    """Test that the bounds are recomputed after replacing the mesh."""
+    cube = Cube()
+    cube.get_world_bounding_sphere()
+    cube.mesh = Mesh(cube.vertices + (Vector3(0, 0, 5),), cube.indices)
+    assert cube.bounding_box[1] == Vector3(1, 1, 5)
+    center, _ = cube.get_world_bounding_sphere()
+    assert center == Vector3(0, 0, 2)
+    assert Cube().bounding_box[1] == Vector3(1, 1, 1)
+
+
+def test_scene_graph():
+    """Test that a child object follows its parent in world space."""
+    body = Cube()
+    wing = Cube()
+    body.add_child(wing)
+    assert wing.parent is body and body.children == [wing]
+    assert list(body.walk()) == [body, wing]
+    body.transform.translate(10, 0, 0)
+    wing.transform.translate(0, 2, 0)
+    center, _ = wing.get_world_bounding_sphere()
+    assert center == Vector3(10, 2, 0)
+    body.transform.translate(0, 0, 1)
+    center, _ = wing.get_world_bounding_sphere()
+    assert center == Vector3(10, 2, 1)
+    wing.set_parent(None)
+    assert body.children == [] and wing.parent is None
+    center, _ = wing.get_world_bounding_sphere()
+    assert center == Vector3(0, 2, 0)
+
+
+def test_constructor_geometry():
+    """Test the geometry arguments of the constructor."""
+    vertices = [Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(0, 1, 0)]
+    uv = [(0, 0), (1, 0), (0, 1)]
+    game_object = GameObject(vertices, [0, 1, 2], uv=uv)
+    assert game_object.uv == tuple(uv)
+    assert game_object.triangles[0].uv == tuple(uv)
+    with pytest.raises(ValueError):
+        GameObject()
+    with pytest.raises(ValueError):
+        GameObject(vertices, [0, 1, 2], mesh=game_object.mesh)
+
+
+def test_uv_setter():
+    """Test that setting the uv of a shared mesh only affects one object."""
+    cube, other = Cube(), Cube()
+    uv = [(0.5, 0.5)] * len(cube.vertices)
+    cube.uv = uv
+    assert cube.uv == tuple(uv)
+    assert cube.mesh is not other.mesh
+    assert other.mesh is Cube.shared_mesh()
+    assert cube.indices == other.indices
+    assert cube.renderer.triangles[0].uv == ((0.5, 0.5),) * 3
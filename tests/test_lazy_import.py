@@ -0,0 +1,37 @@
+"""Tests for verifying that Mathy imports its submodules lazily."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import Mathy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(statement):
+    """Return the heavy modules loaded after running statement."""
+    code = (f"{statement}\n"
+            "import sys\n"
+            "print(' '.join(m for m in ('pygame', 'numpy', 'Mathy.texture')"
+            " if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+
+def test_import_is_lazy():
+    """Test that importing geometry classes skips pygame, NumPy, textures."""
+    assert loaded_modules("import Mathy") == []
+    assert loaded_modules(
+        "from Mathy import Vector2, Vector3, Matrix4x4, Quaternion") == []
+
+
+def test_public_names():
+    """Test that every name in __all__ resolves and is listed by dir()."""
+    for name in Mathy.__all__:
+        assert getattr(Mathy, name) is not None
+        assert name in dir(Mathy)
+    with pytest.raises(AttributeError):
+        Mathy.does_not_exist
@@ -0,0 +1,52 @@
+"""Tests for verifying proper math_utils functionality."""
+
+import math
+
+import numpy as np
+import pytest
+from Mathy import math_utils, sin, cos, tan, pi
+
+BACKENDS = ("taylor", "horner", "math")
+angles = [-7.5, -pi, -1.0, 0, 0.25, pi / 4, pi / 2, 2.0, pi, 5.0, 12.0]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Select each trigonometry backend, then restore the previous one."""
+    previous = math_utils.get_trig_backend()
+    math_utils.set_trig_backend(request.param)
+    yield request.param
+    math_utils.set_trig_backend(previous)
+
+
+def test_sin_cos(backend):
+    """Test sin() and cos() against the math module."""
+    for x in angles:
+        assert abs(sin(x) - math.sin(x)) < 1e-12
+        assert abs(cos(x) - math.cos(x)) < 1e-12
+
+
+def test_tan(backend):
+    """Test tan() values and undefined angles."""
+    assert abs(tan(0.5) - math.tan(0.5)) < 1e-12
+    with pytest.raises(ValueError, match=r"Tangent is undefined.*"):
+        tan(pi / 2)
+    with pytest.raises(ValueError, match=r"Tangent is undefined.*"):
+        tan(np.array([0.0, pi / 2]))
+
+
+def test_arrays(backend):
+    """Test that sin(), cos() and tan() accept arrays."""
+    x = np.linspace(-10, 10, 101)
+    assert np.allclose(sin(x), np.sin(x), rtol=0, atol=1e-12)
+    assert np.allclose(cos(x), np.cos(x), rtol=0, atol=1e-12)
+    assert np.allclose(tan(x[:5]), np.tan(x[:5]), rtol=1e-12)
+    # Lists and 0-d arrays
+    assert np.allclose(sin([0, pi / 2]), [0, 1])
+    assert isinstance(cos(np.float32(0)), float)
+
+
+def test_set_trig_backend():
+    """Test set_trig_backend() with an unknown backend."""
+    with pytest.raises(ValueError):
+        math_utils.set_trig_backend("unknown")
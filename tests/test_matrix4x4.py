@@ -1,5 +1,6 @@
 """Tests for verifying proper Matrix functionality."""
 
+import numpy as np
 import pytest
 from Mathy import (
     Matrix4x4,
@@ -8,6 +9,9 @@ from Mathy import (
     RotationMatrix4x4_y,
     RotationMatrix4x4_z,
     HomothetyMatrix4x4,
+    AnisotropicMatrix4x4,
+    Vector4,
+    Vector4Array,
     deg_to_rad, sin, cos
 )
 
@@ -114,6 +118,45 @@ def test_prod():
         matrix1.prod("invalid")
 
 
+def test_prod_into():
+    """Test prod_into() and imul() methods."""
+    expected = matrix1.prod(matrix2)
+    out = Matrix4x4(*[0] * 16)
+    assert matrix1.prod_into(matrix2, out) is out
+    assert out == expected
+    # The output may alias an operand
+    m = Matrix4x4(*matrix1.flat)
+    assert m.imul(matrix2) is m
+    assert m == expected
+    m = Matrix4x4(*matrix2.flat)
+    matrix1.prod_into(m, m)
+    assert m == expected
+
+    # Invalid types
+    with pytest.raises(TypeError):
+        matrix1.prod_into(matrix2, "invalid")
+    with pytest.raises(TypeError):
+        matrix1.imul("invalid")
+
+
+def test_chain():
+    """Test chain() method."""
+    rot_x = RotationMatrix4x4_x(30)
+    rot_y = RotationMatrix4x4_y(45)
+    translation = TranslationMatrix4x4(1, 2, 3)
+    expected = translation.prod(rot_y).prod(rot_x)
+    assert Matrix4x4.chain(translation, rot_y, rot_x) == expected
+    # A single matrix is copied
+    single = Matrix4x4.chain(matrix1)
+    assert single == matrix1 and single.flat is not matrix1.flat
+
+    # Invalid inputs
+    with pytest.raises(ValueError):
+        Matrix4x4.chain()
+    with pytest.raises(TypeError):
+        Matrix4x4.chain(matrix1, "invalid")
+
+
 def test_determinant():
     """Test determinant() method."""
     assert abs(matrix1.determinant()) < 1e-9
@@ -211,3 +254,91 @@ def test_homothety_matrix():
         0, 0, 0, 1
     )
     assert h == expected
+
+
+def test_matrix_view():
+    """Test matrix[i][j] access on the flat storage."""
+    m = Matrix4x4(*range(16))
+    assert m.flat == list(range(16))
+    assert m.matrix[2][3] == 11
+    assert m.matrix[3] == [12, 13, 14, 15]
+    assert m.matrix == [[0, 1, 2, 3], [4, 5, 6, 7],
+                        [8, 9, 10, 11], [12, 13, 14, 15]]
+    # Writes go through to the matrix
+    m.matrix[0][1] = 42
+    assert m.flat[1] == 42
+    with pytest.raises(IndexError):
+        m.matrix[4]
+    with pytest.raises(IndexError):
+        m.matrix[0][4]
+
+
+def test_slots():
+    """Test that matrices do not carry a per-instance __dict__."""
+    assert not hasattr(matrix1, "__dict__")
+    assert not hasattr(TranslationMatrix4x4(1, 2, 3), "__dict__")
+    assert not hasattr(RotationMatrix4x4_x(30), "__dict__")
+
+
+def test_transform_points():
+    """Test transform_points() against Vector4.multiply_by_matrix()."""
+    m = TranslationMatrix4x4(1, 2, 3).prod(RotationMatrix4x4_z(30))
+    vectors = [Vector4(1, 0, 0, 1), Vector4(0, 2, -1, 1), Vector4(3, 1, 2, 0)]
+    buffer = Vector4Array.from_vectors(vectors)
+    expected = [v.multiply_by_matrix(m) for v in vectors]
+    # Vector4Array in, Vector4Array out
+    assert m.transform_points(buffer).to_vectors() == expected
+    # Plain arrays are accepted too
+    result = m.transform_points(buffer.data)
+    assert isinstance(result, np.ndarray)
+    assert Vector4Array(result).to_vectors() == expected
+    # Output buffer reuse, including in place
+    out = Vector4Array(np.zeros((3, 4)))
+    assert m.transform_points(buffer, out=out) is out
+    assert out.to_vectors() == expected
+    m.transform_points(buffer, out=buffer)
+    assert buffer.to_vectors() == expected
+
+    # Invalid shapes
+    with pytest.raises(ValueError):
+        m.transform_points(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        m.transform_points(np.zeros((3, 4)), out=np.zeros((2, 4)))
+
+
+def test_determinant_matches_numpy():
+    """Test determinant() on random matrices against NumPy."""
+    rng = np.random.default_rng(4)
+    for _ in range(20):
+        values = rng.uniform(-3, 3, 16)
+        m = Matrix4x4(*values.tolist())
+        assert abs(m.determinant() - np.linalg.det(values.reshape(4, 4))) \
+            < 1e-9
+
+
+def test_inverse():
+    """Test inverse() on general, affine and singular matrices."""
+    identity = HomothetyMatrix4x4(1)
+    rng = np.random.default_rng(5)
+    for _ in range(20):
+        m = Matrix4x4(*rng.uniform(-3, 3, 16).tolist())
+        assert not m.is_affine()
+        assert m.prod(m.inverse()) == identity
+        assert m.inverse().prod(m) == identity
+    affine = Matrix4x4.chain(TranslationMatrix4x4(1, -2, 3),
+                             RotationMatrix4x4_x(30),
+                             AnisotropicMatrix4x4(2, 0.5, -4))
+    assert affine.is_affine()
+    assert affine.prod(affine.inverse()) == identity
+    with pytest.raises(ValueError):
+        matrix1.inverse()
+    with pytest.raises(ValueError):
+        AnisotropicMatrix4x4(1, 0, 1).inverse()
+
+
+def test_rigid_inverse():
+    """Test rigid_inverse() against inverse() on a rotation and a move."""
+    rigid = Matrix4x4.chain(TranslationMatrix4x4(4, 5, -6),
+                            RotationMatrix4x4_y(70), RotationMatrix4x4_z(-20))
+    assert rigid.rigid_inverse() == rigid.inverse()
+    assert rigid.prod(rigid.rigid_inverse()) == HomothetyMatrix4x4(1)
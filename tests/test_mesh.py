@@ -0,0 +1,81 @@
+"""Tests for verifying proper Mesh functionality."""
+
+import numpy as np
+import pytest
+
+from Mathy import Airplane, Cube, GameObject, Mesh, Vector3
+
+
+def make_mesh():
+    """Return a textured mesh of two triangles."""
+    return Mesh([Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(0, 2, 0),
+                 Vector3(1, 2, -1)],
+                [0, 1, 2, 1, 3, 2],
+                uv=[(0, 0), (1, 0), (0, 1), (1, 1)], name="Quad")
+
+
+def test_mesh_data():
+    """Test the data derived once by the mesh."""
+    mesh = make_mesh()
+    assert mesh.indices == (0, 1, 2, 1, 3, 2)
+    assert mesh.index_buffer.tolist() == [[0, 1, 2], [1, 3, 2]]
+    assert len(mesh.vertex_buffer) == 4
+    assert len(mesh.corner_buffer) == 6
+    assert mesh.triangles[1].indices == {"pa": 1, "pb": 3, "pc": 2}
+    assert mesh.triangles[1].uv == ((1, 0), (1, 1), (0, 1))
+    low, high = mesh.bounding_box
+    assert low == Vector3(0, 0, -1) and high == Vector3(1, 2, 0)
+    center, radius = mesh.bounding_sphere
+    assert center == Vector3(0.5, 1, -0.5)
+    assert abs(radius ** 2 - 1.5) < 1e-9
+    assert repr(mesh) == "Mesh('Quad', 4 vertices, 2 triangles)"
+
+
+def test_mesh_is_immutable():
+    """Test that a mesh cannot be modified."""
+    mesh = make_mesh()
+    with pytest.raises(AttributeError):
+        mesh.indices = (0, 1, 2)
+    with pytest.raises(AttributeError):
+        del mesh.uv
+    with pytest.raises(ValueError):
+        mesh.vertex_buffer.data[0, 0] = 5
+    with pytest.raises(ValueError):
+        mesh.index_buffer[0, 0] = 3
+    with pytest.raises(ValueError):
+        Mesh([Vector3(0, 0, 0)], [], uv=[])
+
+
+def test_empty_mesh():
+    """Test a mesh without geometry."""
+    mesh = Mesh([], [])
+    assert mesh.bounding_box is None
+    assert mesh.index_buffer.shape == (0, 3)
+    with pytest.raises(ValueError):
+        GameObject(mesh=mesh).bounding_box
+
+
+def test_shared_mesh():
+    """Test that instances of a model share one mesh."""
+    first, second = Cube(), Cube()
+    assert first.mesh is second.mesh is Cube.shared_mesh()
+    assert first.triangles is second.triangles
+    assert first.renderer.vertex_buffer is second.renderer.vertex_buffer
+    assert Airplane().mesh is not first.mesh
+    assert first.uv == Cube.shared_mesh().uv
+    with pytest.raises(TypeError):
+        GameObject.shared_mesh()
+
+
+def test_editing_copies_the_mesh():
+    """Test that optimizing one instance leaves the shared mesh alone."""
+    airplane = Airplane()
+    shared = Airplane.shared_mesh()
+    airplane.weld_vertices()
+    assert airplane.mesh is not shared
+    assert len(shared.vertices) == 168
+    assert len(Airplane().vertices) == 168
+    assert np.array_equal(airplane.renderer.index_buffer,
+                          airplane.mesh.index_buffer)
+    with pytest.raises(TypeError):
+        airplane.mesh = None
@@ -0,0 +1,163 @@
+"""Tests for verifying proper mesh optimization functionality."""
+
+import random
+
+import pytest
+from Mathy import (Airplane, Cube, Vector3, average_cache_miss_ratio,
+                   optimize_vertex_cache, optimize_vertex_fetch, weld_vertices)
+
+
+def test_weld_vertices_tolerance():
+    """Test that only vertices within the tolerance are merged."""
+    vertices = [Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(0, 1, 0),
+                Vector3(1e-7, 0, 0), Vector3(1, 0, 1e-3), Vector3(0, 1, 0)]
+    welded, indices, uv, remap = weld_vertices(
+        vertices, [0, 1, 2, 3, 4, 5], tolerance=1e-6)
+    assert len(welded) == 4
+    assert remap == [0, 1, 2, 0, 3, 2]
+    assert indices == [0, 1, 2, 0, 3, 2]
+    assert uv is None
+
+
+def test_weld_vertices_across_grid_cells():
+    """Test that close vertices on both sides of a cell border merge."""
+    vertices = [Vector3(0.999999, 0, 0), Vector3(1.0000001, 0, 0)]
+    welded, _, _, remap = weld_vertices(vertices, [], tolerance=1e-5)
+    assert len(welded) == 1
+    assert remap == [0, 0]
+
+
+def test_weld_vertices_keeps_uv_seams():
+    """Test that vertices with different uv are not welded."""
+    vertices = [Vector3(0, 0, 0), Vector3(0, 0, 0), Vector3(0, 0, 0)]
+    uv = [(0, 0), (1, 0), (0, 0)]
+    welded, _, welded_uv, remap = weld_vertices(vertices, [], uv)
+    assert len(welded) == 2
+    assert welded_uv == [(0, 0), (1, 0)]
+    assert remap == [0, 1, 0]
+
+
+def test_weld_vertices_drops_collapsed_triangles():
+    """Test that triangles with merged corners are removed."""
+    vertices = [Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(1, 0, 0)]
+    _, indices, _, _ = weld_vertices(vertices, [0, 1, 2])
+    assert indices == []
+
+
+def test_weld_vertices_invalid_tolerance():
+    """Test weld_vertices() with a non-positive tolerance."""
+    with pytest.raises(ValueError):
+        weld_vertices([Vector3(0, 0, 0)], [], tolerance=0)
+
+
+def test_gameobject_weld_vertices():
+    """Test welding the airplane mesh and rebuilding its renderer data."""
+    airplane = Airplane()
+    before = [t.get_vertices() for t in airplane.triangles]
+    report = airplane.weld_vertices()
+    assert report["vertices_before"] == 168
+    assert report["vertices_after"] == len(airplane.vertices) < 168
+    assert report["triangles_after"] == report["triangles_before"]
+    assert 0 < report["reduction"] < 1
+    assert len(airplane.renderer.vertex_buffer) == len(airplane.vertices)
+    for corners, triangle in zip(before, airplane.triangles):
+        for a, b in zip(corners, triangle.get_vertices()):
+            assert a == b
+
+
+def test_cube_weld_vertices_unchanged():
+    """Test that a mesh without duplicates is left as is."""
+    cube = Cube()
+    indices = cube.indices
+    report = cube.weld_vertices()
+    assert report["reduction"] == 0
+    assert cube.indices == indices
+    assert len(cube.uv) == 8
+
+
+def grid_indices(n):
+    """Return the indices of an n by n grid of quads, in row order."""
+    indices = []
+    for y in range(n):
+        for x in range(n):
+            a = y * (n + 1) + x
+            indices += [a, a + 1, a + n + 1, a + 1, a + n + 2, a + n + 1]
+    return indices
+
+
+def triangle_set(indices):
+    """Return the triangles of an index list, up to rotation."""
+    triangles = []
+    for i in range(0, len(indices), 3):
+        a, b, c = indices[i:i + 3]
+        # Rotate so that the smallest index comes first (keeps winding)
+        k = (a, b, c).index(min(a, b, c))
+        triangles.append((a, b, c)[k:] + (a, b, c)[:k])
+    return sorted(triangles)
+
+
+def test_average_cache_miss_ratio():
+    """Test the ACMR on simple index lists."""
+    assert average_cache_miss_ratio([]) == 0
+    assert average_cache_miss_ratio([0, 1, 2, 3, 4, 5]) == 3
+    assert average_cache_miss_ratio([0, 1, 2, 1, 3, 2]) == 2
+    # A cache of 3 vertices evicts vertex 0 before it is used again
+    assert average_cache_miss_ratio([0, 1, 2, 3, 4, 5, 0, 1, 2],
+                                    cache_size=3) == 3
+
+
+def test_optimize_vertex_cache():
+    """Test that reordering lowers the ACMR and keeps every triangle."""
+    triangles = [grid_indices(20)[i:i + 3] for i in range(0, 2400, 3)]
+    random.Random(1).shuffle(triangles)
+    shuffled = [i for triangle in triangles for i in triangle]
+    optimized = optimize_vertex_cache(shuffled, 21 * 21)
+    assert triangle_set(optimized) == triangle_set(shuffled)
+    assert average_cache_miss_ratio(shuffled) > 2
+    assert average_cache_miss_ratio(optimized) < 0.8
+    with pytest.raises(ValueError):
+        optimize_vertex_cache(shuffled, 21 * 21, cache_size=3)
+
+
+def test_optimize_vertex_cache_restart():
+    """Test that disconnected parts are started by their score."""
+    # A fan of four triangles around vertex 0, then two lone triangles,
+    # whose vertices have the fewest triangles left and score highest
+    fan = [0, 1, 2, 0, 2, 3, 0, 3, 4, 0, 4, 5]
+    optimized = optimize_vertex_cache(fan + [6, 7, 8, 9, 10, 11], 12)
+    assert optimized[:6] == [6, 7, 8, 9, 10, 11]
+    assert triangle_set(optimized[6:]) == triangle_set(fan)
+
+
+def test_optimize_vertex_fetch():
+    """Test that vertices are renumbered in order of first use."""
+    vertices, indices, uv = optimize_vertex_fetch(
+        ["a", "b", "c", "d"], [3, 1, 0, 1, 3, 0], [0, 1, 2, 3])
+    assert vertices == ["d", "b", "a"]
+    assert indices == [0, 1, 2, 1, 0, 2]
+    assert uv == [3, 1, 0]
+
+
+def test_gameobject_optimize_vertex_cache():
+    """Test the reordering on a game object and its renderer buffers."""
+    airplane = Airplane()
+    airplane.weld_vertices()
+    def corners(game_object):
+        return sorted(tuple(sorted((p.x, p.y, p.z)
+                                   for p in t.get_vertices()))
+                      for t in game_object.triangles)
+    before = corners(airplane)
+    report = airplane.optimize_vertex_cache()
+    assert report["acmr_after"] < report["acmr_before"]
+    # The defaults measure the cache the reordering was tuned for
+    assert (airplane.renderer.average_cache_miss_ratio()
+            == report["acmr_after"])
+    assert airplane.renderer.index_buffer.ravel().tolist() \
+        == list(airplane.indices)
+    assert corners(airplane) == before
+    # Both ratios are measured with the cache size used for the reordering
+    indices = list(airplane.indices)
+    report = airplane.optimize_vertex_cache(cache_size=8)
+    assert report["acmr_before"] == average_cache_miss_ratio(indices, 8)
+    assert (airplane.renderer.average_cache_miss_ratio(8)
+            == report["acmr_after"])
@@ -1,5 +1,6 @@
 """Tests for verifying proper Quaternion functionality."""
 
+import numpy as np
 from Mathy import Matrix4x4, Quaternion, is_close, deg_to_rad, cos, sin
 import pytest
 
@@ -86,3 +87,83 @@ def test_quaternion_to_rotation_matrix():
     )
     actual = q.to_rotation_matrix()
     assert actual == expected
+
+
+def test_quaternion_from_rotation_matrix():
+    """Test from_rotation_matrix() on every branch of the conversion."""
+    for angles in [(0, 0, 0), (10, 20, 30), (180, 0, 0), (0, 179, 0),
+                   (0, 0, 180), (-120, 45, 170)]:
+        q = Quaternion.euler_to_quaternion(*(deg_to_rad(a) for a in angles))
+        back = Quaternion.from_rotation_matrix(q.to_rotation_matrix())
+        # q and -q are the same rotation
+        assert back == q or back == Quaternion(-q.w, -q.x, -q.y, -q.z)
+
+
+def test_power():
+    """Test power() with integer, fractional and negative exponents."""
+    q = Quaternion(1, 2, -1, 0.5)
+    assert q.power(3) == q.prod(q).prod(q)
+    assert q.power(1) == q
+    assert q.power(0) == Quaternion(1, 0, 0, 0)
+    assert q.power(-1) == q.inverse
+    half = q.power(0.5)
+    assert half.prod(half) == q
+    assert Quaternion(-2, 0, 0, 0).power(2) == Quaternion(4, 0, 0, 0)
+    # Negative real quaternions keep their norm with fractional exponents
+    root = Quaternion(-4, 0, 0, 0).power(0.5)
+    assert abs(root.norm - 2) < 1e-9
+    assert root.prod(root) == Quaternion(-4, 0, 0, 0)
+    assert abs(Quaternion(-1, 0, 0, 0).power(1 / 3).norm - 1) < 1e-9
+    assert Quaternion(0, 0, 0, 0).power(2) == Quaternion(0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        Quaternion(0, 0, 0, 0).power(-1)
+    with pytest.raises(TypeError):
+        q.power("2")
+
+
+def test_slerp():
+    """Test slerp() along a known arc, with shortest path and fallback."""
+    q1 = Quaternion(1, 0, 0, 0)
+    # 90 degrees around z
+    q2 = Quaternion(cos(deg_to_rad(45)), 0, 0, sin(deg_to_rad(45)))
+    assert q1.slerp(q2, 0) == q1
+    assert q1.slerp(q2, 1) == q2
+    # Constant speed: a third of the way is 30 degrees
+    third = Quaternion(cos(deg_to_rad(15)), 0, 0, sin(deg_to_rad(15)))
+    assert q1.slerp(q2, 1 / 3) == third
+    # -q2 is the same rotation: same result
+    assert q1.slerp(Quaternion(-q2.w, 0, 0, -q2.z), 1 / 3) == third
+    # Nearly parallel rotations use the normalized lerp
+    close = Quaternion(1, 0, 0, 1e-5)
+    result = q1.slerp(close, 0.5)
+    assert is_close(result.norm, 1)
+    assert abs(result.z - 0.5e-5) < 1e-9
+    with pytest.raises(ValueError):
+        q1.slerp(q2, 1.5)
+    with pytest.raises(TypeError):
+        q1.slerp("q2", 0.5)
+
+
+def test_slerp_many():
+    """Test slerp_many() against slerp() on each pair."""
+    rng = np.random.default_rng(7)
+    q1s = [Quaternion(*rng.normal(size=4).tolist()) for _ in range(50)]
+    q2s = [Quaternion(*rng.normal(size=4).tolist()) for _ in range(50)]
+    # Include a nearly parallel pair
+    q2s[0] = Quaternion(q1s[0].w, q1s[0].x, q1s[0].y, q1s[0].z + 1e-6)
+    ts = rng.uniform(0, 1, 50)
+    result = Quaternion.slerp_many(q1s, q2s, ts)
+    assert result.shape == (50, 4)
+    for row, q1, q2, t in zip(result.tolist(), q1s, q2s, ts.tolist()):
+        assert Quaternion(*row) == q1.slerp(q2, t)
+    arrays = Quaternion.slerp_many(
+        np.array([(q.w, q.x, q.y, q.z) for q in q1s]),
+        np.array([(q.w, q.x, q.y, q.z) for q in q2s]), 0.25)
+    for row, q1, q2 in zip(arrays.tolist(), q1s, q2s):
+        assert Quaternion(*row) == q1.slerp(q2, 0.25)
+    with pytest.raises(ValueError):
+        Quaternion.slerp_many(q1s, q2s[:3], 0.5)
+    with pytest.raises(ValueError):
+        Quaternion.slerp_many(q1s, q2s, 2)
+    with pytest.raises(ValueError):
+        Quaternion.slerp_many([Quaternion(0, 0, 0, 0)], [q1s[0]], 0.5)
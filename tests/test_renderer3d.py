@@ -0,0 +1,396 @@
+"""Tests for verifying proper Renderer3D functionality."""
+
+import numpy as np
+import pytest
+from Mathy import (Camera, Cube, Projection, Renderer3D,
+                   TranslationMatrix4x4, Triangle3D, Vector3, Vector4,
+                   Vector4Array)
+
+# Example screen-space triangles (x, y in pixels, z as depth)
+triangle1 = Triangle3D(Vector3(2.3, 1.7, 0.5),
+                       Vector3(30.2, 4.1, 0.2),
+                       Vector3(12.8, 25.6, 0.9))
+triangle2 = Triangle3D(Vector3(0.0, 0.0, 0.4),
+                       Vector3(31.0, 0.0, 0.4),
+                       Vector3(0.0, 31.0, 0.4))
+# Long thin diagonal triangle
+triangle3 = Triangle3D(Vector3(1.0, 1.0, 0.1),
+                       Vector3(31.0, 30.0, 0.1),
+                       Vector3(30.0, 31.0, 0.8))
+# Pixel-aligned corners, with pixel centers on the edges
+triangle4 = Triangle3D(Vector3(2.5, 2.5, 0.3),
+                       Vector3(20.5, 2.5, 0.3),
+                       Vector3(2.5, 20.5, 0.6))
+
+
+def make_renderer():
+    """Return a small renderer with cleared buffers."""
+    renderer = Renderer3D(32, 32)
+    renderer.clear()
+    return renderer
+
+
+def make_view():
+    """Return a camera looking at the origin and a small projection."""
+    camera = Camera(Vector3(0, 0, 5), Vector3(0, 0, 0), Vector3(0, 1, 0))
+    projection = Projection(64, 48, 60, 0.1, 100)
+    return camera, projection
+
+
+def make_scene():
+    """Return a rotated cube, a camera and a projection."""
+    cube = Cube()
+    cube.transform.rotate(10, 20, 30)
+    return (cube, *make_view())
+
+
+def make_wide_view():
+    """Return a camera and a full-size projection for frustum tests."""
+    camera = Camera(Vector3(0, 0, 6), Vector3(0, 0, 0), Vector3(0, 1, 0))
+    projection = Projection(800, 600, 60, 0.1, 100)
+    return camera, projection
+
+
+def test_rasterize_triangle_modes():
+    """Test that every rasterization mode covers the same pixels."""
+    renderers = {mode: make_renderer()
+                 for mode in ("scalar", "vectorized", "scanline")}
+    for triangle in (triangle1, triangle2, triangle3, triangle4):
+        pixels = {mode: renderer.rasterize_triangle(triangle, mode=mode)
+                  for mode, renderer in renderers.items()}
+        assert pixels["scalar"]
+        # The array modes evaluate the same planes on the same pixels
+        assert pixels["vectorized"] == pixels["scanline"]
+        # The scalar mode steps them with additions: same coverage, and
+        # colors equal up to the rounding of the last bit
+        assert ([p[:2] for p in pixels["scalar"]]
+                == [p[:2] for p in pixels["vectorized"]])
+    scalar = renderers["scalar"].framebuffer
+    for mode in ("vectorized", "scanline"):
+        other = renderers[mode].framebuffer
+        assert np.allclose(scalar.depth, other.depth)
+        assert np.abs(scalar.color.astype(int) - other.color).max() <= 1
+
+
+def test_rasterize_scanline_clamped():
+    """Test that the scanline mode clamps triangles to the screen."""
+    big = Triangle3D(Vector3(-40.0, -10.0, 0.5), Vector3(70.0, 5.0, 0.5),
+                     Vector3(10.0, 80.0, 0.5))
+    vectorized = make_renderer().rasterize_triangle(big, mode="vectorized")
+    scanline = make_renderer().rasterize_triangle(big, mode="scanline")
+    assert vectorized == scanline
+    off_screen = Triangle3D(Vector3(40.0, 1.0, 0.5), Vector3(50.0, 1.0, 0.5),
+                            Vector3(45.0, 9.0, 0.5))
+    assert make_renderer().rasterize_triangle(off_screen,
+                                              mode="scanline") == []
+
+
+def test_z_buffer_views():
+    """Test that z_buffer and framebuffer_color are [x][y] views."""
+    renderer = make_renderer()
+    renderer.framebuffer.set_pixel(5, 2, 0.25, (1, 2, 3))
+    assert renderer.z_buffer[5][2] == 0.25
+    assert tuple(renderer.framebuffer_color[5][2]) == (1, 2, 3)
+    assert renderer.is_in_front_of_camera(0.1, 5, 2)
+    assert not renderer.is_in_front_of_camera(0.5, 5, 2)
+
+
+def test_rasterize_triangle_invalid_mode():
+    """Test rasterize_triangle() with an unknown mode."""
+    with pytest.raises(ValueError):
+        make_renderer().rasterize_triangle(triangle1, mode="unknown")
+
+
+def test_rasterize_degenerate_triangle():
+    """Test that collinear points are rejected by both modes."""
+    flat = Triangle3D(Vector3(1, 1, 0), Vector3(5, 5, 0), Vector3(9, 9, 0))
+    for mode in ("scalar", "vectorized", "scanline"):
+        with pytest.raises(ValueError, match=r"Degenerate triangle.*"):
+            make_renderer().rasterize_triangle(flat, mode=mode)
+
+
+def test_convert_local_to_world():
+    """Test convert_local_to_world() against per-vertex products."""
+    cube = Cube()
+    cube.transform.rotate(10, 20, 30)
+    cube.transform.translate(1, 2, 3)
+    model = cube.transform.transform_matrix
+    world = cube.renderer.convert_local_to_world(cube)
+    assert len(world) == len(cube.triangles)
+    for local, triangle in zip(cube.triangles, world):
+        assert triangle.pa == local.pa.multiply_by_matrix(model)
+        assert triangle.pb == local.pb.multiply_by_matrix(model)
+        assert triangle.pc == local.pc.multiply_by_matrix(model)
+        assert triangle.indices == local.indices
+
+
+def test_get_screen_triangles_matches_project_triangle():
+    """Test the indexed pipeline against per-corner projection."""
+    cube, camera, projection = make_scene()
+    renderer = cube.renderer
+    screen = renderer.get_screen_triangles(cube, camera, projection)
+    world = renderer.convert_local_to_world(cube)
+    assert len(screen) == len(world)
+    for indexed, triangle in zip(screen, world):
+        expected = renderer.project_triangle(triangle, camera, projection)
+        for a, b in zip(indexed.get_vertices(), expected):
+            assert a == b
+        assert indexed.indices == triangle.indices
+
+
+def test_process_vertices_post_transform_cache():
+    """Test that unique vertices are transformed once per change."""
+    cube, camera, projection = make_scene()
+    renderer = cube.renderer
+    renderer.get_screen_triangles(cube, camera, projection)
+    renderer.get_screen_triangles(cube, camera, projection)
+    assert renderer.stats["vertices_transformed"] == len(cube.vertices)
+    assert renderer.stats["post_transform_hits"] == 1
+    cube.transform.translate(0, 1, 0)
+    renderer.process_vertices(cube, camera, projection)
+    camera.position = Vector3(0, 0, 6)
+    renderer.process_vertices(cube, camera, projection)
+    assert renderer.stats["vertices_transformed"] == 3 * len(cube.vertices)
+    renderer.reset_stats()
+    assert renderer.stats["vertices_transformed"] == 0
+
+
+def test_process_vertices_follows_parent():
+    """Test that moving a parent invalidates its children's vertices."""
+    cube, camera, projection = make_scene()
+    parent = Cube()
+    cube.set_parent(parent)
+    before = cube.renderer.process_vertices(
+        cube, camera, projection).data.copy()
+    parent.transform.translate(0, 1, 0)
+    after = cube.renderer.process_vertices(cube, camera, projection).data
+    assert cube.renderer.stats["post_transform_hits"] == 0
+    assert (after[:, 1] != before[:, 1]).all()
+
+
+def test_clip_to_screen():
+    """Test Projection.clip_to_screen() against get_screen_coordinates()."""
+    _, projection = make_view()
+    points = [Vector4(1, 2, 3, 2), Vector4(-1, 0.5, 0.2, 1),
+              Vector4(1, 1, 1, 0)]
+    screen = projection.clip_to_screen(Vector4Array.from_vectors(points))
+    for row, point in zip(screen.data, points):
+        expected = projection.get_screen_coordinates(point)
+        assert np.allclose(row[:3], [expected.x, expected.y, expected.z])
+
+
+def test_cull_faces_winding():
+    """Test back and front face culling with both windings."""
+    renderer = Renderer3D(32, 32)
+    # Counter-clockwise as seen by the camera (y up), then clockwise
+    renderer.index_buffer = np.array([[0, 1, 2], [0, 2, 1]], dtype=np.intp)
+    screen = Vector4Array([[0, 10, 0, 1], [10, 10, 0, 1], [0, 0, 0, 1]])
+    assert renderer.cull_faces(screen).tolist() == [0, 1]
+    renderer.cull_mode = "back"
+    assert renderer.cull_faces(screen).tolist() == [0]
+    renderer.front_face = "cw"
+    assert renderer.cull_faces(screen).tolist() == [1]
+    renderer.cull_mode = "front"
+    assert renderer.cull_faces(screen).tolist() == [0]
+    assert renderer.stats["triangles_culled"] == 3
+    renderer.cull_mode = "sideways"
+    with pytest.raises(ValueError):
+        renderer.cull_faces(screen)
+
+
+def test_clip_triangle_culling_matches_cull_faces():
+    """Test the per-polygon culling of clip_triangle against cull_faces."""
+    cube, camera, projection = make_scene()
+    renderer = cube.renderer
+    renderer.cull_mode = "back"
+    screen = renderer.process_vertices(cube, camera, projection)
+    mvp = camera.get_view_projection_matrix(projection).prod(
+        cube.transform.world_matrix)
+    clip = mvp.transform_points(renderer.vertex_buffer).data.tolist()
+    kept = set(renderer.cull_faces(screen).tolist())
+    for t, corners in enumerate(renderer.index_buffer.tolist()):
+        pieces = renderer.clip_triangle([clip[i] for i in corners],
+                                        [(0, 0)] * 3, projection, mask=0)
+        assert bool(pieces) == (t in kept)
+    assert 0 < len(kept) < len(renderer.index_buffer)
+
+
+def test_clip_triangle_corner_on_near_plane():
+    """Test clipping and culling a triangle with a corner on the near plane."""
+    _, projection = make_view()
+    points = [(0, 0, -1, 1), (1, 0, -3, 1), (0, 1, 0.5, 1)]
+    uvs = [(0, 0), (1, 0), (0, 1)]
+    renderer = Renderer3D(64, 48)
+    pieces = renderer.clip_triangle(points, uvs, projection, mask=1)
+    # No zero-area piece is left next to the corner on the plane
+    assert len(pieces) == 1
+    kept = 0
+    for cull_mode in ("back", "front"):
+        renderer.cull_mode = cull_mode
+        kept += len(renderer.clip_triangle(points, uvs, projection, mask=1))
+    # The polygon is either front or back facing
+    assert kept == 1
+    assert renderer.stats["triangles_culled"] == 1
+
+
+def test_get_screen_triangles_culled():
+    """Test that culled triangles are left out of the screen triangles."""
+    cube, camera, projection = make_scene()
+    renderer = cube.renderer
+    everything = renderer.get_screen_triangles(cube, camera, projection)
+    renderer.cull_mode = "back"
+    front = renderer.get_screen_triangles(cube, camera, projection)
+    renderer.cull_mode = "front"
+    back = renderer.get_screen_triangles(cube, camera, projection)
+    assert len(front) + len(back) == len(everything)
+    assert renderer.stats["triangles_culled"] == len(everything)
+
+
+def test_frustum_culling():
+    """Test that objects outside the frustum skip vertex processing."""
+    camera, projection = make_wide_view()
+    for position, visible in [((0, 0, 0), True), ((4, 0, 0), True),
+                              ((0, 0, -95), True), ((0, 0, 10), False),
+                              ((20, 0, 0), False), ((0, 12, 0), False),
+                              ((0, 0, -120), False)]:
+        cube = Cube()
+        cube.transform.translate(*position)
+        renderer = cube.renderer
+        assert renderer.is_in_frustum(cube, camera, projection) == visible
+        triangles = renderer.get_screen_triangles(cube, camera, projection)
+        assert bool(triangles) == visible
+        assert renderer.stats["objects_culled"] == (0 if visible else 1)
+        assert renderer.stats["vertices_transformed"] == (8 if visible else 0)
+
+
+def test_frustum_culling_box_refinement():
+    """Test that the box test rejects objects the sphere test keeps."""
+    camera, projection = make_wide_view()
+    cube = Cube()
+    # Just behind the camera: the sphere crosses the near plane,
+    # the box does not
+    cube.transform.translate(0, 0, 7.2)
+    center, radius = cube.get_world_bounding_sphere()
+    near = camera.get_frustum_planes(projection)[4]
+    distance = sum(n * c for n, c in zip(near, (center.x, center.y,
+                                                center.z, 1)))
+    assert -radius < distance < 0
+    assert not cube.renderer.is_in_frustum(cube, camera, projection)
+    # Without frustum culling, the vertices are transformed for nothing:
+    # every triangle is behind the near plane
+    cube.renderer.frustum_culling = False
+    assert cube.renderer.get_screen_triangles(
+        cube, camera, projection) == []
+    assert cube.renderer.stats["vertices_transformed"] == 8
+    assert cube.renderer.stats["triangles_outside"] == 12
+
+
+def test_rasterize_scanline_tests_fewer_pixels():
+    """Test that the scanline mode skips the empty part of the box."""
+    vectorized = make_renderer()
+    scanline = make_renderer()
+    vectorized.rasterize_triangle(triangle3, mode="vectorized")
+    covered = len(scanline.rasterize_triangle(triangle3, mode="scanline"))
+    assert vectorized.stats["pixels_tested"] == 31 * 31
+    assert covered <= scanline.stats["pixels_tested"] < 31 * 31 / 4
+
+
+def test_hierarchical_z_rejects_hidden_triangles():
+    """Test that hidden triangles and tiles are skipped."""
+    near = Triangle3D(Vector3(-5.0, -5.0, 0.1), Vector3(40.0, -5.0, 0.1),
+                      Vector3(-5.0, 40.0, 0.1))
+    far = Triangle3D(Vector3(2.0, 3.0, 0.6), Vector3(12.0, 4.0, 0.7),
+                     Vector3(4.0, 14.0, 0.9))
+    # Partly hidden: the near triangle covers the top left of the screen
+    half = Triangle3D(Vector3(1.0, 1.0, 0.5), Vector3(31.0, 1.0, 0.5),
+                      Vector3(31.0, 31.0, 0.5))
+    for mode in ("scalar", "vectorized", "scanline"):
+        renderer = make_renderer()
+        renderer.hierarchical_z = True
+        reference = make_renderer()
+        for r in (renderer, reference):
+            r.rasterize_triangle(near, mode=mode)
+        assert renderer.rasterize_triangle(far, mode=mode) == []
+        assert renderer.stats["triangles_occluded"] == 1
+        skipped = renderer.stats["fragments_skipped"]
+        assert skipped > 0
+        reference.rasterize_triangle(far, mode=mode)
+        pixels = renderer.rasterize_triangle(half, mode=mode)
+        reference.rasterize_triangle(half, mode=mode)
+        assert pixels
+        assert renderer.stats["fragments_skipped"] > skipped
+        assert np.array_equal(renderer.framebuffer.depth,
+                              reference.framebuffer.depth)
+        assert np.array_equal(renderer.framebuffer.color,
+                              reference.framebuffer.color)
+
+
+def test_hierarchical_z_returned_pixels():
+    """Test which pixels are returned with and without hierarchical_z."""
+    near = Triangle3D(Vector3(0.0, 0.0, 0.1), Vector3(32.0, 0.0, 0.1),
+                      Vector3(0.0, 32.0, 0.1))
+    far = Triangle3D(Vector3(1.0, 1.0, 0.8), Vector3(15.0, 1.0, 0.8),
+                     Vector3(1.0, 15.0, 0.8))
+    renderer = make_renderer()
+    assert not renderer.hierarchical_z
+    covered = [p[:2] for p in make_renderer().rasterize_triangle(far)]
+    renderer.rasterize_triangle(near)
+    # By default, hidden pixels are returned: they are covered, even
+    # though they fail the depth test
+    assert [p[:2] for p in renderer.rasterize_triangle(far)] == covered
+    renderer.hierarchical_z = True
+    assert renderer.rasterize_triangle(far) == []
+    assert renderer.stats["triangles_occluded"] == 1
+
+
+def test_get_instance_triangles_matches_game_objects():
+    """Test that instancing gives the triangles of separate objects."""
+    camera, projection = make_view()
+    cubes = []
+    for position, angles in [((0, 0, 0), (10, 20, 30)),
+                             ((2, -1, -3), (0, 45, 0)),
+                             ((-2, 1, 4.5), (30, 0, 60))]:
+        cube = Cube()
+        cube.transform.translate(*position)
+        cube.transform.rotate(*angles)
+        cubes.append(cube)
+    expected = [t for cube in cubes
+                for t in cube.renderer.get_screen_triangles(
+                    cube, camera, projection)]
+    renderer = Renderer3D()
+    for matrices in ([c.transform.world_matrix for c in cubes],
+                     np.array([c.transform.world_matrix.flat
+                               for c in cubes])):
+        triangles = renderer.get_instance_triangles(
+            Cube.shared_mesh(), matrices, camera, projection)
+        assert len(triangles) == len(expected)
+        for triangle, reference in zip(triangles, expected):
+            assert triangle.get_vertices() == reference.get_vertices()
+            assert triangle.indices == reference.indices
+            # Clipped corners are interpolated from a differently rounded
+            # clip space product
+            assert np.allclose(triangle.uv, reference.uv)
+    assert renderer.stats["vertices_transformed"] == 2 * 3 * 8
+
+
+def test_instance_frustum_culling():
+    """Test that instances outside the frustum are rejected at once."""
+    camera, projection = make_view()
+    renderer = Renderer3D()
+    renderer.cull_mode = "back"
+    matrices = [TranslationMatrix4x4(0, 0, 0),
+                TranslationMatrix4x4(0, 0, 50),
+                TranslationMatrix4x4(500, 0, 0)]
+    mesh = Cube.shared_mesh()
+    visible = renderer.cull_instances(mesh, matrices, camera, projection)
+    assert visible.tolist() == [0]
+    assert renderer.stats["objects_culled"] == 2
+    triangles = renderer.get_instance_triangles(mesh, matrices, camera,
+                                                projection)
+    cube = Cube()
+    cube.renderer.cull_mode = "back"
+    assert len(triangles) == len(cube.renderer.get_screen_triangles(
+        cube, camera, projection)) < 12
+    assert renderer.stats["vertices_transformed"] == 8
+    assert renderer.get_instance_triangles(mesh, [], camera,
+                                           projection) == []
@@ -0,0 +1,46 @@
+"""Tests for verifying proper Texture functionality."""
+
+import numpy as np
+import pytest
+from Mathy import Texture, gengar_tex
+
+
+def test_gengar_tex():
+    """Test the shipped texture's size and row-major layout."""
+    assert gengar_tex.width == 150 and gengar_tex.height == 150
+    assert len(gengar_tex) == 150 * 150
+    assert gengar_tex.pixels.shape == (150, 150, 3)
+    assert gengar_tex.pixels.dtype == np.uint8
+    # Flat indexing matches the former list of tuples
+    assert gengar_tex[0] == (99, 91, 85)
+    assert gengar_tex[1] == (103, 94, 87)
+    assert gengar_tex[150 * 2 + 3] == gengar_tex.get_pixel(3, 2)
+
+
+def test_lazy_loading(tmp_path):
+    """Test that pixels are only read from disk on first access."""
+    path = tmp_path / "texture.npy"
+    np.save(path, np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3))
+    texture = Texture(str(path))
+    assert texture._pixels is None
+    assert (texture.width, texture.height) == (3, 2)
+    assert texture.get_pixel(2, 1) == (15, 16, 17)
+
+
+def test_invalid_file(tmp_path):
+    """Test that arrays which are not RGB images are rejected."""
+    path = tmp_path / "texture.npy"
+    np.save(path, np.zeros((2, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        Texture(str(path)).pixels
+
+
+def test_from_pixels():
+    """Test from_pixels() and sample() methods."""
+    texture = Texture.from_pixels(
+        [(0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 3)], 2, 2)
+    assert texture[3] == (3, 3, 3)
+    assert texture.sample(0, 0) == (0, 0, 0)
+    assert texture.sample(1, 0) == (1, 1, 1)
+    # Coordinates are clamped to [0, 1]
+    assert texture.sample(2, 5) == (3, 3, 3)
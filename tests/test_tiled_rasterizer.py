@@ -0,0 +1,95 @@
+"""Tests for verifying proper TiledRasterizer functionality."""
+
+import random
+
+import numpy as np
+import pytest
+from Mathy import Renderer3D, TiledRasterizer, Triangle3D, Vector3
+
+WIDTH = 96
+HEIGHT = 72
+
+
+def random_triangles(count=40, seed=1):
+    """Return overlapping screen-space triangles, some crossing edges."""
+    rng = random.Random(seed)
+    triangles = []
+    for _ in range(count):
+        cx = rng.uniform(-10, WIDTH + 10)
+        cy = rng.uniform(-10, HEIGHT + 10)
+        triangles.append(Triangle3D(*[
+            Vector3(cx + rng.uniform(-30, 30), cy + rng.uniform(-30, 30),
+                    rng.random())
+            for _ in range(3)]))
+    return triangles
+
+
+def reference(triangles):
+    """Rasterize the triangles in order on a single-threaded renderer."""
+    renderer = Renderer3D(WIDTH, HEIGHT)
+    covered = 0
+    for triangle in triangles:
+        covered += len(renderer.rasterize_triangle(triangle,
+                                                   mode="vectorized"))
+    return renderer.framebuffer, covered
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_tiled_matches_single_threaded(workers):
+    """Test that tiled rendering matches rasterize_triangle."""
+    triangles = random_triangles()
+    expected, covered = reference(triangles)
+    with TiledRasterizer(WIDTH, HEIGHT, tile_size=32,
+                         workers=workers) as tiled:
+        assert tiled.rasterize(triangles) == covered
+        assert np.array_equal(tiled.framebuffer.depth, expected.depth)
+        assert np.array_equal(tiled.framebuffer.color, expected.color)
+        # Clearing and drawing again gives the same frame
+        tiled.clear()
+        assert np.all(tiled.framebuffer.depth == np.inf)
+        tiled.rasterize(triangles)
+        assert np.array_equal(tiled.framebuffer.color, expected.color)
+
+
+def test_tiled_matches_default_mode():
+    """Test tiled rendering against rasterize_triangle's default mode."""
+    triangles = random_triangles()
+    renderer = Renderer3D(WIDTH, HEIGHT)
+    covered = sum(len(renderer.rasterize_triangle(triangle))
+                  for triangle in triangles)
+    expected = renderer.framebuffer
+    with TiledRasterizer(WIDTH, HEIGHT, tile_size=32, workers=0) as tiled:
+        assert tiled.rasterize(triangles) == covered
+        depth = tiled.framebuffer.depth
+        assert np.array_equal(np.isinf(depth), np.isinf(expected.depth))
+        assert np.allclose(depth[np.isfinite(depth)],
+                           expected.depth[np.isfinite(expected.depth)])
+        assert np.abs(tiled.framebuffer.color.astype(int)
+                      - expected.color).max() <= 1
+
+
+def test_bin_triangles():
+    """Test that triangles are binned into the tiles they overlap."""
+    with TiledRasterizer(WIDTH, HEIGHT, tile_size=32, workers=0) as tiled:
+        small = Triangle3D(Vector3(1, 1, 0), Vector3(10, 1, 0),
+                           Vector3(1, 10, 0))
+        wide = Triangle3D(Vector3(5, 40, 0), Vector3(90, 45, 0),
+                          Vector3(50, 60, 0))
+        outside = Triangle3D(Vector3(200, 1, 0), Vector3(210, 1, 0),
+                             Vector3(200, 9, 0))
+        bins = tiled.bin_triangles([small, wide, outside])
+        assert sorted(bins) == [(0, 0), (0, 1), (1, 1), (2, 1)]
+        assert len(bins[(0, 0)]) == 1
+        assert tiled.tile_rectangle(2, 2) == (64, 95, 64, 71)
+        with pytest.raises(ValueError):
+            tiled.bin_triangles([Triangle3D(Vector3(0, 0, 0),
+                                            Vector3(5, 5, 0),
+                                            Vector3(9, 9, 0))])
+
+
+def test_invalid_parameters():
+    """Test the errors raised by TiledRasterizer."""
+    with pytest.raises(ValueError):
+        TiledRasterizer(WIDTH, HEIGHT, workers=0, mode="scalar")
+    with pytest.raises(ValueError):
+        TiledRasterizer(WIDTH, HEIGHT, tile_size=0, workers=0)
@@ -0,0 +1,224 @@
+"""Tests for verifying proper Transform functionality."""
+
+import pytest
+
+from Mathy import (AnisotropicMatrix4x4, Camera, Cube, HomothetyMatrix4x4,
+                   Matrix4x4, Projection, Quaternion, RotationMatrix4x4_x,
+                   RotationMatrix4x4_y, RotationMatrix4x4_z, Transform,
+                   TranslationMatrix4x4, Vector3)
+
+
+def test_identity():
+    """Test that a new transform has an identity model matrix."""
+    transform = Transform()
+    assert transform.transform_matrix == HomothetyMatrix4x4(1)
+    assert transform.position == Vector3(0, 0, 0)
+    assert transform.scale == Vector3(1, 1, 1)
+
+
+def test_operations_match_matrix_products():
+    """Test that the decomposed operations compose like matrices."""
+    transform = Transform()
+    transform.translate(1, 2, 3)
+    transform.rotate(10, 20, 30)
+    transform.homothetic_scale(2)
+    transform.translate(-1, 0.5, 4)
+    transform.rotate(0, 45, -15)
+    transform.anisotropic_scale(1, 3, 0.5)
+    expected = Matrix4x4.chain(
+        TranslationMatrix4x4(1, 2, 3),
+        RotationMatrix4x4_z(30), RotationMatrix4x4_y(20),
+        RotationMatrix4x4_x(10),
+        HomothetyMatrix4x4(2),
+        TranslationMatrix4x4(-1, 0.5, 4),
+        RotationMatrix4x4_z(-15), RotationMatrix4x4_y(45),
+        RotationMatrix4x4_x(0),
+        AnisotropicMatrix4x4(1, 3, 0.5))
+    assert transform.transform_matrix == expected
+
+
+def test_rotate_quaternion():
+    """Test rotating with a quaternion."""
+    transform = Transform()
+    q = Quaternion(1, 0, 0, 1)
+    transform.rotate_quaternion(q)
+    assert transform.transform_matrix == q.to_rotation_matrix()
+    with pytest.raises(TypeError):
+        transform.rotate_quaternion(None)
+
+
+def test_absolute_setters():
+    """Test setting position, rotation and scale directly."""
+    transform = Transform()
+    transform.rotate(0, 0, 90)
+    transform.position = Vector3(4, 5, 6)
+    transform.rotation = Quaternion(2, 0, 0, 0)
+    transform.scale = Vector3(1, 2, 3)
+    assert transform.rotation == Quaternion(1, 0, 0, 0)
+    assert transform.transform_matrix == Matrix4x4(
+        1, 0, 0, 4,
+        0, 2, 0, 5,
+        0, 0, 3, 6,
+        0, 0, 0, 1)
+
+
+def test_matrix_is_cached_until_dirty():
+    """Test that the model matrix is only rebuilt after a change."""
+    transform = Transform()
+    version = transform.version
+    model = transform.transform_matrix
+    assert transform.transform_matrix is model
+    assert transform.version == version
+    transform.translate(1, 0, 0)
+    assert transform.version > version
+    assert transform.transform_matrix is not model
+    transform.position.x = 3
+    transform.mark_dirty()
+    assert transform.transform_matrix.flat[3] == 3
+
+
+def test_set_matrix_decomposes():
+    """Test assigning a model matrix decomposes it into TRS."""
+    transform = Transform()
+    matrix = Matrix4x4.chain(TranslationMatrix4x4(1, -2, 3),
+                             RotationMatrix4x4_z(30), RotationMatrix4x4_y(60),
+                             RotationMatrix4x4_x(-20),
+                             AnisotropicMatrix4x4(-2, 1, 4))
+    transform.transform_matrix = matrix
+    assert transform.position == Vector3(1, -2, 3)
+    assert transform.transform_matrix == matrix
+    with pytest.raises(ValueError):
+        transform.transform_matrix = AnisotropicMatrix4x4(1, 0, 1)
+    with pytest.raises(TypeError):
+        transform.transform_matrix = None
+
+
+def test_lerp():
+    """Test interpolating towards another transform."""
+    start = Transform()
+    end = Transform()
+    end.translate(2, 4, 6)
+    end.homothetic_scale(3)
+    end.rotate(0, 0, 90)
+    start.lerp(end, 0.5)
+    assert start.position == Vector3(1, 2, 3)
+    assert start.scale == Vector3(2, 2, 2)
+    half = Transform()
+    half.rotate(0, 0, 45)
+    assert start.rotation == half.rotation
+    start.lerp(end.transform_matrix, 1)
+    assert start.transform_matrix == end.transform_matrix
+
+
+def test_post_transform_cache_uses_version():
+    """Test that moving the object invalidates the post-transform cache."""
+    cube = Cube()
+    camera = Camera(Vector3(0, 0, 5))
+    projection = Projection(64, 48, 60, 0.1, 100)
+    renderer = cube.renderer
+    first = renderer.process_vertices(cube, camera, projection).data.copy()
+    renderer.process_vertices(cube, camera, projection)
+    assert renderer.stats["post_transform_hits"] == 1
+    cube.transform.translate(0, 1, 0)
+    second = renderer.process_vertices(cube, camera, projection).data
+    assert renderer.stats["post_transform_hits"] == 1
+    assert (first != second).any()
+
+
+def test_world_matrix_composes_parents():
+    """Test that the world matrix is the product along the hierarchy."""
+    root = Transform()
+    child = Transform()
+    grandchild = Transform()
+    child.set_parent(root)
+    grandchild.set_parent(child)
+    root.translate(1, 2, 3)
+    root.rotate(0, 90, 0)
+    child.translate(0, 0, 4)
+    child.homothetic_scale(2)
+    grandchild.rotate(30, 0, 0)
+    expected = Matrix4x4.chain(root.transform_matrix, child.transform_matrix,
+                               grandchild.transform_matrix)
+    assert grandchild.world_matrix == expected
+    assert root.world_matrix is root.transform_matrix
+    assert root.children == (child,)
+    assert grandchild.parent is child
+
+
+def test_dirty_flag_only_reaches_the_subtree():
+    """Test that a change only invalidates the subtree that moved."""
+    root = Transform()
+    left, right, leaf = Transform(), Transform(), Transform()
+    left.set_parent(root)
+    right.set_parent(root)
+    leaf.set_parent(left)
+    for node in (root, left, right, leaf):
+        node.world_matrix
+    versions = [node.world_version for node in (root, left, right, leaf)]
+    right_world = right.world_matrix
+    left.translate(1, 0, 0)
+    assert root.world_version == versions[0]
+    assert left.world_version > versions[1]
+    assert right.world_version == versions[2]
+    assert leaf.world_version > versions[3]
+    assert right.world_matrix is right_world
+    assert leaf.world_matrix == TranslationMatrix4x4(1, 0, 0)
+    # Moving the root reaches every node
+    root.translate(0, 1, 0)
+    assert right.world_matrix == TranslationMatrix4x4(0, 1, 0)
+    assert leaf.world_matrix == TranslationMatrix4x4(1, 1, 0)
+
+
+def test_set_parent():
+    """Test reparenting, detaching and cycle detection."""
+    a, b, c = Transform(), Transform(), Transform()
+    a.translate(5, 0, 0)
+    c.set_parent(a)
+    assert c.world_matrix == TranslationMatrix4x4(5, 0, 0)
+    c.set_parent(b)
+    assert a.children == ()
+    assert c.world_matrix == HomothetyMatrix4x4(1)
+    c.set_parent(None)
+    assert c.parent is None and b.children == ()
+    b.set_parent(a)
+    with pytest.raises(ValueError):
+        a.set_parent(b)
+    with pytest.raises(ValueError):
+        a.set_parent(a)
+    with pytest.raises(TypeError):
+        a.set_parent("root")
+
+
+def test_inverse_matrix():
+    """Test the cached inverse of the model matrix."""
+    transform = Transform()
+    transform.translate(1, 2, 3)
+    transform.rotate(10, -40, 75)
+    transform.anisotropic_scale(2, 0.5, -3)
+    inverse = transform.inverse_matrix
+    assert inverse == transform.transform_matrix.inverse()
+    assert transform.inverse_matrix is inverse
+    transform.translate(0, 1, 0)
+    assert transform.inverse_matrix is not inverse
+    assert transform.transform_matrix.prod(transform.inverse_matrix) \
+        == HomothetyMatrix4x4(1)
+    transform.scale = Vector3(1, 0, 1)
+    with pytest.raises(ValueError):
+        transform.inverse_matrix
+
+
+def test_world_inverse_matrix():
+    """Test the world inverse along a hierarchy, refreshed on changes."""
+    root, child = Transform(), Transform()
+    child.set_parent(root)
+    root.translate(3, 0, 0)
+    root.rotate(0, 0, 90)
+    child.translate(0, 2, 0)
+    child.homothetic_scale(2)
+    # Query the inverse alone, then move the parent
+    assert child.world_inverse_matrix == child.world_matrix.inverse()
+    root.translate(0, 0, 5)
+    assert child.world_inverse_matrix == child.world_matrix.inverse()
+    child.world_matrix
+    root.rotate(45, 0, 0)
+    assert child.world_inverse_matrix == child.world_matrix.inverse()
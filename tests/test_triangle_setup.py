@@ -0,0 +1,57 @@
+"""Tests for verifying proper TriangleSetup functionality."""
+
+import numpy as np
+import pytest
+from Mathy import Vector3, barycentric_coordinates
+from Mathy.triangle_setup import TriangleSetup
+
+A = Vector3(2.3, 1.7, 0.5)
+B = Vector3(30.2, 4.1, 0.2)
+C = Vector3(12.8, 25.6, 0.9)
+UV = ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))
+
+
+def test_barycentric_matches_barycentric_coordinates():
+    """Test the setup planes against barycentric_coordinates()."""
+    setup = TriangleSetup(A, B, C, UV)
+    for x, y in [(10.5, 8.5), (2.3, 1.7), (0.0, 40.0), (25.0, 5.0)]:
+        expected = barycentric_coordinates(Vector3(x, y, 0), A, B, C)
+        assert np.allclose(setup.barycentric(x, y), expected)
+
+
+def test_corner_attributes():
+    """Test that the planes give back the corner depth and uv."""
+    setup = TriangleSetup(A, B, C, UV)
+    for corner, uv in zip((A, B, C), UV):
+        assert abs(setup.depth(corner.x, corner.y) - corner.z) < 1e-12
+        assert np.allclose(setup.texture_coordinates(corner.x, corner.y), uv)
+
+
+def test_incremental_steps():
+    """Test that adding dx and dy steps the values by one pixel."""
+    setup = TriangleSetup(A, B, C)
+    values = list(setup.barycentric(10.5, 8.5)) + [setup.depth(10.5, 8.5)]
+    for _ in range(3):
+        values = [v + d for v, d in zip(values, setup.dx)]
+    for _ in range(2):
+        values = [v + d for v, d in zip(values, setup.dy)]
+    expected = list(setup.barycentric(13.5, 10.5)) + [setup.depth(13.5, 10.5)]
+    assert np.allclose(values, expected)
+
+
+def test_array_evaluation_and_inside():
+    """Test evaluating batches of pixels and the inside test."""
+    setup = TriangleSetup(A, B, C)
+    xs = np.array([10.5, 0.5, 2.3])
+    ys = np.array([8.5, 30.5, 1.7])
+    lambdas = setup.barycentric(xs, ys)
+    assert setup.inside(*lambdas).tolist() == [True, False, True]
+    assert sum(lambdas).tolist() == pytest.approx([1, 1, 1])
+
+
+def test_degenerate_and_missing_uv():
+    """Test the errors raised by TriangleSetup."""
+    with pytest.raises(ValueError, match=r"Degenerate triangle.*"):
+        TriangleSetup(Vector3(0, 0, 0), Vector3(1, 1, 0), Vector3(2, 2, 0))
+    with pytest.raises(ValueError):
+        TriangleSetup(A, B, C).texture_coordinates(1, 1)
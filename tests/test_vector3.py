@@ -189,3 +189,9 @@ def test_homogenize():
 def test_homogeneous_vector3():
     """Test HomogeneousVector3 class."""
     assert HomogeneousVector3(1, 2) == Vector3(1, 2, 1)
+
+
+def test_slots():
+    """Test that vectors do not carry a per-instance __dict__."""
+    assert not hasattr(Vector3(1, 2, 3), "__dict__")
+    assert not hasattr(HomogeneousVector3(1, 2), "__dict__")
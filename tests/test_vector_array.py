@@ -0,0 +1,128 @@
+"""Tests for verifying proper Vector3Array and Vector4Array functionality."""
+
+import numpy as np
+import pytest
+from Mathy import (Vector3,
+                   Vector4,
+                   Vector3Array,
+                   Vector4Array,
+                   Matrix3x3,
+                   TranslationMatrix4x4,
+                   RotationMatrix4x4_z)
+
+# Example batches
+vectors3 = [Vector3(1, 0, 0), Vector3(0, 2, 0), Vector3(1, 2, 2)]
+others3 = [Vector3(0, 1, 0), Vector3(0, 0, 3), Vector3(-1, 1, 0)]
+batch3 = Vector3Array.from_vectors(vectors3)
+other3 = Vector3Array.from_vectors(others3)
+
+
+def test_constructor():
+    """Test arguments for Vector3Array and Vector4Array constructors."""
+    # Valid shapes
+    assert len(Vector3Array([[1, 2, 3], [4, 5, 6]])) == 2
+    assert len(Vector4Array(np.zeros((10, 4)))) == 10
+    assert len(Vector3Array([])) == 0
+    # Data is stored as contiguous float64
+    assert batch3.data.dtype == np.float64
+    assert batch3.data.flags["C_CONTIGUOUS"]
+    # Invalid shape
+    with pytest.raises(ValueError):
+        Vector3Array([[1, 2, 3, 4]])
+    # Invalid types
+    with pytest.raises(TypeError, match=r".* must be floats or ints.*"):
+        Vector3Array([[0, "a", None]])
+
+
+def test_to_vectors():
+    """Test from_vectors(), to_vectors() and __getitem__() methods."""
+    assert batch3.to_vectors() == vectors3
+    assert batch3[2] == Vector3(1, 2, 2)
+    batch4 = Vector4Array.from_vectors([Vector4(1, 2, 3, 4)])
+    assert batch4[0] == Vector4(1, 2, 3, 4)
+
+
+def test_eq():
+    """Test __eq__() method."""
+    assert batch3 == Vector3Array.from_vectors(vectors3)
+    assert batch3 != other3
+    with pytest.raises(TypeError, match=r".* is not a Vector3Array.*"):
+        batch3 == 5
+
+
+def test_add_subtract():
+    """Test add() and subtract() methods against Vector3."""
+    added = batch3.add(other3).to_vectors()
+    subtracted = batch3.subtract(other3).to_vectors()
+    for v, o, a, s in zip(vectors3, others3, added, subtracted):
+        assert a == v.add(o)
+        assert s == v.subtract(o)
+    # Invalid type
+    with pytest.raises(TypeError):
+        batch3.add(Vector3(1, 1, 1))
+    # Length mismatch
+    with pytest.raises(ValueError):
+        batch3.add(Vector3Array([[1, 1, 1]]))
+
+
+def test_scalar_product():
+    """Test scalar_product() method against Vector3."""
+    expected = [v.scalar_product(o) for v, o in zip(vectors3, others3)]
+    assert np.allclose(batch3.scalar_product(other3), expected)
+
+
+def test_multiply_by_scalar():
+    """Test multiply_by_scalar() method."""
+    assert batch3.multiply_by_scalar(2).to_vectors() == [
+        v.multiply_by_scalar(2) for v in vectors3]
+    # One factor per vector
+    scaled = batch3.multiply_by_scalar([1, 0, -1]).to_vectors()
+    assert scaled[1] == Vector3(0, 0, 0)
+    assert scaled[2] == Vector3(-1, -2, -2)
+    # Invalid type
+    with pytest.raises(TypeError):
+        batch3.multiply_by_scalar("a")
+
+
+def test_cross_product():
+    """Test cross_product() method against Vector3."""
+    crossed = batch3.cross_product(other3).to_vectors()
+    for v, o, c in zip(vectors3, others3, crossed):
+        assert c == v.cross_product(o)
+
+
+def test_normalize():
+    """Test normalize() and norm methods."""
+    assert np.allclose(batch3.norm, [1, 2, 3])
+    normalized = batch3.normalize().to_vectors()
+    for v, n in zip(vectors3, normalized):
+        assert n == v.normalize()
+    with pytest.raises(ValueError, match=r"Cannot normalize a zero vector.*"):
+        Vector3Array([[0, 0, 0]]).normalize()
+
+
+def test_multiply_by_matrix():
+    """Test multiply_by_matrix() method against Vector3 and Vector4."""
+    m3 = Matrix3x3(1, 2, 3, 4, 5, 6, 7, 8, 9)
+    result = batch3.multiply_by_matrix(m3).to_vectors()
+    for v, r in zip(vectors3, result):
+        assert r == v.multiply_by_matrix(m3)
+
+    m4 = TranslationMatrix4x4(1, 2, 3).prod(RotationMatrix4x4_z(30))
+    batch4 = batch3.homogenize()
+    result = batch4.multiply_by_matrix(m4).to_vectors()
+    for v, r in zip(vectors3, result):
+        assert r == v.homogenize().multiply_by_matrix(m4)
+
+    # Invalid matrix size
+    with pytest.raises(TypeError, match=r".* is not a Matrix4x4.*"):
+        batch4.multiply_by_matrix(m3)
+
+
+def test_homogenize():
+    """Test homogenize() and dehomogenize() methods."""
+    batch4 = batch3.homogenize()
+    assert batch4.to_vectors() == [v.homogenize() for v in vectors3]
+    assert batch4.multiply_by_scalar(2).dehomogenize() == batch3
+    with pytest.raises(ValueError):
+        Vector4Array([[1, 2, 3, 0]]).dehomogenize()